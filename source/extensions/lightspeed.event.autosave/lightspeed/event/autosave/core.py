@@ -16,6 +16,12 @@
 """
 
 import asyncio
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
 
 import carb
 import omni.kit.notification_manager as _nm
@@ -26,16 +32,18 @@ from lightspeed.layer_manager.core import LayerType as _LayerType
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.kit.widget.prompt import PromptButtonInfo as _PromptButtonInfo
 from omni.kit.widget.prompt import PromptManager as _PromptManager
-from omni.kit.usd.layers import LayerUtils
-from pxr import Sdf
+from omni.kit.usd.layers import LayerUtils, get_layers
+from pxr import Sdf, Tf
 
 _CONTEXT = "/exts/lightspeed.event.autosave/context"
 
 SETTINGS_ENABLED = "/persistent/exts/lightspeed.event.autosave/enabled"
 SETTINGS_INTERVAL_SECONDS = "/persistent/exts/lightspeed.event.autosave/interval_seconds"
+SETTINGS_BACKGROUND = "/persistent/exts/lightspeed.event.autosave/background"
 
 _DEFAULT_ENABLED = False
 _DEFAULT_INTERVAL_SECONDS = 300  # 5 minutes
+_DEFAULT_BACKGROUND = False
 _PROMPT_TITLE = "Auto-Save Project?"
 _PROMPT_MESSAGE = (
     "Auto-Save is turned on, and RTX Remix found unsaved changes in this project.\n\n"
@@ -55,6 +63,9 @@ class AutoSaveCore(_ILSSEvent):
             "_autosave_task": None,
             "_autosave_prompt_open": None,
             "_autosave_prompt_suppressed_for_session": None,
+            "_layers_changed_listener": None,
+            "_background_save_task": None,
+            "_background_save_cancelled": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -68,12 +79,19 @@ class AutoSaveCore(_ILSSEvent):
         self._autosave_prompt_open = False
         self._autosave_prompt_suppressed_for_session = False
 
+        # Number of edits seen per layer, and the edit count and content hash of the last background save of the layer
+        self._layer_generations: dict[str, int] = {}
+        self._saved_generations: dict[str, int] = {}
+        self._saved_hashes: dict[str, str] = {}
+
         # Ensure settings have defaults on first run
         settings = carb.settings.get_settings()
         if settings.get(SETTINGS_ENABLED) is None:
             settings.set(SETTINGS_ENABLED, _DEFAULT_ENABLED)
         if settings.get(SETTINGS_INTERVAL_SECONDS) is None:
             settings.set(SETTINGS_INTERVAL_SECONDS, _DEFAULT_INTERVAL_SECONDS)
+        if settings.get(SETTINGS_BACKGROUND) is None:
+            settings.set(SETTINGS_BACKGROUND, _DEFAULT_BACKGROUND)
 
     @property
     def name(self) -> str:
@@ -87,6 +105,7 @@ class AutoSaveCore(_ILSSEvent):
         self._stage_event_sub = self._context.get_stage_event_stream().create_subscription_to_pop(
             self._on_stage_event, name="AutoSaveStageEvent"
         )
+        self._layers_changed_listener = Tf.Notice.RegisterGlobally(Sdf.Notice.LayersDidChange, self._on_layers_changed)
 
         # If a stage is already open when this extension loads, start the timer immediately
         if self._context.get_stage():
@@ -95,13 +114,24 @@ class AutoSaveCore(_ILSSEvent):
     def _uninstall(self):
         """Function that will delete the behavior"""
         self._stop_timer()
+        self._cancel_background_save()
         self._stage_event_sub = None
+        if self._layers_changed_listener:
+            self._layers_changed_listener.Revoke()
+            self._layers_changed_listener = None
 
     def _on_stage_event(self, event):
         if event.type == int(omni.usd.StageEventType.OPENED):
             self._start_timer()
         elif event.type == int(omni.usd.StageEventType.CLOSING):
             self._stop_timer()
+            self._cancel_background_save()
+
+    def _on_layers_changed(self, notice, _sender):
+        for layer in notice.GetLayers():
+            if layer.anonymous:
+                continue
+            self._layer_generations[layer.identifier] = self._layer_generations.get(layer.identifier, 0) + 1
 
     def _start_timer(self):
         self._stop_timer()
@@ -157,10 +187,18 @@ class AutoSaveCore(_ILSSEvent):
         saveable_layers = []
         for identifier in dirty_identifiers:
             layer = Sdf.Layer.FindOrOpen(identifier)
-            if layer and not layer.anonymous:
+            if layer and not layer.anonymous and not self._is_saved_in_background(layer):
                 saveable_layers.append(layer)
         return saveable_layers
 
+    def _is_saved_in_background(self, layer: Sdf.Layer) -> bool:
+        """
+        Background saves write the layer file without clearing the dirty flag of the layer: the layer stays dirty until
+        it is saved by USD, but there is nothing new to auto-save until it is edited again.
+        """
+        generation = self._saved_generations.get(layer.identifier)
+        return generation is not None and generation == self._layer_generations.get(layer.identifier, 0)
+
     def _prompt_to_autosave(self, layers: list[Sdf.Layer]):
         if self._autosave_prompt_open:
             return
@@ -195,6 +233,17 @@ class AutoSaveCore(_ILSSEvent):
         )
 
     def _save_layers(self, layers: list[Sdf.Layer]):
+        if carb.settings.get_settings().get(SETTINGS_BACKGROUND):
+            if self._background_save_task and not self._background_save_task.done():
+                carb.log_info("[autosave] A background save is still running, skipping auto-save")
+                return
+            self._background_save_cancelled = threading.Event()
+            self._background_save_task = asyncio.ensure_future(
+                self._save_layers_in_background(layers, self._background_save_cancelled)
+            )
+            return
+
+        start = time.perf_counter()
         saved_count = 0
         for layer in layers:
             layer.Save()
@@ -202,11 +251,102 @@ class AutoSaveCore(_ILSSEvent):
             carb.log_info(f"[autosave] Saved layer: {layer.identifier}")
 
         if saved_count:
-            self._post_notification(saved_count)
+            self._post_notification(saved_count, duration=time.perf_counter() - start)
+
+    def _cancel_background_save(self):
+        """
+        Cancel the running background save, if any.
+
+        A layer file that is being written on the worker thread is not replaced, the staged file is removed instead.
+        """
+        if self._background_save_cancelled:
+            self._background_save_cancelled.set()
+            self._background_save_cancelled = None
+        if self._background_save_task:
+            self._background_save_task.cancel()
+            self._background_save_task = None
+
+    def _is_auto_reload_layer(self, layer: Sdf.Layer) -> bool:
+        return get_layers(self._context).get_layers_state().is_auto_reload_layer(layer.identifier)
+
+    async def _save_layers_in_background(self, layers: list[Sdf.Layer], cancelled: threading.Event):
+        """
+        Save the layers without blocking the main thread.
+
+        A snapshot of every layer is copied on the main thread, so the saved content is consistent even if the layer is
+        edited during the save. The snapshots are serialized and written on a worker thread, and each file is replaced
+        atomically so a crash during the save never leaves a truncated layer on disk.
+
+        The layers stay dirty: USD has no way to mark a layer as saved without saving it, and keeping it dirty means an
+        explicit save or closing the project still saves the in-memory layer. Since the file changes behind USD, Kit
+        can report the layer as modified on disk until it is saved again. Layers that Kit reloads automatically when
+        their file changes are saved with USD on the main thread instead, so a reload never discards unsaved edits.
+
+        Args:
+            layers: the layers to save
+            cancelled: set when the save is cancelled, the layer files that are not replaced yet are left untouched
+        """
+        start = time.perf_counter()
+        snapshots = []
+        saved_count = 0
+        for layer in layers:
+            generation = self._layer_generations.get(layer.identifier, 0)
+            if self._saved_generations.get(layer.identifier) == generation:
+                continue
+            try:
+                path = layer.realPath
+                if not path or not os.path.isdir(os.path.dirname(path)) or self._is_auto_reload_layer(layer):
+                    # Not a local file or reloaded on change: save it with USD on the main thread
+                    layer.Save()
+                    saved_count += 1
+                    carb.log_info(f"[autosave] Saved layer: {layer.identifier}")
+                    continue
+                snapshot = Sdf.Layer.CreateAnonymous(
+                    f"autosave{os.path.splitext(path)[1]}", layer.GetFileFormat(), layer.GetFileFormatArguments()
+                )
+                snapshot.TransferContent(layer)
+                file_stat = _get_file_stat(path)
+            except (OSError, Tf.ErrorException) as e:
+                carb.log_error(f"[autosave] Unable to save layer {layer.identifier}: {e}")
+                continue
+            snapshots.append((layer.identifier, path, snapshot, layer.GetFileFormatArguments(), generation, file_stat))
+
+        byte_count = 0
+        for identifier, path, snapshot, file_format_arguments, generation, file_stat in snapshots:
+            try:
+                content_hash, written = await asyncio.to_thread(
+                    _write_layer_snapshot,
+                    snapshot,
+                    path,
+                    file_format_arguments,
+                    self._saved_hashes.get(identifier),
+                    file_stat,
+                    cancelled,
+                )
+            except (OSError, Tf.ErrorException) as e:
+                carb.log_error(f"[autosave] Unable to save layer {identifier}: {e}")
+                continue
+            if content_hash is None:
+                carb.log_info(f"[autosave] Layer file changed during the background save, skipped: {identifier}")
+                continue
+            self._saved_hashes[identifier] = content_hash
+            self._saved_generations[identifier] = generation
+            if not written:
+                carb.log_verbose(f"[autosave] Layer content is unchanged since the last save: {identifier}")
+                continue
+            saved_count += 1
+            byte_count += written
+            carb.log_info(f"[autosave] Saved layer in the background: {identifier} ({written} bytes)")
+
+        if saved_count:
+            self._post_notification(saved_count, duration=time.perf_counter() - start, byte_count=byte_count)
 
-    def _post_notification(self, count: int):
+    def _post_notification(self, count: int, duration: float | None = None, byte_count: int | None = None):
         label = "layer" if count == 1 else "layers"
         message = f"Auto-saved {count} {label}."
+        if duration is not None:
+            size = f"{_format_size(byte_count)} in " if byte_count else ""
+            message = f"Auto-saved {count} {label} ({size}{duration:.2f}s)."
         notification = _nm.notification_info.NotificationInfo(
             message,
             hide_after_timeout=True,
@@ -216,4 +356,78 @@ class AutoSaveCore(_ILSSEvent):
         carb.log_info(f"[autosave] {message}")
 
     def destroy(self):
+        self._cancel_background_save()
         _reset_default_attrs(self)
+
+
+def _format_size(byte_count: int) -> str:
+    size = float(byte_count)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _get_file_stat(path: str) -> tuple[int, int] | None:
+    """
+    Get the modification time and size of a file, or None if the file doesn't exist.
+    """
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _write_layer_snapshot(
+    snapshot: Sdf.Layer,
+    path: str,
+    file_format_arguments: dict[str, str],
+    previous_hash: str | None,
+    file_stat: tuple[int, int] | None,
+    cancelled: threading.Event,
+) -> tuple[str | None, int]:
+    """
+    Serialize a layer snapshot next to the layer file, then atomically replace the file with it.
+
+    A symlinked layer file is resolved, so the link target is replaced and the link is kept. The replaced file keeps
+    the permissions of the original file.
+
+    Args:
+        snapshot: the copy of the layer to write
+        path: the path of the layer file
+        file_format_arguments: the file format arguments of the layer
+        previous_hash: the content hash of the last save of the layer, if any
+        file_stat: the modification time and size of the layer file when the snapshot was taken
+        cancelled: set when the save is cancelled
+
+    Returns:
+        The content hash of the snapshot, and the number of bytes written. Nothing is written, and the number of bytes
+        is 0, when the content hash is the same as the previous one. The content hash is None when the file was not
+        replaced because the save was cancelled or the layer file changed since the snapshot was taken.
+    """
+    path = os.path.realpath(path)
+    directory, name = os.path.split(path)
+    # Keep the extension, USD picks the file format from it
+    staging_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}{os.path.splitext(name)[1]}")
+    try:
+        if not snapshot.Export(staging_path, args=file_format_arguments):
+            raise OSError(f"Unable to export the layer to {staging_path}")
+        content_hash = hashlib.sha256()
+        with open(staging_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                content_hash.update(chunk)
+        if content_hash.hexdigest() == previous_hash:
+            return previous_hash, 0
+        byte_count = os.path.getsize(staging_path)
+        # Don't overwrite a layer saved by USD while the snapshot was written
+        if cancelled.is_set() or _get_file_stat(path) != file_stat:
+            return None, 0
+        if file_stat is not None:
+            shutil.copymode(path, staging_path)
+        os.replace(staging_path, path)
+        return content_hash.hexdigest(), byte_count
+    finally:
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
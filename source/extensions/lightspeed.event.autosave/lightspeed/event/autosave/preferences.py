@@ -20,7 +20,7 @@ from omni import ui
 from omni.kit.widget.settings import create_setting_widget
 from omni.kit.window.preferences import PreferenceBuilder, SettingType
 
-from .core import SETTINGS_ENABLED, SETTINGS_INTERVAL_SECONDS, _DEFAULT_INTERVAL_SECONDS
+from .core import SETTINGS_BACKGROUND, SETTINGS_ENABLED, SETTINGS_INTERVAL_SECONDS, _DEFAULT_INTERVAL_SECONDS
 
 # Preset labels and their corresponding interval in seconds (None = custom)
 _PRESET_LABELS = ["30 seconds", "1 minute", "5 minutes", "10 minutes", "30 minutes", "1 hour", "Custom..."]
@@ -83,12 +83,18 @@ class AutoSavePreferencePage(PreferenceBuilder):
                     self._build_enable_row()
                     self._build_preset_row()
                     self._build_custom_row()
+                    self._build_background_row()
 
     def _build_enable_row(self):
         with ui.HStack(height=24):
             ui.Label("Enable Auto-Save", style_type_name_override="Setting.Label", width=ui.Percent(50))
             create_setting_widget(SETTINGS_ENABLED, SettingType.BOOL)
 
+    def _build_background_row(self):
+        with ui.HStack(height=24):
+            ui.Label("Save In Background", style_type_name_override="Setting.Label", width=ui.Percent(50))
+            create_setting_widget(SETTINGS_BACKGROUND, SettingType.BOOL)
+
     def _build_preset_row(self):
         preset_index = _read_int(_SETTINGS_PRESET_INDEX, _DEFAULT_PRESET_INDEX)
         with ui.HStack(height=24):
@@ -15,15 +15,23 @@
 * limitations under the License.
 """
 
+import asyncio
+import os
+import stat
+import tempfile
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import omni.usd
 from omni.kit.test import AsyncTestCase
+from pxr import Sdf, Tf
 
 from lightspeed.event.autosave.core import (
+    SETTINGS_BACKGROUND,
     SETTINGS_ENABLED,
     SETTINGS_INTERVAL_SECONDS,
     AutoSaveCore,
+    _write_layer_snapshot,
 )
 
 _DIRTY_LAYER_ID = "omni:/test/mod.usda"
@@ -242,3 +250,204 @@ class TestAutoSaveCore(AsyncTestCase):
             await core._do_autosave()
 
         self._notification_manager.post_notification.assert_not_called()
+
+    async def _save_in_background(self, core, layers, auto_reload_layers=(), before_save_fn=None):
+        with (
+            patch("lightspeed.event.autosave.core.carb.settings.get_settings", return_value=self._settings),
+            patch("lightspeed.event.autosave.core.get_layers") as get_layers_mock,
+        ):
+            get_layers_mock.return_value.get_layers_state.return_value.is_auto_reload_layer.side_effect = (
+                lambda identifier: identifier in auto_reload_layers
+            )
+            core._save_layers(layers)
+            task = core._background_save_task
+            if before_save_fn:
+                before_save_fn()
+            await asyncio.gather(task, return_exceptions=True)
+            return task
+
+    async def test_autosave_background_save_writes_a_snapshot_and_keeps_the_layer_dirty(self):
+        """Background saves write the layer file on a worker thread and only save edited layers again."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            layer_changed_notice = SimpleNamespace(GetLayers=lambda: [layer])
+
+            # Act
+            Sdf.CreatePrimInLayer(layer, "/Saved")
+            core._on_layers_changed(layer_changed_notice, None)
+            await self._save_in_background(core, [layer])
+            Sdf.CreatePrimInLayer(layer, "/Unsaved")
+            with patch("lightspeed.event.autosave.core.LayerUtils.get_dirty_layers", return_value=[path]):
+                saved_layers = core._get_saveable_dirty_layers(MagicMock())
+                core._on_layers_changed(layer_changed_notice, None)
+                edited_layers = core._get_saveable_dirty_layers(MagicMock())
+            saved = Sdf.Layer.OpenAsAnonymous(path)
+
+            # Assert
+            self.assertTrue(layer.dirty)
+            self.assertTrue(saved.GetPrimAtPath("/Saved"))
+            self.assertFalse(saved.GetPrimAtPath("/Unsaved"))
+            self.assertEqual([], saved_layers)
+            self.assertEqual([layer], edited_layers)
+            self.assertEqual(["mod.usda"], os.listdir(temp_dir))
+            self._notification_manager.post_notification.assert_called_once()
+
+    async def test_autosave_background_save_skips_unchanged_content(self):
+        """Background saves don't write a layer again when its content didn't change since the last save."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            Sdf.CreatePrimInLayer(layer, "/Prim")
+            await self._save_in_background(core, [layer])
+            modified_time = os.stat(path).st_mtime_ns
+
+            # Act
+            layer.GetPrimAtPath("/Prim").SetInfo("comment", "edited")
+            layer.GetPrimAtPath("/Prim").ClearInfo("comment")
+            core._layer_generations[layer.identifier] = 2
+            await self._save_in_background(core, [layer])
+
+            # Assert
+            self.assertEqual(modified_time, os.stat(path).st_mtime_ns)
+            self.assertEqual(2, core._saved_generations[layer.identifier])
+            self._notification_manager.post_notification.assert_called_once()
+
+    async def test_autosave_background_save_logs_snapshot_errors_and_saves_the_other_layers(self):
+        """A layer that fails to save is logged, and the other layers are still saved in the background."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        failing_layer = MagicMock()
+        failing_layer.identifier = "omni:/test/failing.usda"
+        failing_layer.realPath = ""
+        failing_layer.Save.side_effect = Tf.ErrorException("Unable to save the layer")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            Sdf.CreatePrimInLayer(layer, "/Saved")
+
+            # Act
+            with patch("lightspeed.event.autosave.core.carb.log_error") as log_error_mock:
+                await self._save_in_background(core, [failing_layer, layer])
+            saved = Sdf.Layer.OpenAsAnonymous(path)
+
+            # Assert
+            log_error_mock.assert_called_once()
+            self.assertIn(failing_layer.identifier, log_error_mock.call_args.args[0])
+            self.assertTrue(saved.GetPrimAtPath("/Saved"))
+            self.assertNotIn(failing_layer.identifier, core._saved_generations)
+
+    async def test_autosave_background_save_is_cancelled_on_uninstall(self):
+        """Uninstalling the event cancels the running background save, and the layer file is left untouched."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            layer.Save()
+            Sdf.CreatePrimInLayer(layer, "/Unsaved")
+
+            # Act
+            task = await self._save_in_background(core, [layer], before_save_fn=core._uninstall)
+            saved = Sdf.Layer.OpenAsAnonymous(path)
+
+            # Assert
+            self.assertTrue(task.cancelled())
+            self.assertIsNone(core._background_save_task)
+            self.assertFalse(saved.GetPrimAtPath("/Unsaved"))
+            self.assertEqual(["mod.usda"], os.listdir(temp_dir))
+
+    async def test_autosave_background_save_is_cancelled_on_stage_closing(self):
+        """Closing the stage cancels the running background save."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layer = Sdf.Layer.CreateNew(os.path.join(temp_dir, "mod.usda"))
+
+            closing_event = SimpleNamespace(type=int(omni.usd.StageEventType.CLOSING))
+
+            # Act
+            task = await self._save_in_background(
+                core, [layer], before_save_fn=lambda: core._on_stage_event(closing_event)
+            )
+
+            # Assert
+            self.assertTrue(task.cancelled())
+            self.assertIsNone(core._background_save_task)
+
+    async def test_autosave_background_save_keeps_symlinks_and_permissions(self):
+        """Background saves replace the target of a symlinked layer file and keep the permissions of the file."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target_path = os.path.join(temp_dir, "target.usda")
+            link_path = os.path.join(temp_dir, "mod.usda")
+            Sdf.Layer.CreateNew(target_path).Save()
+            os.chmod(target_path, 0o640)
+            os.symlink(target_path, link_path)
+            layer = Sdf.Layer.FindOrOpen(link_path)
+            Sdf.CreatePrimInLayer(layer, "/Saved")
+
+            # Act
+            await self._save_in_background(core, [layer])
+            saved = Sdf.Layer.OpenAsAnonymous(target_path)
+
+            # Assert
+            self.assertTrue(os.path.islink(link_path))
+            self.assertEqual(0o640, stat.S_IMODE(os.stat(target_path).st_mode))
+            self.assertTrue(saved.GetPrimAtPath("/Saved"))
+            self.assertEqual(["mod.usda", "target.usda"], sorted(os.listdir(temp_dir)))
+
+    async def test_autosave_background_save_doesnt_overwrite_a_layer_saved_during_the_save(self):
+        """A layer file saved by USD after the snapshot was taken is not replaced by the older snapshot."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            Sdf.CreatePrimInLayer(layer, "/Snapshot")
+
+            def save_explicitly(*args):
+                Sdf.CreatePrimInLayer(layer, "/Explicit")
+                layer.Save()
+                return _write_layer_snapshot(*args)
+
+            # Act
+            with patch("lightspeed.event.autosave.core._write_layer_snapshot", side_effect=save_explicitly):
+                await self._save_in_background(core, [layer])
+            saved = Sdf.Layer.OpenAsAnonymous(path)
+
+            # Assert
+            self.assertTrue(saved.GetPrimAtPath("/Explicit"))
+            self.assertNotIn(layer.identifier, core._saved_generations)
+            self._notification_manager.post_notification.assert_not_called()
+
+    async def test_autosave_background_save_saves_auto_reload_layers_with_usd(self):
+        """Layers that Kit reloads when their file changes are saved with USD, so a reload can't drop unsaved edits."""
+        # Arrange
+        self._setting_values[SETTINGS_BACKGROUND] = True
+        core = self._make_core()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mod.usda")
+            layer = Sdf.Layer.CreateNew(path)
+            Sdf.CreatePrimInLayer(layer, "/Saved")
+
+            # Act
+            await self._save_in_background(core, [layer], auto_reload_layers=[layer.identifier])
+            saved = Sdf.Layer.OpenAsAnonymous(path)
+
+            # Assert
+            self.assertFalse(layer.dirty)
+            self.assertTrue(saved.GetPrimAtPath("/Saved"))
+            self._notification_manager.post_notification.assert_called_once()
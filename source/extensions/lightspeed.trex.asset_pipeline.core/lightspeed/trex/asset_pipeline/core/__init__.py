@@ -18,6 +18,7 @@
 __all__ = [
     "AssetKind",
     "AssetPipelineCoreExtension",
+    "DDSArtifactStore",
     "MaterialType",
     "PipelineOutputPath",
     "RemixAssetItem",
@@ -26,9 +27,11 @@ __all__ = [
     "TextureAsset",
     "TextureBinding",
     "build_remix_asset_pipeline",
+    "get_dds_artifact_store",
     "run_remix_asset_pipeline",
 ]
 
+from .dds_artifact_store import DDSArtifactStore, get_dds_artifact_store
 from .extension import AssetPipelineCoreExtension
 from .pipeline_builder import build_remix_asset_pipeline
 from .pipeline_config import RemixAssetPipelineConfig
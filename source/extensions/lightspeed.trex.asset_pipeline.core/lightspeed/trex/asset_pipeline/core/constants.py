@@ -16,11 +16,21 @@
 """
 
 __all__ = (
+    "DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH",
+    "DDS_ARTIFACT_STORE_MAX_SIZE_MB_SETTING_PATH",
+    "DDS_ARTIFACT_STORE_PATH_SETTING_PATH",
+    "DDS_DEFAULT_MAX_CONCURRENT_CONVERSIONS",
+    "DDS_MAX_CONCURRENT_CONVERSIONS_SETTING_PATH",
     "DDS_NVTT_ARGS_METADATA_KEY",
     "DDS_SOURCE_HASH_METADATA_KEY",
     "DDS_TEXTURE_TYPE_METADATA_KEY",
     "NVTT_TIMEOUT_SECONDS",
     "ORPHAN_PARAMETER_CLEANUP_SETTING_PATH",
+    "PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS",
+    "PUBLICATION_MAX_CONCURRENT_TRANSFERS_SETTING_PATH",
+    "PUBLICATION_MODE_DELTA",
+    "PUBLICATION_MODE_SETTING_PATH",
+    "PUBLICATION_MODE_SWAP",
 )
 
 DDS_SOURCE_HASH_METADATA_KEY = "asset_pipeline_source_hash"
@@ -28,4 +38,18 @@ DDS_TEXTURE_TYPE_METADATA_KEY = "asset_pipeline_texture_type"
 DDS_NVTT_ARGS_METADATA_KEY = "asset_pipeline_nvtt_args"
 NVTT_TIMEOUT_SECONDS = 300.0
 
+DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH = "/exts/lightspeed.trex.asset_pipeline.core/dds_artifact_store/enabled"
+DDS_ARTIFACT_STORE_PATH_SETTING_PATH = "/exts/lightspeed.trex.asset_pipeline.core/dds_artifact_store/path"
+DDS_ARTIFACT_STORE_MAX_SIZE_MB_SETTING_PATH = "/exts/lightspeed.trex.asset_pipeline.core/dds_artifact_store/max_size_mb"
+DDS_MAX_CONCURRENT_CONVERSIONS_SETTING_PATH = "/exts/lightspeed.trex.asset_pipeline.core/dds/max_concurrent_conversions"
+DDS_DEFAULT_MAX_CONCURRENT_CONVERSIONS = 4
+
 ORPHAN_PARAMETER_CLEANUP_SETTING_PATH = "/exts/omni.usd/mdl/ignoreOrphanParametersCleanup"
+
+PUBLICATION_MODE_SETTING_PATH = "/exts/lightspeed.trex.asset_pipeline.core/publication/mode"
+PUBLICATION_MAX_CONCURRENT_TRANSFERS_SETTING_PATH = (
+    "/exts/lightspeed.trex.asset_pipeline.core/publication/max_concurrent_transfers"
+)
+PUBLICATION_MODE_DELTA = "delta"
+PUBLICATION_MODE_SWAP = "swap"
+PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS = 8
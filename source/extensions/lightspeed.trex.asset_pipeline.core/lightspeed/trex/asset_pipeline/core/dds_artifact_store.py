@@ -0,0 +1,277 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DDSArtifactStore", "DDSArtifactStoreStatistics", "get_dds_artifact_store"]
+
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+import uuid
+from collections.abc import Callable
+
+import carb
+import carb.settings
+import carb.tokens
+
+from .constants import (
+    DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH,
+    DDS_ARTIFACT_STORE_MAX_SIZE_MB_SETTING_PATH,
+    DDS_ARTIFACT_STORE_PATH_SETTING_PATH,
+)
+
+_OBJECT_SUFFIX = ".dds"
+
+
+@dataclasses.dataclass(frozen=True)
+class DDSArtifactStoreStatistics:
+    """Counters of one artifact store since it was created.
+
+    Attributes:
+        hits: Requests served from an existing artifact.
+        misses: Requests that had to create their artifact.
+        collapsed: Requests that waited for an identical request already in flight.
+        evictions: Artifacts removed to stay under the size limit.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    collapsed: int = 0
+    evictions: int = 0
+
+
+class DDSArtifactStore:
+    """Machine-wide store of converted DDS files, addressed by the inputs of their conversion.
+
+    Artifacts are keyed by the source texture content hash, the texture semantic, and the NVTT arguments, so any
+    project converting the same source with the same settings reuses the same artifact. Artifacts are handed out as
+    hardlinks when the destination is on the same volume and as copies otherwise, so callers must replace, not modify,
+    the files they receive. The least recently used artifacts are evicted once the store exceeds its size limit.
+    """
+
+    def __init__(self, root: pathlib.Path, max_size_bytes: int | None = None) -> None:
+        """Create a store rooted in one directory.
+
+        Args:
+            root: Directory holding the artifacts. It is created on the first write.
+            max_size_bytes: Size above which the least recently used artifacts are evicted, or ``None`` for no limit.
+        """
+        self.root = pathlib.Path(root)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, threading.Event] = {}
+        self._size_bytes: int | None = None
+        self._statistics = DDSArtifactStoreStatistics()
+
+    @staticmethod
+    def get_key(source_hash: str, texture_type: str, nvtt_args: list[str]) -> str:
+        """Build the address of the artifact converted from one source with one set of settings.
+
+        Args:
+            source_hash: Content hash of the source texture.
+            texture_type: Name of the texture semantic.
+            nvtt_args: NVTT arguments used for the conversion.
+
+        Returns:
+            Stable hexadecimal key.
+        """
+        payload = json.dumps([source_hash, texture_type, nvtt_args], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def statistics(self) -> DDSArtifactStoreStatistics:
+        """Return a snapshot of the store counters.
+
+        Returns:
+            Counters since the store was created.
+        """
+        with self._lock:
+            return self._statistics
+
+    def get_or_create(self, key: str, destination: pathlib.Path, create: Callable[[pathlib.Path], None]) -> bool:
+        """Place the artifact of one key at a destination, creating it only when no artifact exists yet.
+
+        Identical requests running at the same time in other threads wait for the first one instead of creating the
+        same artifact again.
+
+        Args:
+            key: Artifact address built by ``get_key``.
+            destination: Path receiving the artifact. An existing file is replaced.
+            create: Blocking callable writing a new artifact at the path it receives.
+
+        Returns:
+            True when an existing artifact was reused, False when ``create`` was called.
+
+        Raises:
+            Exception: Any error raised by ``create``. Waiting requests then retry on their own.
+        """
+        while True:
+            if self.fetch(key, destination):
+                return True
+            with self._lock:
+                event = self._in_flight.get(key)
+                if event is None:
+                    self._in_flight[key] = threading.Event()
+                    break
+                self._statistics = dataclasses.replace(self._statistics, collapsed=self._statistics.collapsed + 1)
+            event.wait()
+        try:
+            # The previous owner may have finished between the lookup and the registration
+            if self.fetch(key, destination):
+                return True
+            with self._lock:
+                self._statistics = dataclasses.replace(self._statistics, misses=self._statistics.misses + 1)
+            create(destination)
+            self.add(key, destination)
+            return False
+        finally:
+            with self._lock:
+                self._in_flight.pop(key).set()
+
+    def fetch(self, key: str, destination: pathlib.Path) -> bool:
+        """Place an existing artifact at a destination.
+
+        Args:
+            key: Artifact address built by ``get_key``.
+            destination: Path receiving the artifact. An existing file is replaced.
+
+        Returns:
+            True when the artifact exists and was placed at the destination.
+        """
+        artifact = self._get_artifact_path(key)
+        staging = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            # Mark the artifact as recently used before linking it so a concurrent eviction keeps it
+            os.utime(artifact)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(artifact, staging)
+            except OSError:
+                shutil.copyfile(artifact, staging)
+            os.replace(staging, destination)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            staging.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._statistics = dataclasses.replace(self._statistics, hits=self._statistics.hits + 1)
+        return True
+
+    def add(self, key: str, path: pathlib.Path) -> None:
+        """Copy a converted file into the store.
+
+        Args:
+            key: Artifact address built by ``get_key``.
+            path: Converted file. Nothing is stored when the file does not exist.
+        """
+        artifact = self._get_artifact_path(key)
+        if artifact.exists() or not path.exists():
+            return
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        staging = artifact.with_name(f".{artifact.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(path, staging)
+            os.replace(staging, artifact)
+        except OSError as e:
+            # The store is only a cache: the converted file is still valid for the caller
+            carb.log_warn(f"[DDSArtifactStore] Unable to store {path}: {e}")
+            staging.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._size_bytes is not None:
+                self._size_bytes += artifact.stat().st_size
+            exceeded = self.max_size_bytes is not None and (
+                self._size_bytes is None or self._size_bytes > self.max_size_bytes
+            )
+        if exceeded:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used artifacts until the store is under its size limit."""
+        artifacts = []
+        for artifact in self.root.glob(f"*/*{_OBJECT_SUFFIX}"):
+            try:
+                stat = artifact.stat()
+            except FileNotFoundError:
+                continue
+            artifacts.append((stat.st_mtime_ns, stat.st_size, artifact))
+        size_bytes = sum(size for _, size, _ in artifacts)
+        evictions = 0
+        if self.max_size_bytes is not None:
+            for _, size, artifact in sorted(artifacts, key=lambda entry: entry[0]):
+                if size_bytes <= self.max_size_bytes:
+                    break
+                try:
+                    # Files handed out as hardlinks keep their content
+                    artifact.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    carb.log_warn(f"[DDSArtifactStore] Unable to evict {artifact}: {e}")
+                    continue
+                size_bytes -= size
+                evictions += 1
+        with self._lock:
+            self._size_bytes = size_bytes
+            if evictions:
+                self._statistics = dataclasses.replace(
+                    self._statistics, evictions=self._statistics.evictions + evictions
+                )
+
+    def _get_artifact_path(self, key: str) -> pathlib.Path:
+        """Return the path of one artifact, sharded by the first characters of its key.
+
+        Args:
+            key: Artifact address built by ``get_key``.
+
+        Returns:
+            Artifact path inside the store.
+        """
+        return self.root / key[:2] / f"{key}{_OBJECT_SUFFIX}"
+
+
+_INSTANCE: DDSArtifactStore | None = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def get_dds_artifact_store() -> DDSArtifactStore | None:
+    """Return the artifact store shared by the current process.
+
+    Returns:
+        The shared store, or ``None`` when the store is disabled or has no path in the settings.
+    """
+    global _INSTANCE
+    settings = carb.settings.get_settings()
+    if settings.get(DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH) is False:
+        return None
+    with _INSTANCE_LOCK:
+        if _INSTANCE is None:
+            path = settings.get(DDS_ARTIFACT_STORE_PATH_SETTING_PATH)
+            if not path:
+                return None
+            max_size_mb = settings.get(DDS_ARTIFACT_STORE_MAX_SIZE_MB_SETTING_PATH)
+            _INSTANCE = DDSArtifactStore(
+                pathlib.Path(carb.tokens.get_tokens_interface().resolve(path)),
+                max_size_bytes=max_size_mb * 1024 * 1024 if max_size_mb else None,
+            )
+    return _INSTANCE
@@ -20,8 +20,12 @@ from __future__ import annotations
 __all__ = ["get_local_output_path", "publish_remote_outputs"]
 
 import asyncio
+import dataclasses
+import functools
+import json
 import pathlib
 import uuid
+from collections.abc import Awaitable, Callable
 from urllib.request import url2pathname
 
 import carb
@@ -33,13 +37,41 @@ from omni.client import (
     create_folder_async,
     delete_async,
     is_local_url,
+    list_async,
     move_async,
+    read_file_async,
     stat_async,
+    write_file_async,
 )
 from omni.flux.job_queue.core.job import JobProgress, JobProgressCallback
 
+from .constants import (
+    PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    PUBLICATION_MAX_CONCURRENT_TRANSFERS_SETTING_PATH,
+    PUBLICATION_MODE_SETTING_PATH,
+    PUBLICATION_MODE_SWAP,
+)
 from .worker import await_settled, run_in_worker_thread
 
+_JOURNAL_INFIX = ".asset_pipeline_journal_"
+_JOURNAL_SUFFIX = ".json"
+
+
+@dataclasses.dataclass
+class _PublicationJournal:
+    """Remote changes made by one delta publication, in the order rollback must undo them in reverse.
+
+    The files, the created directories, and the commit phase are written next to the output directory before the
+    transaction directories are created and again before the first move. The backed up and committed files are only
+    tracked in memory: after a crash, the next publication infers them from the staging and backup directories.
+    """
+
+    files: list[str]
+    created_directories: list[str] = dataclasses.field(default_factory=list)
+    committing: bool = False
+    backed_up_files: list[str] = dataclasses.field(default_factory=list)
+    committed_files: list[str] = dataclasses.field(default_factory=list)
+
 
 def get_local_output_path(output_url: str) -> pathlib.Path | None:
     """Convert a local publication URL to a path and reject remote URLs.
@@ -65,6 +97,10 @@ async def publish_remote_outputs(
 ) -> list[str]:
     """Publish every pipeline output and sidecar to one remote directory.
 
+    The publication mode is read from ``/exts/lightspeed.trex.asset_pipeline.core/publication/mode``. The default
+    ``delta`` mode transfers only the batch files, while ``swap`` replaces a clone of the whole remote directory.
+    A delta publication left unfinished by a dead process is rolled back first.
+
     Args:
         local_output_dir: Local directory containing only final pipeline outputs.
         primary_outputs: Primary output paths in request order.
@@ -76,11 +112,24 @@ async def publish_remote_outputs(
         Remote primary URLs in request order.
 
     Raises:
-        RuntimeError: If the remote directory or any output cannot be published.
+        RuntimeError: If an unfinished publication cannot be rolled back, or the remote directory or any output cannot
+            be published.
     """
     await progress_callback(JobProgress(completed=asset_count, total=asset_count, detail="Save processed assets"))
     output_files = await run_in_worker_thread(_list_output_files, local_output_dir)
-    await _publish_remote_batch(output_files, local_output_dir, remote_output_url)
+    settings = carb.settings.get_settings()
+    max_concurrent_transfers = (
+        settings.get(PUBLICATION_MAX_CONCURRENT_TRANSFERS_SETTING_PATH) or PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS
+    )
+    await _recover_remote_deltas(remote_output_url, max_concurrent_transfers)
+    if settings.get(PUBLICATION_MODE_SETTING_PATH) == PUBLICATION_MODE_SWAP:
+        await _publish_remote_batch(
+            output_files, local_output_dir, remote_output_url, max_concurrent_transfers=max_concurrent_transfers
+        )
+    else:
+        await _publish_remote_delta(
+            output_files, local_output_dir, remote_output_url, max_concurrent_transfers=max_concurrent_transfers
+        )
 
     output_directory_url = f"{remote_output_url.rstrip('/')}/"
     return [
@@ -104,6 +153,8 @@ async def _publish_remote_batch(
     source_paths: list[pathlib.Path],
     source_root: pathlib.Path,
     remote_output_url: str,
+    *,
+    max_concurrent_transfers: int = PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS,
 ) -> None:
     """Stage and atomically swap one complete remote output directory.
 
@@ -115,6 +166,7 @@ async def _publish_remote_batch(
         source_paths: Local files to publish as one transaction.
         source_root: Local root preserved below the remote directory.
         remote_output_url: Final remote directory receiving the complete batch.
+        max_concurrent_transfers: Number of files copied to staging at the same time.
 
     Raises:
         RuntimeError: If staging, commit, or rollback fails.
@@ -139,12 +191,7 @@ async def _publish_remote_batch(
         else:
             raise RuntimeError(f"Could not inspect the asset output directory ({stat_result})")
 
-        for source_path in source_paths:
-            relative_path = source_path.relative_to(source_root)
-            await _ensure_remote_directories(staging_url, relative_path.parent)
-            destination_url = combine_urls(f"{staging_url}/", relative_path.as_posix())
-            copy_result = await await_settled(copy_async(str(source_path), destination_url, CopyBehavior.OVERWRITE))
-            _require_remote_success(copy_result, f"stage processed asset {relative_path.as_posix()}")
+        await _stage_remote_files(source_paths, source_root, staging_url, max_concurrent_transfers)
 
         if final_exists:
             move_result, _copied = await await_settled(move_async(final_url, backup_url, CopyBehavior.ERROR_IF_EXISTS))
@@ -155,7 +202,7 @@ async def _publish_remote_batch(
         move_result, _copied = await await_settled(final_move_operation)
         if move_result != ClientResult.OK:
             raise RuntimeError(f"Could not commit the processed asset batch ({move_result})")
-    except (asyncio.CancelledError, RuntimeError) as publication_error:
+    except BaseException as publication_error:
         rollback_error = await _rollback_remote_publication(
             final_url,
             staging_url,
@@ -172,26 +219,466 @@ async def _publish_remote_batch(
             await _delete_remote_path(backup_url, required=False)
 
 
-async def _ensure_remote_directories(root_url: str, relative_directory: pathlib.Path) -> None:
-    """Create each missing remote directory below one existing transaction root.
+async def _publish_remote_delta(
+    source_paths: list[pathlib.Path],
+    source_root: pathlib.Path,
+    remote_output_url: str,
+    *,
+    max_concurrent_transfers: int = PUBLICATION_DEFAULT_MAX_CONCURRENT_TRANSFERS,
+) -> None:
+    """Stage only the batch files and commit them into the remote output directory one atomic move at a time.
+
+    The batch directory only holds the outputs of the current run, so every file is new or changed. Those files are
+    copied to a sibling staging directory, then each one replaces its final path with two moves: the previous file
+    goes to a sibling backup directory and the staged file takes its place. Every remote change is recorded in a
+    journal, so a failure or cancellation undoes the whole batch. The journal is also written next to the output
+    directory before the first move and removed once every file is committed, so the next publication can roll back
+    a batch interrupted by a dead process. A first publication has nothing to back up and uses the directory swap
+    instead.
 
     Args:
-        root_url: Existing remote staging root.
-        relative_directory: Relative local directory hierarchy to reproduce remotely.
+        source_paths: Local files to publish as one transaction.
+        source_root: Local root preserved below the remote directory.
+        remote_output_url: Final remote directory receiving the batch.
+        max_concurrent_transfers: Number of files copied or moved at the same time.
 
     Raises:
-        RuntimeError: If a destination directory cannot be inspected or created.
+        RuntimeError: If staging, commit, or rollback fails.
     """
-    current_url = root_url
-    for part in relative_directory.parts:
-        current_url = combine_urls(f"{current_url.rstrip('/')}/", part)
-        stat_result, _entry = await await_settled(stat_async(current_url))
-        if stat_result == ClientResult.OK:
+    final_url = remote_output_url.rstrip("/")
+    stat_result, _entry = await await_settled(stat_async(final_url))
+    if stat_result == ClientResult.ERROR_NOT_FOUND:
+        await _publish_remote_batch(
+            source_paths, source_root, remote_output_url, max_concurrent_transfers=max_concurrent_transfers
+        )
+        return
+    if stat_result != ClientResult.OK:
+        raise RuntimeError(f"Could not inspect the asset output directory ({stat_result})")
+
+    transaction_id = uuid.uuid4().hex
+    staging_url = f"{final_url}.asset_pipeline_staging_{transaction_id}"
+    backup_url = f"{final_url}.asset_pipeline_backup_{transaction_id}"
+    journal_url = f"{final_url}{_JOURNAL_INFIX}{transaction_id}{_JOURNAL_SUFFIX}"
+    relative_paths = [source_path.relative_to(source_root) for source_path in source_paths]
+    relative_directories = {relative_path.parent for relative_path in relative_paths}
+    journal = _PublicationJournal(files=[relative_path.as_posix() for relative_path in relative_paths])
+
+    async def commit(relative_path: str) -> None:
+        """Back up the previous final file, then move the staged file into its place.
+
+        Args:
+            relative_path: File path relative to the transaction directories.
+
+        Raises:
+            RuntimeError: If the previous file cannot be backed up or the staged file cannot be committed.
+        """
+        final_file_url = combine_urls(f"{final_url}/", relative_path)
+        backup_result = await _move_remote_path(
+            final_file_url,
+            combine_urls(f"{backup_url}/", relative_path),
+            on_owned=functools.partial(journal.backed_up_files.append, relative_path),
+        )
+        if backup_result not in (ClientResult.OK, ClientResult.ERROR_NOT_FOUND):
+            raise RuntimeError(f"Could not retain the current asset output {relative_path} ({backup_result})")
+        commit_result = await _move_remote_path(
+            combine_urls(f"{staging_url}/", relative_path),
+            final_file_url,
+            on_owned=functools.partial(journal.committed_files.append, relative_path),
+        )
+        _require_remote_success(commit_result, f"commit processed asset {relative_path}")
+
+    try:
+        await _write_journal(journal_url, journal)
+        for transaction_url in (staging_url, backup_url):
+            create_result = await await_settled(create_folder_async(transaction_url))
+            _require_remote_success(create_result, "create the asset publication transaction directories")
+        await _stage_remote_files(source_paths, source_root, staging_url, max_concurrent_transfers)
+        await _create_remote_directories(backup_url, relative_directories, max_concurrent_transfers)
+        await _create_remote_directories(
+            final_url, relative_directories, max_concurrent_transfers, created=journal.created_directories
+        )
+
+        journal.committing = True
+        await _write_journal(journal_url, journal)
+        await _run_bounded(
+            [functools.partial(commit, relative_path) for relative_path in journal.files], max_concurrent_transfers
+        )
+        # Removing the journal commits the batch: a later recovery must not undo it.
+        await _delete_remote_path(journal_url, required=True)
+    except BaseException as publication_error:
+        rollback_error = await _rollback_remote_delta(final_url, staging_url, backup_url, journal_url, journal)
+        if rollback_error is not None:
+            raise RuntimeError(
+                f"Asset publication failed and rollback could not restore the previous output: {rollback_error}"
+            ) from publication_error
+        raise
+    else:
+        await _delete_remote_path(staging_url, required=False)
+        await _delete_remote_path(backup_url, required=False)
+
+
+async def _recover_remote_deltas(remote_output_url: str, max_concurrent_transfers: int) -> None:
+    """Roll back every delta publication a dead process left unfinished in one remote output directory.
+
+    An interrupted publication is found through its journal next to the output directory. Before its commit phase,
+    only its transaction directories are removed. During its commit phase, a file missing from staging was committed
+    and a file present in the backup was backed up, which the rollback then undoes.
+
+    Args:
+        remote_output_url: Remote output directory about to be published.
+        max_concurrent_transfers: Number of files inspected at the same time.
+
+    Raises:
+        RuntimeError: If a journal cannot be found, read, or rolled back.
+    """
+    final_url = remote_output_url.rstrip("/")
+    parent_url, _separator, output_name = final_url.rpartition("/")
+    if not parent_url:
+        return
+    list_result, entries = await await_settled(list_async(parent_url))
+    if list_result == ClientResult.ERROR_NOT_FOUND:
+        return
+    _require_remote_success(list_result, "list the asset output parent directory")
+
+    journal_prefix = f"{output_name}{_JOURNAL_INFIX}"
+    for entry_name in sorted(entry.relative_path for entry in entries):
+        if not entry_name.startswith(journal_prefix) or not entry_name.endswith(_JOURNAL_SUFFIX):
             continue
-        if stat_result != ClientResult.ERROR_NOT_FOUND:
-            raise RuntimeError(f"Could not inspect asset publication directory {current_url} ({stat_result})")
-        create_result = await await_settled(create_folder_async(current_url))
-        _require_remote_success(create_result, f"create asset publication directory {current_url}")
+        transaction_id = entry_name[len(journal_prefix) : -len(_JOURNAL_SUFFIX)]
+        journal_url = f"{final_url}{_JOURNAL_INFIX}{transaction_id}{_JOURNAL_SUFFIX}"
+        staging_url = f"{final_url}.asset_pipeline_staging_{transaction_id}"
+        backup_url = f"{final_url}.asset_pipeline_backup_{transaction_id}"
+        journal = await _read_journal(journal_url)
+
+        if journal.committing:
+            await _run_bounded(
+                [
+                    functools.partial(_inspect_interrupted_file, staging_url, backup_url, journal, relative_path)
+                    for relative_path in journal.files
+                ],
+                max_concurrent_transfers,
+            )
+        carb.log_warn(f"Rolling back the interrupted asset publication {journal_url}")
+        rollback_error = await _rollback_remote_delta(final_url, staging_url, backup_url, journal_url, journal)
+        if rollback_error is not None:
+            raise RuntimeError(f"Could not roll back the interrupted asset publication {journal_url}: {rollback_error}")
+
+
+async def _inspect_interrupted_file(
+    staging_url: str, backup_url: str, journal: _PublicationJournal, relative_path: str
+) -> None:
+    """Record whether one journaled file was backed up or committed before the process died.
+
+    Args:
+        staging_url: Transaction staging directory.
+        backup_url: Transaction backup directory.
+        journal: Journal receiving the inferred changes.
+        relative_path: File path relative to the transaction directories.
+
+    Raises:
+        RuntimeError: If the staged or backed up file cannot be inspected.
+    """
+    for transaction_url, moved_result, moved_files in (
+        (staging_url, ClientResult.ERROR_NOT_FOUND, journal.committed_files),
+        (backup_url, ClientResult.OK, journal.backed_up_files),
+    ):
+        stat_result, _entry = await await_settled(stat_async(combine_urls(f"{transaction_url}/", relative_path)))
+        if stat_result not in (ClientResult.OK, ClientResult.ERROR_NOT_FOUND):
+            raise RuntimeError(f"Could not inspect the interrupted asset output {relative_path} ({stat_result})")
+        if stat_result == moved_result:
+            moved_files.append(relative_path)
+
+
+async def _write_journal(journal_url: str, journal: _PublicationJournal) -> None:
+    """Write the persisted part of one delta publication journal.
+
+    Args:
+        journal_url: Remote journal file next to the output directory.
+        journal: Journal to write.
+
+    Raises:
+        RuntimeError: If the journal cannot be written.
+    """
+    content = json.dumps(
+        {
+            "files": journal.files,
+            "created_directories": journal.created_directories,
+            "committing": journal.committing,
+        },
+        indent=4,
+    ).encode("utf-8")
+    write_result = await await_settled(write_file_async(journal_url, content))
+    _require_remote_success(write_result, "write the asset publication journal")
+
+
+async def _read_journal(journal_url: str) -> _PublicationJournal:
+    """Read the persisted part of one delta publication journal.
+
+    Args:
+        journal_url: Remote journal file next to the output directory.
+
+    Returns:
+        Journal without backed up or committed files.
+
+    Raises:
+        RuntimeError: If the journal cannot be read or parsed.
+    """
+    read_result, _version, content = await await_settled(read_file_async(journal_url))
+    _require_remote_success(read_result, f"read the asset publication journal {journal_url}")
+    try:
+        data = json.loads(memoryview(content).tobytes().decode("utf-8"))
+        return _PublicationJournal(
+            files=list(data["files"]),
+            created_directories=list(data["created_directories"]),
+            committing=bool(data["committing"]),
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise RuntimeError(f"Could not parse the asset publication journal {journal_url}") from error
+
+
+async def _stage_remote_files(
+    source_paths: list[pathlib.Path],
+    source_root: pathlib.Path,
+    staging_url: str,
+    max_concurrent_transfers: int,
+) -> None:
+    """Copy local files below one existing staging directory, keeping their relative hierarchy.
+
+    Args:
+        source_paths: Local files to copy.
+        source_root: Local root preserved below the staging directory.
+        staging_url: Existing remote staging directory.
+        max_concurrent_transfers: Number of files copied at the same time.
+
+    Raises:
+        RuntimeError: If a directory or a file cannot be staged.
+    """
+    relative_paths = [source_path.relative_to(source_root) for source_path in source_paths]
+    await _create_remote_directories(
+        staging_url, {relative_path.parent for relative_path in relative_paths}, max_concurrent_transfers
+    )
+
+    async def stage(source_path: pathlib.Path, relative_path: pathlib.Path) -> None:
+        """Copy one local file to staging.
+
+        Args:
+            source_path: Local file to copy.
+            relative_path: File path relative to the staging directory.
+
+        Raises:
+            RuntimeError: If the file cannot be copied.
+        """
+        destination_url = combine_urls(f"{staging_url}/", relative_path.as_posix())
+        copy_result = await await_settled(copy_async(str(source_path), destination_url, CopyBehavior.OVERWRITE))
+        _require_remote_success(copy_result, f"stage processed asset {relative_path.as_posix()}")
+
+    await _run_bounded(
+        [
+            functools.partial(stage, source_path, relative_path)
+            for source_path, relative_path in zip(source_paths, relative_paths)
+        ],
+        max_concurrent_transfers,
+    )
+
+
+async def _create_remote_directories(
+    root_url: str,
+    relative_directories: set[pathlib.Path],
+    max_concurrent_transfers: int,
+    *,
+    created: list[str] | None = None,
+) -> None:
+    """Create every missing remote directory below one existing root, one hierarchy level at a time.
+
+    The directories of a level are created concurrently once their parents exist. Existing directories are left as
+    they are, so no directory is inspected before its creation.
+
+    Args:
+        root_url: Existing remote root.
+        relative_directories: Relative directories to reproduce remotely. Their parents are created too.
+        max_concurrent_transfers: Number of directories created at the same time.
+        created: Receives the URLs of the directories this call created, parents first.
+
+    Raises:
+        RuntimeError: If a directory cannot be created.
+    """
+    directories_by_depth: dict[int, set[pathlib.PurePosixPath]] = {}
+    for relative_directory in relative_directories:
+        posix_directory = pathlib.PurePosixPath(relative_directory.as_posix())
+        for directory in (posix_directory, *posix_directory.parents):
+            if directory.parts:
+                directories_by_depth.setdefault(len(directory.parts), set()).add(directory)
+
+    async def create(directory_url: str) -> None:
+        """Create one remote directory and record it when it did not exist.
+
+        Args:
+            directory_url: Remote directory URL.
+
+        Raises:
+            RuntimeError: If the directory cannot be created.
+        """
+        operation = asyncio.ensure_future(create_folder_async(directory_url))
+        try:
+            create_result = await await_settled(operation)
+        finally:
+            if created is not None and _operation_result(operation) == ClientResult.OK:
+                created.append(directory_url)
+        if create_result != ClientResult.ERROR_ALREADY_EXISTS:
+            _require_remote_success(create_result, f"create asset publication directory {directory_url}")
+
+    for depth in sorted(directories_by_depth):
+        await _run_bounded(
+            [
+                functools.partial(create, combine_urls(f"{root_url.rstrip('/')}/", directory.as_posix()))
+                for directory in sorted(directories_by_depth[depth])
+            ],
+            max_concurrent_transfers,
+        )
+
+
+async def _run_bounded(operations: list[Callable[[], Awaitable[None]]], max_concurrency: int) -> None:
+    """Run independent remote operations with bounded concurrency and stop at the first failure.
+
+    The remaining operations are cancelled after a failure or a cancellation, and every started operation settles
+    before this returns, so rollback never races a transfer that is still running.
+
+    Args:
+        operations: Callables creating the operations to run.
+        max_concurrency: Number of operations running at the same time.
+
+    Raises:
+        RuntimeError: The first operation failure.
+        asyncio.CancelledError: If the awaiting caller is cancelled.
+    """
+    if not operations:
+        return
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(operation: Callable[[], Awaitable[None]]) -> None:
+        async with semaphore:
+            await operation()
+
+    tasks = [asyncio.ensure_future(run(operation)) for operation in operations]
+    cancelled = False
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        cancelled = True
+    for task in tasks:
+        task.cancel()
+    while not all(task.done() for task in tasks):
+        try:
+            await asyncio.wait([task for task in tasks if not task.done()])
+        except asyncio.CancelledError:
+            cancelled = True
+    errors = [task.exception() for task in tasks if not task.cancelled() and task.exception() is not None]
+    if cancelled:
+        raise asyncio.CancelledError()
+    if errors:
+        raise errors[0]
+
+
+async def _move_remote_path(source_url: str, destination_url: str, *, on_owned: Callable[[], None]) -> ClientResult:
+    """Move one remote path without replacing an existing destination and report when the destination is owned.
+
+    Args:
+        source_url: Remote path to move.
+        destination_url: Remote destination that must not exist.
+        on_owned: Called once the move created or copied the destination, even if the caller is cancelled.
+
+    Returns:
+        Client move result.
+    """
+    operation = asyncio.ensure_future(move_async(source_url, destination_url, CopyBehavior.ERROR_IF_EXISTS))
+    try:
+        move_result, _copied = await await_settled(operation)
+    finally:
+        if _move_owns_destination(operation):
+            on_owned()
+    return move_result
+
+
+def _operation_result(operation: asyncio.Future[ClientResult]) -> ClientResult | None:
+    """Return the result of a settled client operation.
+
+    Args:
+        operation: Client operation future.
+
+    Returns:
+        Client result, or ``None`` when the operation did not complete.
+    """
+    if not operation.done() or operation.cancelled() or operation.exception() is not None:
+        return None
+    return operation.result()
+
+
+async def _rollback_remote_delta(
+    final_url: str,
+    staging_url: str,
+    backup_url: str,
+    journal_url: str,
+    journal: _PublicationJournal,
+) -> str | None:
+    """Undo the journaled changes of one delta publication.
+
+    Committed files are moved back to staging and their previous versions restored from the backup, so an
+    interrupted rollback can be resumed from the same journal. A final path taken by a competing publisher in the
+    meantime is left untouched. Directories created by the publication are removed when they are empty again. The
+    journal and the transaction directories are kept when a file could not be restored.
+
+    Args:
+        final_url: Final remote output directory.
+        staging_url: Transaction staging directory.
+        backup_url: Transaction backup directory.
+        journal_url: Persisted journal of the publication.
+        journal: Remote changes made by the publication.
+
+    Returns:
+        Combined user-readable rollback errors, or ``None`` when rollback completed.
+    """
+    rollback_errors: list[str] = []
+    unrestorable_files: set[str] = set()
+    for relative_path in reversed(journal.committed_files):
+        move_result, _copied = await await_settled(
+            move_async(
+                combine_urls(f"{final_url}/", relative_path),
+                combine_urls(f"{staging_url}/", relative_path),
+                CopyBehavior.ERROR_IF_EXISTS,
+            )
+        )
+        if move_result not in (ClientResult.OK, ClientResult.ERROR_NOT_FOUND):
+            rollback_errors.append(f"Could not remove the processed asset output {relative_path} ({move_result})")
+            unrestorable_files.add(relative_path)
+
+    for relative_path in reversed(journal.backed_up_files):
+        if relative_path in unrestorable_files:
+            continue
+        move_result, _copied = await await_settled(
+            move_async(
+                combine_urls(f"{backup_url}/", relative_path),
+                combine_urls(f"{final_url}/", relative_path),
+                CopyBehavior.ERROR_IF_EXISTS,
+            )
+        )
+        if move_result not in (ClientResult.OK, ClientResult.ERROR_ALREADY_EXISTS):
+            rollback_errors.append(f"Could not restore the previous asset output {relative_path} ({move_result})")
+
+    for directory_url in reversed(journal.created_directories):
+        list_result, entries = await await_settled(list_async(directory_url))
+        if list_result == ClientResult.OK and not entries:
+            await _delete_remote_path(directory_url, required=False)
+
+    if rollback_errors:
+        return "; ".join(rollback_errors)
+    try:
+        await _delete_remote_path(journal_url, required=True)
+        await _delete_remote_path(staging_url, required=True)
+        await _delete_remote_path(backup_url, required=True)
+    except (asyncio.CancelledError, RuntimeError) as rollback_error:
+        rollback_errors.append(str(rollback_error))
+
+    return "; ".join(rollback_errors) or None
 
 
 async def _rollback_remote_publication(
@@ -284,7 +771,7 @@ async def _delete_remote_path(url: str, *, required: bool) -> None:
         return
     if required:
         raise RuntimeError(f"Could not remove incomplete asset output ({delete_result})")
-    carb.log_warn(f"Could not remove asset publication backup {url} ({delete_result})")
+    carb.log_warn(f"Could not remove asset publication transaction path {url} ({delete_result})")
 
 
 def _require_remote_success(result: ClientResult, action: str) -> None:
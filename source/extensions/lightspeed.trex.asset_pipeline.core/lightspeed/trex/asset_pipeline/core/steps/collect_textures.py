@@ -40,6 +40,18 @@ class CollectTexturesStep(PipelineStep):
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset(
+        {
+            "items.kind",
+            "items.value",
+            "items.source_path",
+            "execution_state",
+            "stage_context_name",
+            "_stage_context",
+            "_stage_path",
+        }
+    )
+    writes = frozenset({"items.textures", "items.texture_bindings", "_stage_context", "_stage_path"})
 
     @property
     def name(self) -> str:
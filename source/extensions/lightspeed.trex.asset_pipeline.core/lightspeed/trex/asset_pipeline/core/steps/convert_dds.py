@@ -19,23 +19,29 @@ from __future__ import annotations
 
 __all__ = ["ConvertDDSStep"]
 
+import asyncio
+import json
 import pathlib
 import subprocess
 
 import carb
+import carb.settings
 import carb.tokens
 from lightspeed.common.constants import NVTT_PATH, TEXTURE_INFO
 from omni.flux.asset_importer.core.data_models import TEXTURE_TYPE_INPUT_MAP, TextureTypes
-from omni.flux.asset_pipeline.core import PipelineContext, PipelineStep
-from omni.flux.utils.common.path_utils import hash_file, read_metadata, write_metadata
+from omni.flux.asset_pipeline.core import PipelineContext, PipelineItem, PipelineStep
+from omni.flux.utils.common.path_utils import hash_file, read_metadata, write_metadata_values
 
 from ..constants import (
+    DDS_DEFAULT_MAX_CONCURRENT_CONVERSIONS,
+    DDS_MAX_CONCURRENT_CONVERSIONS_SETTING_PATH,
     DDS_NVTT_ARGS_METADATA_KEY,
     DDS_SOURCE_HASH_METADATA_KEY,
     DDS_TEXTURE_TYPE_METADATA_KEY,
     NVTT_TIMEOUT_SECONDS,
 )
-from ..pipeline_context import RemixAssetPipelineContext
+from ..dds_artifact_store import DDSArtifactStore, get_dds_artifact_store
+from ..pipeline_context import PipelineOutputPath, RemixAssetPipelineContext
 from ..pipeline_item import RemixAssetItem, get_texture_source_path, iter_texture_assets
 from ..worker import run_in_worker_thread
 
@@ -157,9 +163,82 @@ def _write_dds_reuse_metadata(
     _validate_nvtt_args(extra_args)
     if source_hash is None:
         return
-    write_metadata(path, DDS_SOURCE_HASH_METADATA_KEY, source_hash)
-    write_metadata(path, DDS_TEXTURE_TYPE_METADATA_KEY, texture_type.name)
-    write_metadata(path, DDS_NVTT_ARGS_METADATA_KEY, extra_args)
+    write_metadata_values(
+        path,
+        {
+            DDS_SOURCE_HASH_METADATA_KEY: source_hash,
+            DDS_TEXTURE_TYPE_METADATA_KEY: texture_type.name,
+            DDS_NVTT_ARGS_METADATA_KEY: extra_args,
+        },
+    )
+
+
+def _convert_texture(
+    context: RemixAssetPipelineContext,
+    nvtt_path: str,
+    input_path: pathlib.Path,
+    output_path: PipelineOutputPath,
+    texture_type: TextureTypes,
+    artifact_store: DDSArtifactStore | None,
+) -> pathlib.Path:
+    """Produce the workspace DDS of one texture, reusing an earlier conversion when possible.
+
+    The final output of a previous run is reused first, then an artifact converted by any project from the same
+    source content and settings. NVTT only runs when neither exists.
+
+    Args:
+        context: Pipeline state owning the workspace.
+        nvtt_path: Executable path.
+        input_path: Source texture path.
+        output_path: Reserved workspace and final DDS paths.
+        texture_type: Texture semantic selecting compression settings.
+        artifact_store: Store of earlier conversions, or ``None`` to always convert.
+
+    Returns:
+        Workspace DDS path.
+
+    Raises:
+        subprocess.CalledProcessError: If NVTT exits with a non-zero status.
+        subprocess.TimeoutExpired: If NVTT exceeds the conversion timeout.
+    """
+    work_path = output_path.work_path
+    final_path = output_path.output_path
+    source_hash = _hash_existing_file(str(input_path))
+    extra_args = _get_nvtt_args(texture_type)
+
+    def convert(path: pathlib.Path) -> None:
+        carb.log_info(f"[ConvertDDS] Converting {input_path} -> {path}")
+        _run_nvtt(nvtt_path, str(input_path), str(path), extra_args)
+
+    if _can_reuse_dds_output(str(final_path), source_hash, texture_type, extra_args):
+        carb.log_info(f"[ConvertDDS] Reusing existing {final_path}")
+        context.copy_to_work_path(final_path, work_path)
+    elif artifact_store is not None and source_hash is not None:
+        key = artifact_store.get_key(source_hash, texture_type.name, extra_args)
+        if artifact_store.get_or_create(key, work_path, convert):
+            carb.log_info(f"[ConvertDDS] Reusing stored conversion of {input_path}")
+    else:
+        convert(work_path)
+
+    _write_dds_reuse_metadata(str(work_path), source_hash, texture_type, extra_args)
+    return work_path
+
+
+def _read_dds_reuse_metadata(path: pathlib.Path) -> list | None:
+    """Return the conversion input signature recorded on a workspace DDS.
+
+    Args:
+        path: Workspace DDS path.
+
+    Returns:
+        Source hash, texture type name and NVTT arguments, or ``None`` when the file carries no complete signature.
+    """
+    signature = [
+        read_metadata(str(path), DDS_SOURCE_HASH_METADATA_KEY),
+        read_metadata(str(path), DDS_TEXTURE_TYPE_METADATA_KEY),
+        read_metadata(str(path), DDS_NVTT_ARGS_METADATA_KEY),
+    ]
+    return None if None in signature else signature
 
 
 class ConvertDDSStep(PipelineStep):
@@ -167,6 +246,24 @@ class ConvertDDSStep(PipelineStep):
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset({"items.textures", "source_root", "work_dir", "output_dir"})
+    writes = frozenset({"items.textures", "_output_paths", "_used_output_paths"})
+
+    def __init__(
+        self,
+        artifact_store: DDSArtifactStore | None = None,
+        max_concurrent_conversions: int | None = None,
+    ):
+        """Create the step.
+
+        Args:
+            artifact_store: Store of earlier conversions. The process-wide store from the settings is used when omitted.
+            max_concurrent_conversions: Number of textures converted at the same time. Read from the settings when
+                omitted.
+        """
+        super().__init__()
+        self._artifact_store = artifact_store
+        self._max_concurrent_conversions = max_concurrent_conversions
 
     @property
     def name(self) -> str:
@@ -233,6 +330,79 @@ class ConvertDDSStep(PipelineStep):
         """
         return "all texture records already point to workspace DDS files"
 
+    def get_cache_key(self, context: PipelineContext, item: PipelineItem) -> str | None:
+        """Return the source hashes and NVTT settings deciding the DDS files of one item.
+
+        Items are only cached when an artifact store keeps the converted files the cached results point to.
+
+        Args:
+            context: Pipeline state owning the item.
+            item: Item whose textures are converted.
+
+        Returns:
+            JSON signature of the item textures, or ``None`` when a texture is missing or no artifact store is set.
+        """
+        if (self._artifact_store or get_dds_artifact_store()) is None:
+            return None
+        signature = []
+        for texture in item.textures:
+            source_hash = _hash_existing_file(str(texture.path))
+            if source_hash is None:
+                return None
+            if texture.path.suffix.lower() == ".dds":
+                signature.append([source_hash, "dds"])
+            else:
+                signature.append([source_hash, texture.texture_type.name, _get_nvtt_args(texture.texture_type)])
+        return json.dumps(signature, separators=(",", ":"))
+
+    def get_cached_result(self, context: PipelineContext, item: PipelineItem) -> list[list | None]:
+        """Return the conversion signatures of the DDS files written on one item.
+
+        Args:
+            context: Pipeline state owning the item.
+            item: Item whose textures were converted.
+
+        Returns:
+            One signature per texture, ``None`` for copied DDS inputs.
+        """
+        return [_read_dds_reuse_metadata(texture.path) for texture in item.textures]
+
+    def apply_cached_result(self, context: PipelineContext, item: PipelineItem, result: list[list | None]) -> bool:
+        """Place the stored DDS files of one item in the workspace without running NVTT.
+
+        Args:
+            context: Pipeline state owning the workspace.
+            item: Item whose textures receive the DDS files.
+            result: Conversion signatures returned by ``get_cached_result()`` for the same cache key.
+
+        Returns:
+            False when an artifact is no longer stored. The texture records are left unchanged in that case.
+        """
+        artifact_store = self._artifact_store or get_dds_artifact_store()
+        if artifact_store is None or len(result) != len(item.textures):
+            return False
+        work_paths = []
+        for texture, signature in zip(item.textures, result, strict=True):
+            output_path = context.reserve_output_path(
+                texture.path,
+                source_path=get_texture_source_path(texture),
+                stem_suffix=f".{texture.texture_type.name.lower()}",
+                suffix=".dds",
+            )
+            if texture.path.suffix.lower() == ".dds":
+                context.copy_to_work_path(texture.path, output_path.work_path)
+            elif signature is None or not artifact_store.fetch(
+                artifact_store.get_key(*signature), output_path.work_path
+            ):
+                return False
+            else:
+                source_hash, _texture_type, extra_args = signature
+                _write_dds_reuse_metadata(str(output_path.work_path), source_hash, texture.texture_type, extra_args)
+            work_paths.append(output_path.work_path)
+        for texture, work_path in zip(item.textures, work_paths, strict=True):
+            texture.path = work_path
+        return True
+
     async def run(self, context: RemixAssetPipelineContext) -> None:
         """Convert texture records to DDS or reuse an existing DDS output.
 
@@ -244,58 +414,67 @@ class ConvertDDSStep(PipelineStep):
             subprocess.TimeoutExpired: If NVTT exceeds the conversion timeout.
         """
         nvtt_path = carb.tokens.get_tokens_interface().resolve(NVTT_PATH)
+        artifact_store = self._artifact_store or get_dds_artifact_store()
+        max_concurrent_conversions = self._max_concurrent_conversions or (
+            carb.settings.get_settings().get(DDS_MAX_CONCURRENT_CONVERSIONS_SETTING_PATH)
+            or DDS_DEFAULT_MAX_CONCURRENT_CONVERSIONS
+        )
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_conversions))
+
+        async def produce(
+            texture_path: pathlib.Path, output_path: PipelineOutputPath, texture_type: TextureTypes
+        ) -> pathlib.Path:
+            """Stage or convert one texture once a conversion slot is free.
+
+            Args:
+                texture_path: Current texture path.
+                output_path: Reserved workspace and final DDS paths.
+                texture_type: Texture semantic selecting compression settings.
+
+            Returns:
+                Workspace DDS path.
+            """
+            async with semaphore:
+                if texture_path.suffix.lower() == ".dds":
+                    return await run_in_worker_thread(context.copy_to_work_path, texture_path, output_path.work_path)
+                return await run_in_worker_thread(
+                    _convert_texture, context, nvtt_path, texture_path, output_path, texture_type, artifact_store
+                )
 
-        for texture in iter_texture_assets(context):
-            semantic_suffix = f".{texture.texture_type.name.lower()}"
-            if texture.path.suffix.lower() == ".dds":
-                output_path = context.reserve_output_path(
+        # Output paths are reserved in texture order so their names stay deterministic
+        assignments = [
+            (
+                texture,
+                context.reserve_output_path(
                     texture.path,
                     source_path=get_texture_source_path(texture),
-                    stem_suffix=semantic_suffix,
+                    stem_suffix=f".{texture.texture_type.name.lower()}",
                     suffix=".dds",
-                )
-                texture.path = await run_in_worker_thread(
-                    context.copy_to_work_path, texture.path, output_path.work_path
-                )
-                continue
-
-            old_path = texture.path
-            source_hash = await run_in_worker_thread(_hash_existing_file, str(old_path))
-            extra_args = _get_nvtt_args(texture.texture_type)
-            output_path = context.reserve_output_path(
-                old_path,
-                source_path=get_texture_source_path(texture),
-                stem_suffix=semantic_suffix,
-                suffix=".dds",
+                ),
             )
-            new_path = output_path.work_path
-            final_path = output_path.output_path
-            if await run_in_worker_thread(
-                _can_reuse_dds_output,
-                str(final_path),
-                source_hash,
-                texture.texture_type,
-                extra_args,
-            ):
-                carb.log_info(f"[ConvertDDS] Reusing existing {final_path}")
-                texture.path = await run_in_worker_thread(context.copy_to_work_path, final_path, new_path)
-                await run_in_worker_thread(
-                    _write_dds_reuse_metadata,
-                    str(texture.path),
-                    source_hash,
-                    texture.texture_type,
-                    extra_args,
+            for texture in iter_texture_assets(context)
+        ]
+        # Textures sharing a workspace path share one conversion
+        tasks: dict[pathlib.Path, asyncio.Future[pathlib.Path]] = {}
+        for texture, output_path in assignments:
+            if output_path.work_path not in tasks:
+                tasks[output_path.work_path] = asyncio.ensure_future(
+                    produce(texture.path, output_path, texture.texture_type)
                 )
-                continue
-
-            carb.log_info(f"[ConvertDDS] Converting {old_path} -> {new_path}")
-            await run_in_worker_thread(_run_nvtt, nvtt_path, str(old_path), str(new_path), extra_args)
-            await run_in_worker_thread(
-                _write_dds_reuse_metadata,
-                str(new_path),
-                source_hash,
-                texture.texture_type,
-                extra_args,
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # Settle the remaining conversions before propagating the first failure
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        for texture, output_path in assignments:
+            texture.path = tasks[output_path.work_path].result()
+        if artifact_store is not None:
+            statistics = artifact_store.statistics
+            carb.log_info(
+                f"[ConvertDDS] Artifact store: {statistics.hits} hits, {statistics.misses} misses, "
+                f"{statistics.collapsed} collapsed, {statistics.evictions} evictions"
             )
-
-            texture.path = new_path
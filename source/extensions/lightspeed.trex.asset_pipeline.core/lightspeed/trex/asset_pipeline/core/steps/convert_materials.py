@@ -53,6 +53,10 @@ class ConvertMaterialsStep(PipelineStep):
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset(
+        {"items.kind", "items.value", "items.material_type", "stage_context_name", "_stage_context", "_stage_path"}
+    )
+    writes = frozenset({"_stage_context", "_stage_path"})
 
     @property
     def name(self) -> str:
@@ -128,15 +132,29 @@ class ConvertMaterialsStep(PipelineStep):
             target_output = _get_target_shader_output(item.material_type)
             material_paths = [prim.GetPath() for prim in stage.Traverse() if prim.IsA(UsdShade.Material)]
 
-            with _orphan_parameter_cleanup_disabled():
-                changed = False
-                for prim_path in material_paths:
-                    prim = stage.GetPrimAtPath(prim_path)
-                    if prim and prim.IsValid():
-                        changed = (
-                            await _convert_material_if_needed(context.stage_context_name, prim, target_output)
-                            or changed
+            converters = []
+            for prim_path in material_paths:
+                prim = stage.GetPrimAtPath(prim_path)
+                if prim and prim.IsValid():
+                    converter = await _get_material_converter(prim, target_output)
+                    if converter is not None:
+                        converters.append(converter)
+
+            changed = False
+            if converters:
+                with _orphan_parameter_cleanup_disabled():
+                    # Every material of the stage is written in one change block and one undo entry
+                    results = await MaterialConverterCore.convert_batch(context.stage_context_name, converters)
+                for result in results:
+                    if not result.success:
+                        raise RuntimeError(
+                            result.message
+                            or f"Failed to convert material {result.material_path} to {target_output.value}"
                         )
+                    carb.log_verbose(
+                        f"[ConvertMaterials] Converted {result.material_path} in {result.duration * 1000:.1f}ms"
+                    )
+                changed = any(not result.skipped for result in results)
 
             if changed:
                 context.save_stage()
@@ -174,28 +192,26 @@ def _orphan_parameter_cleanup_disabled() -> Iterator[None]:
                 _ORPHAN_PARAMETER_CLEANUP_PREVIOUS_VALUE = None
 
 
-async def _convert_material_if_needed(
-    context_name: str,
+async def _get_material_converter(
     material_prim: Usd.Prim,
     target_output: SupportedShaderOutputs,
-) -> bool:
-    """Convert a material unless it already authors the target shader.
+) -> ConverterBase | None:
+    """Build the converter of a material unless it already authors the target shader.
 
     Args:
-        context_name: USD context used by the material converter.
-        material_prim: Material prim whose shader should be inspected and converted.
+        material_prim: Material prim whose shader should be inspected.
         target_output: AperturePBR shader variant required by the asset.
 
     Returns:
-        True when conversion changed the material.
+        The converter of the material, or None when the material doesn't need to be converted.
 
     Raises:
-        RuntimeError: If no converter supports the shader or conversion fails.
+        RuntimeError: If no converter supports the shader.
         ValueError: If ``target_output`` is unsupported.
     """
     input_subidentifier = _get_material_shader_subidentifier(material_prim)
     if input_subidentifier == target_output.value:
-        return False
+        return None
 
     converter = await _build_converter(material_prim, input_subidentifier, target_output)
     if converter is None:
@@ -203,11 +219,7 @@ async def _convert_material_if_needed(
             f"Unsupported material shader '{input_subidentifier}' on {material_prim.GetPath()}; "
             f"cannot convert to {target_output.value}"
         )
-
-    success, message, _was_skipped = await MaterialConverterCore.convert(context_name, converter)
-    if not success:
-        raise RuntimeError(message or f"Failed to convert material {material_prim.GetPath()} to {target_output.value}")
-    return not _was_skipped
+    return converter
 
 
 def _get_material_shader_subidentifier(material_prim: Usd.Prim) -> str | None:
@@ -19,39 +19,60 @@ from __future__ import annotations
 
 __all__ = ["ConvertNormalStep"]
 
-from collections.abc import Callable
+import json
+import pathlib
 
 import carb
 from omni.flux.asset_importer.core.data_models import TextureTypes
-from omni.flux.asset_pipeline.core import PipelineContext, PipelineStep
-from omni.flux.utils.octahedral_converter import OctahedralConverter
+from omni.flux.asset_pipeline.core import PipelineContext, PipelineItem, PipelineStep
+from omni.flux.utils.common.path_utils import hash_file
+from omni.flux.utils.octahedral_converter import OctahedralConversion, OctahedralConverter
 
 from ..pipeline_context import RemixAssetPipelineContext
-from ..pipeline_item import RemixAssetItem, iter_texture_assets
+from ..pipeline_item import RemixAssetItem, TextureAsset, iter_texture_assets
 from ..worker import run_in_worker_thread
 
 
-def _get_normal_converter(texture_type: TextureTypes) -> Callable[[str, str], None] | None:
-    """Return the converter for one source normal-map semantic.
+def _is_opengl_normal(texture_type: TextureTypes) -> bool | None:
+    """Return the handedness of one source normal-map semantic.
 
     Args:
         texture_type: Texture semantic to resolve.
 
     Returns:
-        DirectX or OpenGL converter, or ``None`` for non-convertible semantics.
+        True for OpenGL normals, False for DirectX normals, or ``None`` for non-convertible semantics.
     """
     if texture_type is TextureTypes.NORMAL_DX:
-        return OctahedralConverter.convert_dx_file_to_octahedral
+        return False
     if texture_type is TextureTypes.NORMAL_OGL:
-        return OctahedralConverter.convert_ogl_file_to_octahedral
+        return True
     return None
 
 
+def _get_octahedral_work_path(context: RemixAssetPipelineContext, texture: TextureAsset) -> pathlib.Path:
+    """Return the workspace path receiving the octahedral conversion of one normal texture.
+
+    Args:
+        context: Pipeline state owning the workspace.
+        texture: DirectX or OpenGL normal texture.
+
+    Returns:
+        Workspace PNG path.
+    """
+    return context.get_work_path(
+        texture.path,
+        stem_suffix=f".{texture.texture_type.name.lower()}.octahedral",
+        suffix=".png",
+    )
+
+
 class ConvertNormalStep(PipelineStep):
     """Convert DirectX/OpenGL normal textures to octahedral normal textures."""
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset({"items.textures", "work_dir"})
+    writes = frozenset({"items.textures"})
 
     @property
     def name(self) -> str:
@@ -80,7 +101,7 @@ class ConvertNormalStep(PipelineStep):
         Returns:
             Whether any normal texture needs octahedral conversion.
         """
-        return any(_get_normal_converter(texture.texture_type) is not None for texture in iter_texture_assets(context))
+        return any(_is_opengl_normal(texture.texture_type) is not None for texture in iter_texture_assets(context))
 
     def validate(self, context: PipelineContext) -> list[str]:
         """Validate that the runner provided a work directory for converted files.
@@ -107,30 +128,119 @@ class ConvertNormalStep(PipelineStep):
         """
         return "no DirectX/OpenGL normal textures"
 
+    def get_cache_key(self, context: PipelineContext, item: PipelineItem) -> str | None:
+        """Return the semantics and source hashes deciding the converted normals of one item.
+
+        Args:
+            context: Pipeline state owning the item.
+            item: Item whose textures are converted.
+
+        Returns:
+            JSON signature of the item textures, or ``None`` when a normal texture to convert is missing.
+        """
+        signature = []
+        for texture in item.textures:
+            source_hash = None
+            if _is_opengl_normal(texture.texture_type) is not None:
+                if not texture.path.exists():
+                    return None
+                source_hash = hash_file(str(texture.path))
+            signature.append([texture.texture_type.name, source_hash])
+        return json.dumps(signature, separators=(",", ":"))
+
+    def get_cached_result(self, context: PipelineContext, item: PipelineItem) -> list[list[str] | None]:
+        """Return the octahedral files written on one item.
+
+        Args:
+            context: Pipeline state owning the item.
+            item: Item whose textures were converted.
+
+        Returns:
+            The workspace path and content hash of each converted texture, ``None`` for the other textures.
+        """
+        return [
+            [str(texture.path), hash_file(str(texture.path))]
+            if texture.texture_type is TextureTypes.NORMAL_OTH and context.is_in_work_dir(texture.path)
+            else None
+            for texture in item.textures
+        ]
+
+    def apply_cached_result(self, context: PipelineContext, item: PipelineItem, result: list[list[str] | None]) -> bool:
+        """Point the normal textures of one item back to octahedral files converted by an earlier run.
+
+        A converted file is only reused while it is still in this run's workspace with the content it was written with.
+
+        Args:
+            context: Pipeline state owning the workspace.
+            item: Item whose textures receive the converted files.
+            result: Converted files returned by ``get_cached_result()`` for the same cache key.
+
+        Returns:
+            False when a converted file is gone or changed. The texture records are left unchanged in that case.
+        """
+        if len(result) != len(item.textures):
+            return False
+        converted_paths = []
+        for texture, converted in zip(item.textures, result, strict=True):
+            if _is_opengl_normal(texture.texture_type) is None:
+                continue
+            if converted is None:
+                return False
+            converted_path, converted_hash = converted
+            work_path = _get_octahedral_work_path(context, texture)
+            if (
+                str(work_path) != converted_path
+                or not work_path.exists()
+                or hash_file(str(work_path)) != converted_hash
+            ):
+                return False
+            converted_paths.append((texture, work_path))
+        for texture, work_path in converted_paths:
+            texture.path = work_path
+            texture.texture_type = TextureTypes.NORMAL_OTH
+        return True
+
     async def run(self, context: RemixAssetPipelineContext) -> None:
         """Convert matching texture records in place.
 
         This mutates ``TextureAsset.path`` and ``TextureAsset.texture_type`` only.
         The owning ``RemixAssetItem`` object and item type stay unchanged.
+        All the textures are converted in one batch spread across worker processes.
 
         Args:
             context: Pipeline state containing texture records and the temporary work directory.
+
+        Raises:
+            RuntimeError: If a texture could not be converted. No texture record is updated in that case.
         """
+        textures = []
+        conversions = []
         for texture in iter_texture_assets(context):
-            converter = _get_normal_converter(texture.texture_type)
-            if converter is None:
+            opengl = _is_opengl_normal(texture.texture_type)
+            if opengl is None:
                 continue
 
             old_path = texture.path
-            source_semantic = texture.texture_type.name.lower()
-            new_path = context.get_work_path(
-                old_path,
-                stem_suffix=f".{source_semantic}.octahedral",
-                suffix=".png",
-            )
+            new_path = _get_octahedral_work_path(context, texture)
 
             carb.log_info(f"[ConvertNormal] Converting {old_path} -> {new_path}")
-            await run_in_worker_thread(converter, str(old_path), str(new_path))
+            textures.append((texture, new_path))
+            conversions.append(
+                OctahedralConversion(source_path=str(old_path), output_path=str(new_path), opengl=opengl)
+            )
+
+        if not conversions:
+            return
+
+        results = await run_in_worker_thread(OctahedralConverter.convert_files_to_octahedral, conversions)
+        failures = [result for result in results if not result.success]
+        if failures:
+            raise RuntimeError(
+                "Unable to convert the normal textures:\n"
+                + "\n".join(f"{result.conversion.source_path}: {result.message}" for result in failures)
+            )
 
+        for (texture, new_path), result in zip(textures, results, strict=True):
+            carb.log_info(f"[ConvertNormal] Converted {new_path} in {result.seconds:.2f}s")
             texture.path = new_path
             texture.texture_type = TextureTypes.NORMAL_OTH
@@ -19,27 +19,22 @@ from __future__ import annotations
 
 __all__ = ["TriangulateMeshesStep"]
 
-from dataclasses import dataclass
-
 import carb
 from omni.flux.asset_pipeline.core import PipelineContext, PipelineStep
+from omni.flux.utils.common import mesh as _mesh
 from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..pipeline_context import RemixAssetPipelineContext
 from ..pipeline_item import AssetKind, RemixAssetItem
 
 
-@dataclass
-class _SubsetFaces:
-    subset: UsdGeom.Subset
-    new_faces: list[int]
-
-
 class TriangulateMeshesStep(PipelineStep):
     """Triangulate model meshes after input standardization."""
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset({"items.kind", "items.value", "stage_context_name", "_stage_context", "_stage_path"})
+    writes = frozenset({"_stage_context", "_stage_path"})
 
     @property
     def name(self) -> str:
@@ -143,7 +138,7 @@ def _is_triangulated(face_counts: Vt.IntArray | None) -> bool:
     Returns:
         Whether the face counts describe only triangles.
     """
-    return face_counts is not None and all(face_count == 3 for face_count in face_counts)
+    return face_counts is not None and _mesh.is_triangulated(face_counts)
 
 
 def _triangulate_mesh(prim: Usd.Prim) -> bool:
@@ -172,11 +167,7 @@ def _triangulate_mesh(prim: Usd.Prim) -> bool:
     if not indices or not face_counts:
         return False
 
-    indices_offset = 0
-    new_face_counts = []
-    triangles = []
-    subsets: list[_SubsetFaces] = []
-    face_to_subsets: dict[int, list[_SubsetFaces]] = {}
+    triangulation = _mesh.triangulate_fan(face_counts, indices)
 
     for child_prim in prim.GetChildren():
         if child_prim.IsA(UsdGeom.Subset):
@@ -187,25 +178,10 @@ def _triangulate_mesh(prim: Usd.Prim) -> bool:
             subset_indices = subset_indices_attr.Get()
             if subset_indices is None:
                 continue
-            subset_faces = _SubsetFaces(subset=subset, new_faces=[])
-            subsets.append(subset_faces)
-            for old_face_index in subset_indices:
-                face_to_subsets.setdefault(old_face_index, []).append(subset_faces)
-
-    for old_face_index, face_count in enumerate(face_counts):
-        start_index = indices[indices_offset]
-        for face_index in range(face_count - 2):
-            for subset in face_to_subsets.get(old_face_index, []):
-                subset.new_faces.append(len(new_face_counts))
-            new_face_counts.append(3)
-            triangles.append(start_index)
-            triangles.append(indices[indices_offset + face_index + 1])
-            triangles.append(indices[indices_offset + face_index + 2])
-        indices_offset += face_count
-
-    for subset in subsets:
-        subset.subset.GetIndicesAttr().Set(subset.new_faces)
-
-    mesh.GetFaceVertexIndicesAttr().Set(triangles)
-    mesh.GetFaceVertexCountsAttr().Set(new_face_counts)
+            subset_indices_attr.Set(
+                _mesh.remap_subset_faces(subset_indices, triangulation.source_faces, len(face_counts))
+            )
+
+    mesh.GetFaceVertexIndicesAttr().Set(triangulation.face_vertex_indices)
+    mesh.GetFaceVertexCountsAttr().Set(triangulation.face_vertex_counts)
     return True
@@ -32,6 +32,21 @@ class UpdateTexturesStep(PipelineStep):
 
     context_type = RemixAssetPipelineContext
     item_types = (RemixAssetItem,)
+    reads = frozenset(
+        {
+            "items.kind",
+            "items.value",
+            "items.source_path",
+            "items.textures",
+            "items.texture_bindings",
+            "source_root",
+            "output_dir",
+            "stage_context_name",
+            "_stage_context",
+            "_stage_path",
+        }
+    )
+    writes = frozenset({"_stage_context", "_stage_path", "_output_paths", "_used_output_paths"})
 
     @property
     def name(self) -> str:
@@ -21,6 +21,7 @@ from .e2e.test_asset_processing_job import TestTextureProcessingJobE2E
 from .e2e.test_publication import TestAssetPublicationE2E
 from .unit.test_collect_textures import TestCollectTextures
 from .unit.test_convert_dds import TestConvertDDS
+from .unit.test_dds_artifact_store import TestDDSArtifactStore
 from .unit.test_convert_materials import TestConvertMaterials
 from .unit.test_convert_normal import TestConvertNormal
 from .unit.test_pipeline_builder import TestPipelineBuilder
@@ -43,6 +44,7 @@ __all__ = (
     "TestConvertMaterials",
     "TestConvertMaterialsE2E",
     "TestConvertNormal",
+    "TestDDSArtifactStore",
     "TestPipelineBuilder",
     "TestRemixAssetPipelineContext",
     "TestRemixAssetPipelineE2E",
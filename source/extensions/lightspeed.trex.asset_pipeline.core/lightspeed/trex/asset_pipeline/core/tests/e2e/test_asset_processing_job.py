@@ -166,6 +166,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual(completed_counts[-1], 2)
             self.assertTrue(all(value.total == 2 for value in progress))
             self.assertEqual(completed_counts, sorted(completed_counts))
+            interface.close()
 
     async def test_request_without_destination_publishes_to_durable_job_directory(self):
         """Project-independent processing keeps real outputs with the persisted queue job."""
@@ -202,6 +203,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
                 interface.get_job_outputs(job.job_id)[TextureProcessingJob.PROCESSED_TEXTURES],
                 outputs[TextureProcessingJob.PROCESSED_TEXTURES],
             )
+            interface.close()
 
     async def test_completed_outputs_reconstruct_through_fresh_queue_interface(self):
         """A fresh queue interface reconstructs a completed typed texture result."""
@@ -222,6 +224,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
 
             # Typed outputs survive serialization and reconstruct without relying on the original interface.
             self.assertEqual(restored_outputs, outputs)
+            interface.close()
 
     async def test_independent_jobs_preserve_source_hierarchy_in_shared_output_directory(self):
         """Independent jobs keep same-named source textures at distinct stable destinations."""
@@ -259,6 +262,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual(chair_output.relative_to(output_dir), pathlib.Path("textures/chair") / expected_name)
             self.assertTrue(table_output.exists())
             self.assertTrue(chair_output.exists())
+            interface.close()
 
     async def test_extension_shutdown_keeps_codecs_until_active_queue_work_drains(self):
         """Texture jobs serialize successful outputs after their product extension begins shutdown."""
@@ -279,6 +283,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
             # The active job completes and persists its typed output before core-owned registry teardown.
             self.assertIs(queue_job.snapshot().state, JobState.DONE)
             self.assertEqual(len(outputs[TextureProcessingJob.PROCESSED_TEXTURES].items), 1)
+            interface.close()
 
     async def test_connected_request_reaches_texture_job_through_real_scheduler(self):
         """A producer output supplies the exact connected texture-processing input."""
@@ -306,6 +311,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
             result = outputs[TextureProcessingJob.PROCESSED_TEXTURES]
             self.assertEqual(len(result.items), 1)
             self.assertEqual(result.items[0].key, "texture_1")
+            interface.close()
 
     async def test_queue_publication_failure_persists_failed_state_without_apply_ready_output(self):
         """A publication failure crosses the real queue boundary without durable outputs."""
@@ -339,6 +345,7 @@ class TestTextureProcessingJobE2E(omni.kit.test.AsyncTestCase):
             self.assertIs(snapshot.apply_disposition, ApplyDisposition.NOT_APPLICABLE)
             with self.assertRaises(KeyError):
                 interface.get_job_outputs(job.job_id)
+            interface.close()
 
 
 async def _run_until_outputs(queue_job, interface: QueueInterface) -> JobOutputs:
@@ -19,6 +19,7 @@ import json
 import pathlib
 import tempfile
 
+import carb.settings
 import omni.kit.app
 import omni.usd
 import omni.kit.test
@@ -33,9 +34,19 @@ from lightspeed.trex.asset_pipeline.core import (
     RemixAssetPipelineContext,
     run_remix_asset_pipeline,
 )
+from lightspeed.trex.asset_pipeline.core.constants import DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH
 
 
 class TestRemixAssetPipelineE2E(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        # Convert every texture for real instead of reusing the machine-wide artifact store
+        self._settings = carb.settings.get_settings()
+        self._original_store_enabled = self._settings.get(DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH)
+        self._settings.set(DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH, False)
+
+    async def tearDown(self):
+        self._settings.set(DDS_ARTIFACT_STORE_ENABLED_SETTING_PATH, self._original_store_enabled)
+
     async def test_texture_pipeline_processes_real_normal_map_to_final_dds(self):
         """The canonical pipeline processes a real normal texture into final published outputs."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -361,3 +361,254 @@ class TestAssetPublicationE2E(omni.kit.test.AsyncTestCase):
             published = remote_dir / "textures" / "chair" / "albedo.diffuse.dds"
             self.assertEqual(published.read_bytes(), b"processed")
             self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
+
+    async def test_remote_delta_transfers_only_the_batch_files(self):
+        """A delta publication copies the batch files without cloning the existing output directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            local_dir = temp_path / "local"
+            remote_dir = temp_path / "remote"
+            (local_dir / "textures" / "chair").mkdir(parents=True)
+            remote_dir.mkdir()
+            (remote_dir / "existing.dds").write_bytes(b"existing")
+            (remote_dir / "changed.dds").write_bytes(b"previous")
+            changed_source = local_dir / "changed.dds"
+            changed_source.write_bytes(b"changed")
+            nested_source = local_dir / "textures" / "chair" / "albedo.diffuse.dds"
+            nested_source.write_bytes(b"nested")
+            remote_url = omni.client.make_file_url(str(remote_dir))
+            real_copy_async = publication_module.copy_async
+            copied_sources = []
+
+            async def record_copy(source_url, destination_url, behavior):
+                """Record every copied source before running the real copy.
+
+                Args:
+                    source_url: Client source URL.
+                    destination_url: Client destination URL.
+                    behavior: Client collision behavior.
+
+                Returns:
+                    Real client copy result.
+                """
+                copied_sources.append(source_url)
+                return await real_copy_async(source_url, destination_url, behavior)
+
+            with mock.patch.object(publication_module, "copy_async", side_effect=record_copy):
+                # Publish one changed file and one new nested file over an existing output directory.
+                await publication_module._publish_remote_delta(
+                    [changed_source, nested_source], local_dir, remote_url, max_concurrent_transfers=2
+                )
+
+            # Only the batch files are copied, existing files are untouched, and no transaction path remains.
+            self.assertCountEqual(copied_sources, [str(changed_source), str(nested_source)])
+            self.assertEqual((remote_dir / "existing.dds").read_bytes(), b"existing")
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"changed")
+            self.assertEqual((remote_dir / "textures" / "chair" / "albedo.diffuse.dds").read_bytes(), b"nested")
+            self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
+
+    async def test_remote_delta_commit_failure_restores_previous_files(self):
+        """A failed per-file commit rolls back every file already committed by the batch."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            local_dir = temp_path / "local"
+            remote_dir = temp_path / "remote"
+            (local_dir / "textures").mkdir(parents=True)
+            remote_dir.mkdir()
+            (remote_dir / "changed.dds").write_bytes(b"previous")
+            changed_source = local_dir / "changed.dds"
+            changed_source.write_bytes(b"changed")
+            new_source = local_dir / "textures" / "new.dds"
+            new_source.write_bytes(b"new")
+            remote_url = omni.client.make_file_url(str(remote_dir))
+            real_move_async = publication_module.move_async
+            changed_committed = asyncio.Event()
+
+            async def fail_new_commit(source_url, destination_url, behavior):
+                """Fail the commit of the new file once the changed file is committed.
+
+                Args:
+                    source_url: Client source URL.
+                    destination_url: Client destination URL.
+                    behavior: Client collision behavior.
+
+                Returns:
+                    Real client result except for the injected commit failure.
+                """
+                if source_url.startswith(f"{remote_url}.asset_pipeline_staging_"):
+                    if source_url.endswith("new.dds"):
+                        await changed_committed.wait()
+                        return omni.client.Result.ERROR, False
+                    result = await real_move_async(source_url, destination_url, behavior)
+                    changed_committed.set()
+                    return result
+                return await real_move_async(source_url, destination_url, behavior)
+
+            with (
+                mock.patch.object(publication_module, "move_async", side_effect=fail_new_commit),
+                self.assertRaises(RuntimeError) as error,
+            ):
+                # Commit the changed file, then fail the new file of the same batch.
+                await publication_module._publish_remote_delta([changed_source, new_source], local_dir, remote_url)
+
+            # The journal restores the previous file and removes the directory created for the new file.
+            self.assertIn("commit processed asset textures/new.dds", str(error.exception))
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"previous")
+            self.assertFalse((remote_dir / "textures").exists())
+            self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
+
+    async def test_remote_delta_cancellation_restores_previous_files(self):
+        """Cancellation during a delta commit settles the transfers and restores the previous output."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            local_dir = temp_path / "local"
+            remote_dir = temp_path / "remote"
+            local_dir.mkdir()
+            remote_dir.mkdir()
+            (remote_dir / "changed.dds").write_bytes(b"previous")
+            source = local_dir / "changed.dds"
+            source.write_bytes(b"changed")
+            remote_url = omni.client.make_file_url(str(remote_dir))
+            real_move_async = publication_module.move_async
+            committed = asyncio.Event()
+            release_commit = asyncio.Event()
+
+            async def pause_after_commit(source_url, destination_url, behavior):
+                """Pause after the real staging-to-final file move succeeds.
+
+                Args:
+                    source_url: Client source URL.
+                    destination_url: Client destination URL.
+                    behavior: Client collision behavior.
+
+                Returns:
+                    Real client move result.
+                """
+                result = await real_move_async(source_url, destination_url, behavior)
+                if source_url.startswith(f"{remote_url}.asset_pipeline_staging_"):
+                    committed.set()
+                    await release_commit.wait()
+                return result
+
+            with mock.patch.object(publication_module, "move_async", side_effect=pause_after_commit):
+                # Cancel the publication while the committed move settles.
+                publication_task = asyncio.create_task(
+                    publication_module._publish_remote_delta([source], local_dir, remote_url)
+                )
+                await committed.wait()
+                publication_task.cancel()
+                release_commit.set()
+                with self.assertRaises(asyncio.CancelledError):
+                    await publication_task
+
+            # The committed file is replaced by its previous version and no transaction path remains.
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"previous")
+            self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
+
+    async def test_remote_delta_interrupted_by_process_exit_restores_previous_files(self):
+        """An exception that is not an error, such as a process exit, still rolls back the committed files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            local_dir = temp_path / "local"
+            remote_dir = temp_path / "remote"
+            local_dir.mkdir()
+            remote_dir.mkdir()
+            (remote_dir / "changed.dds").write_bytes(b"previous")
+            changed_source = local_dir / "changed.dds"
+            changed_source.write_bytes(b"changed")
+            new_source = local_dir / "new.dds"
+            new_source.write_bytes(b"new")
+            remote_url = omni.client.make_file_url(str(remote_dir))
+            real_move_async = publication_module.move_async
+            changed_committed = asyncio.Event()
+
+            class ProcessExit(BaseException):
+                """Stand-in for an exit request raised through the publication."""
+
+            async def exit_on_new_commit(source_url, destination_url, behavior):
+                """Raise the exit request on the commit of the new file once the changed file is committed.
+
+                Args:
+                    source_url: Client source URL.
+                    destination_url: Client destination URL.
+                    behavior: Client collision behavior.
+
+                Returns:
+                    Real client move result.
+
+                Raises:
+                    ProcessExit: On the commit of the new file.
+                """
+                if source_url.startswith(f"{remote_url}.asset_pipeline_staging_"):
+                    if source_url.endswith("new.dds"):
+                        await changed_committed.wait()
+                        raise ProcessExit()
+                    result = await real_move_async(source_url, destination_url, behavior)
+                    changed_committed.set()
+                    return result
+                return await real_move_async(source_url, destination_url, behavior)
+
+            with (
+                mock.patch.object(publication_module, "move_async", side_effect=exit_on_new_commit),
+                self.assertRaises(ProcessExit),
+            ):
+                # Commit the changed file, then exit during the commit of the new file.
+                await publication_module._publish_remote_delta([changed_source, new_source], local_dir, remote_url)
+
+            # The exit request is propagated only after the previous output is restored.
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"previous")
+            self.assertFalse((remote_dir / "new.dds").exists())
+            self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
+
+    async def test_remote_delta_left_by_dead_process_is_rolled_back_by_next_publication(self):
+        """The persisted journal lets the next publication undo a batch whose process died mid-commit."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir)
+            local_dir = temp_path / "local"
+            remote_dir = temp_path / "remote"
+            (local_dir / "textures").mkdir(parents=True)
+            remote_dir.mkdir()
+            (remote_dir / "existing.dds").write_bytes(b"existing")
+            (remote_dir / "changed.dds").write_bytes(b"previous")
+            changed_source = local_dir / "changed.dds"
+            changed_source.write_bytes(b"changed")
+            new_source = local_dir / "textures" / "new.dds"
+            new_source.write_bytes(b"new")
+            remote_url = omni.client.make_file_url(str(remote_dir))
+            real_move_async = publication_module.move_async
+
+            async def fail_new_commit(source_url, destination_url, behavior):
+                """Fail the commit of the new file so the batch is left half committed.
+
+                Args:
+                    source_url: Client source URL.
+                    destination_url: Client destination URL.
+                    behavior: Client collision behavior.
+
+                Returns:
+                    Real client result except for the injected commit failure.
+                """
+                if source_url.startswith(f"{remote_url}.asset_pipeline_staging_") and source_url.endswith("new.dds"):
+                    return omni.client.Result.ERROR, False
+                return await real_move_async(source_url, destination_url, behavior)
+
+            with (
+                mock.patch.object(publication_module, "move_async", side_effect=fail_new_commit),
+                mock.patch.object(publication_module, "_rollback_remote_delta", return_value=None),
+                self.assertRaises(RuntimeError),
+            ):
+                # Leave the batch half committed, as a process dying before its rollback would.
+                await publication_module._publish_remote_delta(
+                    [changed_source, new_source], local_dir, remote_url, max_concurrent_transfers=1
+                )
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"changed")
+            self.assertEqual(len(list(temp_path.glob("remote.asset_pipeline_journal_*.json"))), 1)
+
+            # Recover the output directory as the next publication does before transferring anything.
+            await publication_module._recover_remote_deltas(remote_url, 2)
+
+            # The previous output is restored and the interrupted transaction leaves nothing behind.
+            self.assertEqual((remote_dir / "existing.dds").read_bytes(), b"existing")
+            self.assertEqual((remote_dir / "changed.dds").read_bytes(), b"previous")
+            self.assertFalse((remote_dir / "textures").exists())
+            self.assertEqual(list(temp_path.glob("remote.asset_pipeline_*")), [])
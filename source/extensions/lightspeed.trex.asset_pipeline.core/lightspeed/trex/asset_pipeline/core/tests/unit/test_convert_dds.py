@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import asyncio
 import json
 import pathlib
 import tempfile
@@ -24,6 +25,7 @@ from unittest.mock import patch
 import omni.kit.test
 from lightspeed.common.constants import NVTT_PATH, TEXTURE_INFO
 from omni.flux.asset_importer.core.data_models import TEXTURE_TYPE_INPUT_MAP, TextureTypes
+from omni.flux.asset_pipeline.core import PipelineStepCache, run_pipeline
 
 import lightspeed.trex.asset_pipeline.core.steps.convert_dds as convert_dds_module
 from lightspeed.trex.asset_pipeline.core.constants import (
@@ -31,6 +33,7 @@ from lightspeed.trex.asset_pipeline.core.constants import (
     DDS_SOURCE_HASH_METADATA_KEY,
     DDS_TEXTURE_TYPE_METADATA_KEY,
 )
+from lightspeed.trex.asset_pipeline.core.dds_artifact_store import DDSArtifactStore
 from lightspeed.trex.asset_pipeline.core.steps import ConvertDDSStep
 from lightspeed.trex.asset_pipeline.core import (
     MaterialType,
@@ -39,9 +42,34 @@ from lightspeed.trex.asset_pipeline.core import (
 )
 
 
+def _write_fake_dds(_nvtt_path, _input_path, output_path, _extra_args) -> None:
+    pathlib.Path(output_path).write_bytes(b"dds")
+
+
 class TestConvertDDS(omni.kit.test.AsyncTestCase):
     """Test DDS conversion behavior."""
 
+    async def setUp(self):
+        # Keep the tests away from the machine-wide artifact store
+        self._store_dir = tempfile.TemporaryDirectory()
+        self._store = DDSArtifactStore(pathlib.Path(self._store_dir.name))
+
+    async def tearDown(self):
+        self._store_dir.cleanup()
+        self._store_dir = None
+        self._store = None
+
+    def _create_step(self, max_concurrent_conversions: int | None = None) -> ConvertDDSStep:
+        """Create a DDS conversion step using the temporary artifact store of the test.
+
+        Args:
+            max_concurrent_conversions: Number of textures converted at the same time.
+
+        Returns:
+            The step to test.
+        """
+        return ConvertDDSStep(artifact_store=self._store, max_concurrent_conversions=max_concurrent_conversions)
+
     async def test_run_converts_texture_records_without_replacing_item(self):
         """Non-DDS texture records convert off-thread without replacing their owning item."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -51,7 +79,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
             item = RemixAssetItem.from_texture(pathlib.Path("/textures/albedo.png"), TextureTypes.DIFFUSE)
             original_item = item
             context = RemixAssetPipelineContext(items=[item], work_dir=output_dir, output_dir=output_dir)
-            step = ConvertDDSStep()
+            step = self._create_step()
             caller_thread = threading.get_ident()
             worker_threads = []
 
@@ -106,7 +134,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
 
             with patch.object(convert_dds_module, "_run_nvtt") as mock_nvtt:
                 # Act
-                await ConvertDDSStep().run(context)
+                await self._create_step().run(context)
 
             # Assert
             mock_nvtt.assert_called_once()
@@ -146,7 +174,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
 
             with patch.object(convert_dds_module, "_run_nvtt") as mock_nvtt:
                 # Act
-                await ConvertDDSStep().run(context)
+                await self._create_step().run(context)
 
             # Assert
             self.assertEqual(item.textures[0].path, expected_work_path)
@@ -170,7 +198,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
             context = RemixAssetPipelineContext(items=[item], work_dir=work_dir, output_dir=output_dir)
 
             # Act
-            await ConvertDDSStep().run(context)
+            await self._create_step().run(context)
 
             # Assert
             self.assertEqual(item.textures[0].path.parent.parent, work_dir)
@@ -207,7 +235,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
 
             with patch.object(convert_dds_module, "_run_nvtt") as mock_nvtt:
                 # Act
-                await ConvertDDSStep().run(context)
+                await self._create_step().run(context)
 
             # Assert
             self.assertEqual(item.textures[0].path.name, "albedo.diffuse.dds")
@@ -252,7 +280,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
 
             with patch.object(convert_dds_module, "_run_nvtt") as mock_nvtt:
                 # Act
-                await ConvertDDSStep().run(context)
+                await self._create_step().run(context)
 
             # Assert
             self.assertEqual(mock_nvtt.call_count, 2)
@@ -262,6 +290,191 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
             self.assertEqual(second_item.textures[0].path.parent.parent, work_dir)
             self.assertNotEqual(first_item.textures[0].path, second_item.textures[0].path)
 
+    async def test_run_reuses_stored_conversion_across_projects(self):
+        """A source converted by one project is reused by another project from the artifact store."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            source_path = temp_path / "albedo.png"
+            source_path.write_bytes(b"png")
+            store = self._store
+            items = []
+            contexts = []
+            for project in ("first", "second"):
+                work_dir = temp_path / project / "work"
+                output_dir = temp_path / project / "processed"
+                work_dir.mkdir(parents=True)
+                output_dir.mkdir(parents=True)
+                items.append(RemixAssetItem.from_texture(source_path, TextureTypes.DIFFUSE))
+                contexts.append(RemixAssetPipelineContext(items=[items[-1]], work_dir=work_dir, output_dir=output_dir))
+
+            def run_nvtt(_nvtt_path, _input_path, output_path, _extra_args) -> None:
+                """Write a fake DDS where NVTT would.
+
+                Args:
+                    _nvtt_path: Unused executable path.
+                    _input_path: Unused source path.
+                    output_path: DDS path to write.
+                    _extra_args: Unused NVTT arguments.
+                """
+                pathlib.Path(output_path).write_bytes(b"dds")
+
+            with patch.object(convert_dds_module, "_run_nvtt", side_effect=run_nvtt) as mock_nvtt:
+                # Act
+                for context in contexts:
+                    await self._create_step().run(context)
+
+            # Assert
+            mock_nvtt.assert_called_once()
+            second_path = items[1].textures[0].path
+            self.assertEqual(second_path.parent.parent, temp_path / "second" / "work")
+            self.assertEqual(second_path.read_bytes(), b"dds")
+            self.assertEqual(
+                json.loads(second_path.with_suffix(".dds.meta").read_text())[DDS_TEXTURE_TYPE_METADATA_KEY],
+                TextureTypes.DIFFUSE.name,
+            )
+            self.assertEqual((store.statistics.hits, store.statistics.misses), (1, 1))
+
+    async def test_pipeline_cache_reuses_conversion_of_unchanged_texture(self):
+        """A pipeline run with a step cache places the stored DDS of an unchanged texture without running the step."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            source_path = temp_path / "albedo.png"
+            source_path.write_bytes(b"png")
+            cache = PipelineStepCache()
+            contexts = []
+            for project in ("first", "second"):
+                work_dir = temp_path / project / "work"
+                output_dir = temp_path / project / "processed"
+                work_dir.mkdir(parents=True)
+                output_dir.mkdir(parents=True)
+                item = RemixAssetItem.from_texture(source_path, TextureTypes.DIFFUSE)
+                contexts.append(RemixAssetPipelineContext(items=[item], work_dir=work_dir, output_dir=output_dir))
+
+            with patch.object(convert_dds_module, "_run_nvtt", side_effect=_write_fake_dds) as mock_nvtt:
+                # Act
+                for context in contexts:
+                    await run_pipeline([self._create_step()], context, cache=cache)
+
+            # Assert
+            mock_nvtt.assert_called_once()
+            state = contexts[1].execution_state["convert_dds"]
+            self.assertTrue(state.was_skipped)
+            self.assertEqual(state.skip_reason, "cached")
+            self.assertEqual(state.cached_item_count, 1)
+            texture_path = contexts[1].items[0].textures[0].path
+            self.assertTrue(contexts[1].is_in_work_dir(texture_path))
+            self.assertEqual(texture_path.suffix, ".dds")
+            self.assertEqual(texture_path.read_bytes(), b"dds")
+            self.assertEqual(
+                json.loads(texture_path.with_suffix(".dds.meta").read_text())[DDS_TEXTURE_TYPE_METADATA_KEY],
+                TextureTypes.DIFFUSE.name,
+            )
+            self.assertEqual(
+                contexts[1].get_output_path(texture_path), temp_path / "second" / "processed" / texture_path.name
+            )
+
+    async def test_pipeline_cache_converts_again_when_stored_artifact_is_gone(self):
+        """A cached result pointing to an artifact no longer stored falls back to running the step."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            source_path = temp_path / "albedo.png"
+            source_path.write_bytes(b"png")
+            cache = PipelineStepCache()
+            runs = []
+            for project in ("first", "second"):
+                work_dir = temp_path / project / "work"
+                output_dir = temp_path / project / "processed"
+                work_dir.mkdir(parents=True)
+                output_dir.mkdir(parents=True)
+                item = RemixAssetItem.from_texture(source_path, TextureTypes.DIFFUSE)
+                context = RemixAssetPipelineContext(items=[item], work_dir=work_dir, output_dir=output_dir)
+                # Each run uses its own empty artifact store
+                store = DDSArtifactStore(temp_path / project / "store")
+                runs.append((ConvertDDSStep(artifact_store=store), context))
+
+            with patch.object(convert_dds_module, "_run_nvtt", side_effect=_write_fake_dds) as mock_nvtt:
+                # Act
+                for step, context in runs:
+                    await run_pipeline([step], context, cache=cache)
+
+            # Assert
+            self.assertEqual(mock_nvtt.call_count, 2)
+            state = runs[1][1].execution_state["convert_dds"]
+            self.assertTrue(state.did_run)
+            self.assertEqual(state.cached_item_count, 0)
+            self.assertEqual(runs[1][1].items[0].textures[0].path.read_bytes(), b"dds")
+
+    async def test_run_limits_concurrent_conversions(self):
+        """Textures convert in parallel without exceeding the configured number of NVTT processes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            output_dir = temp_path / "processed"
+            output_dir.mkdir()
+            items = [
+                RemixAssetItem.from_texture(pathlib.Path(f"/textures/albedo_{index}.png"), TextureTypes.DIFFUSE)
+                for index in range(6)
+            ]
+            context = RemixAssetPipelineContext(items=items, work_dir=output_dir, output_dir=output_dir)
+            lock = threading.Lock()
+            started = 0
+            both_started = threading.Event()
+            release = threading.Event()
+
+            def run_nvtt(*_args) -> None:
+                """Count the mocked NVTT invocations and hold them until the test releases them.
+
+                Args:
+                    *_args: Arguments passed to the mocked NVTT invocation.
+                """
+                nonlocal started
+                with lock:
+                    started += 1
+                    if started == 2:
+                        both_started.set()
+                release.wait()
+
+            with patch.object(convert_dds_module, "_run_nvtt", side_effect=run_nvtt) as mock_nvtt:
+                # Act
+                run_task = asyncio.ensure_future(self._create_step(max_concurrent_conversions=2).run(context))
+                # Every conversion task has tried to take a slot by the time the test resumes
+                both_started_in_time = await asyncio.to_thread(both_started.wait, 5)
+                with lock:
+                    started_while_held = started
+                release.set()
+                await run_task
+
+            # Assert
+            self.assertTrue(both_started_in_time)
+            self.assertEqual(started_while_held, 2)
+            self.assertEqual(mock_nvtt.call_count, 6)
+            self.assertEqual(
+                [item.textures[0].path.name for item in items], [f"albedo_{index}.diffuse.dds" for index in range(6)]
+            )
+
+    async def test_run_converts_textures_sharing_a_work_path_once(self):
+        """Texture records resolving to the same workspace DDS share one conversion."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            output_dir = pathlib.Path(temp_dir) / "processed"
+            output_dir.mkdir()
+            first_item = RemixAssetItem.from_texture(pathlib.Path("/textures/albedo.png"), TextureTypes.DIFFUSE)
+            second_item = RemixAssetItem.from_texture(pathlib.Path("/textures/albedo.png"), TextureTypes.DIFFUSE)
+            context = RemixAssetPipelineContext(
+                items=[first_item, second_item], work_dir=output_dir, output_dir=output_dir
+            )
+
+            with patch.object(convert_dds_module, "_run_nvtt") as mock_nvtt:
+                # Act
+                await self._create_step().run(context)
+
+            # Assert
+            mock_nvtt.assert_called_once()
+            self.assertEqual(first_item.textures[0].path, second_item.textures[0].path)
+
     async def test_should_run_returns_false_when_all_texture_records_are_dds(self):
         """should_run returns False when all texture records already point to DDS files."""
         # Arrange
@@ -269,7 +482,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
         context = RemixAssetPipelineContext(items=[item])
 
         # Act
-        should_run = ConvertDDSStep().should_run(context)
+        should_run = self._create_step().should_run(context)
 
         # Assert
         self.assertFalse(should_run)
@@ -281,7 +494,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
         context = RemixAssetPipelineContext(items=[item])
 
         # Act
-        should_run = ConvertDDSStep().should_run(context)
+        should_run = self._create_step().should_run(context)
 
         # Assert
         self.assertFalse(should_run)
@@ -293,7 +506,7 @@ class TestConvertDDS(omni.kit.test.AsyncTestCase):
         context = RemixAssetPipelineContext(items=[item])
 
         # Act
-        should_run = ConvertDDSStep().should_run(context)
+        should_run = self._create_step().should_run(context)
 
         # Assert
         self.assertTrue(should_run)
@@ -20,6 +20,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import omni.kit.test
 from omni.flux.asset_pipeline.core import PipelineContext
+from omni.flux.utils.material_converter import MaterialConversionResult
 from omni.flux.utils.material_converter.utils import SupportedShaderInputs, SupportedShaderOutputs
 
 from lightspeed.trex.asset_pipeline.core import AssetKind, MaterialType, RemixAssetItem, RemixAssetPipelineContext
@@ -114,13 +115,49 @@ class TestConvertMaterials(omni.kit.test.AsyncTestCase):
         context.open_stage = MagicMock(return_value=stage)
         context.save_stage = MagicMock()
 
-        with patch.object(convert_materials_module, "_convert_material_if_needed", AsyncMock(return_value=False)):
+        with (
+            patch.object(convert_materials_module, "_get_material_converter", AsyncMock(return_value=None)),
+            patch.object(convert_materials_module.MaterialConverterCore, "convert_batch") as convert_batch_mock,
+        ):
             # Act
             await ConvertMaterialsStep().run(context)
 
         # Assert
+        convert_batch_mock.assert_not_called()
         context.save_stage.assert_not_called()
 
+    async def test_run_converts_every_material_of_a_stage_in_one_batch(self):
+        """All the materials of a model are converted together and a failure stops the step."""
+        # Arrange
+        material_prims = [MagicMock(), MagicMock()]
+        for index, material_prim in enumerate(material_prims):
+            material_prim.GetPath.return_value = f"/World/Looks/Material{index}"
+        stage = MagicMock()
+        stage.Traverse.return_value = material_prims
+        stage.GetPrimAtPath.side_effect = material_prims
+        item = RemixAssetItem.from_model(pathlib.Path("/models/chair.usd"), MaterialType.OPAQUE)
+        context = RemixAssetPipelineContext(items=[item])
+        context.open_stage = MagicMock(return_value=stage)
+        context.save_stage = MagicMock()
+        converters = [MagicMock(), MagicMock()]
+        results = [
+            MaterialConversionResult("/World/Looks/Material0", True, None, False),
+            MaterialConversionResult("/World/Looks/Material1", True, None, True),
+        ]
+
+        with (
+            patch.object(convert_materials_module, "_get_material_converter", AsyncMock(side_effect=converters)),
+            patch.object(
+                convert_materials_module.MaterialConverterCore, "convert_batch", AsyncMock(return_value=results)
+            ) as convert_batch_mock,
+        ):
+            # Act
+            await ConvertMaterialsStep().run(context)
+
+        # Assert
+        convert_batch_mock.assert_awaited_once_with(context.stage_context_name, converters)
+        context.save_stage.assert_called_once_with()
+
     async def test_orphan_parameter_cleanup_restores_after_last_context(self):
         """Concurrent material conversion guards keep cleanup disabled until the last user exits."""
         # Arrange
@@ -22,6 +22,8 @@ from unittest.mock import MagicMock, patch
 
 import omni.kit.test
 from omni.flux.asset_importer.core.data_models import TextureTypes
+from omni.flux.asset_pipeline.core import PipelineStepCache, run_pipeline
+from omni.flux.utils.octahedral_converter import OctahedralConversionResult
 
 import lightspeed.trex.asset_pipeline.core.steps.convert_normal as convert_normal_module
 from lightspeed.trex.asset_pipeline.core.steps import ConvertNormalStep
@@ -31,6 +33,18 @@ from lightspeed.trex.asset_pipeline.core import (
 )
 
 
+def _convert(conversions, worker_threads=None, success=True):
+    if worker_threads is not None:
+        worker_threads.append(threading.get_ident())
+    return [OctahedralConversionResult(conversion=conversion, success=success) for conversion in conversions]
+
+
+def _write_octahedral(conversions):
+    for conversion in conversions:
+        pathlib.Path(conversion.output_path).write_bytes(b"octahedral")
+    return _convert(conversions)
+
+
 class TestConvertNormal(omni.kit.test.AsyncTestCase):
     """Test normal-map conversion behavior."""
 
@@ -40,7 +54,7 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
             # Arrange
             caller_thread = threading.get_ident()
             worker_threads = []
-            mock_converter = MagicMock(side_effect=lambda *_args: worker_threads.append(threading.get_ident()))
+            mock_converter = MagicMock(side_effect=lambda conversions: _convert(conversions, worker_threads))
             output_dir = pathlib.Path(temp_dir) / "processed"
             output_dir.mkdir()
             item = RemixAssetItem.from_texture(pathlib.Path("/textures/normal.png"), TextureTypes.NORMAL_DX)
@@ -49,7 +63,7 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
 
             with patch.object(
                 convert_normal_module.OctahedralConverter,
-                "convert_dx_file_to_octahedral",
+                "convert_files_to_octahedral",
                 mock_converter,
             ):
                 # Act
@@ -62,6 +76,9 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
             self.assertEqual(item.textures[0].path.parent.parent, output_dir)
             self.assertEqual(item.textures[0].texture_type, TextureTypes.NORMAL_OTH)
             mock_converter.assert_called_once()
+            (conversion,) = mock_converter.call_args.args[0]
+            self.assertFalse(conversion.opengl)
+            self.assertEqual(conversion.output_path, str(item.textures[0].path))
             self.assertTrue(worker_threads)
             self.assertNotIn(caller_thread, worker_threads)
 
@@ -69,7 +86,7 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
         """NORMAL_OGL records are converted to octahedral normals."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Arrange
-            mock_converter = MagicMock()
+            mock_converter = MagicMock(side_effect=_convert)
             output_dir = pathlib.Path(temp_dir) / "processed"
             output_dir.mkdir()
             item = RemixAssetItem.from_texture(pathlib.Path("/textures/normal.png"), TextureTypes.NORMAL_OGL)
@@ -77,7 +94,7 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
 
             with patch.object(
                 convert_normal_module.OctahedralConverter,
-                "convert_ogl_file_to_octahedral",
+                "convert_files_to_octahedral",
                 mock_converter,
             ):
                 # Act
@@ -88,6 +105,52 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
             self.assertEqual(item.textures[0].path.parent.parent, output_dir)
             self.assertEqual(item.textures[0].texture_type, TextureTypes.NORMAL_OTH)
             mock_converter.assert_called_once()
+            self.assertTrue(mock_converter.call_args.args[0][0].opengl)
+
+    async def test_run_converts_every_normal_texture_in_one_batch(self):
+        """Every normal texture record is converted by a single batch call."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            mock_converter = MagicMock(side_effect=_convert)
+            items = [
+                RemixAssetItem.from_texture(pathlib.Path(f"/textures/normal_{index}.png"), texture_type)
+                for index, texture_type in enumerate([TextureTypes.NORMAL_DX, TextureTypes.NORMAL_OGL])
+            ]
+            context = RemixAssetPipelineContext(items=items, work_dir=pathlib.Path(temp_dir))
+
+            with patch.object(
+                convert_normal_module.OctahedralConverter,
+                "convert_files_to_octahedral",
+                mock_converter,
+            ):
+                # Act
+                await ConvertNormalStep().run(context)
+
+            # Assert
+            mock_converter.assert_called_once()
+            self.assertEqual(2, len(mock_converter.call_args.args[0]))
+            self.assertEqual([TextureTypes.NORMAL_OTH] * 2, [item.textures[0].texture_type for item in items])
+
+    async def test_run_failed_conversion_raises_without_updating_records(self):
+        """A failed conversion raises and leaves the texture records unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            mock_converter = MagicMock(side_effect=lambda conversions: _convert(conversions, success=False))
+            item = RemixAssetItem.from_texture(pathlib.Path("/textures/normal.png"), TextureTypes.NORMAL_DX)
+            context = RemixAssetPipelineContext(items=[item], work_dir=pathlib.Path(temp_dir))
+
+            with patch.object(
+                convert_normal_module.OctahedralConverter,
+                "convert_files_to_octahedral",
+                mock_converter,
+            ):
+                # Act
+                with self.assertRaises(RuntimeError):
+                    await ConvertNormalStep().run(context)
+
+            # Assert
+            self.assertEqual(item.textures[0].path, pathlib.Path("/textures/normal.png"))
+            self.assertEqual(item.textures[0].texture_type, TextureTypes.NORMAL_DX)
 
     async def test_run_skips_non_normal_texture_records(self):
         """Diffuse texture records are left unchanged."""
@@ -125,3 +188,73 @@ class TestConvertNormal(omni.kit.test.AsyncTestCase):
 
         # Assert
         self.assertTrue(should_run)
+
+    async def test_pipeline_cache_reuses_converted_normal_of_unchanged_texture(self):
+        """A pipeline run with a step cache points an unchanged normal texture back to its earlier conversion."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            source_path = temp_path / "normal.png"
+            source_path.write_bytes(b"png")
+            work_dir = temp_path / "work"
+            work_dir.mkdir()
+            cache = PipelineStepCache()
+            contexts = [
+                RemixAssetPipelineContext(
+                    items=[RemixAssetItem.from_texture(source_path, TextureTypes.NORMAL_DX)], work_dir=work_dir
+                )
+                for _ in range(2)
+            ]
+            mock_converter = MagicMock(side_effect=_write_octahedral)
+
+            with patch.object(
+                convert_normal_module.OctahedralConverter,
+                "convert_files_to_octahedral",
+                mock_converter,
+            ):
+                # Act
+                for context in contexts:
+                    await run_pipeline([ConvertNormalStep()], context, cache=cache)
+
+            # Assert
+            mock_converter.assert_called_once()
+            state = contexts[1].execution_state["convert_normal"]
+            self.assertEqual(state.skip_reason, "cached")
+            self.assertEqual(state.cached_item_count, 1)
+            texture = contexts[1].items[0].textures[0]
+            self.assertEqual(texture.path, contexts[0].items[0].textures[0].path)
+            self.assertEqual(texture.texture_type, TextureTypes.NORMAL_OTH)
+
+    async def test_pipeline_cache_converts_again_when_converted_normal_changed(self):
+        """A converted file overwritten since it was cached is converted again instead of being reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            temp_path = pathlib.Path(temp_dir)
+            source_path = temp_path / "normal.png"
+            source_path.write_bytes(b"png")
+            work_dir = temp_path / "work"
+            work_dir.mkdir()
+            cache = PipelineStepCache()
+            mock_converter = MagicMock(side_effect=_write_octahedral)
+
+            with patch.object(
+                convert_normal_module.OctahedralConverter,
+                "convert_files_to_octahedral",
+                mock_converter,
+            ):
+                first = RemixAssetPipelineContext(
+                    items=[RemixAssetItem.from_texture(source_path, TextureTypes.NORMAL_DX)], work_dir=work_dir
+                )
+                await run_pipeline([ConvertNormalStep()], first, cache=cache)
+                first.items[0].textures[0].path.write_bytes(b"other")
+                second = RemixAssetPipelineContext(
+                    items=[RemixAssetItem.from_texture(source_path, TextureTypes.NORMAL_DX)], work_dir=work_dir
+                )
+
+                # Act
+                await run_pipeline([ConvertNormalStep()], second, cache=cache)
+
+            # Assert
+            self.assertEqual(mock_converter.call_count, 2)
+            self.assertTrue(second.execution_state["convert_normal"].did_run)
+            self.assertEqual(second.items[0].textures[0].path.read_bytes(), b"octahedral")
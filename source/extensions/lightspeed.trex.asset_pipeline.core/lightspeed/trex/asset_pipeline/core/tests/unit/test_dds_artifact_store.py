@@ -0,0 +1,166 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import omni.kit.test
+
+from lightspeed.trex.asset_pipeline.core.dds_artifact_store import DDSArtifactStore
+
+
+class TestDDSArtifactStore(omni.kit.test.AsyncTestCase):
+    """Test the content-addressed DDS artifact store."""
+
+    async def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = pathlib.Path(self._temp_dir.name)
+
+    async def tearDown(self):
+        self._temp_dir.cleanup()
+
+    async def test_get_key_depends_on_every_conversion_input(self):
+        """Artifacts are only shared between identical sources, semantics, and NVTT arguments."""
+        # Arrange
+        key = DDSArtifactStore.get_key("hash", "DIFFUSE", ["--format", "bc7"])
+
+        # Act
+        other_keys = {
+            DDSArtifactStore.get_key("other-hash", "DIFFUSE", ["--format", "bc7"]),
+            DDSArtifactStore.get_key("hash", "ROUGHNESS", ["--format", "bc7"]),
+            DDSArtifactStore.get_key("hash", "DIFFUSE", ["--format", "bc1"]),
+        }
+
+        # Assert
+        self.assertEqual(key, DDSArtifactStore.get_key("hash", "DIFFUSE", ["--format", "bc7"]))
+        self.assertNotIn(key, other_keys)
+        self.assertEqual(len(other_keys), 3)
+
+    async def test_get_or_create_reuses_artifacts_across_destinations(self):
+        """A second project receives the artifact created by the first one without converting again."""
+        # Arrange
+        store = DDSArtifactStore(self.temp_path / "store")
+        key = store.get_key("hash", "DIFFUSE", [])
+        first_destination = self.temp_path / "first" / "albedo.dds"
+        second_destination = self.temp_path / "second" / "albedo.dds"
+        conversions = []
+
+        def create(path: pathlib.Path) -> None:
+            conversions.append(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"dds")
+
+        # Act
+        first_reused = store.get_or_create(key, first_destination, create)
+        second_reused = store.get_or_create(key, second_destination, create)
+
+        # Assert
+        self.assertFalse(first_reused)
+        self.assertTrue(second_reused)
+        self.assertEqual(conversions, [first_destination])
+        self.assertEqual(second_destination.read_bytes(), b"dds")
+        self.assertEqual((store.statistics.hits, store.statistics.misses), (1, 1))
+
+    async def test_get_or_create_collapses_identical_requests_in_flight(self):
+        """Concurrent requests for one artifact wait for a single conversion."""
+        # Arrange
+        store = DDSArtifactStore(self.temp_path / "store")
+        key = store.get_key("hash", "DIFFUSE", [])
+        started = threading.Event()
+        release = threading.Event()
+        conversions = []
+
+        def create(path: pathlib.Path) -> None:
+            conversions.append(path)
+            started.set()
+            release.wait(5)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"dds")
+
+        destinations = [self.temp_path / f"project_{index}" / "albedo.dds" for index in range(4)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=len(destinations)) as executor:
+            first = executor.submit(store.get_or_create, key, destinations[0], create)
+            self.assertTrue(started.wait(5))
+            others = [executor.submit(store.get_or_create, key, path, create) for path in destinations[1:]]
+            deadline = time.monotonic() + 5
+            try:
+                while store.statistics.collapsed < len(others):
+                    if time.monotonic() > deadline:
+                        self.fail("The identical requests did not wait for the conversion in flight")
+                    time.sleep(0.01)
+            finally:
+                # Let the conversion finish so the executor shuts down even when the wait failed
+                release.set()
+            results = [first.result(5)] + [future.result(5) for future in others]
+
+        # Assert
+        self.assertEqual(len(conversions), 1)
+        self.assertEqual(results, [False, True, True, True])
+        self.assertTrue(all(path.read_bytes() == b"dds" for path in destinations))
+
+    async def test_get_or_create_failure_lets_waiting_requests_retry(self):
+        """A failed conversion is not stored and does not block later requests."""
+        # Arrange
+        store = DDSArtifactStore(self.temp_path / "store")
+        key = store.get_key("hash", "DIFFUSE", [])
+        destination = self.temp_path / "project" / "albedo.dds"
+
+        def fail(_path: pathlib.Path) -> None:
+            raise RuntimeError("conversion failed")
+
+        def create(path: pathlib.Path) -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"dds")
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            store.get_or_create(key, destination, fail)
+        reused = store.get_or_create(key, destination, create)
+
+        # Assert
+        self.assertFalse(reused)
+        self.assertEqual(destination.read_bytes(), b"dds")
+        self.assertEqual(store.statistics.misses, 2)
+
+    async def test_evict_removes_least_recently_used_artifacts(self):
+        """The store stays under its size limit by dropping the artifacts unused for the longest time."""
+        # Arrange
+        store = DDSArtifactStore(self.temp_path / "store", max_size_bytes=20)
+        source = self.temp_path / "source.dds"
+        source.write_bytes(b"0123456789")
+        keys = [store.get_key(f"hash-{index}", "DIFFUSE", []) for index in range(3)]
+        store.add(keys[0], source)
+        store.add(keys[1], source)
+        # Use the oldest artifact so the second one becomes the least recently used
+        os.utime(store._get_artifact_path(keys[1]), ns=(1, 1))
+        self.assertTrue(store.fetch(keys[0], self.temp_path / "used.dds"))
+
+        # Act
+        store.add(keys[2], source)
+
+        # Assert
+        self.assertTrue(store._get_artifact_path(keys[0]).exists())
+        self.assertFalse(store._get_artifact_path(keys[1]).exists())
+        self.assertTrue(store._get_artifact_path(keys[2]).exists())
+        self.assertEqual(store.statistics.evictions, 1)
+        self.assertFalse(store.fetch(keys[1], self.temp_path / "evicted.dds"))
@@ -37,7 +37,7 @@ from lightspeed.trex.utils.common.asset_utils import is_asset_ingested as _is_as
 from lightspeed.trex.utils.common.asset_utils import is_layer_from_capture as _is_layer_from_capture
 from lightspeed.trex.utils.common.asset_utils import is_mesh_from_capture as _is_mesh_from_capture
 from lightspeed.trex.utils.common.asset_utils import is_texture_from_capture as _is_texture_from_capture
-from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
+from lightspeed.trex.utils.common.capture_hash_index import get_capture_hash_index as _get_capture_hash_index
 from lightspeed.trex.utils.common.prim_utils import get_children_prims
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
@@ -293,11 +293,15 @@ class Setup:
 
     def get_instances_from_mesh_path(self, prim_path: str) -> set[str]:
         instances = set()
+        match = constants.COMPILED_REGEX_HASH.match(prim_path)
+        if not match:
+            return instances
         instance_pattern = re.compile(constants.REGEX_INSTANCE_PATH)
-        for instance_path in _filter_prims_paths(lambda prim: bool(instance_pattern.match(str(prim.GetPath())))):
-            if Setup.get_prim_hash(instance_path) != Setup.get_prim_hash(prim_path):
+        capture_hash_index = _get_capture_hash_index(self._context.get_stage())
+        for instance_path in capture_hash_index.get_entry(match.group(3)).instances:
+            if not instance_pattern.match(str(instance_path)):
                 continue
-            instances.add(constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(instance_path, prim_path))
+            instances.add(constants.COMPILED_REGEX_MESH_TO_INSTANCE_SUB.sub(str(instance_path), prim_path))
         return instances
 
     def get_textures_from_material_path(
@@ -0,0 +1,487 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "CaptureCatalog",
+    "CaptureCatalogEntry",
+    "CaptureHashSummary",
+    "find_capture_thumbnail",
+    "get_capture_catalog",
+    "get_hashes_from_capture_layer",
+    "read_layer_type",
+]
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+import carb
+import carb.settings
+import carb.tokens
+from lightspeed.common import constants
+from lightspeed.layer_manager.core.data_models import LayerType, LayerTypeKeys
+from pxr import Sdf, Tf
+
+EXTS_CAPTURE_CATALOG_PATH = "/exts/lightspeed.trex.capture.core.shared/capture_catalog/path"
+
+_INDEX_VERSION = 1
+_SUMMARY_VERSION = 1
+_THUMBNAIL_FOLDERS = (".thumbs", "thumbs")
+
+
+@dataclasses.dataclass(frozen=True)
+class CaptureCatalogEntry:
+    """
+    What the catalog knows about one USD file of a capture directory.
+
+    Args:
+        path: the path of the file
+        size: the size of the file in bytes when it was read
+        mtime_ns: the modification time of the file in nanoseconds when it was read
+        is_capture: whether the file is a capture layer
+        thumbnail: the path of the capture thumbnail, if any
+        hash_count: the number of captured assets, once counted
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    is_capture: bool
+    thumbnail: str | None = None
+    hash_count: int | None = None
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        """Whether the entry was read from the file version described by a stat result"""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+def read_layer_type(path: str) -> str | None:
+    """
+    Read the layer type of a USD file from its header metadata only.
+
+    The layer is opened as an anonymous layer in metadata-only mode, so the file content is not loaded and the layer
+    doesn't stay in the layer registry.
+
+    Args:
+        path: the path of the USD file
+
+    Returns:
+        The `lightspeed_layer_type` custom layer data of the file, or None if the file can't be read
+    """
+    try:
+        layer = Sdf.Layer.OpenAsAnonymous(path, metadataOnly=True)
+    except Tf.ErrorException:
+        # Not a USD file, or a file that can't be parsed
+        return None
+    if not layer:
+        return None
+    return layer.customLayerData.get(LayerTypeKeys.layer_type.value)
+
+
+def find_capture_thumbnail(path: str) -> str | None:
+    """
+    Find the thumbnail saved by the runtime next to a capture.
+
+    Args:
+        path: the path of the capture
+
+    Returns:
+        The path of the thumbnail, or None if the capture has no thumbnail
+    """
+    capture_path = Path(path)
+    for folder in _THUMBNAIL_FOLDERS:
+        # Some older capture thumbnails were saved with the .usd extension in the filename
+        # so we check for both with and without the extension in the filename.
+        for name in (f"{capture_path.name}.dds", f"{capture_path.stem}.dds"):
+            thumbnail = capture_path.parent / folder / name
+            if thumbnail.exists():
+                return str(thumbnail)
+    return None
+
+
+def get_hashes_from_capture_layer(layer: Sdf.Layer) -> tuple[dict[str, Sdf.Path], dict[str, set[str]]]:
+    """
+    Faster version that use pre defined prims from a capture layer
+
+    Args:
+        layer: The layer to traverse
+
+    Returns:
+        A dictionary of the various hashes found and their respective prims, and the meshes using each material
+    """
+    result = {}
+    # for replaced assets, if a prim is a key of this dictionary, we use the list as a value instead.
+    # For example, for material, if a material as an override and this materials is assigned to multiple meshes
+    # we set all meshes as "replaced".
+    result_switch_grouped = {}
+    for path in [constants.ROOTNODE_LOOKS, constants.ROOTNODE_MESHES, constants.ROOTNODE_LIGHTS]:
+        prim = layer.GetObjectAtPath(path)
+        if not prim:
+            continue
+        if path == constants.ROOTNODE_MESHES:
+            for child in prim.nameChildren:
+                mesh_hash = str(child.path)[-16:]
+                if constants.MATERIAL_RELATIONSHIP in child.relationships:
+                    materials = child.relationships[constants.MATERIAL_RELATIONSHIP].targetPathList.explicitItems
+                    # Always take the first material as there should never be more than 1 material here
+                    mat_hash = str(materials[0])[-16:]
+                    result[mat_hash] = materials[0]
+                    if mat_hash not in result_switch_grouped:
+                        result_switch_grouped[mat_hash] = set()
+                    result_switch_grouped[mat_hash].add(mesh_hash)
+                result[mesh_hash] = child.path
+        else:
+            for child in prim.nameChildren:
+                result[str(child.path)[-16:]] = child.path
+    return result, result_switch_grouped
+
+
+@dataclasses.dataclass(frozen=True)
+class CaptureHashSummary:
+    """
+    The captured hashes of a capture layer, enough to count and compare the captured assets without opening the layer.
+
+    Args:
+        hashes: the captured mesh, material and light hashes
+        grouped_hashes: the meshes using each material bound to a mesh
+        size: the size in bytes of the capture layer the summary was read from
+        mtime_ns: the modification time in nanoseconds of the capture layer the summary was read from
+    """
+
+    hashes: tuple[str, ...]
+    grouped_hashes: dict[str, tuple[str, ...]] = dataclasses.field(default_factory=dict)
+    size: int = 0
+    mtime_ns: int = 0
+
+    @classmethod
+    def from_layer(cls, layer: Sdf.Layer, size: int = 0, mtime_ns: int = 0) -> CaptureHashSummary:
+        """
+        Summarize a capture layer.
+
+        Args:
+            layer: the capture layer
+            size: the size of the file of the layer
+            mtime_ns: the modification time of the file of the layer
+
+        Returns:
+            The summary of the layer
+        """
+        hashes, grouped_hashes = get_hashes_from_capture_layer(layer)
+        return cls(
+            hashes=tuple(hashes),
+            grouped_hashes={material: tuple(sorted(meshes)) for material, meshes in grouped_hashes.items()},
+            size=size,
+            mtime_ns=mtime_ns,
+        )
+
+    @functools.cached_property
+    def asset_hashes(self) -> frozenset[str]:
+        """The hashes counted as captured assets: the materials bound to meshes are counted through their meshes"""
+        return frozenset(self.hashes).difference(self.grouped_hashes)
+
+    def get_replaced_hashes(self, replaced_items: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        Match the hashes of a replacement layer against the captured hashes.
+
+        Args:
+            replaced_items: the hashes replaced in the replacement layer
+
+        Returns:
+            The captured assets replaced, and all the captured assets. A replaced material bound to meshes counts as
+            replaced meshes.
+        """
+        replaced_items = set(replaced_items)
+        replaced_result = replaced_items & self.asset_hashes
+        for material in replaced_items.intersection(self.grouped_hashes):
+            replaced_result.update(self.grouped_hashes[material])
+        return replaced_result, set(self.asset_hashes)
+
+    def diff(self, other: CaptureHashSummary) -> tuple[set[str], set[str]]:
+        """
+        Compare the captured assets with the assets of another capture.
+
+        Args:
+            other: the other capture
+
+        Returns:
+            The assets only captured in this capture, and the assets only captured in the other capture
+        """
+        return set(self.asset_hashes - other.asset_hashes), set(other.asset_hashes - self.asset_hashes)
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        """Whether the summary was read from the file version described by a stat result"""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+class CaptureCatalog:
+    def __init__(self, directory: str, index_path: Path | None = None):
+        """
+        Catalog of the capture layers of a capture directory.
+
+        Files are identified by their header metadata only, and what was read is cached by path, size and modification
+        time. Refreshing the catalog only reads the files that were added or changed since the last refresh. The cache
+        is persisted in an index file so the next session starts from it.
+
+        Args:
+            directory: the capture directory
+            index_path: the JSON file persisting the catalog, or None to keep the catalog in memory
+        """
+        self.directory = directory
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._entries: dict[str, CaptureCatalogEntry] = self._load_index()
+        self._summaries: dict[str, CaptureHashSummary] = {}
+
+    def refresh(self) -> list[CaptureCatalogEntry]:
+        """
+        Update the catalog with the USD files currently in the directory.
+
+        Returns:
+            The entries of the USD files of the directory, capture layers or not
+
+        Raises:
+            FileNotFoundError: if the directory doesn't exist
+        """
+        entries = {}
+        changed = False
+        with os.scandir(self.directory) as iterator:
+            for dir_entry in iterator:
+                if os.path.splitext(dir_entry.name)[1] not in constants.USD_EXTENSIONS:
+                    continue
+                try:
+                    if not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                path = str(Path(self.directory) / dir_entry.name)
+                with self._lock:
+                    entry = self._entries.get(path)
+                updated = self._update_entry(path, stat, entry)
+                changed = changed or updated is not entry
+                entries[path] = updated
+        with self._lock:
+            changed = changed or entries.keys() != self._entries.keys()
+            self._entries = entries
+        if changed:
+            self._save_index()
+        return list(entries.values())
+
+    def get_entry(self, path: str) -> CaptureCatalogEntry | None:
+        """
+        Get the entry of one file, reading the file header if the file was added or changed.
+
+        Args:
+            path: the path of the file
+
+        Returns:
+            The entry of the file, or None if the file doesn't exist
+        """
+        path = str(Path(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+        updated = self._update_entry(path, stat, entry)
+        if updated is not entry:
+            with self._lock:
+                self._entries[path] = updated
+            self._save_index()
+        return updated
+
+    def get_hash_count(self, path: str) -> int | None:
+        """
+        Get the number of assets captured in a capture layer. The count is kept in the catalog index.
+
+        Args:
+            path: the path of the capture layer
+
+        Returns:
+            The number of captured meshes, lights and materials not bound to a mesh, or None if the file is not a
+            capture layer
+        """
+        entry = self.get_entry(path)
+        if entry is None or not entry.is_capture:
+            return None
+        if entry.hash_count is None:
+            summary = self.get_hash_summary(entry.path)
+            if summary is None:
+                return None
+            entry = dataclasses.replace(entry, hash_count=len(summary.asset_hashes))
+            with self._lock:
+                self._entries[entry.path] = entry
+            self._save_index()
+        return entry.hash_count
+
+    def get_hash_summary(self, path: str) -> CaptureHashSummary | None:
+        """
+        Get the summary of the hashes captured in a capture layer.
+
+        The summary is persisted in a sidecar file next to the catalog index. The capture layer is only opened when it
+        changed since its summary was written.
+
+        Args:
+            path: the path of the capture layer
+
+        Returns:
+            The summary of the capture layer, or None if the file doesn't exist or can't be read
+        """
+        path = str(Path(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            summary = self._summaries.get(path)
+        if summary is not None and summary.is_current(stat):
+            return summary
+        summary = self._read_summary(path)
+        if summary is None or not summary.is_current(stat):
+            try:
+                layer = Sdf.Layer.OpenAsAnonymous(path)
+            except Tf.ErrorException:
+                return None
+            if not layer:
+                return None
+            summary = CaptureHashSummary.from_layer(layer, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            self._write_summary(path, summary)
+        with self._lock:
+            self._summaries[path] = summary
+        return summary
+
+    def _get_summary_path(self, path: str) -> Path | None:
+        if self.index_path is None:
+            return None
+        return self.index_path.with_suffix("") / f"{Path(path).name}.json"
+
+    def _read_summary(self, path: str) -> CaptureHashSummary | None:
+        summary_path = self._get_summary_path(path)
+        if summary_path is None:
+            return None
+        try:
+            data = json.loads(summary_path.read_text(encoding="utf-8"))
+            if data.get("version") != _SUMMARY_VERSION:
+                return None
+            return CaptureHashSummary(
+                hashes=tuple(data["hashes"]),
+                grouped_hashes={material: tuple(meshes) for material, meshes in data["grouped_hashes"].items()},
+                size=data["size"],
+                mtime_ns=data["mtime_ns"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            carb.log_warn(f"[CaptureCatalog] Ignoring the unreadable summary {summary_path}: {e}")
+            return None
+
+    def _write_summary(self, path: str, summary: CaptureHashSummary):
+        summary_path = self._get_summary_path(path)
+        if summary_path is None:
+            return
+        data = {"version": _SUMMARY_VERSION, **dataclasses.asdict(summary)}
+        self._write_json(summary_path, data)
+
+    def _update_entry(self, path: str, stat: os.stat_result, entry: CaptureCatalogEntry | None) -> CaptureCatalogEntry:
+        if entry is not None and entry.is_current(stat):
+            if entry.is_capture and entry.thumbnail is None:
+                # The thumbnail can be written after the capture
+                thumbnail = find_capture_thumbnail(path)
+                if thumbnail:
+                    return dataclasses.replace(entry, thumbnail=thumbnail)
+            return entry
+        is_capture = read_layer_type(path) == LayerType.capture.value
+        return CaptureCatalogEntry(
+            path=path,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            is_capture=is_capture,
+            thumbnail=find_capture_thumbnail(path) if is_capture else None,
+        )
+
+    def _load_index(self) -> dict[str, CaptureCatalogEntry]:
+        if self.index_path is None:
+            return {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION:
+                return {}
+            return {entry["path"]: CaptureCatalogEntry(**entry) for entry in data["entries"]}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            carb.log_warn(f"[CaptureCatalog] Ignoring the unreadable index {self.index_path}: {e}")
+            return {}
+
+    def _save_index(self):
+        if self.index_path is None:
+            return
+        with self._lock:
+            data = {
+                "version": _INDEX_VERSION,
+                "entries": [dataclasses.asdict(entry) for entry in self._entries.values()],
+            }
+        self._write_json(self.index_path, data)
+
+    @staticmethod
+    def _write_json(path: Path, data: dict):
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(staging, path)
+        except OSError as e:
+            # The index and the summaries are only a cache: the catalog is still valid in memory
+            carb.log_warn(f"[CaptureCatalog] Unable to save {path}: {e}")
+            staging.unlink(missing_ok=True)
+
+
+_INSTANCES: dict[str, CaptureCatalog] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_capture_catalog(directory: str) -> CaptureCatalog:
+    """
+    Get the catalog of a capture directory shared by the current process, creating it on first use.
+
+    Args:
+        directory: the capture directory
+
+    Returns:
+        The catalog of the directory. It is persisted in the folder of the catalog setting, if set.
+    """
+    directory = str(Path(directory))
+    with _INSTANCES_LOCK:
+        catalog = _INSTANCES.get(directory)
+        if catalog is None:
+            index_path = None
+            root = carb.settings.get_settings().get(EXTS_CAPTURE_CATALOG_PATH)
+            if root:
+                key = hashlib.sha256(directory.encode("utf-8")).hexdigest()
+                index_path = Path(carb.tokens.get_tokens_interface().resolve(root)) / f"{key}.json"
+            catalog = CaptureCatalog(directory, index_path=index_path)
+            _INSTANCES[directory] = catalog
+        return catalog
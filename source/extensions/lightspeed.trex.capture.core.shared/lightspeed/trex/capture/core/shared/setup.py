@@ -33,6 +33,12 @@ from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from PIL import Image
 from pxr import Sdf, Usd, UsdGeom
 
+from .capture_catalog import CaptureHashSummary
+from .capture_catalog import find_capture_thumbnail as _find_capture_thumbnail
+from .capture_catalog import get_capture_catalog as _get_capture_catalog
+from .capture_catalog import get_hashes_from_capture_layer as _get_hashes_from_capture_layer
+from .capture_catalog import read_layer_type as _read_layer_type
+
 
 class Setup:
     def __init__(self, context_name: str):
@@ -159,8 +165,11 @@ class Setup:
 
     @staticmethod
     def is_capture_file(path: str) -> bool:
-        layer = Sdf.Layer.FindOrOpen(path)
-        return Setup.is_layer_a_capture_file(layer)
+        layer = Sdf.Layer.Find(path)
+        if layer:
+            return Setup.is_layer_a_capture_file(layer)
+        # Only read the header of the files that are not opened yet, so they don't stay loaded in the layer registry
+        return _read_layer_type(path) == LayerType.capture.value
 
     @staticmethod
     def is_layer_a_capture_file(layer: Sdf.Layer) -> bool:
@@ -188,36 +197,40 @@ class Setup:
         await callback(result)
 
     def get_capture_files(self) -> list[str]:
-        def _get_files(_file):
-            return _file.is_file() and _file.suffix in constants.USD_EXTENSIONS and self.is_capture_file(str(_file))
+        """
+        Get the capture layers of the capture directory, most recent name first.
+
+        Only the files added or changed since the last call are read, and only their header.
 
+        Returns:
+            The paths of the capture layers
+        """
         if not self._check_directory():
             return []
 
         try:
-            result = [str(path) for path in Path(self.__directory).iterdir() if _get_files(path)]
+            entries = _get_capture_catalog(self.__directory).refresh()
         except FileNotFoundError:
             return []
-
-        # It will deadlock
-        # result = []
-        # with concurrent.futures.ThreadPoolExecutor() as executor:
-        #     for file, is_valid in executor.map(_get_files, Path(self.__directory).iterdir()):
-        #         if is_valid:
-        #             result.append(str(file))
-        return sorted(result, reverse=True)
+        return sorted((entry.path for entry in entries if entry.is_capture), reverse=True)
 
     def get_capture_image(self, path: str) -> str | None:
-        for folder in [".thumbs", "thumbs"]:
-            # Some older capture thumbnails were saved with the .usd extension in the filename
-            # so we check for both with and without the extension in the filename.
-            image_path_with_extension = Path(path).parent / folder / f"{Path(path).name}.dds"
-            image_path_without_extension = Path(path).parent / folder / f"{Path(path).stem}.dds"
-            if image_path_with_extension.exists():
-                return str(image_path_with_extension)
-            if image_path_without_extension.exists():
-                return str(image_path_without_extension)
-        return None
+        entry = _get_capture_catalog(str(Path(path).parent)).get_entry(path)
+        if entry is None:
+            return _find_capture_thumbnail(path)
+        return entry.thumbnail
+
+    def get_capture_hash_count(self, path: str) -> int | None:
+        """
+        Get the number of assets captured in a capture layer. The count is cached with the capture catalog.
+
+        Args:
+            path: the capture layer path
+
+        Returns:
+            The number of captured assets, or None if the file is not a capture layer
+        """
+        return _get_capture_catalog(str(Path(path).parent)).get_hash_count(path)
 
     @staticmethod
     def get_hashes_from_capture_layer(layer: Sdf.Layer) -> tuple[dict[str, Sdf.Path], dict[str, set[str]]]:
@@ -230,29 +243,28 @@ class Setup:
         Returns:
             A dictionary of the various hashes found and their respective prims
         """
-        result = {}
-        # for replaced assets, if a prim is a key of this dictionary, we use the list as a value instead.
-        # For example, for material, if a material as an override and this materials is assigned to multiple meshes
-        # we set all meshes as "replaced".
-        result_switch_grouped = {}
-        for path in [constants.ROOTNODE_LOOKS, constants.ROOTNODE_MESHES, constants.ROOTNODE_LIGHTS]:
-            prim = layer.GetObjectAtPath(path)
-            if path == constants.ROOTNODE_MESHES:
-                for child in prim.nameChildren:
-                    mesh_hash = str(child.path)[-16:]
-                    if constants.MATERIAL_RELATIONSHIP in child.relationships:
-                        materials = child.relationships[constants.MATERIAL_RELATIONSHIP].targetPathList.explicitItems
-                        # Always take the first material as there should never be more than 1 material here
-                        mat_hash = str(materials[0])[-16:]
-                        result[mat_hash] = materials[0]
-                        if mat_hash not in result_switch_grouped:
-                            result_switch_grouped[mat_hash] = set()
-                        result_switch_grouped[mat_hash].add(mesh_hash)
-                    result[mesh_hash] = child.path
-            else:
-                for child in prim.nameChildren:
-                    result[str(child.path)[-16:]] = child.path
-        return result, result_switch_grouped
+        return _get_hashes_from_capture_layer(layer)
+
+    def get_capture_hash_summary(self, layer_path: str) -> CaptureHashSummary | None:
+        """
+        Get the summary of the hashes of a capture layer.
+
+        Capture files are summarized once per file version and the summary is persisted with the capture catalog, so
+        the capture layer is not opened again. Layers without a local file are summarized from the opened layer.
+
+        Args:
+            layer_path: the capture layer path
+
+        Returns:
+            The summary of the capture layer, or None if the layer can't be read
+        """
+        summary = _get_capture_catalog(str(Path(layer_path).parent)).get_hash_summary(layer_path)
+        if summary is not None:
+            return summary
+        layer = Sdf.Layer.FindOrOpen(layer_path)
+        if layer is None:
+            return None
+        return CaptureHashSummary.from_layer(layer)
 
     @omni.usd.handle_exception
     async def async_get_replaced_hashes(self, layer_path: str, replaced_items: list[str]) -> tuple[set[str], set[str]]:
@@ -266,33 +278,11 @@ class Setup:
         Returns:
             Replaced hash from the current layer path, all hashes from the current layer path
         """
-        wrapped_fn = _async_wrap(functools.partial(Sdf.Layer.FindOrOpen, layer_path))
-        _layer = await wrapped_fn()
-        if _layer is None:
+        wrapped_fn = _async_wrap(functools.partial(self.get_capture_hash_summary, layer_path))
+        summary = await wrapped_fn()
+        if summary is None:
             return set(), set()
-        hashes, grouped_hashes = self.get_captured_hashes(_layer, ignore_capture_check=True)
-        captured_items = set()
-        if hashes:
-            captured_items = set(hashes.keys())
-        replaced_result = set()
-        for replaced_item in replaced_items:
-            if replaced_item in replaced_result:
-                continue
-            # if this is a material was edited/replaced and the material is from mesh(es), we set the mesh(es)
-            # as replaced asset(s) (not the material)
-            mesh_from_mat = grouped_hashes.get(replaced_item, set())
-            if mesh_from_mat:
-                for mesh in mesh_from_mat:
-                    replaced_result.add(mesh)
-                continue
-            if replaced_item in captured_items:
-                replaced_result.add(replaced_item)
-        all_assets_result = set()
-        for captured_item in captured_items:
-            if captured_item in all_assets_result or captured_item in grouped_hashes:
-                continue
-            all_assets_result.add(captured_item)
-        return replaced_result, all_assets_result
+        return summary.get_replaced_hashes(replaced_items)
 
     def get_captured_hashes(
         self, layer: Sdf.Layer, ignore_capture_check: bool = False
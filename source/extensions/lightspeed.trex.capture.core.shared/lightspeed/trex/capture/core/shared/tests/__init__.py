@@ -16,6 +16,7 @@
 """
 
 from .e2e.test_setup import TestOnLoadEvent
+from .unit.test_capture_catalog import TestCaptureCatalog
 from .unit.test_setup import TestSetup
 
-__all__ = ["TestOnLoadEvent", "TestSetup"]
+__all__ = ["TestCaptureCatalog", "TestOnLoadEvent", "TestSetup"]
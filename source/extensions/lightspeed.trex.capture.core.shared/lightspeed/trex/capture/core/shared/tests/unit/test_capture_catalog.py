@@ -0,0 +1,159 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from lightspeed.trex.capture.core.shared.capture_catalog import CaptureCatalog, CaptureHashSummary
+from pxr import Sdf, Usd, UsdGeom, UsdShade
+
+
+class TestCaptureCatalog(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name) / "captures"
+        self.directory.mkdir()
+        self.index_path = Path(self.temp_dir.name) / "index" / "catalog.json"
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _create_layer(self, name: str, layer_type: str | None, meshes: int = 0) -> str:
+        stage = Usd.Stage.CreateInMemory()
+        if layer_type:
+            stage.GetRootLayer().customLayerData = {"lightspeed_layer_type": layer_type}
+        material = UsdShade.Material.Define(stage, "/RootNode/Looks/mat_0123456789ABCDEF")
+        for index in range(meshes):
+            mesh = UsdGeom.Mesh.Define(stage, f"/RootNode/meshes/mesh_{index:016X}")
+            UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim()).Bind(material)
+        UsdGeom.Xform.Define(stage, "/RootNode/lights/light_FEDCBA9876543210")
+        path = str(self.directory / name)
+        stage.GetRootLayer().Export(path)
+        return path
+
+    async def test_refresh_should_only_read_added_and_changed_files(self):
+        # Arrange
+        capture_a = self._create_layer("capture_a.usda", "capture", meshes=2)
+        replacement = self._create_layer("replacement.usda", "replacement")
+        (self.directory / "notes.txt").write_text("not a layer", encoding="utf-8")
+        catalog = CaptureCatalog(str(self.directory), index_path=self.index_path)
+        first = {entry.path: entry for entry in catalog.refresh()}
+
+        # Act
+        capture_b = self._create_layer("capture_b.usda", "capture")
+        with patch(
+            "lightspeed.trex.capture.core.shared.capture_catalog.read_layer_type", return_value="capture"
+        ) as read_mock:
+            second = {entry.path: entry for entry in catalog.refresh()}
+
+        # Assert
+        self.assertEqual({capture_a, replacement}, first.keys())
+        self.assertTrue(first[capture_a].is_capture)
+        self.assertFalse(first[replacement].is_capture)
+        self.assertEqual({capture_a, replacement, capture_b}, second.keys())
+        read_mock.assert_called_once_with(capture_b)
+        self.assertIs(first[capture_a], second[capture_a])
+        # Only the header was read: the files are not left in the layer registry
+        self.assertIsNone(Sdf.Layer.Find(capture_a))
+
+    async def test_refresh_should_persist_the_catalog(self):
+        # Arrange
+        capture = self._create_layer("capture.usda", "capture", meshes=3)
+        catalog = CaptureCatalog(str(self.directory), index_path=self.index_path)
+        catalog.refresh()
+        hash_count = catalog.get_hash_count(capture)
+
+        # Act
+        reloaded = CaptureCatalog(str(self.directory), index_path=self.index_path)
+        with patch("lightspeed.trex.capture.core.shared.capture_catalog.read_layer_type") as read_mock:
+            entries = reloaded.refresh()
+            reloaded_hash_count = reloaded.get_hash_count(capture)
+
+        # Assert
+        read_mock.assert_not_called()
+        self.assertEqual([capture], [entry.path for entry in entries if entry.is_capture])
+        # 3 meshes and 1 light. The material is bound to the meshes, so it is not counted on its own.
+        self.assertEqual(4, hash_count)
+        self.assertEqual(4, reloaded_hash_count)
+
+    async def test_changed_file_should_be_read_again(self):
+        # Arrange
+        path = self._create_layer("capture.usda", "replacement")
+        catalog = CaptureCatalog(str(self.directory))
+        self.assertFalse(catalog.get_entry(path).is_capture)
+
+        # Act
+        self._create_layer("capture.usda", "capture")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        entry = catalog.get_entry(path)
+
+        # Assert
+        self.assertTrue(entry.is_capture)
+
+    async def test_thumbnail_written_after_the_capture_should_be_found(self):
+        # Arrange
+        path = self._create_layer("capture.usda", "capture")
+        catalog = CaptureCatalog(str(self.directory))
+        catalog.refresh()
+
+        # Act
+        thumbnail = self.directory / ".thumbs" / "capture.usda.dds"
+        thumbnail.parent.mkdir()
+        thumbnail.write_bytes(b"DDS ")
+        entry = catalog.get_entry(path)
+
+        # Assert
+        self.assertEqual(str(thumbnail), entry.thumbnail)
+
+    async def test_hash_summary_should_be_persisted_until_the_capture_changes(self):
+        # Arrange
+        path = self._create_layer("capture.usda", "capture", meshes=2)
+        CaptureCatalog(str(self.directory), index_path=self.index_path).get_hash_summary(path)
+        catalog = CaptureCatalog(str(self.directory), index_path=self.index_path)
+
+        # Act
+        with patch.object(Sdf.Layer, "OpenAsAnonymous") as open_mock:
+            summary = catalog.get_hash_summary(path)
+        self._create_layer("capture.usda", "capture", meshes=3)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        changed_summary = catalog.get_hash_summary(path)
+
+        # Assert
+        open_mock.assert_not_called()
+        self.assertEqual({"0000000000000000", "0000000000000001", "FEDCBA9876543210"}, summary.asset_hashes)
+        self.assertEqual({"0123456789ABCDEF": ("0000000000000000", "0000000000000001")}, dict(summary.grouped_hashes))
+        self.assertEqual(({"0000000000000002"}, set()), changed_summary.diff(summary))
+
+    async def test_hash_summary_replaced_hashes_should_count_materials_through_their_meshes(self):
+        # Arrange
+        summary = CaptureHashSummary(
+            hashes=("MAT0", "MAT1", "MESH0", "MESH1", "LIGHT0"),
+            grouped_hashes={"MAT0": ("MESH0", "MESH1")},
+        )
+
+        # Act
+        replaced, total = summary.get_replaced_hashes(["MAT0", "MAT1", "LIGHT0", "UNKNOWN"])
+
+        # Assert
+        self.assertEqual({"MESH0", "MESH1", "MAT1", "LIGHT0"}, replaced)
+        self.assertEqual({"MAT1", "MESH0", "MESH1", "LIGHT0"}, total)
@@ -22,6 +22,7 @@ import omni.usd
 from lightspeed.layer_manager.core import LayerManagerCore as _LayerManagerCore
 from lightspeed.layer_manager.core import LayerType as _LayerType
 from lightspeed.trex.capture.core.shared import Setup as _CaptureCoreSetup
+from lightspeed.trex.capture.core.shared.capture_catalog import CaptureCatalogEntry
 from pxr import Sdf, Usd, UsdGeom
 
 
@@ -121,33 +122,15 @@ class TestSetup(omni.kit.test.AsyncTestCase):
         core = _CaptureCoreSetup("")
         core.set_directory("C:/project/deps/captures")
 
-        capture_a = MagicMock()
-        capture_a.is_file.return_value = True
-        capture_a.suffix = ".usda"
-        capture_a.__str__.return_value = "C:/project/deps/captures/capture_a.usda"
-
-        capture_b = MagicMock()
-        capture_b.is_file.return_value = True
-        capture_b.suffix = ".usda"
-        capture_b.__str__.return_value = "C:/project/deps/captures/capture_b.usda"
-
-        not_a_capture = MagicMock()
-        not_a_capture.is_file.return_value = True
-        not_a_capture.suffix = ".usda"
-        not_a_capture.__str__.return_value = "C:/project/deps/captures/not_a_capture.usda"
+        catalog = MagicMock()
+        catalog.refresh.return_value = [
+            CaptureCatalogEntry("C:/project/deps/captures/capture_a.usda", 1, 1, True),
+            CaptureCatalogEntry("C:/project/deps/captures/not_a_capture.usda", 1, 1, False),
+            CaptureCatalogEntry("C:/project/deps/captures/capture_b.usda", 1, 1, True),
+        ]
 
         # Act
-        with (
-            patch(
-                "lightspeed.trex.capture.core.shared.setup.Path.iterdir",
-                return_value=[capture_a, not_a_capture, capture_b],
-            ),
-            patch.object(
-                _CaptureCoreSetup,
-                "is_capture_file",
-                side_effect=lambda path: path != "C:/project/deps/captures/not_a_capture.usda",
-            ),
-        ):
+        with patch("lightspeed.trex.capture.core.shared.setup._get_capture_catalog", return_value=catalog):
             result = core.get_capture_files()
 
         # Assert
@@ -164,8 +147,11 @@ class TestSetup(omni.kit.test.AsyncTestCase):
         core = _CaptureCoreSetup("")
         core.set_directory("C:/project/deps/captures")
 
+        catalog = MagicMock()
+        catalog.refresh.side_effect = FileNotFoundError
+
         # Act
-        with patch("lightspeed.trex.capture.core.shared.setup.Path.iterdir", side_effect=FileNotFoundError):
+        with patch("lightspeed.trex.capture.core.shared.setup._get_capture_catalog", return_value=catalog):
             result = core.get_capture_files()
 
         # Assert
@@ -1738,6 +1738,7 @@ class TestComfyUICore(AsyncTestCase):
                 JobOutputs({ComfyUIJob.GENERATED_TEXTURES: generation_output}),
             )
             snapshot = interface.get_job_snapshot(generation_job.job_id)
+            interface.close()
 
         # Assert
         self.assertTrue(completed)
@@ -780,6 +780,7 @@ class TestComfyUIJob(AsyncTestCase):
             restored_generation = restarted.get_job(generation_job.job_id)
             restored_processing = restarted.get_job(processing_job.job_id)
             restored_request = restarted.resolve_job_inputs(generation_job.job_id)[ComfyUIJob.WORKFLOW_REQUEST]
+            restarted.close()
 
         # Assert
         self.assertEqual(graph_snapshot.name, graph.name)
@@ -836,6 +837,7 @@ class TestComfyUIJob(AsyncTestCase):
 
             # Act
             restored_inputs = restarted.resolve_job_inputs(processing_job.job_id)
+            restarted.close()
 
         # Assert
         self.assertEqual(restored_inputs[TextureProcessingJob.SOURCE_TEXTURES], request)
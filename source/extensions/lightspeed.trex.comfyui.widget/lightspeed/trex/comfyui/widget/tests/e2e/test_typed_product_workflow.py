@@ -86,6 +86,7 @@ class TestTypedComfyUIProductWorkflowE2E(AsyncTestCase):
         if self._context.get_stage() is not None:
             await self._context.close_stage_async()
         omni.usd.destroy_context(_CONTEXT_NAME)
+        self._interface.close()
         self._temporary_directory.cleanup()
 
     def _create_materials(self, count: int) -> list[str]:
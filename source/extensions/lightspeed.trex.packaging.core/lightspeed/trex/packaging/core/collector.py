@@ -0,0 +1,167 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["AssetCollector", "CollectionJob"]
+
+import asyncio
+import dataclasses
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper as _OmniClientWrapper
+from pxr import Sdf
+
+
+@dataclasses.dataclass(frozen=True)
+class CollectionJob:
+    """
+    A dependency to write in the package.
+
+    Args:
+        input_path: the path of the dependency to copy
+        output_path: the path of the dependency in the package
+        layer: the layer to export instead of copying the input path
+        is_packaged_root: whether the layer is the root layer of the package
+    """
+
+    input_path: str
+    output_path: _OmniUrl
+    layer: Sdf.Layer | None = None
+    is_packaged_root: bool = False
+
+
+class AssetCollector:
+    def __init__(
+        self,
+        output_directory: Path | str,
+        export_layer: Callable[[CollectionJob], Awaitable[None]],
+        is_cancelled: Callable[[], bool],
+        on_job_done: Callable[[], None],
+        max_concurrency: int = 16,
+    ):
+        """
+        Write the collected dependencies of a package in an empty output directory.
+
+        The output directories are created once before any file is written. Files are copied by a bounded number of
+        concurrent workers while layers are exported one at a time next to the copies.
+
+        Args:
+            output_directory: the package directory. It must not exist or be empty.
+            export_layer: the coroutine function exporting the layer of a job
+            is_cancelled: returns True when the collection should stop before the next job
+            on_job_done: called after every job is written
+            max_concurrency: the maximum number of files copied at the same time
+        """
+        self._output_directory = output_directory
+        self._export_layer = export_layer
+        self._is_cancelled = is_cancelled
+        self._on_job_done = on_job_done
+        self._max_concurrency = max(1, max_concurrency)
+
+        self.__errors: list[str] = []
+
+    def get_output_directories(self, jobs: list[CollectionJob]) -> list[list[str]]:
+        """
+        Get the directories to create inside the output directory for the given jobs.
+
+        Args:
+            jobs: the jobs to write
+
+        Returns:
+            The unique directories, grouped by depth so parents are created before their children
+        """
+        output_directory = str(_OmniUrl(self._output_directory))
+        depths: dict[str, int] = {}
+        for parent_url in dict.fromkeys(job.output_path.parent_url for job in jobs):
+            # Walk up to the output directory, the directories outside of it are never created
+            chain = []
+            directory = parent_url
+            while directory.startswith(output_directory) and directory not in chain:
+                chain.append(directory)
+                directory = _OmniUrl(directory).parent_url
+            for depth, directory in enumerate(reversed(chain)):
+                depths.setdefault(directory, depth)
+
+        levels: dict[int, list[str]] = {}
+        for directory, depth in depths.items():
+            levels.setdefault(depth, []).append(directory)
+        return [levels[depth] for depth in sorted(levels)]
+
+    async def collect(self, jobs: list[CollectionJob]) -> list[str]:
+        """
+        Create the output directories, then export the layers and copy the files of the jobs.
+
+        The collection stops scheduling new jobs on the first error or when cancelled. Jobs in flight are finished.
+
+        Args:
+            jobs: the jobs to write
+
+        Returns:
+            The errors that occurred
+        """
+        self.__errors = []
+
+        for directories in self.get_output_directories(jobs):
+            if self.__should_stop():
+                return self.__errors
+            await self.__run_all(_OmniClientWrapper.create_folder(directory) for directory in directories)
+
+        layer_jobs = [job for job in jobs if job.layer is not None]
+        copy_jobs = iter([job for job in jobs if job.layer is None])
+        worker_count = min(self._max_concurrency, len(jobs) - len(layer_jobs))
+
+        await asyncio.gather(
+            self.__export_layers(layer_jobs),
+            *(self.__copy_files(copy_jobs) for _ in range(worker_count)),
+        )
+        return self.__errors
+
+    def __should_stop(self) -> bool:
+        return bool(self.__errors) or self._is_cancelled()
+
+    async def __run_all(self, coroutines):
+        for result in await asyncio.gather(*coroutines, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.__errors.append(str(result))
+
+    async def __export_layers(self, jobs: list[CollectionJob]):
+        for job in jobs:
+            if self.__should_stop():
+                return
+            try:
+                await self._export_layer(job)
+            except Exception as e:  # noqa: BLE001
+                # Make sure to bubble up failures
+                self.__errors.append(str(e))
+                return
+            self._on_job_done()
+
+    async def __copy_files(self, jobs):
+        # Every worker pulls from the same iterator, so each job is copied once
+        for job in jobs:
+            if self.__should_stop():
+                return
+            try:
+                await _OmniClientWrapper.copy(job.input_path, str(job.output_path))
+            except Exception as e:  # noqa: BLE001
+                # Make sure to bubble up failures
+                self.__errors.append(str(e))
+                return
+            self._on_job_done()
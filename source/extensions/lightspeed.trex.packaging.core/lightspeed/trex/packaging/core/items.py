@@ -43,7 +43,8 @@ class ModPackagingSchema(BaseModel):
     )
     output_directory: Path = Field(
         description="The directory where the packaged mod should be stored.\n\n"
-        "WARNING: The directory will be emptied prior to packaging the mod.",
+        "WARNING: The directory will be emptied prior to packaging the mod, unless `incremental` is set and the "
+        "directory contains the manifest of a previous package.",
     )
     packaging_mode: ModPackagingMode = Field(
         default=ModPackagingMode.FLATTEN,
@@ -67,6 +68,12 @@ class ModPackagingSchema(BaseModel):
     ignored_errors: list[tuple[str, str, str]] | None = Field(
         default=None, description="A list of errors to ignore when packaging the mod."
     )
+    incremental: bool = Field(
+        default=False,
+        description="When True, the output directory is updated instead of being emptied: only the new or modified "
+        "assets are copied, only the modified layers are exported and the outputs that are no longer part of the "
+        "package are removed. A manifest of the package sources is written in the output directory.",
+    )
     rtxio_pack: bool = Field(
         default=False,
         description="When True, all DDS textures in the output directory are compressed into an RTX IO .pkg file "
@@ -0,0 +1,279 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "PACKAGE_MANIFEST_FILE_NAME",
+    "CollectionPlan",
+    "CollectionReport",
+    "ManifestEntry",
+    "PackageManifest",
+]
+
+import dataclasses
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import carb
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.path_utils import hash_files as _hash_files
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
+
+from .collector import CollectionJob as _CollectionJob
+
+PACKAGE_MANIFEST_FILE_NAME = ".package_manifest.json"
+
+_MANIFEST_VERSION = 1
+_KIND_FILE = "file"
+_KIND_LAYER = "layer"
+
+
+@dataclasses.dataclass
+class ManifestEntry:
+    """
+    The source of an output written in the package.
+
+    Args:
+        kind: "file" for copied dependencies, "layer" for exported layers
+        source: the path of the copied file, or of the original layer
+        digest: the hash of the file content, or of the exported layer content
+        size: the size of the copied file
+        mtime_ns: the modification time of the copied file
+    """
+
+    kind: str
+    source: str
+    digest: str | None = None
+    size: int | None = None
+    mtime_ns: int | None = None
+
+
+@dataclasses.dataclass
+class CollectionReport:
+    """Summary of the outputs written and reused by a collection"""
+
+    copied_files: int = 0
+    copied_bytes: int = 0
+    exported_layers: int = 0
+    reused_files: int = 0
+    reused_bytes: int = 0
+    reused_layers: int = 0
+    removed_outputs: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"Copied {self.copied_files} files ({self.copied_bytes} bytes), "
+            f"reused {self.reused_files} files ({self.reused_bytes} bytes), "
+            f"exported {self.exported_layers} layers, reused {self.reused_layers} layers, "
+            f"removed {self.removed_outputs} outdated outputs"
+        )
+
+
+@dataclasses.dataclass
+class CollectionPlan:
+    """
+    The work left to update a package.
+
+    Args:
+        jobs: the jobs to write, their outputs are missing or outdated
+        stale_outputs: the outputs of the previous collection that are no longer part of the package
+        manifest: the manifest describing the package once the jobs are written
+        report: the summary of the collection, assuming every job is written
+    """
+
+    jobs: list[_CollectionJob]
+    stale_outputs: list[str]
+    manifest: PackageManifest
+    report: CollectionReport
+
+
+class PackageManifest:
+    def __init__(self, entries: dict[str, ManifestEntry] | None = None):
+        """
+        The sources of every output of a package, stored in the package directory.
+
+        Packaging a mod again compares the manifest with the new dependencies so only the outputs of new or modified
+        sources are written again. Files are compared by size and modification time, and by content hash when only the
+        modification time changed. Layers are compared by the hash of their content once the asset paths are updated.
+
+        Args:
+            entries: the entries of the manifest, keyed by output path relative to the package directory
+        """
+        self._entries = entries or {}
+
+    @property
+    def entries(self) -> dict[str, ManifestEntry]:
+        """The entries of the manifest, keyed by output path relative to the package directory"""
+        return self._entries
+
+    @staticmethod
+    def get_path(output_directory: Path | str) -> str:
+        """
+        Get the path of the manifest of a package.
+
+        Args:
+            output_directory: the package directory
+
+        Returns:
+            The path of the manifest file
+        """
+        return str(_OmniUrl(output_directory) / PACKAGE_MANIFEST_FILE_NAME)
+
+    @classmethod
+    def load(cls, output_directory: Path | str) -> PackageManifest | None:
+        """
+        Read the manifest of a package.
+
+        Args:
+            output_directory: the package directory
+
+        Returns:
+            The manifest, or None if the package has no valid manifest
+        """
+        manifest_path = cls.get_path(output_directory)
+        if not _OmniUrl(manifest_path).exists:
+            return None
+        try:
+            data = _read_json_file(manifest_path)
+            if data.get("version") != _MANIFEST_VERSION:
+                return None
+            entries = {key: ManifestEntry(**value) for key, value in data["entries"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            carb.log_warn(f"Ignoring the invalid package manifest {manifest_path}: {e}")
+            return None
+        return cls(entries)
+
+    def save(self, output_directory: Path | str):
+        """
+        Write the manifest in a package.
+
+        Args:
+            output_directory: the package directory
+
+        Raises:
+            OSError: if the manifest can't be written
+        """
+        data: dict[str, Any] = {
+            "version": _MANIFEST_VERSION,
+            "entries": {key: dataclasses.asdict(entry) for key, entry in sorted(self._entries.items())},
+        }
+        _write_json_file(self.get_path(output_directory), data)
+
+    def plan(self, jobs: list[_CollectionJob], output_directory: Path | str) -> CollectionPlan:
+        """
+        Compare the jobs of a new collection with the manifest.
+
+        This call reads the sources and exports the layers to memory, it should not run on the main thread.
+
+        Args:
+            jobs: the jobs of the new collection
+            output_directory: the package directory
+
+        Returns:
+            The jobs to write, the outputs to remove and the manifest to save once the jobs are written
+        """
+        output_root = _OmniUrl(output_directory).path
+        report = CollectionReport()
+        entries: dict[str, ManifestEntry] = {}
+        to_write: list[_CollectionJob] = []
+        to_hash: dict[str, list[tuple[_CollectionJob, str, ManifestEntry]]] = {}
+
+        for job in jobs:
+            key = Path(os.path.relpath(job.output_path.path, output_root)).as_posix()
+            previous = self._entries.get(key)
+            output_stat = self.__stat(job.output_path.path)
+
+            if job.layer is not None:
+                entry = ManifestEntry(
+                    _KIND_LAYER, job.input_path, digest=hashlib.md5(job.layer.ExportToString().encode()).hexdigest()
+                )
+                entries[key] = entry
+                if output_stat and previous and previous.kind == _KIND_LAYER and previous.digest == entry.digest:
+                    report.reused_layers += 1
+                else:
+                    report.exported_layers += 1
+                    to_write.append(job)
+                continue
+
+            source_stat = self.__stat(job.input_path)
+            if source_stat is None:
+                # Let the copy report the error
+                entries[key] = ManifestEntry(_KIND_FILE, job.input_path)
+                to_write.append(job)
+                report.copied_files += 1
+                continue
+
+            entry = ManifestEntry(
+                _KIND_FILE, job.input_path, size=source_stat.st_size, mtime_ns=source_stat.st_mtime_ns
+            )
+            entries[key] = entry
+            is_same_source = (
+                previous is not None
+                and previous.kind == _KIND_FILE
+                and previous.source == entry.source
+                and previous.size == entry.size
+            )
+            if is_same_source and output_stat and output_stat.st_size == entry.size:
+                if previous.mtime_ns == entry.mtime_ns and previous.digest:
+                    entry.digest = previous.digest
+                    report.reused_files += 1
+                    report.reused_bytes += entry.size
+                    continue
+                if previous.digest:
+                    # Only the modification time changed: the content decides
+                    to_hash.setdefault(job.input_path, []).append((job, previous.digest, entry))
+                    continue
+            to_hash.setdefault(job.input_path, []).append((job, "", entry))
+
+        # Hash the new sources too, so touching them without changing them doesn't copy them again on the next run
+        for source, digest in _hash_files(list(to_hash)).items():
+            for job, previous_digest, entry in to_hash[source]:
+                entry.digest = digest
+                if digest and digest == previous_digest:
+                    report.reused_files += 1
+                    report.reused_bytes += entry.size
+                else:
+                    to_write.append(job)
+                    report.copied_files += 1
+                    report.copied_bytes += entry.size
+
+        stale_outputs = [
+            output_path
+            for output_path in (str(_OmniUrl(output_directory) / key) for key in self._entries if key not in entries)
+            if self.__stat(output_path) is not None
+        ]
+        report.removed_outputs = len(stale_outputs)
+
+        # Keep the order of the jobs
+        ordered_jobs = set(map(id, to_write))
+        return CollectionPlan(
+            jobs=[job for job in jobs if id(job) in ordered_jobs],
+            stale_outputs=stale_outputs,
+            manifest=PackageManifest(entries),
+            report=report,
+        )
+
+    @staticmethod
+    def __stat(path: str) -> os.stat_result | None:
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Any
 
 import carb
+import carb.settings
 import omni.client
 import omni.usd
 from lightspeed.common.constants import REMIX_CAPTURE_FOLDER as _REMIX_CAPTURE_FOLDER
@@ -49,11 +50,17 @@ from omni.flux.utils.material_converter.utils import MaterialConverterUtils as _
 from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper as _OmniClientWrapper
 from pxr import Sdf, Usd, UsdUtils
 
+from .collector import AssetCollector as _AssetCollector
+from .collector import CollectionJob as _CollectionJob
 from .enum import FLATTEN_PACKAGING_OUTPUT_FORMAT as _FLATTEN_PACKAGING_OUTPUT_FORMAT
 from .enum import ModPackagingMode as _ModPackagingMode
 from .enum import get_packaged_root_export_args as _get_packaged_root_export_args
 from .enum import get_packaged_root_output_suffix as _get_packaged_root_output_suffix
 from .items import ModPackagingSchema as _ModPackagingSchema
+from .manifest import CollectionReport as _CollectionReport
+from .manifest import PackageManifest as _PackageManifest
+
+EXTS_COLLECT_MAX_CONCURRENCY = "/exts/lightspeed.trex.packaging.core/collect/max_concurrency"
 
 
 class PackagingCore:
@@ -69,6 +76,7 @@ class PackagingCore:
             "_status": None,
             "_can_cancel": None,
             "_collected_dependencies": None,
+            "_collection_report": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -80,6 +88,7 @@ class PackagingCore:
         self._can_cancel = True
         self._temp_files = {}
         self._collected_dependencies = {}
+        self._collection_report = None
         self._package_task = None
         self._rtxio_core = _RtxIoCore()
         self._rtxio_progress_sub = self._rtxio_core.subscribe_progress(self._on_rtxio_progress)
@@ -159,6 +168,15 @@ class PackagingCore:
         """
         return self._can_cancel
 
+    @property
+    def collection_report(self) -> _CollectionReport | None:
+        """Get the summary of the outputs copied and reused by the last incremental packaging.
+
+        Returns:
+            The summary of the last incremental packaging, or None if the last packaging was not incremental.
+        """
+        return self._collection_report
+
     def package(self, schema: dict):
         r"""
         Execute the project packaging process using the given schema.
@@ -322,6 +340,7 @@ class PackagingCore:
                 model.output_directory,
                 redirected_dependencies,
                 output_format,
+                incremental=model.incremental,
             )
             errors.extend(collect_errors)
             failed_assets = collected_failed_assets
@@ -445,22 +464,20 @@ class PackagingCore:
             return []
 
         def scan_invalid_assets(queue_progress: Callable[[int, int | None, Any | None], None]):
-            stage_prims = list(stage.TraverseAll())
-            total_prims = len(stage_prims)
-            queue_progress(0, total_prims, "Looking for invalid references...")
+            queue_progress(0, len(stage.GetUsedLayers()), "Looking for invalid references...")
 
-            processed_prim_count = 0
+            processed_layer_count = 0
 
-            def on_prim_processed():
-                nonlocal processed_prim_count
-                processed_prim_count += 1
-                queue_progress(processed_prim_count)
+            def on_layer_processed():
+                nonlocal processed_layer_count
+                processed_layer_count += 1
+                queue_progress(processed_layer_count)
 
-            return self._rtxio_core.collect_invalid_stage_assets(
-                stage_prims,
+            return self._rtxio_core.collect_invalid_layer_assets(
+                stage,
                 unresolved_paths,
                 is_cancelled=lambda: self._cancel_token,
-                on_prim_processed=on_prim_processed,
+                on_layer_processed=on_layer_processed,
             )
 
         def apply_progress(current: int, total: int, status: str):
@@ -773,9 +790,11 @@ class PackagingCore:
         output_directory: Path | str,
         redirected_dependencies: set[str],
         output_format: _UsdExtensions | None,
+        incremental: bool = False,
     ) -> tuple[list[str], list[tuple[str, str, str]]]:
         errors = []
         failed_assets = []
+        self._collection_report = None
         if self._cancel_token:
             return errors, failed_assets
 
@@ -882,19 +901,23 @@ class PackagingCore:
             if self._cancel_token:
                 return errors, failed_assets
 
-            # Make sure to create a clean packaging directory
-            if _OmniUrl(output_directory).exists:
-                await _OmniClientWrapper.delete(str(output_directory))
+            previous_manifest = _PackageManifest.load(output_directory) if incremental else None
+            if previous_manifest is None:
+                # Make sure to create a clean packaging directory
+                if _OmniUrl(output_directory).exists:
+                    await _OmniClientWrapper.delete(str(output_directory))
+            else:
+                # The manifest is written back once the package is up to date, so an interrupted update can't be reused
+                await _OmniClientWrapper.delete(_PackageManifest.get_path(output_directory))
 
             self._packaging_new_stage("Collecting assets...", len(self._collected_dependencies))
 
-            # Copy all collected assets to the output directory
+            root_temp_path = _OmniUrl(temp_root_layer.identifier).path
+            jobs = []
             for temp_input_path, relative_output_path in self._collected_dependencies.items():
-                if self._cancel_token:
-                    return errors, failed_assets
                 output_path = _OmniUrl(output_directory) / relative_output_path
                 input_path = self._get_original_path(temp_input_path)
-                is_packaged_root = temp_input_path == _OmniUrl(temp_root_layer.identifier).path
+                is_packaged_root = temp_input_path == root_temp_path
                 if input_path:
                     output_name = (
                         self._get_packaged_root_output_name(input_path, output_format)
@@ -902,29 +925,51 @@ class PackagingCore:
                         else _OmniUrl(input_path).name
                     )
                     output_path = output_path.with_name(output_name)
-
-                # Create all the missing folders in the tree
-                cumulative_url = None
-                for part in Path(output_path.parent_url).parts:
-                    if not cumulative_url:
-                        cumulative_url = _OmniUrl(part)
-                    else:
-                        cumulative_url /= part
-                    if not str(cumulative_url).startswith(str(output_directory)) or cumulative_url.exists:
-                        continue
-                    await _OmniClientWrapper.create_folder(str(cumulative_url))
-
-                # If the dependency is a layer, export it to the output directory to keep references changes applied
-                input_layer = temp_layer_paths.get(temp_input_path)
-                if input_layer:
-                    await self._export_packaged_layer_async(
-                        input_layer, output_path, output_format, is_packaged_root=is_packaged_root
+                # If the dependency is a layer, it is exported to the output directory to keep references changes
+                # applied. Otherwise, the dependency is simply copied to the output directory.
+                jobs.append(
+                    _CollectionJob(
+                        input_path=temp_input_path,
+                        output_path=output_path,
+                        layer=temp_layer_paths.get(temp_input_path),
+                        is_packaged_root=is_packaged_root,
                     )
-                # Otherwise simply copy the dependency to the output directory
-                else:
-                    await _OmniClientWrapper.copy(temp_input_path, str(output_path))
+                )
 
+            plan = None
+            if incremental:
+                self._packaging_update_status("Comparing assets with the previous package...")
+                plan = await self._run_packaging_blocking_call(
+                    (previous_manifest or _PackageManifest()).plan, jobs, output_directory
+                )
+                if self._cancel_token or plan is None:
+                    return errors, failed_assets
+                for stale_output in plan.stale_outputs:
+                    await _OmniClientWrapper.delete(stale_output)
+                self._packaging_update_status("Collecting assets...")
+                self.current_count += len(jobs) - len(plan.jobs)
+                jobs = plan.jobs
+
+            def on_job_done():
                 self.current_count += 1
+
+            collector = _AssetCollector(
+                output_directory,
+                export_layer=lambda job: self._export_packaged_layer_async(
+                    job.layer, job.output_path, output_format, is_packaged_root=job.is_packaged_root
+                ),
+                is_cancelled=lambda: self._cancel_token,
+                on_job_done=on_job_done,
+                max_concurrency=carb.settings.get_settings().get(EXTS_COLLECT_MAX_CONCURRENCY) or 16,
+            )
+            errors.extend(await collector.collect(jobs))
+            if self._cancel_token:
+                return errors, failed_assets
+
+            if plan is not None and not errors:
+                plan.manifest.save(output_directory)
+                self._collection_report = plan.report
+                carb.log_info(f"Incremental packaging of {output_directory}: {plan.report}")
         # Make sure to bubble up failures
         except Exception as e:  # noqa: BLE001
             errors.append(str(e))
@@ -16,13 +16,17 @@
 """
 
 from .e2e.test_packaging import TestPackagingCoreE2E
+from .unit.test_collector import TestAssetCollector
 from .unit.test_items import TestModPackagingSchema
+from .unit.test_manifest import TestPackageManifest
 from .unit.test_packaging import TestPackagingCoreUnit
 from .unit.test_repair import TestPackagingRepairCoreUnit
 from .unit.test_repair_authoring import TestRepairAuthoringCore
 
 __all__ = [
+    "TestAssetCollector",
     "TestModPackagingSchema",
+    "TestPackageManifest",
     "TestPackagingCoreE2E",
     "TestPackagingCoreUnit",
     "TestPackagingRepairCoreUnit",
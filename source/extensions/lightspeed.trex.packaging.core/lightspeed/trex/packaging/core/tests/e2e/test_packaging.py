@@ -156,7 +156,7 @@ class TestPackagingCoreE2E(omni.kit.test.AsyncTestCase):
                     (3, 3),
                 ),
                 ("Listing references...", (0, INDETERMINATE_PROGRESS_TOTAL), (0, INDETERMINATE_PROGRESS_TOTAL)),
-                ("Looking for invalid references...", (0, 0), (18, 18)),
+                ("Looking for invalid references...", (0, 0), (10, 10)),
                 ("Redirecting dependencies...", (0, 13), (13, 13)),
                 ("Creating temporary layers...", (0, 10), (10, 10)),
                 ("Listing assets to collect...", (0, 13), (13, 13)),
@@ -0,0 +1,182 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import omni.kit.test
+from lightspeed.trex.packaging.core.collector import AssetCollector, CollectionJob
+from omni.flux.utils.common.omni_url import OmniUrl
+from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper
+
+_OUTPUT_DIRECTORY = "S:/mods/ProjectMod"
+
+
+class TestAssetCollector(omni.kit.test.AsyncTestCase):
+    def _make_collector(self, export_layer=None, is_cancelled=None, max_concurrency: int = 16):
+        self.done_count = 0
+
+        def on_job_done():
+            self.done_count += 1
+
+        return AssetCollector(
+            _OUTPUT_DIRECTORY,
+            export_layer=export_layer or AsyncMock(),
+            is_cancelled=is_cancelled or (lambda: False),
+            on_job_done=on_job_done,
+            max_concurrency=max_concurrency,
+        )
+
+    def _make_copy_job(self, relative_path: str) -> CollectionJob:
+        return CollectionJob(
+            input_path=f"C:/projects/Project/{relative_path}", output_path=OmniUrl(_OUTPUT_DIRECTORY) / relative_path
+        )
+
+    async def test_get_output_directories_returns_unique_directories_parents_first(self):
+        # Arrange
+        collector = self._make_collector()
+        jobs = [
+            self._make_copy_job("mod.usda"),
+            self._make_copy_job("textures/a.dds"),
+            self._make_copy_job("textures/b.dds"),
+            self._make_copy_job("textures/sub/c.dds"),
+            self._make_copy_job("meshes/d.usd"),
+        ]
+
+        # Act
+        levels = collector.get_output_directories(jobs)
+
+        # Assert
+        self.assertEqual(
+            [
+                [_OUTPUT_DIRECTORY],
+                [f"{_OUTPUT_DIRECTORY}/textures", f"{_OUTPUT_DIRECTORY}/meshes"],
+                [f"{_OUTPUT_DIRECTORY}/textures/sub"],
+            ],
+            levels,
+        )
+
+    async def test_collect_creates_each_directory_once_and_copies_every_file(self):
+        # Arrange
+        collector = self._make_collector()
+        jobs = [self._make_copy_job(f"textures/{index}.dds") for index in range(20)]
+
+        # Act
+        with (
+            patch.object(OmniClientWrapper, "create_folder", AsyncMock()) as create_folder_mock,
+            patch.object(OmniClientWrapper, "copy", AsyncMock()) as copy_mock,
+        ):
+            errors = await collector.collect(jobs)
+
+        # Assert
+        self.assertEqual([], errors)
+        self.assertEqual(
+            [call(_OUTPUT_DIRECTORY), call(f"{_OUTPUT_DIRECTORY}/textures")], create_folder_mock.call_args_list
+        )
+        self.assertCountEqual([call(job.input_path, str(job.output_path)) for job in jobs], copy_mock.call_args_list)
+        self.assertEqual(20, self.done_count)
+
+    async def test_collect_copies_at_most_max_concurrency_files_at_once(self):
+        # Arrange
+        collector = self._make_collector(max_concurrency=3)
+        jobs = [self._make_copy_job(f"{index}.dds") for index in range(12)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def copy(*_):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        # Act
+        with (
+            patch.object(OmniClientWrapper, "create_folder", AsyncMock()),
+            patch.object(OmniClientWrapper, "copy", AsyncMock(side_effect=copy)),
+        ):
+            await collector.collect(jobs)
+
+        # Assert
+        self.assertEqual(3, max_in_flight)
+        self.assertEqual(12, self.done_count)
+
+    async def test_collect_exports_layers_while_files_are_copied(self):
+        # Arrange
+        copy_started = asyncio.Event()
+        export_layer = AsyncMock(side_effect=lambda _job: copy_started.wait())
+        collector = self._make_collector(export_layer=export_layer)
+        layer_job = CollectionJob(
+            input_path="C:/projects/Project/mod_temp.usda",
+            output_path=OmniUrl(_OUTPUT_DIRECTORY) / "mod.usda",
+            layer=Mock(),
+            is_packaged_root=True,
+        )
+        copy_job = self._make_copy_job("a.dds")
+
+        async def copy(*_):
+            copy_started.set()
+
+        # Act
+        with (
+            patch.object(OmniClientWrapper, "create_folder", AsyncMock()),
+            patch.object(OmniClientWrapper, "copy", AsyncMock(side_effect=copy)),
+        ):
+            errors = await asyncio.wait_for(collector.collect([layer_job, copy_job]), timeout=5)
+
+        # Assert
+        self.assertEqual([], errors)
+        export_layer.assert_called_once_with(layer_job)
+        self.assertEqual(2, self.done_count)
+
+    async def test_collect_copy_fails_stops_scheduling_and_returns_error(self):
+        # Arrange
+        collector = self._make_collector(max_concurrency=1)
+        jobs = [self._make_copy_job(f"{index}.dds") for index in range(5)]
+
+        # Act
+        with (
+            patch.object(OmniClientWrapper, "create_folder", AsyncMock()),
+            patch.object(OmniClientWrapper, "copy", AsyncMock(side_effect=[None, OSError("disk full")])) as copy_mock,
+        ):
+            errors = await collector.collect(jobs)
+
+        # Assert
+        self.assertEqual(["disk full"], errors)
+        self.assertEqual(2, copy_mock.call_count)
+        self.assertEqual(1, self.done_count)
+
+    async def test_collect_cancelled_stops_scheduling(self):
+        # Arrange
+        cancelled = False
+        collector = self._make_collector(is_cancelled=lambda: cancelled, max_concurrency=1)
+        jobs = [self._make_copy_job(f"{index}.dds") for index in range(5)]
+
+        async def copy(*_):
+            nonlocal cancelled
+            cancelled = True
+
+        # Act
+        with (
+            patch.object(OmniClientWrapper, "create_folder", AsyncMock()),
+            patch.object(OmniClientWrapper, "copy", AsyncMock(side_effect=copy)) as copy_mock,
+        ):
+            errors = await collector.collect(jobs)
+
+        # Assert
+        self.assertEqual([], errors)
+        self.assertEqual(1, copy_mock.call_count)
@@ -0,0 +1,166 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import omni.kit.test
+from lightspeed.trex.packaging.core.collector import CollectionJob
+from lightspeed.trex.packaging.core.manifest import PACKAGE_MANIFEST_FILE_NAME, PackageManifest
+from omni.flux.utils.common.omni_url import OmniUrl
+
+
+class TestPackageManifest(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_dir = Path(self.temp_dir.name) / "project"
+        self.output_dir = Path(self.temp_dir.name) / "package"
+        self.project_dir.mkdir()
+        self.output_dir.mkdir()
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_source(self, name: str, data: bytes, age_seconds: float = 60) -> str:
+        path = self.project_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        mtime = time.time() - age_seconds
+        os.utime(path, (mtime, mtime))
+        return path.as_posix()
+
+    def _file_job(self, source_path: str, relative_output: str) -> CollectionJob:
+        return CollectionJob(input_path=source_path, output_path=OmniUrl(self.output_dir) / relative_output)
+
+    def _layer_job(self, content: str, relative_output: str) -> CollectionJob:
+        layer = Mock()
+        layer.ExportToString.return_value = content
+        return CollectionJob(
+            input_path=(self.project_dir / relative_output).as_posix(),
+            output_path=OmniUrl(self.output_dir) / relative_output,
+            layer=layer,
+        )
+
+    def _write_outputs(self, jobs: list[CollectionJob]):
+        for job in jobs:
+            output_path = Path(job.output_path.path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if job.layer is None:
+                shutil.copyfile(job.input_path, output_path)
+            else:
+                output_path.write_text(job.layer.ExportToString())
+
+    def _package(self, manifest: PackageManifest, jobs: list[CollectionJob]):
+        plan = manifest.plan(jobs, self.output_dir)
+        self._write_outputs(plan.jobs)
+        plan.manifest.save(self.output_dir)
+        return plan
+
+    async def test_plan_without_previous_package_writes_every_job(self):
+        # Arrange
+        texture = self._write_source("textures/a.dds", b"texture")
+        jobs = [self._file_job(texture, "textures/a.dds"), self._layer_job("#usda 1.0", "mod.usda")]
+
+        # Act
+        plan = PackageManifest().plan(jobs, self.output_dir)
+
+        # Assert
+        self.assertEqual(jobs, plan.jobs)
+        self.assertEqual([], plan.stale_outputs)
+        self.assertEqual({"mod.usda", "textures/a.dds"}, set(plan.manifest.entries))
+        self.assertIsNotNone(plan.manifest.entries["textures/a.dds"].digest)
+        self.assertEqual((1, 7, 1), (plan.report.copied_files, plan.report.copied_bytes, plan.report.exported_layers))
+        self.assertEqual((0, 0, 0), (plan.report.reused_files, plan.report.reused_bytes, plan.report.reused_layers))
+
+    async def test_plan_unchanged_package_reuses_every_output(self):
+        # Arrange
+        texture = self._write_source("textures/a.dds", b"texture")
+        jobs = [self._file_job(texture, "textures/a.dds"), self._layer_job("#usda 1.0", "mod.usda")]
+        self._package(PackageManifest(), jobs)
+
+        # Act
+        plan = PackageManifest.load(self.output_dir).plan(jobs, self.output_dir)
+
+        # Assert
+        self.assertEqual([], plan.jobs)
+        self.assertEqual((1, 7, 1), (plan.report.reused_files, plan.report.reused_bytes, plan.report.reused_layers))
+        self.assertEqual((0, 0, 0), (plan.report.copied_files, plan.report.copied_bytes, plan.report.exported_layers))
+
+    async def test_plan_modified_sources_are_written_again(self):
+        # Arrange
+        touched = self._write_source("touched.dds", b"same", age_seconds=120)
+        modified = self._write_source("modified.dds", b"before", age_seconds=120)
+        jobs = [
+            self._file_job(touched, "touched.dds"),
+            self._file_job(modified, "modified.dds"),
+            self._layer_job("#usda 1.0", "mod.usda"),
+        ]
+        self._package(PackageManifest(), jobs)
+        self._write_source("touched.dds", b"same")
+        self._write_source("modified.dds", b"after!")
+        jobs[2].layer.ExportToString.return_value = '#usda 1.0\n(doc = "changed")'
+
+        # Act
+        plan = PackageManifest.load(self.output_dir).plan(jobs, self.output_dir)
+
+        # Assert
+        self.assertEqual([jobs[1], jobs[2]], plan.jobs)
+        self.assertEqual((1, 4), (plan.report.reused_files, plan.report.reused_bytes))
+        self.assertEqual((1, 6, 1), (plan.report.copied_files, plan.report.copied_bytes, plan.report.exported_layers))
+
+    async def test_plan_missing_or_modified_outputs_are_written_again(self):
+        # Arrange
+        deleted = self._write_source("deleted.dds", b"deleted")
+        truncated = self._write_source("truncated.dds", b"truncated")
+        jobs = [self._file_job(deleted, "deleted.dds"), self._file_job(truncated, "truncated.dds")]
+        self._package(PackageManifest(), jobs)
+        (self.output_dir / "deleted.dds").unlink()
+        (self.output_dir / "truncated.dds").write_bytes(b"trunc")
+
+        # Act
+        plan = PackageManifest.load(self.output_dir).plan(jobs, self.output_dir)
+
+        # Assert
+        self.assertEqual(jobs, plan.jobs)
+
+    async def test_plan_removed_dependencies_are_stale_outputs(self):
+        # Arrange
+        kept = self._write_source("kept.dds", b"kept")
+        removed = self._write_source("removed.dds", b"removed")
+        self._package(PackageManifest(), [self._file_job(kept, "kept.dds"), self._file_job(removed, "removed.dds")])
+
+        # Act
+        plan = PackageManifest.load(self.output_dir).plan([self._file_job(kept, "kept.dds")], self.output_dir)
+
+        # Assert
+        self.assertEqual([str(OmniUrl(self.output_dir) / "removed.dds")], plan.stale_outputs)
+        self.assertEqual(1, plan.report.removed_outputs)
+        self.assertEqual({"kept.dds"}, set(plan.manifest.entries))
+
+    async def test_load_invalid_manifest_returns_none(self):
+        # Arrange
+        (self.output_dir / PACKAGE_MANIFEST_FILE_NAME).write_text('{"version": 0, "entries": {}}')
+
+        # Act
+        manifest = PackageManifest.load(self.output_dir)
+
+        # Assert
+        self.assertIsNone(manifest)
@@ -77,7 +77,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         # Arrange
         packaging_core = PackagingCore()
         stage_mock = Mock()
-        stage_mock.TraverseAll.return_value = [Mock()]
+        stage_mock.GetUsedLayers.return_value = [Mock()]
 
         temp_layer = "C:/projects/MainProject/sublayer_temp.usda"
         source_layer = "C:/projects/MainProject/sublayer.usda"
@@ -98,7 +98,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             with (
                 patch.object(
                     packaging_core._rtxio_core,
-                    "collect_invalid_stage_assets",
+                    "collect_invalid_layer_assets",
                     return_value=invalid_assets,
                 ),
                 patch.object(packaging_core, "_get_original_path", side_effect=get_original_path),
@@ -541,6 +541,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             model_mock.return_value.selected_layer_paths = [root_mod_mock]
             model_mock.return_value.context_name = context_name_mock
             model_mock.return_value.output_directory = output_directory_mock
+            model_mock.return_value.incremental = False
             model_mock.return_value.ignored_errors = []
             model_mock.return_value.packaging_mode = ModPackagingMode.REDIRECT
             model_mock.return_value.output_format = None
@@ -606,6 +607,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
                 output_directory_mock,
                 redirected_mock,
                 None,
+                incremental=False,
             ),
             collect_mock.call_args,
         )
@@ -654,6 +656,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             model_mock.return_value.selected_layer_paths = [root_mod_mock]
             model_mock.return_value.context_name = context_name_mock
             model_mock.return_value.output_directory = output_directory_mock
+            model_mock.return_value.incremental = False
             model_mock.return_value.ignored_errors = []
             model_mock.return_value.packaging_mode = ModPackagingMode.IMPORT
             model_mock.return_value.output_format = None
@@ -699,6 +702,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
                 output_directory_mock,
                 set(),
                 None,
+                incremental=False,
             ),
             collect_mock.call_args,
         )
@@ -734,7 +738,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         exported_mod_layer_mock.customLayerData = {}
         source_stage_mock = Mock(name="source_stage")
         temp_stage_mock = Mock(name="temp_stage")
-        temp_stage_mock.TraverseAll.return_value = []
+        temp_stage_mock.GetUsedLayers.return_value = []
         flattened_stage_mock = Mock(name="flattened_stage")
 
         with (
@@ -747,7 +751,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(PackagingCore, "_collect") as collect_mock,
             patch.object(PackagingCore, "_packaging_completed") as completed_mock,
             patch.object(PackagingCore, "_update_layer_metadata") as update_metadata_mock,
-            patch.object(packaging_core._rtxio_core, "collect_invalid_stage_assets") as collect_invalid_mock,
+            patch.object(packaging_core._rtxio_core, "collect_invalid_layer_assets") as collect_invalid_mock,
             patch.object(UsdUtils, "ComputeAllDependencies") as compute_dependencies_mock,
             patch.object(Sdf.Layer, "FindOrOpen") as find_open_mock,
         ):
@@ -755,6 +759,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             model_mock.return_value.selected_layer_paths = [root_mod_mock]
             model_mock.return_value.context_name = context_name_mock
             model_mock.return_value.output_directory = output_directory_mock
+            model_mock.return_value.incremental = False
             model_mock.return_value.ignored_errors = []
             model_mock.return_value.packaging_mode = ModPackagingMode.FLATTEN
             model_mock.return_value.output_format = None
@@ -821,6 +826,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
                 output_directory_mock,
                 set(),
                 _UsdExtensions.USD,
+                incremental=False,
             ),
             collect_mock.call_args,
         )
@@ -1612,7 +1618,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             cancel_if_stage("get_redirected_dependencies")
             return set(), set()
 
-        async def collect(*_args):
+        async def collect(*_args, **_kwargs):
             cancel_if_stage("collect")
             return [], []
 
@@ -228,8 +228,8 @@ class TestPackagingRepairCoreUnit(omni.kit.test.AsyncTestCase):
     def _collect_invalid_assets(root_layer: Sdf.Layer, unresolved_paths: list[str]) -> set[tuple[str, str, str]]:
         stage = Usd.Stage.Open(root_layer.identifier)
         try:
-            return RtxIoCore().collect_invalid_stage_assets(
-                list(stage.TraverseAll()),
+            return RtxIoCore().collect_invalid_layer_assets(
+                stage,
                 unresolved_paths,
                 include_missing_authored_textures=False,
             )
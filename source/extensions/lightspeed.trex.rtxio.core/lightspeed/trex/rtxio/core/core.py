@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Any
 
 import carb
+import carb.settings
 import carb.tokens
 import omni.kit.app
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
@@ -34,6 +35,7 @@ from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.progress import run_worker_with_latest_progress as _run_worker_with_latest_progress
 from pxr import Sdf, Usd, UsdUtils
 
 _PACKAGING_TEXTURE_SUFFIXES = frozenset(suffix.lower() for suffix in _SUPPORTED_TEXTURE_EXTENSIONS)
@@ -41,6 +43,19 @@ _RTXIO_PACKAGER_EXE_RELATIVE = Path("deps") / "rtxio" / "bin" / "RtxIoResourcePa
 _RTXIO_EXTRACTOR_EXE_RELATIVE = Path("deps") / "rtxio" / "bin" / "RtxIoResourceExtractor.exe"
 _RTXIO_PACKAGE_MAGIC = b"\x0d\xd0\xad\xba"
 
+EXTS_INVALID_ASSET_SCAN_MAX_WORKERS = "/exts/lightspeed.trex.rtxio.core/invalid_asset_scan/max_workers"
+
+
+def _normalize_packaging_absolute_path(absolute_path: str) -> str:
+    return Path(absolute_path).as_posix()
+
+
+def _is_missing_packaging_texture_path(absolute_path: str) -> bool:
+    absolute_url = _OmniUrl(absolute_path)
+    if absolute_url.suffix.lower() not in _PACKAGING_TEXTURE_SUFFIXES:
+        return False
+    return not absolute_url.exists
+
 
 @dataclass(frozen=True)
 class RtxIoProbeResult:
@@ -150,67 +165,42 @@ class RtxIoCore:
             return []
         return [pkg for pkg in path.rglob("*.pkg") if cls.is_rtxio_package_file(pkg)]
 
-    @staticmethod
-    def _normalize_packaging_absolute_path(absolute_path: str) -> str:
-        return Path(absolute_path).as_posix()
-
-    @staticmethod
-    def _is_missing_packaging_texture_path(absolute_path: str) -> bool:
-        absolute_url = _OmniUrl(absolute_path)
-        if absolute_url.suffix.lower() not in _PACKAGING_TEXTURE_SUFFIXES:
-            return False
-        return not absolute_url.exists
-
-    def collect_invalid_stage_assets(
+    def collect_invalid_layer_assets(
         self,
-        stage_prims: list[Usd.Prim],
+        stage: Usd.Stage,
         unresolved_paths: list[str],
         *,
         include_missing_authored_textures: bool = True,
         is_cancelled: Callable[[], bool] | None = None,
-        on_prim_processed: Callable[[], None] | None = None,
+        on_layer_processed: Callable[[], None] | None = None,
     ) -> set[tuple[str, str, str]]:
-        """Collect invalid authored asset references from stage prims."""
-        unresolved_set = (
-            {self._normalize_packaging_absolute_path(path) for path in unresolved_paths} if unresolved_paths else None
-        )
-        result: set[tuple[str, str, str]] = set()
-
-        for prim in stage_prims:
-            if is_cancelled and is_cancelled():
-                return result
-
-            if unresolved_set:
-                prim_stack = prim.GetPrimStack()
-                for prim_spec in prim_stack:
-                    for ref in prim_spec.referenceList.GetAddedOrExplicitItems():
-                        resolved_path = self._normalize_packaging_absolute_path(
-                            prim_spec.layer.ComputeAbsolutePath(ref.assetPath)
-                        )
-                        if resolved_path in unresolved_set:
-                            result.add((prim_spec.layer.identifier, str(prim.GetPath()), resolved_path))
-
-            for prop in prim.GetAttributes():
-                if not isinstance(prop.Get(), Sdf.AssetPath):
-                    continue
-                property_stack = prop.GetPropertyStack(Usd.TimeCode.Default())
-                for prop_spec in property_stack:
-                    prop_layer = prop_spec.layer
-                    authored_value = prop_spec.default
-                    if not isinstance(authored_value, Sdf.AssetPath) or not authored_value.path:
-                        continue
-                    abs_path = self._normalize_packaging_absolute_path(
-                        prop_layer.ComputeAbsolutePath(authored_value.path)
-                    )
-                    if include_missing_authored_textures and self._is_missing_packaging_texture_path(abs_path):
-                        result.add((prop_layer.identifier, str(prop.GetPath()), abs_path))
-                    if unresolved_set and abs_path in unresolved_set:
-                        result.add((prop_layer.identifier, str(prop.GetPath()), abs_path))
+        """Collect invalid authored asset references from the layers used by a stage.
 
-            if on_prim_processed:
-                on_prim_processed()
+        Returns the same references as a scan of every composed prim of the stage, but reads the layer specs in
+        parallel instead of composing every attribute value.
 
-        return result
+        Args:
+            stage: Stage whose used layers should be scanned.
+            unresolved_paths: Asset paths that could not be resolved.
+            include_missing_authored_textures: Whether to report authored texture paths that don't exist.
+            is_cancelled: Optional callback returning whether the scan should stop.
+            on_layer_processed: Optional callback called after every scanned layer.
+
+        Returns:
+            The authoring layer identifier, composed prim or property path, and resolved asset path of every invalid
+            reference.
+        """
+        # The scanner imports the packaging path helpers of this module
+        from .scanner import InvalidAssetScanner as _InvalidAssetScanner  # noqa: PLC0415
+
+        max_workers = carb.settings.get_settings().get(EXTS_INVALID_ASSET_SCAN_MAX_WORKERS) or 8
+        return _InvalidAssetScanner(max_workers=max_workers).scan(
+            stage,
+            unresolved_paths,
+            include_missing_authored_textures=include_missing_authored_textures,
+            is_cancelled=is_cancelled,
+            on_layer_processed=on_layer_processed,
+        )
 
     async def scan_invalid_stage_asset_references(self, root_layer_path: Path) -> list[tuple[str, str, str]]:
         """Return broken asset references authored anywhere in the given stage stack.
@@ -239,25 +229,34 @@ class RtxIoCore:
             return []
 
         _, _, unresolved_paths = UsdUtils.ComputeAllDependencies(root_layer.identifier)
-        stage_prims = list(stage.TraverseAll())
-        total_prims = max(len(stage_prims), 1)
-        self._new_stage("Scanning project texture references...", total_prims)
-
-        result: set[tuple[str, str, str]] = set()
-        for start_index in range(0, len(stage_prims), 32):
-            if self._cancel_token:
-                break
-            prim_chunk = stage_prims[start_index : start_index + 32]
-            result.update(
-                self.collect_invalid_stage_assets(
-                    prim_chunk,
-                    unresolved_paths,
-                    include_missing_authored_textures=True,
-                    is_cancelled=lambda: self._cancel_token,
-                    on_prim_processed=lambda: setattr(self, "current_count", self.current_count + 1),
-                )
+        self._new_stage("Scanning project texture references...", max(len(stage.GetUsedLayers()), 1))
+
+        def scan_layers(queue_progress: Callable[[int, int | None, Any | None], None]):
+            processed_layer_count = 0
+
+            def on_layer_processed():
+                nonlocal processed_layer_count
+                processed_layer_count += 1
+                queue_progress(processed_layer_count)
+
+            return self.collect_invalid_layer_assets(
+                stage,
+                unresolved_paths,
+                include_missing_authored_textures=True,
+                is_cancelled=lambda: self._cancel_token,
+                on_layer_processed=on_layer_processed,
             )
-            await omni.kit.app.get_app().next_update_async()
+
+        def apply_progress(current: int, _total: int, _status: Any):
+            self.current_count = current
+
+        result = await _run_worker_with_latest_progress(
+            scan_layers,
+            progress_callback=apply_progress,
+            is_cancelled=lambda: self._cancel_token,
+            cancelled_result=set(),
+            finish_worker_on_cancel=True,
+        )
 
         stage = None
         return list(result)
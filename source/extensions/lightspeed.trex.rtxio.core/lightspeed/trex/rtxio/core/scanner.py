@@ -0,0 +1,343 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["InvalidAssetScanner"]
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from pxr import Sdf, Usd
+
+from .core import _is_missing_packaging_texture_path, _normalize_packaging_absolute_path
+
+# (layer identifier, spec path, resolved asset path)
+_Candidate = tuple[str, Sdf.Path, str]
+# (layer identifier, spec path of the prim introducing the arc, arc)
+_Arc = tuple[str, Sdf.Path, Sdf.Reference | Sdf.Payload]
+
+
+class _LayerScanResult:
+    __slots__ = ("arcs", "class_arc_prims", "prim_candidates", "property_candidates")
+
+    def __init__(self):
+        self.arcs: list[_Arc] = []
+        # (layer identifier, spec path) of the prims with inherit or specialize arcs
+        self.class_arc_prims: list[tuple[str, Sdf.Path]] = []
+        self.prim_candidates: list[_Candidate] = []
+        self.property_candidates: list[_Candidate] = []
+
+
+class InvalidAssetScanner:
+    def __init__(self, max_workers: int = 8):
+        """
+        Find the invalid asset paths authored in the layers of a stage without composing any value.
+
+        Every layer is scanned spec by spec in a pool of worker threads. Asset paths are resolved and checked for
+        existence once per unique path. Only the specs authoring an invalid asset path are then mapped back to the
+        composed stage, through the reference and payload arcs found while scanning, so the results match a scan of
+        every prim of the stage:
+
+        - a reference is reported on every composed prim whose prim stack contains the spec authoring it
+        - an asset attribute is reported on every composed attribute holding an asset value whose property stack
+          contains the spec authoring it
+
+        The specs reaching the stage through inherit or specialize arcs are not mapped: the prims authoring these arcs,
+        and their descendants, are scanned on the composed stage instead.
+
+        Prims under instances are not reported, since they are not part of a `Usd.Stage.TraverseAll` traversal.
+
+        Args:
+            max_workers: the number of threads scanning layers at the same time
+        """
+        self._max_workers = max(1, max_workers)
+
+        self.__lock = threading.Lock()
+        self.__resolved_paths: dict[tuple[str, str], str] = {}
+        self.__missing_textures: dict[str, bool] = {}
+
+    def scan(
+        self,
+        stage: Usd.Stage,
+        unresolved_paths: list[str],
+        *,
+        include_missing_authored_textures: bool = True,
+        is_cancelled: Callable[[], bool] | None = None,
+        on_layer_processed: Callable[[], None] | None = None,
+    ) -> set[tuple[str, str, str]]:
+        """
+        Collect the invalid asset references authored in the layers used by a stage.
+
+        Args:
+            stage: the stage to scan
+            unresolved_paths: the asset paths that could not be resolved
+            include_missing_authored_textures: whether to report texture paths that don't exist
+            is_cancelled: returns True when the scan should stop
+            on_layer_processed: called after every scanned layer
+
+        Returns:
+            The authoring layer identifier, the composed prim or property path and the resolved asset path of every
+            invalid asset reference
+        """
+        self.__resolved_paths.clear()
+        self.__missing_textures.clear()
+
+        layers_by_path = {
+            _normalize_packaging_absolute_path(layer.identifier): layer for layer in stage.GetUsedLayers()
+        }
+        unresolved_set = (
+            {_normalize_packaging_absolute_path(path) for path in unresolved_paths} if unresolved_paths else set()
+        )
+
+        def scan_layer(layer: Sdf.Layer) -> _LayerScanResult | None:
+            if is_cancelled and is_cancelled():
+                return None
+            result = self._scan_layer(layer, unresolved_set, include_missing_authored_textures)
+            if on_layer_processed:
+                on_layer_processed()
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, max(len(layers_by_path), 1))) as executor:
+            layer_results = list(executor.map(scan_layer, layers_by_path.values()))
+        if (is_cancelled and is_cancelled()) or any(result is None for result in layer_results):
+            return set()
+
+        arcs = [arc for result in layer_results for arc in result.arcs]
+        class_arc_prims = [prim for result in layer_results for prim in result.class_arc_prims]
+        prim_candidates = [candidate for result in layer_results for candidate in result.prim_candidates]
+        property_candidates = [candidate for result in layer_results for candidate in result.property_candidates]
+        if not prim_candidates and not property_candidates:
+            return set()
+
+        namespace_mappings = self._get_namespace_mappings(stage, layers_by_path, arcs)
+
+        invalid_assets = set()
+        for layer_identifier, spec_path, asset_path in prim_candidates:
+            for stage_path in self._get_stage_paths(namespace_mappings, layer_identifier, spec_path):
+                prim = stage.GetPrimAtPath(stage_path)
+                if not prim or prim.IsInstanceProxy():
+                    continue
+                if any(
+                    spec.layer.identifier == layer_identifier and spec.path == spec_path for spec in prim.GetPrimStack()
+                ):
+                    invalid_assets.add((layer_identifier, str(stage_path), asset_path))
+        for layer_identifier, spec_path, asset_path in property_candidates:
+            for stage_path in self._get_stage_paths(namespace_mappings, layer_identifier, spec_path):
+                attribute = stage.GetAttributeAtPath(stage_path)
+                if not attribute or attribute.GetPrim().IsInstanceProxy():
+                    continue
+                if not isinstance(attribute.Get(), Sdf.AssetPath):
+                    continue
+                if any(
+                    spec.layer.identifier == layer_identifier and spec.path == spec_path
+                    for spec in attribute.GetPropertyStack(Usd.TimeCode.Default())
+                ):
+                    invalid_assets.add((layer_identifier, str(stage_path), asset_path))
+
+        class_arc_stage_paths = {
+            stage_path
+            for layer_identifier, spec_path in class_arc_prims
+            for stage_path in self._get_stage_paths(namespace_mappings, layer_identifier, spec_path)
+        }
+        for stage_path in Sdf.Path.RemoveDescendentPaths(list(class_arc_stage_paths)):
+            prim = stage.GetPrimAtPath(stage_path)
+            if not prim or prim.IsInstanceProxy():
+                continue
+            for composed_prim in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate):
+                if is_cancelled and is_cancelled():
+                    return set()
+                invalid_assets.update(
+                    self._scan_composed_prim(composed_prim, unresolved_set, include_missing_authored_textures)
+                )
+        return invalid_assets
+
+    def _resolve(self, layer: Sdf.Layer, asset_path: str) -> str:
+        key = (layer.identifier, asset_path)
+        resolved_path = self.__resolved_paths.get(key)
+        if resolved_path is None:
+            resolved_path = _normalize_packaging_absolute_path(layer.ComputeAbsolutePath(asset_path))
+            with self.__lock:
+                self.__resolved_paths[key] = resolved_path
+        return resolved_path
+
+    def _is_missing_texture(self, absolute_path: str) -> bool:
+        is_missing = self.__missing_textures.get(absolute_path)
+        if is_missing is None:
+            is_missing = _is_missing_packaging_texture_path(absolute_path)
+            with self.__lock:
+                self.__missing_textures[absolute_path] = is_missing
+        return is_missing
+
+    def _scan_layer(
+        self, layer: Sdf.Layer, unresolved_set: set[str], include_missing_authored_textures: bool
+    ) -> _LayerScanResult:
+        result = _LayerScanResult()
+        identifier = layer.identifier
+        to_visit = list(layer.rootPrims)
+        while to_visit:
+            prim_spec = to_visit.pop()
+            prim_path = prim_spec.path
+
+            for reference in prim_spec.referenceList.GetAddedOrExplicitItems():
+                result.arcs.append((identifier, prim_path, reference))
+                if unresolved_set and reference.assetPath:
+                    resolved_path = self._resolve(layer, reference.assetPath)
+                    if resolved_path in unresolved_set:
+                        result.prim_candidates.append((identifier, prim_path, resolved_path))
+            for payload in prim_spec.payloadList.GetAddedOrExplicitItems():
+                result.arcs.append((identifier, prim_path, payload))
+            if (
+                prim_spec.inheritPathList.GetAddedOrExplicitItems()
+                or prim_spec.specializesList.GetAddedOrExplicitItems()
+            ):
+                result.class_arc_prims.append((identifier, prim_path))
+
+            for attribute_spec in prim_spec.attributes:
+                if attribute_spec.typeName != Sdf.ValueTypeNames.Asset:
+                    continue
+                authored_value = attribute_spec.default
+                if not isinstance(authored_value, Sdf.AssetPath) or not authored_value.path:
+                    continue
+                resolved_path = self._resolve(layer, authored_value.path)
+                if (include_missing_authored_textures and self._is_missing_texture(resolved_path)) or (
+                    resolved_path in unresolved_set
+                ):
+                    result.property_candidates.append((identifier, attribute_spec.path, resolved_path))
+
+            to_visit.extend(prim_spec.nameChildren)
+            for variant_set in prim_spec.variantSets:
+                to_visit.extend(variant.primSpec for variant in variant_set.variants.values())
+        return result
+
+    def _scan_composed_prim(
+        self, prim: Usd.Prim, unresolved_set: set[str], include_missing_authored_textures: bool
+    ) -> set[tuple[str, str, str]]:
+        """
+        Collect the invalid asset references of a composed prim, reading its prim and property stacks.
+
+        Args:
+            prim: the composed prim to scan
+            unresolved_set: the normalized asset paths that could not be resolved
+            include_missing_authored_textures: whether to report texture paths that don't exist
+
+        Returns:
+            The authoring layer identifier, the composed prim or property path and the resolved asset path of every
+            invalid asset reference of the prim
+        """
+        result = set()
+        if unresolved_set:
+            for prim_spec in prim.GetPrimStack():
+                for reference in prim_spec.referenceList.GetAddedOrExplicitItems():
+                    if not reference.assetPath:
+                        continue
+                    resolved_path = self._resolve(prim_spec.layer, reference.assetPath)
+                    if resolved_path in unresolved_set:
+                        result.add((prim_spec.layer.identifier, str(prim.GetPath()), resolved_path))
+
+        for attribute in prim.GetAttributes():
+            if not isinstance(attribute.Get(), Sdf.AssetPath):
+                continue
+            for property_spec in attribute.GetPropertyStack(Usd.TimeCode.Default()):
+                authored_value = property_spec.default
+                if not isinstance(authored_value, Sdf.AssetPath) or not authored_value.path:
+                    continue
+                resolved_path = self._resolve(property_spec.layer, authored_value.path)
+                if (include_missing_authored_textures and self._is_missing_texture(resolved_path)) or (
+                    resolved_path in unresolved_set
+                ):
+                    result.add((property_spec.layer.identifier, str(attribute.GetPath()), resolved_path))
+        return result
+
+    def _get_namespace_mappings(
+        self, stage: Usd.Stage, layers_by_path: dict[str, Sdf.Layer], arcs: list[_Arc]
+    ) -> dict[str, set[tuple[Sdf.Path, Sdf.Path]]]:
+        """Get the (layer path prefix, stage path prefix) pairs mapping the specs of every layer to the stage"""
+        root = Sdf.Path.absoluteRootPath
+        mappings: dict[str, set[tuple[Sdf.Path, Sdf.Path]]] = {}
+        for layer in stage.GetLayerStack(includeSessionLayers=True):
+            mappings.setdefault(layer.identifier, set()).add((root, root))
+
+        arcs_by_layer: dict[str, list[_Arc]] = {}
+        for arc in arcs:
+            arcs_by_layer.setdefault(arc[0], []).append(arc)
+
+        layers_by_identifier = {layer.identifier: layer for layer in layers_by_path.values()}
+        to_visit = [
+            (identifier, mapping) for identifier, layer_mappings in mappings.items() for mapping in layer_mappings
+        ]
+        while to_visit:
+            identifier, (source_prefix, stage_prefix) = to_visit.pop()
+            source_layer = layers_by_identifier.get(identifier)
+            if source_layer is None:
+                continue
+            for _, arc_prim_path, arc in arcs_by_layer.get(identifier, []):
+                arc_path = arc_prim_path.StripAllVariantSelections()
+                if not arc_path.HasPrefix(source_prefix):
+                    continue
+                arc_stage_path = arc_path.ReplacePrefix(source_prefix, stage_prefix)
+
+                if arc.assetPath:
+                    target_layer = layers_by_path.get(self._resolve(source_layer, arc.assetPath))
+                    if target_layer is None:
+                        continue
+                    target_layers = self._get_layer_stack(target_layer, layers_by_path)
+                else:
+                    # Internal arcs target the layer authoring them
+                    target_layer = source_layer
+                    target_layers = [source_layer]
+
+                target_path = arc.primPath
+                if target_path.isEmpty:
+                    if not target_layer.defaultPrim:
+                        continue
+                    target_path = Sdf.Path.absoluteRootPath.AppendChild(target_layer.defaultPrim)
+
+                for target in target_layers:
+                    mapping = (target_path, arc_stage_path)
+                    target_mappings = mappings.setdefault(target.identifier, set())
+                    if mapping in target_mappings:
+                        continue
+                    target_mappings.add(mapping)
+                    to_visit.append((target.identifier, mapping))
+        return mappings
+
+    def _get_layer_stack(self, layer: Sdf.Layer, layers_by_path: dict[str, Sdf.Layer]) -> list[Sdf.Layer]:
+        result = []
+        to_visit = [layer]
+        while to_visit:
+            current = to_visit.pop()
+            if current in result:
+                continue
+            result.append(current)
+            for sublayer_path in current.subLayerPaths:
+                sublayer = layers_by_path.get(self._resolve(current, sublayer_path))
+                if sublayer is not None:
+                    to_visit.append(sublayer)
+        return result
+
+    @staticmethod
+    def _get_stage_paths(
+        mappings: dict[str, set[tuple[Sdf.Path, Sdf.Path]]], layer_identifier: str, spec_path: Sdf.Path
+    ) -> set[Sdf.Path]:
+        path = spec_path.StripAllVariantSelections()
+        return {
+            path.ReplacePrefix(source_prefix, stage_prefix)
+            for source_prefix, stage_prefix in mappings.get(layer_identifier, ())
+            if path.HasPrefix(source_prefix)
+        }
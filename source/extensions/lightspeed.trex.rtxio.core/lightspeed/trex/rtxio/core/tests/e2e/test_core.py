@@ -53,7 +53,7 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual("/RootNode/Looks/mat_001/Shader.inputs:diffuse_texture", prop_path)
             self.assertEqual(missing_posix, abs_path)
 
-    async def test_collect_invalid_stage_assets_reports_composed_path_for_referenced_layer_reference(self):
+    async def test_collect_invalid_layer_assets_reports_composed_path_for_referenced_layer_reference(self):
         rtxio_core = RtxIoCore()
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp = Path(tmp_dir)
@@ -84,8 +84,8 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
 
             usd_stage = Usd.Stage.Open(root_layer.identifier)
             missing_posix = Path(asset_layer.ComputeAbsolutePath("./missing_asset.usda")).as_posix()
-            result = rtxio_core.collect_invalid_stage_assets(
-                list(usd_stage.TraverseAll()),
+            result = rtxio_core.collect_invalid_layer_assets(
+                usd_stage,
                 [missing_posix],
                 include_missing_authored_textures=False,
             )
@@ -97,7 +97,7 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual("/RootNode/Asset/MissingReference", prim_path)
             self.assertEqual(missing_posix, abs_path)
 
-    async def test_collect_invalid_stage_assets_detects_missing_texture_masked_by_valid_stronger_sublayer(self):
+    async def test_collect_invalid_layer_assets_detects_missing_texture_masked_by_valid_stronger_sublayer(self):
         rtxio_core = RtxIoCore()
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp = Path(tmp_dir)
@@ -125,8 +125,8 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             usd_stage = Usd.Stage.Open(stage.identifier) if stage else None
 
             result = list(
-                rtxio_core.collect_invalid_stage_assets(
-                    list(usd_stage.TraverseAll()),
+                rtxio_core.collect_invalid_layer_assets(
+                    usd_stage,
                     [missing_texture_posix],
                     include_missing_authored_textures=False,
                 )
@@ -139,7 +139,7 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual("/RootNode/Looks/mat_001/Shader.inputs:diffuse_texture", prim_path)
             self.assertEqual(missing_texture_posix, resolved_path)
 
-    async def test_collect_invalid_stage_assets_detects_missing_textures_in_both_sublayers(self):
+    async def test_collect_invalid_layer_assets_detects_unresolved_textures_in_both_sublayers(self):
         rtxio_core = RtxIoCore()
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp = Path(tmp_dir)
@@ -165,8 +165,8 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
 
             usd_stage = Usd.Stage.Open(stronger_layer.identifier)
             result = list(
-                rtxio_core.collect_invalid_stage_assets(
-                    list(usd_stage.TraverseAll()),
+                rtxio_core.collect_invalid_layer_assets(
+                    usd_stage,
                     [missing_a_posix, missing_b_posix],
                     include_missing_authored_textures=False,
                 )
@@ -181,7 +181,7 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             for _, prim_path, _ in result:
                 self.assertEqual(attr_path, prim_path)
 
-    async def test_collect_invalid_stage_assets_detects_missing_file_without_dependency_scan(self):
+    async def test_collect_invalid_layer_assets_detects_missing_file_without_dependency_scan(self):
         rtxio_core = RtxIoCore()
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp = Path(tmp_dir)
@@ -194,8 +194,8 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             layer.Save()
 
             usd_stage = Usd.Stage.Open(layer.identifier)
-            result = rtxio_core.collect_invalid_stage_assets(
-                list(usd_stage.TraverseAll()),
+            result = rtxio_core.collect_invalid_layer_assets(
+                usd_stage,
                 [],
                 include_missing_authored_textures=True,
             )
@@ -208,6 +208,165 @@ class TestRtxIoCoreE2E(omni.kit.test.AsyncTestCase):
             self.assertEqual("/RootNode/Looks/mat_001/Shader.inputs:diffuse_texture", prop_path)
             self.assertEqual(missing_posix, abs_path)
 
+    async def test_collect_invalid_layer_assets_reports_composed_paths_through_references_and_variants(self):
+        rtxio_core = RtxIoCore()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            missing_reference_posix = (tmp / "missing_asset.usda").as_posix()
+
+            asset_layer = Sdf.Layer.CreateNew(str(tmp / "asset.usda"))
+            asset_layer.defaultPrim = "Asset"
+            with Sdf.ChangeBlock():
+                asset_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset")
+                asset_spec.specifier = Sdf.SpecifierDef
+                variant_set_spec = Sdf.VariantSetSpec(asset_spec, "look")
+                Sdf.VariantSpec(variant_set_spec, "dirty")
+                asset_spec.variantSetNameList.Prepend("look")
+                asset_spec.variantSelections["look"] = "dirty"
+                shader_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset{look=dirty}Shader")
+                shader_spec.specifier = Sdf.SpecifierDef
+                attr_spec = Sdf.AttributeSpec(shader_spec, "inputs:diffuse_texture", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./missing_texture.a.rtex.dds")
+                missing_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset/Missing")
+                missing_spec.specifier = Sdf.SpecifierDef
+                missing_spec.referenceList.Append(Sdf.Reference("./missing_asset.usda"))
+            asset_layer.Save()
+
+            root_layer = Sdf.Layer.CreateNew(str(tmp / "mod.usda"))
+            with Sdf.ChangeBlock():
+                for name in ("First", "Second"):
+                    ref_spec = Sdf.CreatePrimInLayer(root_layer, f"/RootNode/{name}")
+                    ref_spec.specifier = Sdf.SpecifierDef
+                    ref_spec.referenceList.Append(Sdf.Reference("./asset.usda"))
+            root_layer.Save()
+
+            usd_stage = Usd.Stage.Open(root_layer.identifier)
+            result = rtxio_core.collect_invalid_layer_assets(usd_stage, [missing_reference_posix])
+            usd_stage = None
+
+            missing_texture_posix = (tmp / "missing_texture.a.rtex.dds").as_posix()
+            self.assertEqual(
+                {
+                    (asset_layer.identifier, "/RootNode/First/Missing", missing_reference_posix),
+                    (asset_layer.identifier, "/RootNode/Second/Missing", missing_reference_posix),
+                    (asset_layer.identifier, "/RootNode/First/Shader.inputs:diffuse_texture", missing_texture_posix),
+                    (asset_layer.identifier, "/RootNode/Second/Shader.inputs:diffuse_texture", missing_texture_posix),
+                },
+                result,
+            )
+
+    async def test_collect_invalid_layer_assets_reports_textures_reached_through_inherits_and_specializes(self):
+        rtxio_core = RtxIoCore()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            missing_texture_posix = (tmp / "missing_texture.a.rtex.dds").as_posix()
+
+            asset_layer = Sdf.Layer.CreateNew(str(tmp / "asset.usda"))
+            asset_layer.defaultPrim = "Asset"
+            with Sdf.ChangeBlock():
+                asset_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset")
+                asset_spec.specifier = Sdf.SpecifierDef
+                inherited_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset/Inherited")
+                inherited_spec.specifier = Sdf.SpecifierDef
+                inherited_spec.inheritPathList.Append("/Asset/Class")
+                class_spec = Sdf.CreatePrimInLayer(asset_layer, "/Asset/Class")
+                class_spec.specifier = Sdf.SpecifierClass
+                attr_spec = Sdf.AttributeSpec(class_spec, "tex", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./missing_texture.a.rtex.dds")
+            asset_layer.Save()
+
+            root_layer = Sdf.Layer.CreateNew(str(tmp / "mod.usda"))
+            with Sdf.ChangeBlock():
+                class_spec = Sdf.CreatePrimInLayer(root_layer, "/Class")
+                class_spec.specifier = Sdf.SpecifierClass
+                attr_spec = Sdf.AttributeSpec(class_spec, "tex", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./missing_texture.a.rtex.dds")
+                inherited_spec = Sdf.CreatePrimInLayer(root_layer, "/World/Foo")
+                inherited_spec.specifier = Sdf.SpecifierDef
+                inherited_spec.inheritPathList.Append("/Class")
+                specialized_spec = Sdf.CreatePrimInLayer(root_layer, "/World/Bar")
+                specialized_spec.specifier = Sdf.SpecifierDef
+                specialized_spec.specializesList.Append("/Class")
+                ref_spec = Sdf.CreatePrimInLayer(root_layer, "/World/Asset")
+                ref_spec.specifier = Sdf.SpecifierDef
+                ref_spec.referenceList.Append(Sdf.Reference("./asset.usda"))
+            root_layer.Save()
+
+            usd_stage = Usd.Stage.Open(root_layer.identifier)
+            result = rtxio_core.collect_invalid_layer_assets(usd_stage, [])
+            usd_stage = None
+
+            self.assertEqual(
+                {
+                    (root_layer.identifier, "/Class.tex", missing_texture_posix),
+                    (root_layer.identifier, "/World/Foo.tex", missing_texture_posix),
+                    (root_layer.identifier, "/World/Bar.tex", missing_texture_posix),
+                    (asset_layer.identifier, "/World/Asset/Class.tex", missing_texture_posix),
+                    (asset_layer.identifier, "/World/Asset/Inherited.tex", missing_texture_posix),
+                },
+                result,
+            )
+
+    async def test_collect_invalid_layer_assets_detects_missing_textures_in_both_sublayers(self):
+        rtxio_core = RtxIoCore()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            (tmp / "valid_texture.a.rtex.dds").touch()
+
+            weaker_layer = Sdf.Layer.CreateNew(str(tmp / "weaker.usda"))
+            with Sdf.ChangeBlock():
+                spec = Sdf.CreatePrimInLayer(weaker_layer, "/RootNode/Looks/mat_001/Shader")
+                spec.specifier = Sdf.SpecifierOver
+                attr_spec = Sdf.AttributeSpec(spec, "inputs:diffuse_texture", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./missing_texture.a.rtex.dds")
+            weaker_layer.Save()
+
+            stronger_layer = Sdf.Layer.CreateNew(str(tmp / "stronger.usda"))
+            with Sdf.ChangeBlock():
+                spec = Sdf.CreatePrimInLayer(stronger_layer, "/RootNode/Looks/mat_001/Shader")
+                spec.specifier = Sdf.SpecifierOver
+                attr_spec = Sdf.AttributeSpec(spec, "inputs:diffuse_texture", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./valid_texture.a.rtex.dds")
+                stronger_layer.subLayerPaths.append("./weaker.usda")
+            stronger_layer.Save()
+
+            usd_stage = Usd.Stage.Open(stronger_layer.identifier)
+            processed_layers = []
+            result = rtxio_core.collect_invalid_layer_assets(
+                usd_stage, [], on_layer_processed=lambda: processed_layers.append(True)
+            )
+            used_layer_count = len(usd_stage.GetUsedLayers())
+            usd_stage = None
+
+            self.assertEqual(
+                {
+                    (
+                        weaker_layer.identifier,
+                        "/RootNode/Looks/mat_001/Shader.inputs:diffuse_texture",
+                        (tmp / "missing_texture.a.rtex.dds").as_posix(),
+                    )
+                },
+                result,
+            )
+            self.assertEqual(used_layer_count, len(processed_layers))
+
+    async def test_collect_invalid_layer_assets_cancelled_returns_no_result(self):
+        rtxio_core = RtxIoCore()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            layer = Sdf.Layer.CreateNew(str(Path(tmp_dir) / "layer.usda"))
+            with Sdf.ChangeBlock():
+                shader_spec = Sdf.CreatePrimInLayer(layer, "/RootNode/Looks/mat_001/Shader")
+                shader_spec.specifier = Sdf.SpecifierDef
+                attr_spec = Sdf.AttributeSpec(shader_spec, "inputs:diffuse_texture", Sdf.ValueTypeNames.Asset)
+                attr_spec.default = Sdf.AssetPath("./not_created.a.rtex.dds")
+            layer.Save()
+
+            usd_stage = Usd.Stage.Open(layer.identifier)
+            result = rtxio_core.collect_invalid_layer_assets(usd_stage, [], is_cancelled=lambda: True)
+            usd_stage = None
+
+            self.assertEqual(set(), result)
+
     async def test_compress_directory_with_split_size_should_pass_split_argument(self):
         rtxio_core = RtxIoCore()
         popen_calls = []
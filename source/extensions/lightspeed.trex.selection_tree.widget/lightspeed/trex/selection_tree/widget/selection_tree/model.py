@@ -17,9 +17,6 @@
 
 from __future__ import annotations
 
-import concurrent.futures
-import math
-import multiprocessing
 import re
 from contextlib import contextmanager
 from typing import TypeAlias
@@ -30,6 +27,7 @@ import omni.ui as ui
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
+from lightspeed.trex.utils.common.capture_hash_index import get_capture_hash_index as _get_capture_hash_index
 from lightspeed.trex.utils.common.prim_utils import get_prototype as _get_prototype
 from lightspeed.trex.utils.common.prim_utils import get_reference_file_paths as _get_reference_file_paths
 from lightspeed.trex.utils.common.prim_utils import is_light as _is_light
@@ -575,26 +573,6 @@ class ListModel(ui.AbstractItemModel):
 
         return None
 
-    @staticmethod
-    def __get_reference_prims(prims) -> dict[Usd.Prim, list[Sdf.Path]]:
-        prim_paths = {}
-        regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-        for prim in prims:
-            if regex_pattern.match(str(prim.GetPath())):
-                prim_paths[prim] = [prim.GetPath()]
-            else:
-                for prim_spec in prim.GetPrimStack():
-                    items = prim_spec.referenceList.prependedItems
-                    for item in items:
-                        if not item.primPath:
-                            continue
-                        if prim in prim_paths:
-                            prim_paths[prim].append(item.primPath)
-                        else:
-                            prim_paths[prim] = [item.primPath]
-
-        return prim_paths
-
     def __get_model_from_prototype_path(self, path):
         if not path.startswith(constants.MESH_PATH) and not path.startswith(constants.LIGHT_PATH):
             return None
@@ -624,8 +602,6 @@ class ListModel(ui.AbstractItemModel):
         if not self.stage:
             return {}
 
-        iterator = list(iter(Usd.PrimRange.Stage(self.stage, Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded)))
-
         # extract hashes from paths
         hashes = set()
         regex_inst_pattern = re.compile(constants.REGEX_HASH)
@@ -636,39 +612,25 @@ class ListModel(ui.AbstractItemModel):
             hashes.add(match.groups()[2])
 
         result = {}
-        futures = []
-        cpu_count = multiprocessing.cpu_count()
-        # we can use threadpool here because we are just reading the stage
-        # Use exact number of cpu count as max worker: this is faster that letting Python doing it
-        # Divide the iter by group that fit the  max worker
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpu_count) as executor:
-            to_send = []
-            size_iter = len(iterator)
-            group_size = math.ceil(size_iter / cpu_count)
-            for i, prim in enumerate(iterator):
-                match = regex_inst_pattern.match(prim.GetName())
-                if not match or match.groups()[2] not in hashes:
-                    if i == size_iter - 1 and to_send:
-                        futures.append(executor.submit(self.__get_reference_prims, to_send))
+        capture_hash_index = _get_capture_hash_index(self.stage)
+        regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
+        for capture_hash in hashes:
+            entry = capture_hash_index.get_entry(capture_hash)
+            for path in entry.paths:
+                prim = self.stage.GetPrimAtPath(path)
+                if not prim or not prim.IsActive() or not prim.IsDefined() or not prim.IsLoaded():
                     continue
-                if i == size_iter - 1 and to_send:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
+                # lights are their own prototype, other prims are grouped under the prim they reference
+                if regex_pattern.match(str(path)):
+                    ref = path
+                elif path in entry.references and entry.references[path][0] != path:
+                    ref = entry.references[path][0]
+                else:
                     continue
-                to_send.append(prim)
-                if len(to_send) == group_size:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    to_send = []
-
-            regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-            for future in concurrent.futures.as_completed(futures):
-                refs = future.result()
-                for prim, ref in refs.items():
-                    if ref and ref[0] == prim.GetPath() and not regex_pattern.match(str(prim.GetPath())):
-                        continue
-                    if ref and ref[0] in result and prim not in result[ref[0]]:
-                        result[ref[0]].append(prim)
-                    elif ref and ref[0] not in result:
-                        result[ref[0]] = [prim]
+                if ref not in result:
+                    result[ref] = [prim]
+                elif prim not in result[ref]:
+                    result[ref].append(prim)
         return result
 
     def select_prim_paths(self, paths: list[str]):
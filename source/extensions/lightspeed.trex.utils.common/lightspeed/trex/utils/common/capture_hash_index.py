@@ -0,0 +1,224 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["CaptureHashEntry", "CaptureHashIndex", "get_capture_hash_index"]
+
+import dataclasses
+import threading
+
+from lightspeed.common import constants
+from omni.flux.utils.common.stage_cache import StageCache as _StageCache
+from omni.flux.utils.common.stage_cache import StageCacheRegistry as _StageCacheRegistry
+from pxr import Sdf, Usd
+
+
+@dataclasses.dataclass(frozen=True)
+class CaptureHashEntry:
+    """
+    The prims of a stage named after one capture hash.
+
+    Args:
+        capture_hash: the hash of the captured asset
+        meshes: the mesh prototypes (`mesh_HASH`)
+        instances: the instance prims (`inst_HASH_N`)
+        materials: the material prims (`mat_HASH`)
+        lights: the light prims (`light_HASH`)
+        references: the prims referenced by every prim above, for the prims with internal references
+    """
+
+    capture_hash: str
+    meshes: tuple[Sdf.Path, ...] = ()
+    instances: tuple[Sdf.Path, ...] = ()
+    materials: tuple[Sdf.Path, ...] = ()
+    lights: tuple[Sdf.Path, ...] = ()
+    references: dict[Sdf.Path, tuple[Sdf.Path, ...]] = dataclasses.field(default_factory=dict)
+
+    @property
+    def paths(self) -> tuple[Sdf.Path, ...]:
+        """All the prims named after the capture hash"""
+        return self.meshes + self.instances + self.materials + self.lights
+
+
+class CaptureHashIndex(_StageCache):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Index the prims named after a capture hash so the prims of one captured asset can be found without walking
+        the stage.
+
+        The stage is walked once, on the first lookup after the stage or its capture layer is loaded. Prims resynced
+        afterward are queued and only their subtrees are indexed again on the next lookup.
+
+        Args:
+            stage: the stage to index. The index doesn't keep the stage alive.
+        """
+        super().__init__(stage)
+        self._lock = threading.Lock()
+
+        self._built = False
+        self._pending_paths: set[Sdf.Path] = set()
+        # path -> (name prefix, capture hash)
+        self._hashes: dict[Sdf.Path, tuple[str, str]] = {}
+        self._paths_by_hash: dict[str, set[Sdf.Path]] = {}
+        # Indexed paths grouped by parent, so a resynced subtree is found without looking at every indexed path
+        self._paths_by_parent: dict[Sdf.Path, set[Sdf.Path]] = {}
+        self._references: dict[Sdf.Path, tuple[Sdf.Path, ...]] = {}
+
+    def get_entry(self, capture_hash: str) -> CaptureHashEntry:
+        """
+        Get the prims named after a capture hash.
+
+        Args:
+            capture_hash: the hash of the captured asset
+
+        Returns:
+            The prims of the hash, sorted by path. The entry is empty if no prim is named after the hash.
+        """
+        with self._lock:
+            self._update()
+            buckets = {prefix: [] for prefix in _PREFIX_FIELDS}
+            references = {}
+            for path in self._paths_by_hash.get(capture_hash, ()):
+                buckets[self._hashes[path][0]].append(path)
+                if path in self._references:
+                    references[path] = self._references[path]
+        return CaptureHashEntry(
+            capture_hash=capture_hash,
+            references=references,
+            **{_PREFIX_FIELDS[prefix]: tuple(sorted(paths)) for prefix, paths in buckets.items()},
+        )
+
+    def get_capture_hash(self, path: Sdf.Path | str) -> str | None:
+        """
+        Get the capture hash a prim is named after.
+
+        Args:
+            path: the path of the prim
+
+        Returns:
+            The capture hash, or None if the prim is not named after a capture hash
+        """
+        with self._lock:
+            self._update()
+            value = self._hashes.get(Sdf.Path(str(path)))
+        return value[1] if value else None
+
+    def invalidate(self):
+        """Walk the whole stage again on the next lookup"""
+        with self._lock:
+            self._built = False
+            self._pending_paths.clear()
+            self._hashes.clear()
+            self._paths_by_hash.clear()
+            self._paths_by_parent.clear()
+            self._references.clear()
+
+    def _update(self):
+        stage = self._stage()
+        if stage is None:
+            return
+        if not self._built:
+            for prim in stage.TraverseAll():
+                self._add(prim)
+            self._built = True
+            self._pending_paths.clear()
+            return
+        if not self._pending_paths:
+            return
+        for path in Sdf.Path.RemoveDescendentPaths(list(self._pending_paths)):
+            self._remove_subtree(path)
+            prim = stage.GetPrimAtPath(path)
+            if not prim:
+                continue
+            for child in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate):
+                self._add(child)
+        self._pending_paths.clear()
+
+    def _add(self, prim: Usd.Prim):
+        match = constants.COMPILED_REGEX_HASH.match(prim.GetName())
+        if not match:
+            return
+        path = prim.GetPath()
+        prefix, capture_hash = match.group(2), match.group(3)
+        self._hashes[path] = (prefix, capture_hash)
+        self._paths_by_hash.setdefault(capture_hash, set()).add(path)
+        self._paths_by_parent.setdefault(path.GetParentPath(), set()).add(path)
+
+        # Keep the strongest opinion first, without duplicates
+        references = {}
+        for prim_spec in prim.GetPrimStack():
+            for reference in prim_spec.referenceList.prependedItems:
+                if reference.primPath:
+                    references.setdefault(reference.primPath, None)
+        if references:
+            self._references[path] = tuple(references)
+
+    def _remove_subtree(self, root: Sdf.Path):
+        for parent in [parent for parent in self._paths_by_parent if parent.HasPrefix(root)]:
+            for path in self._paths_by_parent.pop(parent):
+                self._remove(path)
+        siblings = self._paths_by_parent.get(root.GetParentPath())
+        if siblings and root in siblings:
+            siblings.discard(root)
+            if not siblings:
+                del self._paths_by_parent[root.GetParentPath()]
+            self._remove(root)
+
+    def _remove(self, path: Sdf.Path):
+        _, capture_hash = self._hashes.pop(path)
+        self._references.pop(path, None)
+        paths = self._paths_by_hash[capture_hash]
+        paths.discard(path)
+        if not paths:
+            del self._paths_by_hash[capture_hash]
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, _sender: Usd.Stage):
+        # Prims are only added, removed, renamed, activated or re-referenced through resyncs
+        resynced_paths = [path for path in notice.GetResyncedPaths() if path.IsAbsoluteRootOrPrimPath()]
+        if not resynced_paths:
+            return
+        if any(path.IsAbsoluteRootPath() for path in resynced_paths):
+            # Layers were added, removed or muted: loading the capture layer ends up here
+            self.invalidate()
+            return
+        with self._lock:
+            if self._built:
+                self._pending_paths.update(resynced_paths)
+
+
+_PREFIX_FIELDS = {
+    constants.MESH_NAME_PREFIX: "meshes",
+    constants.INSTANCE_NAME_PREFIX: "instances",
+    constants.MATERIAL_NAME_PREFIX: "materials",
+    constants.LIGHT_NAME_PREFIX: "lights",
+}
+
+_CAPTURE_HASH_INDEXES = _StageCacheRegistry(CaptureHashIndex)
+
+
+def get_capture_hash_index(stage: Usd.Stage) -> CaptureHashIndex:
+    """
+    Get the capture hash index shared by every tool working on a stage, creating it on first use.
+
+    Args:
+        stage: the stage to index
+
+    Returns:
+        The index of the stage
+    """
+    return _CAPTURE_HASH_INDEXES.get(stage)
@@ -54,6 +54,8 @@ from lightspeed.common.constants import PARTICLE_SCHEMA_NAME
 from omni.flux.utils.common.lights import get_light_type as _get_light_type
 from pxr import Sdf, Usd, UsdGeom, UsdShade
 
+from .capture_hash_index import get_capture_hash_index as _get_capture_hash_index
+
 
 class PrimTypes(Enum):
     LIGHTS = "lights"
@@ -87,6 +89,11 @@ def get_prim_paths(
     Returns:
         A list of prims paths
     """
+    if prim_hashes is not None and selection is None:
+        # Only the prims named after a hash and their children can match, so they are looked up in the capture hash
+        # index instead of walking the whole stage
+        selection = _get_capture_hash_prim_paths(prim_hashes, context_name)
+
     if prim_type is not None:
         match prim_type:
             case PrimTypes.LIGHTS:
@@ -131,6 +138,30 @@ def get_prim_paths(
     )
 
 
+def _get_capture_hash_prim_paths(prim_hashes: set[str], context_name: str) -> list[str]:
+    """
+    Get the paths of the prims named after the given capture hashes and of all their children
+
+    Args:
+        prim_hashes: The capture hashes to look up
+        context_name: Context name for the stage to get prim paths from
+
+    Returns:
+        A list of prim paths
+    """
+    stage = omni.usd.get_context(context_name).get_stage()
+    capture_hash_index = _get_capture_hash_index(stage)
+    root_paths = [path for prim_hash in prim_hashes for path in capture_hash_index.get_entry(prim_hash).paths]
+
+    prim_paths = []
+    for root_path in Sdf.Path.RemoveDescendentPaths(root_paths):
+        prim = stage.GetPrimAtPath(root_path)
+        if not prim:
+            continue
+        prim_paths.extend(str(child.GetPath()) for child in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate))
+    return prim_paths
+
+
 def filter_prims_paths(
     predicate: Callable[[Usd.Prim], bool],
     prim_paths: list[str] | None = None,
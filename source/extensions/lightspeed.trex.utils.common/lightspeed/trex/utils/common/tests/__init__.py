@@ -17,6 +17,7 @@
 
 from .unit import (
     TestCameraAuthority,
+    TestCaptureHashIndex,
     TestFindPrimWithReferences,
     TestGetPrototype,
     TestGetReferenceFilePaths,
@@ -29,6 +30,7 @@ from .unit import (
 
 __all__ = [
     "TestCameraAuthority",
+    "TestCaptureHashIndex",
     "TestFindPrimWithReferences",
     "TestGetPrototype",
     "TestGetReferenceFilePaths",
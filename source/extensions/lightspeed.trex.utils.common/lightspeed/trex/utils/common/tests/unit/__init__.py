@@ -25,10 +25,12 @@ from .test_prim_utils import (
     TestTransferableSpecs,
 )
 from .test_camera import TestCameraAuthority
+from .test_capture_hash_index import TestCaptureHashIndex
 from .test_user_utils import TestUserUtils
 
 __all__ = [
     "TestCameraAuthority",
+    "TestCaptureHashIndex",
     "TestFindPrimWithReferences",
     "TestGetPrototype",
     "TestGetReferenceFilePaths",
@@ -0,0 +1,150 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.test
+from lightspeed.trex.utils.common.capture_hash_index import get_capture_hash_index
+from pxr import Sdf, Usd, UsdGeom, UsdShade
+
+_HASH_A = "0123456789ABCDEF"
+_HASH_B = "FEDCBA9876543210"
+
+
+class TestCaptureHashIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.capture_layer = Sdf.Layer.CreateAnonymous()
+        self.stage = Usd.Stage.CreateInMemory()
+        self.stage.GetRootLayer().subLayerPaths.append(self.capture_layer.identifier)
+        with Usd.EditContext(self.stage, self.capture_layer):
+            for capture_hash in (_HASH_A, _HASH_B):
+                self._define_asset(capture_hash, instance_count=2)
+
+    async def tearDown(self):
+        self.stage = None
+        self.capture_layer = None
+
+    def _define_asset(self, capture_hash: str, instance_count: int):
+        mesh_path = f"/RootNode/meshes/mesh_{capture_hash}"
+        UsdGeom.Xform.Define(self.stage, mesh_path)
+        UsdGeom.Mesh.Define(self.stage, f"{mesh_path}/mesh")
+        UsdShade.Material.Define(self.stage, f"/RootNode/Looks/mat_{capture_hash}")
+        for index in range(instance_count):
+            self._define_instance(capture_hash, index)
+
+    def _define_instance(self, capture_hash: str, index: int) -> Usd.Prim:
+        instance = UsdGeom.Xform.Define(self.stage, f"/RootNode/instances/inst_{capture_hash}_{index}").GetPrim()
+        instance.GetReferences().AddInternalReference(f"/RootNode/meshes/mesh_{capture_hash}")
+        return instance
+
+    async def test_get_entry_should_group_prims_by_capture_hash(self):
+        # Arrange
+        index = get_capture_hash_index(self.stage)
+
+        # Act
+        entry = index.get_entry(_HASH_A)
+
+        # Assert
+        self.assertIs(index, get_capture_hash_index(self.stage))
+        self.assertEqual((Sdf.Path(f"/RootNode/meshes/mesh_{_HASH_A}"),), entry.meshes)
+        self.assertEqual((Sdf.Path(f"/RootNode/Looks/mat_{_HASH_A}"),), entry.materials)
+        self.assertEqual(
+            (
+                Sdf.Path(f"/RootNode/instances/inst_{_HASH_A}_0"),
+                Sdf.Path(f"/RootNode/instances/inst_{_HASH_A}_1"),
+            ),
+            entry.instances,
+        )
+        self.assertEqual((), entry.lights)
+        self.assertEqual(
+            {path: (Sdf.Path(f"/RootNode/meshes/mesh_{_HASH_A}"),) for path in entry.instances}, entry.references
+        )
+        self.assertEqual(_HASH_B, index.get_capture_hash(f"/RootNode/instances/inst_{_HASH_B}_1"))
+        self.assertIsNone(index.get_capture_hash(f"/RootNode/meshes/mesh_{_HASH_A}/mesh"))
+
+    async def test_get_entry_unknown_hash_should_be_empty(self):
+        # Act
+        entry = get_capture_hash_index(self.stage).get_entry("AAAAAAAAAAAAAAAA")
+
+        # Assert
+        self.assertEqual((), entry.paths)
+        self.assertEqual({}, entry.references)
+
+    async def test_added_and_removed_prims_should_update_the_index(self):
+        # Arrange
+        index = get_capture_hash_index(self.stage)
+        index.get_entry(_HASH_A)
+
+        # Act
+        self._define_instance(_HASH_A, 2)
+        with Usd.EditContext(self.stage, self.capture_layer):
+            self.stage.RemovePrim(f"/RootNode/instances/inst_{_HASH_A}_0")
+        self.stage.GetPrimAtPath(f"/RootNode/instances/inst_{_HASH_B}_0").SetActive(False)
+
+        # Assert
+        self.assertEqual(
+            (
+                Sdf.Path(f"/RootNode/instances/inst_{_HASH_A}_1"),
+                Sdf.Path(f"/RootNode/instances/inst_{_HASH_A}_2"),
+            ),
+            index.get_entry(_HASH_A).instances,
+        )
+        # Inactive prims are still indexed, like the prims of `Usd.Stage.TraverseAll`
+        self.assertEqual(2, len(index.get_entry(_HASH_B).instances))
+
+    async def test_removed_parent_should_remove_the_indexed_descendants(self):
+        # Arrange
+        index = get_capture_hash_index(self.stage)
+        index.get_entry(_HASH_A)
+
+        # Act
+        with Usd.EditContext(self.stage, self.capture_layer):
+            self.stage.RemovePrim("/RootNode/instances")
+
+        # Assert
+        self.assertEqual((), index.get_entry(_HASH_A).instances)
+        self.assertEqual((), index.get_entry(_HASH_B).instances)
+        self.assertEqual(1, len(index.get_entry(_HASH_B).meshes))
+
+    async def test_changed_reference_should_update_the_referenced_prims(self):
+        # Arrange
+        index = get_capture_hash_index(self.stage)
+        instance_path = Sdf.Path(f"/RootNode/instances/inst_{_HASH_A}_0")
+        index.get_entry(_HASH_A)
+
+        # Act
+        self.capture_layer.GetPrimAtPath(instance_path).referenceList.prependedItems = [
+            Sdf.Reference(primPath=f"/RootNode/meshes/mesh_{_HASH_B}")
+        ]
+
+        # Assert
+        self.assertEqual(
+            (Sdf.Path(f"/RootNode/meshes/mesh_{_HASH_B}"),), index.get_entry(_HASH_A).references[instance_path]
+        )
+
+    async def test_removed_capture_layer_should_rebuild_the_index(self):
+        # Arrange
+        index = get_capture_hash_index(self.stage)
+        index.get_entry(_HASH_A)
+
+        # Act
+        self.stage.GetRootLayer().subLayerPaths.remove(self.capture_layer.identifier)
+        removed_entry = index.get_entry(_HASH_A)
+        self.stage.GetRootLayer().subLayerPaths.append(self.capture_layer.identifier)
+        added_entry = index.get_entry(_HASH_A)
+
+        # Assert
+        self.assertEqual((), removed_entry.paths)
+        self.assertEqual(4, len(added_entry.paths))
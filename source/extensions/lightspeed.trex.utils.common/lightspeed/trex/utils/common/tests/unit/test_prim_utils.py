@@ -22,6 +22,7 @@ import omni.kit.test
 from lightspeed.trex.utils.common.prim_utils import (
     find_prim_with_references,
     get_reference_file_paths,
+    get_prim_paths,
     get_prototype,
     get_transferable_prim_specs,
     get_transferable_property_specs,
@@ -29,8 +30,9 @@ from lightspeed.trex.utils.common.prim_utils import (
     has_replacement_ref_edits,
     is_ghost_prim,
     is_empty_mesh_prim,
+    PrimTypes,
 )
-from pxr import Sdf
+from pxr import Sdf, Usd, UsdGeom, UsdShade
 
 _MODULE = "lightspeed.trex.utils.common.prim_utils"
 
@@ -730,3 +732,52 @@ class TestIsEmptyMeshPrim(omni.kit.test.AsyncTestCase):
 
         # Assert
         self.assertTrue(result)
+
+
+class TestGetPrimPaths(omni.kit.test.AsyncTestCase):
+    _HASH_A = "0123456789ABCDEF"
+    _HASH_B = "FEDCBA9876543210"
+
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        for capture_hash in (self._HASH_A, self._HASH_B):
+            UsdGeom.Xform.Define(self.stage, f"/RootNode/meshes/mesh_{capture_hash}")
+            UsdGeom.Mesh.Define(self.stage, f"/RootNode/meshes/mesh_{capture_hash}/mesh")
+            UsdShade.Material.Define(self.stage, f"/RootNode/Looks/mat_{capture_hash}")
+            instance = UsdGeom.Xform.Define(self.stage, f"/RootNode/instances/inst_{capture_hash}_0").GetPrim()
+            instance.GetReferences().AddInternalReference(f"/RootNode/meshes/mesh_{capture_hash}")
+        self.context = Mock()
+        self.context.get_stage.return_value = self.stage
+
+    async def tearDown(self):
+        self.stage = None
+        self.context = None
+
+    async def test_get_prim_paths_should_return_the_prims_of_the_hashes(self):
+        # Act
+        with patch(f"{_MODULE}.omni.usd.get_context", return_value=self.context):
+            all_paths = get_prim_paths(prim_hashes={self._HASH_A})
+            model_paths = get_prim_paths(prim_hashes={self._HASH_A, self._HASH_B}, prim_type=PrimTypes.MODELS)
+
+        # Assert
+        self.assertCountEqual(
+            [f"/RootNode/meshes/mesh_{self._HASH_A}/mesh", f"/RootNode/Looks/mat_{self._HASH_A}"], all_paths
+        )
+        self.assertCountEqual(
+            [f"/RootNode/meshes/mesh_{self._HASH_A}/mesh", f"/RootNode/meshes/mesh_{self._HASH_B}/mesh"], model_paths
+        )
+
+    async def test_get_prim_paths_should_return_prims_added_after_the_first_lookup(self):
+        # Arrange
+        with patch(f"{_MODULE}.omni.usd.get_context", return_value=self.context):
+            get_prim_paths(prim_hashes={self._HASH_A})
+        UsdGeom.Mesh.Define(self.stage, f"/RootNode/meshes/mesh_{self._HASH_A}/other_mesh")
+
+        # Act
+        with patch(f"{_MODULE}.omni.usd.get_context", return_value=self.context):
+            paths = get_prim_paths(prim_hashes={self._HASH_A}, prim_type=PrimTypes.MODELS)
+
+        # Assert
+        self.assertCountEqual(
+            [f"/RootNode/meshes/mesh_{self._HASH_A}/mesh", f"/RootNode/meshes/mesh_{self._HASH_A}/other_mesh"], paths
+        )
@@ -19,6 +19,7 @@ __all__ = [
     "PipelineContext",
     "PipelineItem",
     "PipelineStep",
+    "PipelineStepCache",
     "PipelineStepState",
     "PipelineValidationError",
     "run_pipeline",
@@ -26,6 +27,7 @@ __all__ = [
 ]
 
 from .pipeline import PipelineValidationError, run_pipeline, validate_pipeline
+from .pipeline_cache import PipelineStepCache
 from .pipeline_context import PipelineContext, PipelineStepState
 from .pipeline_item import PipelineItem
 from .pipeline_step import PipelineStep
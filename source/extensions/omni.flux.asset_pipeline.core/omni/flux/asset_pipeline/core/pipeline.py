@@ -24,9 +24,14 @@ __all__ = [
     "validate_pipeline",
 ]
 
+import asyncio
+import dataclasses
+import time
 from collections.abc import Awaitable, Callable, Iterable
 
+from .pipeline_cache import PipelineStepCache
 from .pipeline_context import PipelineContext, PipelineStepState
+from .pipeline_item import PipelineItem
 from .pipeline_step import PipelineStep
 
 PipelineProgressCallback = Callable[[PipelineStep, int, int], Awaitable[None]]
@@ -68,6 +73,7 @@ def validate_pipeline(steps: Iterable[PipelineStep], context: PipelineContext) -
 
         if step.enabled:
             errors.extend(step.validate(context))
+            errors.extend(_validate_step_accesses(step, context))
 
     if errors:
         raise PipelineValidationError(errors)
@@ -78,13 +84,20 @@ async def run_pipeline(
     context: PipelineContext,
     *,
     on_step_started: PipelineProgressCallback | None = None,
+    cache: PipelineStepCache | None = None,
 ) -> None:
-    """Validate and run enabled steps in order while recording execution state.
+    """Validate and run enabled steps while recording execution state.
+
+    Steps run in configured order, but a step starts as soon as every earlier step whose declared context accesses
+    conflict with its own has finished, so independent steps run concurrently. Steps without declared accesses keep
+    the strict configured order. When a step fails, the steps already running finish and no other step starts.
 
     Args:
         steps: Configured steps in execution order.
         context: State shared by all pipeline steps.
         on_step_started: Async callback awaited before each runnable step.
+        cache: Store of per-item step results. Items whose cache key is unchanged reuse their result instead of
+            running the step again.
 
     Raises:
         PipelineValidationError: If the configured steps cannot run against the context.
@@ -94,32 +107,260 @@ async def run_pipeline(
     validate_pipeline(ordered_steps, context)
     total = len(ordered_steps)
 
-    for index, step in enumerate(ordered_steps, start=1):
-        if not step.enabled:
+    pending: list[int] = []
+    for index, step in enumerate(ordered_steps):
+        if step.enabled:
+            pending.append(index)
+        else:
             context.execution_state[step.name] = PipelineStepState(
                 step_name=step.name,
                 was_skipped=True,
                 skip_reason="disabled",
             )
-            continue
+    dependencies = {
+        index: {
+            earlier_index
+            for earlier_index in pending
+            if earlier_index < index
+            and _steps_conflict(ordered_steps[earlier_index], ordered_steps[index], cache is not None)
+        }
+        for index in pending
+    }
 
-        if not step.should_run(context):
-            context.execution_state[step.name] = PipelineStepState(
-                step_name=step.name,
-                was_skipped=True,
-                skip_reason=step.skip_reason(context),
-            )
-            continue
+    finished: set[int] = set()
+    running: dict[asyncio.Future[None], int] = {}
+    errors: dict[int, BaseException] = {}
+    try:
+        while running or (pending and not errors):
+            if not errors:
+                for index in [index for index in pending if dependencies[index] <= finished]:
+                    pending.remove(index)
+                    operation = _run_step(ordered_steps[index], index + 1, total, context, on_step_started, cache)
+                    running[asyncio.ensure_future(operation)] = index
+            done, _running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = running.pop(task)
+                finished.add(index)
+                if task.cancelled():
+                    errors[index] = asyncio.CancelledError()
+                elif task.exception() is not None:
+                    errors[index] = task.exception()
+    except asyncio.CancelledError:
+        # Settle the running steps so none keeps mutating the context after the caller is cancelled
+        for task in running:
+            task.cancel()
+        while running:
+            try:
+                done, _running = await asyncio.wait(running)
+            except asyncio.CancelledError:
+                continue
+            for task in done:
+                del running[task]
+        raise
+
+    if errors:
+        raise errors[min(errors)]
+
+
+async def _run_step(
+    step: PipelineStep,
+    position: int,
+    total: int,
+    context: PipelineContext,
+    on_step_started: PipelineProgressCallback | None,
+    cache: PipelineStepCache | None,
+) -> None:
+    """Run one enabled step, reusing the cached results of its unchanged items, and record its state.
+
+    Args:
+        step: Enabled step to run.
+        position: One-based configured position of the step.
+        total: Total number of configured pipeline steps.
+        context: State shared by all pipeline steps.
+        on_step_started: Async callback awaited before the step runs.
+        cache: Store of per-item step results, if any.
 
-        try:
-            if on_step_started is not None:
-                await on_step_started(step, index, total)
+    Raises:
+        Exception: If the progress callback or the step fails.
+    """
+    start = time.perf_counter()
+    if not step.should_run(context):
+        context.execution_state[step.name] = PipelineStepState(
+            step_name=step.name,
+            was_skipped=True,
+            skip_reason=step.skip_reason(context),
+            duration=time.perf_counter() - start,
+        )
+        return
+
+    cached_item_count = 0
+    try:
+        items_to_run = context.items
+        item_cache_keys: dict[int, str] = {}
+        if cache is not None:
+            items_to_run, item_cache_keys = _apply_cached_results(step, context, cache)
+            cached_item_count = len(context.items) - len(items_to_run)
+            if cached_item_count and not items_to_run:
+                context.execution_state[step.name] = PipelineStepState(
+                    step_name=step.name,
+                    was_skipped=True,
+                    skip_reason="cached",
+                    cached_item_count=cached_item_count,
+                    duration=time.perf_counter() - start,
+                )
+                return
+
+        if on_step_started is not None:
+            await on_step_started(step, position, total)
+        if cached_item_count:
+            await _run_step_on_items(step, context, items_to_run)
+        else:
             await step.run(context)
-        except Exception as error:
-            context.execution_state[step.name] = PipelineStepState(
-                step_name=step.name,
-                error=f"{type(error).__name__}: {error}",
-            )
-            raise
 
-        context.execution_state[step.name] = PipelineStepState(step_name=step.name, did_run=True)
+        for item in items_to_run:
+            cache_key = item_cache_keys.get(id(item))
+            if cache_key is None:
+                continue
+            result = step.get_cached_result(context, item)
+            if result is not None:
+                cache.put(cache_key, result)
+    except Exception as error:
+        context.execution_state[step.name] = PipelineStepState(
+            step_name=step.name,
+            error=f"{type(error).__name__}: {error}",
+            cached_item_count=cached_item_count,
+            duration=time.perf_counter() - start,
+        )
+        raise
+
+    context.execution_state[step.name] = PipelineStepState(
+        step_name=step.name,
+        did_run=True,
+        cached_item_count=cached_item_count,
+        duration=time.perf_counter() - start,
+    )
+
+
+def _apply_cached_results(
+    step: PipelineStep, context: PipelineContext, cache: PipelineStepCache
+) -> tuple[list[PipelineItem], dict[int, str]]:
+    """Write the cached results of a step back on the items that have one.
+
+    Args:
+        step: Step whose results are looked up.
+        context: State shared by all pipeline steps.
+        cache: Store of per-item step results.
+
+    Returns:
+        The items the step must still run on, and the cache keys of those items by item ID.
+    """
+    items_to_run: list[PipelineItem] = []
+    item_cache_keys: dict[int, str] = {}
+    for item in context.items:
+        item_key = step.get_cache_key(context, item)
+        if item_key is None:
+            items_to_run.append(item)
+            continue
+        cache_key = cache.make_key(step.name, item_key)
+        result = cache.get(cache_key)
+        if result is not None and step.apply_cached_result(context, item, result):
+            continue
+        items_to_run.append(item)
+        item_cache_keys[id(item)] = cache_key
+    return items_to_run, item_cache_keys
+
+
+async def _run_step_on_items(step: PipelineStep, context: PipelineContext, items: list[PipelineItem]) -> None:
+    """Run a step on a subset of the context items.
+
+    The items are swapped in on the context for the duration of the step. The scheduler never runs this step next to
+    another step accessing the items, see ``_get_step_writes()``.
+
+    Args:
+        step: Step to run.
+        context: State shared by all pipeline steps.
+        items: Items the step runs on.
+    """
+    all_items = context.items
+    context.items = items
+    try:
+        await step.run(context)
+    finally:
+        context.items = all_items
+
+
+def _steps_conflict(first: PipelineStep, second: PipelineStep, uses_cache: bool) -> bool:
+    """Return whether two steps must not run at the same time.
+
+    Args:
+        first: One step.
+        second: Another step.
+        uses_cache: Whether the pipeline reuses cached item results.
+
+    Returns:
+        True if a step writes a context field the other reads or writes, or if a step doesn't declare its accesses.
+    """
+    first_writes = _get_step_writes(first, uses_cache)
+    second_writes = _get_step_writes(second, uses_cache)
+    if first.reads is None or first_writes is None or second.reads is None or second_writes is None:
+        return True
+    return _fields_overlap(first_writes, second.reads | second_writes) or _fields_overlap(second_writes, first.reads)
+
+
+def _get_step_writes(step: PipelineStep, uses_cache: bool) -> frozenset[str] | None:
+    """Return the context fields a step writes while the pipeline runs it.
+
+    A step caching its item results may run on the items without a cached result only, which replaces
+    ``context.items`` while it runs.
+
+    Args:
+        step: Step to inspect.
+        uses_cache: Whether the pipeline reuses cached item results.
+
+    Returns:
+        The declared writes, including ``items`` for a cached step, or ``None`` if the step doesn't declare them.
+    """
+    if step.writes is None or not uses_cache or type(step).get_cache_key is PipelineStep.get_cache_key:
+        return step.writes
+    return step.writes | {"items"}
+
+
+def _fields_overlap(first: Iterable[str], second: Iterable[str]) -> bool:
+    """Return whether two sets of dotted context fields share a field, or a field and one of its parents.
+
+    Args:
+        first: Dotted context fields.
+        second: Other dotted context fields.
+
+    Returns:
+        True if the fields overlap.
+    """
+    for first_field in first:
+        for second_field in second:
+            if (
+                first_field == second_field
+                or first_field.startswith(f"{second_field}.")
+                or second_field.startswith(f"{first_field}.")
+            ):
+                return True
+    return False
+
+
+def _validate_step_accesses(step: PipelineStep, context: PipelineContext) -> list[str]:
+    """Return errors for declared context accesses that don't name a context field.
+
+    Args:
+        step: Enabled step to validate.
+        context: State shared by the configured steps.
+
+    Returns:
+        User-readable validation messages.
+    """
+    if not dataclasses.is_dataclass(context):
+        return []
+    field_names = {context_field.name for context_field in dataclasses.fields(context)}
+    return [
+        f"{step.name}: declares unknown context field {accessed_field}"
+        for accessed_field in sorted((step.reads or frozenset()) | (step.writes or frozenset()))
+        if accessed_field.split(".", 1)[0] not in field_names
+    ]
@@ -0,0 +1,112 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["PipelineStepCache"]
+
+import hashlib
+import json
+import os
+import pathlib
+import uuid
+from typing import Any
+
+_MISSING = object()
+
+
+class PipelineStepCache:
+    """Content-addressed store of per-item step results shared by pipeline runs.
+
+    Entries are keyed by a hash of the step name and the step's item cache key, so a step whose inputs and
+    configuration are unchanged finds the result of an earlier run. Results stay in memory and, when a directory is
+    given, are also written there as JSON so later sessions reuse them.
+    """
+
+    def __init__(self, directory: pathlib.Path | None = None):
+        """Create a cache with no stored results.
+
+        Args:
+            directory: Directory persisting the results. Results only live in memory when ``None``.
+        """
+        self._directory = directory
+        self._results: dict[str, Any] = {}
+
+    @staticmethod
+    def make_key(step_name: str, item_key: str) -> str:
+        """Return the content address of one step result.
+
+        Args:
+            step_name: Name of the step producing the result.
+            item_key: Key returned by the step for one item.
+
+        Returns:
+            Hexadecimal digest identifying the result.
+        """
+        return hashlib.sha256(f"{step_name}\0{item_key}".encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return a stored result.
+
+        Args:
+            key: Content address returned by ``make_key``.
+
+        Returns:
+            The stored result, or ``None`` when nothing is stored for the key.
+        """
+        result = self._results.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+        path = self._get_path(key)
+        if path is None:
+            return None
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        self._results[key] = result
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """Store a result.
+
+        Args:
+            key: Content address returned by ``make_key``.
+            result: JSON-serializable result.
+        """
+        self._results[key] = result
+        path = self._get_path(key)
+        if path is None:
+            return
+        # Stage the entry next to its final path so a reader never sees a partial file
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(json.dumps(result), encoding="utf-8")
+            os.replace(staging, path)
+        except OSError:
+            # The result is still reused from memory by this session
+            staging.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget the results kept in memory. Persisted results are left in place."""
+        self._results.clear()
+
+    def _get_path(self, key: str) -> pathlib.Path | None:
+        if self._directory is None:
+            return None
+        return self._directory / key[:2] / f"{key}.json"
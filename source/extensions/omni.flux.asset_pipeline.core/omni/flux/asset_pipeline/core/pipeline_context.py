@@ -34,7 +34,9 @@ class PipelineStepState:
     This is for status, debugging, and explaining sparse execution. It is not
     rollback history. ``did_run`` means a step completed successfully. If
     ``error`` is set, the step did not complete and may still have partial
-    forward-only side effects.
+    forward-only side effects. ``cached_item_count`` items reused a cached
+    result instead of running the step, and ``duration`` is the wall-clock
+    time spent on the step, in seconds.
     """
 
     step_name: str
@@ -42,6 +44,8 @@ class PipelineStepState:
     was_skipped: bool = False
     skip_reason: str = ""
     error: str = ""
+    cached_item_count: int = 0
+    duration: float = 0.0
 
 
 @dataclass
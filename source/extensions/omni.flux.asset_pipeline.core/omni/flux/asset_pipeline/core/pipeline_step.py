@@ -20,7 +20,7 @@ from __future__ import annotations
 __all__ = ["PipelineStep"]
 
 import abc
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from .pipeline_context import PipelineContext
 from .pipeline_item import PipelineItem
@@ -32,11 +32,17 @@ class PipelineStep(abc.ABC):
     ``validate()`` is for compatibility/configuration errors before mutation.
     ``should_run()`` is only for no-op checks after validation succeeds.
     ``run()`` mutates existing items/typed child records in place.
+
+    ``reads`` and ``writes`` declare the context fields the step accesses, as dotted paths such as ``"items.textures"``
+    for a field of every item. Steps whose accesses don't conflict may run concurrently. A step that leaves either
+    declaration to ``None`` runs alone, after every earlier step and before every later one.
     """
 
     context_type: ClassVar[type[PipelineContext]] = PipelineContext
     item_types: ClassVar[tuple[type[PipelineItem], ...]] = ()
     idempotent: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str] | None] = None
+    writes: ClassVar[frozenset[str] | None] = None
 
     def __init__(self):
         self.enabled: bool = True
@@ -89,3 +95,24 @@ class PipelineStep(abc.ABC):
     @abc.abstractmethod
     async def run(self, context: PipelineContext) -> None:
         """Perform the step mutation idempotently."""
+
+    def get_cache_key(self, context: PipelineContext, item: PipelineItem) -> str | None:
+        """Return a key identifying everything that decides this step's result for one item.
+
+        The key must change with the item's input content and the step configuration, for example a hash of the source
+        file and the conversion arguments. Items with an unchanged key reuse the cached result instead of running the
+        step again. ``None``, the default, never caches the item.
+        """
+        return None
+
+    def get_cached_result(self, context: PipelineContext, item: PipelineItem) -> Any:
+        """Return the JSON-serializable result written on one item by a successful run, or ``None`` to not cache it."""
+        return None
+
+    def apply_cached_result(self, context: PipelineContext, item: PipelineItem, result: Any) -> bool:
+        """Write a cached result back on one item.
+
+        Returns:
+            False if the result can't be reused, for example when a file it references is gone. The item then runs.
+        """
+        return False
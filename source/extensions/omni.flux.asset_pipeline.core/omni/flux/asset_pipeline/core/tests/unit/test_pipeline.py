@@ -17,6 +17,7 @@
 
 import asyncio
 import pathlib
+import tempfile
 from dataclasses import dataclass, field
 
 import omni.kit.test
@@ -24,6 +25,7 @@ from omni.flux.asset_pipeline.core import (
     PipelineContext,
     PipelineItem,
     PipelineStep,
+    PipelineStepCache,
     PipelineValidationError,
     run_pipeline,
     validate_pipeline,
@@ -163,6 +165,80 @@ class _SceneTagStep(PipelineStep):
         context.items[0].value = {**context.items[0].value, "tag": "processed"}
 
 
+class _DeclaredStep(PipelineStep):
+    """Test step that declares its context accesses and waits for a signal before finishing."""
+
+    item_types = (PipelineItem,)
+
+    def __init__(self, name: str, reads: set[str], writes: set[str], release: asyncio.Event | None = None):
+        super().__init__()
+        self._name = name
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self._release = release
+        self.started = asyncio.Event()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return f"Declared step {self._name}"
+
+    async def run(self, context: PipelineContext) -> None:
+        self.started.set()
+        if self._release is not None:
+            await self._release.wait()
+
+
+class _CachedSuffixStep(_SuffixRenameStep):
+    """Rename step caching the renamed path of each item."""
+
+    def __init__(self):
+        super().__init__(".png", ".dds")
+        self.run_values: list[list[pathlib.Path]] = []
+
+    def get_cache_key(self, context: PipelineContext, item: PipelineItem) -> str | None:
+        return f"{item.value.as_posix()}:{self._to_suffix}"
+
+    def get_cached_result(self, context: PipelineContext, item: PipelineItem) -> str:
+        return item.value.as_posix()
+
+    def apply_cached_result(self, context: PipelineContext, item: PipelineItem, result: str) -> bool:
+        item.value = pathlib.Path(result)
+        return True
+
+    async def run(self, context: PipelineContext) -> None:
+        self.run_values.append([item.value for item in context.items])
+        await super().run(context)
+
+
+class _BlockingCachedSuffixStep(_CachedSuffixStep):
+    """Cached rename step declaring its accesses and waiting for a signal before renaming."""
+
+    reads = frozenset({"items.value"})
+    writes = frozenset({"items.value"})
+
+    def __init__(self, release: asyncio.Event):
+        super().__init__()
+        self._release = release
+        self.started = asyncio.Event()
+
+    async def run(self, context: PipelineContext) -> None:
+        self.started.set()
+        await self._release.wait()
+        await super().run(context)
+
+
+class _StateReplacingStep(_DeclaredStep):
+    """Declared step replacing the execution state with a copy holding a marker, then releasing another step."""
+
+    async def run(self, context: PipelineContext) -> None:
+        context.execution_state = {**context.execution_state, "marker": None}
+        self._release.set()
+
+
 class TestPipeline(omni.kit.test.AsyncTestCase):
     """Test generic pipeline validation and execution behavior."""
 
@@ -420,3 +496,180 @@ class TestPipeline(omni.kit.test.AsyncTestCase):
         # Assert
         self.assertFalse(step.should_run_called)
         self.assertEqual(context.execution_state, {})
+
+    async def test_run_pipeline_runs_independent_declared_steps_concurrently(self):
+        """Steps without conflicting accesses overlap, and a conflicting step waits for both."""
+        # Arrange
+        context = PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))])
+        release = asyncio.Event()
+        first = _DeclaredStep("first", {"items.value"}, {"items.meshes"}, release=release)
+        second = _DeclaredStep("second", {"items.value"}, {"items.textures"}, release=release)
+        third = _DeclaredStep("third", {"items.textures"}, {"items.metadata"})
+
+        async def release_when_both_started() -> None:
+            """Release both declared steps once they are running at the same time."""
+            await first.started.wait()
+            await second.started.wait()
+            self.assertFalse(third.started.is_set())
+            release.set()
+
+        # Act
+        await asyncio.wait_for(
+            asyncio.gather(run_pipeline([first, second, third], context), release_when_both_started()), timeout=5
+        )
+
+        # Assert
+        self.assertTrue(all(context.execution_state[step.name].did_run for step in (first, second, third)))
+        self.assertGreater(context.execution_state[first.name].duration, 0)
+
+    async def test_run_pipeline_keeps_undeclared_steps_in_order(self):
+        """A step without declared accesses waits for every earlier step."""
+        # Arrange
+        context = PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))])
+        release = asyncio.Event()
+        declared = _DeclaredStep("declared", set(), {"items.value"}, release=release)
+        undeclared = _SuffixRenameStep(".png", ".dds")
+
+        # Act
+        pipeline_task = asyncio.ensure_future(run_pipeline([declared, undeclared], context))
+        await declared.started.wait()
+        await asyncio.sleep(0)
+        renamed_before_release = context.items[0].value.suffix == ".dds"
+        release.set()
+        await pipeline_task
+
+        # Assert
+        self.assertFalse(renamed_before_release)
+        self.assertEqual(context.items[0].value.suffix, ".dds")
+
+    async def test_validate_pipeline_rejects_unknown_declared_fields(self):
+        """Declared accesses must name context fields."""
+        # Arrange
+        context = PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))])
+        step = _DeclaredStep("declared", {"stage"}, {"items.value"})
+
+        # Act
+        with self.assertRaises(PipelineValidationError) as error_context:
+            validate_pipeline([step], context)
+
+        # Assert
+        self.assertIn("declares unknown context field stage", str(error_context.exception))
+
+    async def test_run_pipeline_reuses_cached_item_results(self):
+        """Unchanged items reuse the cached result and only changed items run the step."""
+        # Arrange
+        cache = PipelineStepCache()
+        step = _CachedSuffixStep()
+        await run_pipeline(
+            [step],
+            PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))]),
+            cache=cache,
+        )
+        cached_context = PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))])
+        partial_context = PipelineContext(
+            items=[
+                _PathItem(value=pathlib.Path("/textures/albedo.png")),
+                _PathItem(value=pathlib.Path("/textures/normal.png")),
+            ]
+        )
+
+        # Act
+        await run_pipeline([step], cached_context, cache=cache)
+        await run_pipeline([step], partial_context, cache=cache)
+
+        # Assert
+        self.assertEqual(
+            step.run_values, [[pathlib.Path("/textures/albedo.png")], [pathlib.Path("/textures/normal.png")]]
+        )
+        self.assertEqual(cached_context.items[0].value, pathlib.Path("/textures/albedo.dds"))
+        self.assertEqual(cached_context.execution_state[step.name].skip_reason, "cached")
+        self.assertEqual(cached_context.execution_state[step.name].cached_item_count, 1)
+        self.assertEqual(
+            [item.value for item in partial_context.items],
+            [pathlib.Path("/textures/albedo.dds"), pathlib.Path("/textures/normal.dds")],
+        )
+        self.assertTrue(partial_context.execution_state[step.name].did_run)
+        self.assertEqual(partial_context.execution_state[step.name].cached_item_count, 1)
+
+    async def test_run_pipeline_keeps_context_fields_replaced_next_to_a_cached_step(self):
+        """A step replacing a context field while a cached step runs on part of the items keeps its new value."""
+        # Arrange
+        cache = PipelineStepCache()
+        release = asyncio.Event()
+        await run_pipeline(
+            [_CachedSuffixStep()],
+            PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))]),
+            cache=cache,
+        )
+        cached_step = _BlockingCachedSuffixStep(release)
+        writer_step = _StateReplacingStep("writer", set(), {"execution_state"}, release=release)
+        context = PipelineContext(
+            items=[
+                _PathItem(value=pathlib.Path("/textures/albedo.png")),
+                _PathItem(value=pathlib.Path("/textures/normal.png")),
+            ]
+        )
+
+        # Act
+        await asyncio.wait_for(run_pipeline([cached_step, writer_step], context, cache=cache), timeout=5)
+
+        # Assert
+        self.assertEqual(cached_step.run_values, [[pathlib.Path("/textures/normal.png")]])
+        self.assertIn("marker", context.execution_state)
+        self.assertTrue(context.execution_state[cached_step.name].did_run)
+        self.assertEqual(context.execution_state[cached_step.name].cached_item_count, 1)
+        self.assertTrue(context.execution_state[writer_step.name].did_run)
+        self.assertEqual(
+            [item.value for item in context.items],
+            [pathlib.Path("/textures/albedo.dds"), pathlib.Path("/textures/normal.dds")],
+        )
+
+    async def test_run_pipeline_runs_item_readers_after_a_cached_step(self):
+        """A step reading the items waits for a cached step running on part of them."""
+        # Arrange
+        cache = PipelineStepCache()
+        release = asyncio.Event()
+        await run_pipeline(
+            [_CachedSuffixStep()],
+            PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))]),
+            cache=cache,
+        )
+        cached_step = _BlockingCachedSuffixStep(release)
+        reader_step = _DeclaredStep("reader", {"items.metadata"}, set())
+        context = PipelineContext(
+            items=[
+                _PathItem(value=pathlib.Path("/textures/albedo.png")),
+                _PathItem(value=pathlib.Path("/textures/normal.png")),
+            ]
+        )
+
+        # Act
+        pipeline_task = asyncio.ensure_future(run_pipeline([cached_step, reader_step], context, cache=cache))
+        await cached_step.started.wait()
+        await asyncio.sleep(0)
+        reader_started_before_release = reader_step.started.is_set()
+        release.set()
+        await asyncio.wait_for(pipeline_task, timeout=5)
+
+        # Assert
+        self.assertFalse(reader_started_before_release)
+        self.assertTrue(reader_step.started.is_set())
+
+    async def test_step_cache_persists_results_in_its_directory(self):
+        """A cache directory lets another session reuse the results."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            step = _CachedSuffixStep()
+            await run_pipeline(
+                [step],
+                PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))]),
+                cache=PipelineStepCache(pathlib.Path(temp_dir)),
+            )
+            context = PipelineContext(items=[_PathItem(value=pathlib.Path("/textures/albedo.png"))])
+
+            # Act
+            await run_pipeline([step], context, cache=PipelineStepCache(pathlib.Path(temp_dir)))
+
+            # Assert
+            self.assertEqual(len(step.run_values), 1)
+            self.assertEqual(context.items[0].value, pathlib.Path("/textures/albedo.dds"))
@@ -16,18 +16,133 @@
 """
 
 import re
+from collections.abc import Iterable
 from contextlib import nullcontext
 
 import omni.kit.commands
 import omni.kit.undo
 import omni.usd
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
+from omni.flux.utils.common.stage_cache import StageCache as _StageCache
+from omni.flux.utils.common.stage_cache import StageCacheRegistry as _StageCacheRegistry
 
 # Required to register commands
 from omni.kit.core.collection import commands as _usd_commands  # noqa: F401
 from pxr import Sdf, Usd
 
 
+class _CustomTagsCache(_StageCache):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Cache the tag queries of one stage, shared by every `CustomTagsCore` of the stage.
+
+        Holds the tags, one membership query per tag and a reverse index from prim path to tags. Everything is
+        dropped when a tag collection changes, so a stage-manager refresh computes each membership query once instead
+        of once per prim and tag.
+
+        Args:
+            stage: The stage holding the tags
+        """
+        super().__init__(stage)
+        self._all_tags: tuple[Sdf.Path, tuple[Sdf.Path, ...]] | None = None
+        self._membership_queries: dict[Sdf.Path, Usd.UsdCollectionMembershipQuery] = {}
+        self._prim_tags: dict[Sdf.Path, tuple[Sdf.Path, ...]] = {}
+
+    def get_all_tags(self, tags_base_path: Sdf.Path) -> tuple[Sdf.Path, ...]:
+        """
+        Get the tags of the stage
+
+        Args:
+            tags_base_path: The path of the prim holding the tags
+
+        Returns:
+            The paths of the tags (USD Collections)
+        """
+        all_tags = self._all_tags
+        if all_tags is not None and all_tags[0] == tags_base_path:
+            return all_tags[1]
+
+        stage = self._stage()
+        tags_prim = stage.GetPrimAtPath(tags_base_path) if stage else None
+        tags = ()
+        if tags_prim and tags_prim.IsValid():
+            tags = tuple(
+                p
+                for collection in Usd.CollectionAPI.GetAllCollections(tags_prim)
+                if (p := collection.GetCollectionPath())
+            )
+        if all_tags is not None:
+            # The reverse index only covers the tags found under the previous base path
+            self._prim_tags = {}
+        self._all_tags = (tags_base_path, tags)
+        return tags
+
+    def get_membership_query(self, tag_path: Sdf.Path) -> Usd.UsdCollectionMembershipQuery:
+        """
+        Get the membership query of a tag
+
+        Args:
+            tag_path: The path of the tag (USD Collection)
+
+        Returns:
+            The membership query, computed once until the tag changes
+        """
+        membership_queries = self._membership_queries
+        query = membership_queries.get(tag_path)
+        if query is None:
+            query = Usd.CollectionAPI.GetCollection(self._stage(), tag_path).ComputeMembershipQuery()
+            membership_queries[tag_path] = query
+        return query
+
+    def get_prim_tags(self, prim_path: Sdf.Path, tags_base_path: Sdf.Path) -> tuple[Sdf.Path, ...]:
+        """
+        Get the tags assigned to a prim
+
+        Args:
+            prim_path: The path of the prim
+            tags_base_path: The path of the prim holding the tags
+
+        Returns:
+            The paths of the tags including the prim, in the order of `get_all_tags`
+        """
+        all_tags = self.get_all_tags(tags_base_path)
+        # Capture the index so a concurrent invalidation can't receive tags computed from the previous queries
+        prim_tags = self._prim_tags
+        tags = prim_tags.get(prim_path)
+        if tags is None:
+            tags = tuple(tag for tag in all_tags if self.get_membership_query(tag).IsPathIncluded(prim_path))
+            prim_tags[prim_path] = tags
+        return tags
+
+    def invalidate(self):
+        """Drop the cached tags, membership queries and reverse index"""
+        self._all_tags = None
+        self._membership_queries = {}
+        self._prim_tags = {}
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, _sender: Usd.Stage):
+        # The tags live on their base prim: any change to its properties, or a resync of one of its ancestors, can
+        # change the includes/excludes of a collection. A resync of the pseudo-root also covers default prim changes.
+        owner_paths = {tag_path.GetPrimPath() for tag_path in self._membership_queries}
+        all_tags = self._all_tags
+        if all_tags is not None:
+            owner_paths.add(all_tags[0])
+        if not owner_paths:
+            return
+        for path in notice.GetResyncedPaths():
+            prim_path = path.GetPrimPath()
+            if any(owner_path.HasPrefix(prim_path) for owner_path in owner_paths):
+                self.invalidate()
+                return
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.GetPrimPath() in owner_paths:
+                self.invalidate()
+                return
+
+
+_CUSTOM_TAGS_CACHES = _StageCacheRegistry(_CustomTagsCache)
+
+
 class CustomTagsCore:
     def __init__(self, context_name: str = ""):
         self._default_attrs = {
@@ -128,13 +243,7 @@ class CustomTagsCore:
         """
         if not self._stage:
             return []
-
-        tags_prim = self._stage.GetPrimAtPath(self._get_tags_base_path())
-        if not tags_prim.IsValid():
-            return []
-        return [
-            p for collection in Usd.CollectionAPI.GetAllCollections(tags_prim) if (p := collection.GetCollectionPath())
-        ]
+        return list(_CUSTOM_TAGS_CACHES.get(self._stage).get_all_tags(self._get_tags_base_path()))
 
     def get_prim_tags(self, prim: Usd.Prim) -> list[Sdf.Path]:
         """
@@ -146,17 +255,25 @@ class CustomTagsCore:
         Returns:
             A list of Prim Paths for the tags (USD Collections) assigned to the prim
         """
-        item_tags = []
+        if not self._stage or not prim:
+            return []
+        return list(_CUSTOM_TAGS_CACHES.get(self._stage).get_prim_tags(prim.GetPath(), self._get_tags_base_path()))
 
-        if not self._stage:
-            return item_tags
+    def get_prims_tags(self, prims: Iterable[Usd.Prim]) -> dict[Sdf.Path, list[Sdf.Path]]:
+        """
+        Get all the tags assigned to each of the given prims
 
-        for tag_path in self.get_all_tags():
-            if not self.prim_has_tag(prim, tag_path):
-                continue
-            item_tags.append(tag_path)
+        Args:
+            prims: The prims to get tags for
 
-        return item_tags
+        Returns:
+            The Prim Paths of the tags (USD Collections) assigned to each prim, by prim path
+        """
+        if not self._stage:
+            return {prim.GetPath(): [] for prim in prims if prim}
+        cache = _CUSTOM_TAGS_CACHES.get(self._stage)
+        tags_base_path = self._get_tags_base_path()
+        return {prim.GetPath(): list(cache.get_prim_tags(prim.GetPath(), tags_base_path)) for prim in prims if prim}
 
     def get_tag_prims(self, tag_path: Sdf.Path) -> list[Sdf.Path]:
         """
@@ -183,11 +300,7 @@ class CustomTagsCore:
         """
         if not prim or not tag_path or tag_path.isEmpty:
             return False
-        return (
-            Usd.CollectionAPI.GetCollection(self._stage, tag_path)
-            .ComputeMembershipQuery()
-            .IsPathIncluded(prim.GetPath())
-        )
+        return _CUSTOM_TAGS_CACHES.get(self._stage).get_membership_query(tag_path).IsPathIncluded(prim.GetPath())
 
     def prim_has_any_tag(self, prim: Usd.Prim, tag_paths: list[Sdf.Path]) -> bool:
         """
@@ -200,7 +313,38 @@ class CustomTagsCore:
         Returns:
             True if the prim is a member of at least one of the given collections, False otherwise
         """
-        return any(self.prim_has_tag(prim, tag_path) for tag_path in tag_paths)
+        return self.prims_have_any_tag([prim], tag_paths)[0]
+
+    def prims_have_any_tag(self, prims: Iterable[Usd.Prim], tag_paths: Iterable[Sdf.Path]) -> list[bool]:
+        """
+        Check, for each of the given prims, whether it belongs to any of the given tag collections (OR logic).
+
+        Args:
+            prims: The prims to evaluate
+            tag_paths: The tag collection paths to check membership against
+
+        Returns:
+            One value per prim, True if the prim is a member of at least one of the given collections
+        """
+        tag_paths = {tag_path for tag_path in tag_paths if tag_path and not tag_path.isEmpty}
+        if not self._stage or not tag_paths:
+            return [False for _prim in prims]
+
+        cache = _CUSTOM_TAGS_CACHES.get(self._stage)
+        tags_base_path = self._get_tags_base_path()
+        # Paths that aren't custom tags are outside the reverse index and use their membership query
+        other_queries = [
+            cache.get_membership_query(tag_path)
+            for tag_path in tag_paths.difference(cache.get_all_tags(tags_base_path))
+        ]
+        return [
+            bool(prim)
+            and (
+                not tag_paths.isdisjoint(cache.get_prim_tags(prim.GetPath(), tags_base_path))
+                or any(query.IsPathIncluded(prim.GetPath()) for query in other_queries)
+            )
+            for prim in prims
+        ]
 
     def create_tag(self, tag_name: str, use_undo_group: bool = True):
         """
@@ -15,6 +15,8 @@
 * limitations under the License.
 """
 
+from unittest.mock import patch
+
 import omni.kit.undo
 import omni.usd
 from omni.flux.custom_tags.core import CustomTagsCore
@@ -512,3 +514,77 @@ class TestCustomTagsCore(AsyncTestCase):
             .GetTargets()
         )
         self.assertEqual(includes_02, [])
+
+    def _define_tags(self, prims: list[str], tags: dict[str, list[str]]) -> dict[str, Usd.CollectionAPI]:
+        with Usd.EditContext(self.stage, self.root_layer):
+            base_prim = self.stage.DefinePrim("/CustomTags", "Scope")
+            for prim in prims:
+                self.stage.DefinePrim(prim, "Xform")
+            collections = {}
+            for tag, tag_prims in tags.items():
+                collections[tag] = Usd.CollectionAPI.Apply(base_prim, tag)
+                collections[tag].CreateExpansionRuleAttr("explicitOnly")
+                includes_rel = collections[tag].CreateIncludesRel()
+                for prim in tag_prims:
+                    includes_rel.AddTarget(prim)
+        return collections
+
+    async def test_prim_tags_should_compute_one_membership_query_per_tag(self):
+        # Arrange
+        prims = [f"/RootNode/meshes/mesh_{index:02}" for index in range(20)]
+        self._define_tags(prims, {"Test_Tag_01": prims[:10], "Test_Tag_02": prims[5:]})
+        core = CustomTagsCore(context_name="")
+        other_core = CustomTagsCore(context_name="")
+
+        # Act
+        with patch.object(Usd.CollectionAPI, "GetCollection", wraps=Usd.CollectionAPI.GetCollection) as collection_mock:
+            tags = [core.get_prim_tags(self.stage.GetPrimAtPath(prim)) for prim in prims]
+            other_tags = other_core.get_prims_tags([self.stage.GetPrimAtPath(prim) for prim in prims])
+
+        # Assert
+        self.assertEqual(collection_mock.call_count, 2)
+        self.assertEqual(tags[0], [Sdf.Path("/CustomTags.collection:Test_Tag_01")])
+        self.assertEqual(len(tags[7]), 2)
+        self.assertEqual(tags[15], [Sdf.Path("/CustomTags.collection:Test_Tag_02")])
+        self.assertEqual(other_tags, {Sdf.Path(prim): tag for prim, tag in zip(prims, tags)})
+
+    async def test_changed_includes_and_excludes_should_invalidate_the_cache(self):
+        # Arrange
+        prims = ["/RootNode/meshes/mesh_01", "/RootNode/meshes/mesh_02"]
+        collections = self._define_tags(prims, {"Test_Tag_01": prims[:1]})
+        tag_path = collections["Test_Tag_01"].GetCollectionPath()
+        core = CustomTagsCore(context_name="")
+        prim = self.stage.GetPrimAtPath(prims[1])
+        self.assertFalse(core.prim_has_tag(prim, tag_path))
+
+        # Act
+        with Usd.EditContext(self.stage, self.root_layer):
+            collections["Test_Tag_01"].GetIncludesRel().AddTarget(prims[1])
+        included_tags = core.get_prim_tags(prim)
+        with Usd.EditContext(self.stage, self.root_layer):
+            collections["Test_Tag_01"].CreateExcludesRel().AddTarget(prims[1])
+        excluded = core.prim_has_tag(prim, tag_path)
+        with Usd.EditContext(self.stage, self.root_layer):
+            Usd.CollectionAPI.Apply(self.stage.GetPrimAtPath("/CustomTags"), "Test_Tag_02")
+        all_tags = core.get_all_tags()
+
+        # Assert
+        self.assertEqual(included_tags, [tag_path])
+        self.assertFalse(excluded)
+        self.assertEqual(all_tags, [tag_path, Sdf.Path("/CustomTags.collection:Test_Tag_02")])
+
+    async def test_prims_have_any_tag_should_answer_for_every_prim(self):
+        # Arrange
+        prims = ["/RootNode/meshes/mesh_01", "/RootNode/meshes/mesh_02", "/RootNode/meshes/mesh_03"]
+        self._define_tags(prims, {"Test_Tag_01": prims[:1], "Test_Tag_02": prims[1:2]})
+        core = CustomTagsCore(context_name="")
+        items = [self.stage.GetPrimAtPath(prim) for prim in prims]
+
+        # Act
+        values = core.prims_have_any_tag(items, [Sdf.Path("/CustomTags.collection:Test_Tag_02")])
+        any_values = core.prims_have_any_tag(items, core.get_all_tags())
+
+        # Assert
+        self.assertEqual(values, [False, True, False])
+        self.assertEqual(any_values, [True, True, False])
+        self.assertEqual(core.prim_has_any_tag(items[2], core.get_all_tags()), False)
@@ -21,7 +21,7 @@ __all__ = (
     "QUEUE_SCHEMA_VERSION",
 )
 
-QUEUE_SCHEMA_VERSION = 10
+QUEUE_SCHEMA_VERSION = 12
 
 COLLECTION_TYPES: dict[str, type] = {"tuple": tuple, "set": set, "frozenset": frozenset}
 COLLECTION_TYPE_NAMES: dict[type, str] = {collection_type: name for name, collection_type in COLLECTION_TYPES.items()}
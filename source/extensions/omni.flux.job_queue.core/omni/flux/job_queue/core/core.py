@@ -15,8 +15,6 @@
 * limitations under the License.
 """
 
-import asyncio
-
 from . import handlers, persistence
 from .interface import QueueInterface
 
@@ -73,17 +71,19 @@ class JobQueueCore:
         if self._persistence_started:
             persistence.get_registry().set_changed_callback(None)
         if shutdown_task is None:
-            self._shutdown_persistence()
+            self._release(queue)
         else:
-            shutdown_task.add_done_callback(self._on_handlers_shutdown)
+            shutdown_task.add_done_callback(lambda _task: self._release(queue))
 
-    def _on_handlers_shutdown(self, _task: asyncio.Task[None]) -> None:
-        """Release persistence after active Apply work stops using serialization.
+    def _release(self, queue: QueueInterface | None) -> None:
+        """Release persistence and database connections after active Apply work stops using them.
 
         Args:
-            _task: Completed Apply-runtime shutdown task.
+            queue: Queue interface that was active before shutdown.
         """
         self._shutdown_persistence()
+        if queue is not None:
+            queue.close()
 
     def _shutdown_persistence(self) -> None:
         """Release the persistence registry once."""
@@ -0,0 +1,372 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+
+from .enums import JobState
+from .job import Job
+from .serializer import deserialize
+
+__all__ = (
+    "ConnectionPool",
+    "JobCache",
+    "QueueDatabase",
+    "ReadinessIndex",
+    "close_queue_database",
+    "get_queue_database",
+)
+
+
+class _ThreadConnections:
+    """Hold the idle connections owned by one thread."""
+
+    __slots__ = ("__weakref__", "idle")
+
+    def __init__(self) -> None:
+        """Create an empty idle list."""
+        self.idle: list[sqlite3.Connection] = []
+
+
+class ConnectionPool:
+    """Reuse configured SQLite connections per thread instead of reopening the database for every operation."""
+
+    def __init__(self, db_path: str) -> None:
+        """Create an empty pool for one database file.
+
+        Args:
+            db_path: Path to the SQLite queue database.
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owners: weakref.WeakSet[_ThreadConnections] = weakref.WeakSet()
+        self._generation = 0
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow one configured connection owned by the calling thread.
+
+        Nested borrows on the same thread receive distinct connections. A borrowed connection is returned with its open
+        transaction rolled back and its statement trace removed, matching the state of a freshly opened connection.
+
+        Yields:
+            Connection with dictionary rows, foreign keys, and write-ahead logging enabled.
+        """
+        with self._lock:
+            generation = self._generation
+            owner = getattr(self._local, "connections", None)
+            if owner is None:
+                owner = _ThreadConnections()
+                self._local.connections = owner
+                self._owners.add(owner)
+        connection = owner.idle.pop() if owner.idle else self._open()
+        try:
+            yield connection
+        finally:
+            reusable = True
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+                connection.set_trace_callback(None)
+            except sqlite3.Error:
+                reusable = False
+            with self._lock:
+                reusable = reusable and generation == self._generation
+            if reusable:
+                owner.idle.append(connection)
+            else:
+                connection.close()
+
+    def close(self) -> None:
+        """Close every idle connection. Connections borrowed at this time are closed when they are returned."""
+        with self._lock:
+            self._generation += 1
+            owners = list(self._owners)
+            self._owners = weakref.WeakSet()
+            self._local = threading.local()
+        for owner in owners:
+            while owner.idle:
+                owner.idle.pop().close()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure one connection.
+
+        Returns:
+            Connection with its pragmas applied.
+        """
+        # Pooled connections may be closed by another thread in ``close``; each one is only used by its owner thread.
+        connection = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        try:
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+
+class ReadinessIndex:
+    """Track the queued jobs whose data and control predecessors are all done.
+
+    The index is rebuilt from the database after structural changes and updated incrementally from committed execution
+    transitions, so a scheduler pass only re-examines jobs whose predecessors just finished instead of scanning every
+    queued job and its edges.
+    """
+
+    def __init__(self) -> None:
+        """Create an index that is rebuilt on its first use."""
+        self._lock = threading.Lock()
+        self._valid = False
+        self._changed: set[str] = set()
+        self._states: dict[str, str] = {}
+        self._successors: dict[str, list[str]] = {}
+        self._pending: dict[str, int] = {}
+        self._ready: set[str] = set()
+
+    def invalidate(self) -> None:
+        """Rebuild the whole index before its next use."""
+        with self._lock:
+            self._valid = False
+            self._changed.clear()
+
+    def mark_changed(self, job_ids: Iterable[str]) -> None:
+        """Reload the committed state of jobs before the next use of the index.
+
+        Args:
+            job_ids: Identifiers of the jobs whose state changed.
+        """
+        with self._lock:
+            if self._valid:
+                self._changed.update(job_ids)
+
+    def get_ready_jobs(self, connection: sqlite3.Connection) -> set[str]:
+        """Return the queued jobs whose predecessors are all done.
+
+        Args:
+            connection: Connection used to refresh the index. It must not be inside a transaction.
+
+        Returns:
+            Identifiers of the runnable candidates.
+        """
+        with self._lock:
+            if self._valid and self._changed:
+                changed = self._changed
+                self._changed = set()
+                connection.execute("BEGIN")
+                try:
+                    rows = connection.execute(
+                        "SELECT job_id, state FROM jobs WHERE job_id IN (SELECT value FROM json_each(?))",
+                        (json.dumps(sorted(changed)),),
+                    ).fetchall()
+                finally:
+                    connection.rollback()
+                states = {row["job_id"]: row["state"] for row in rows}
+                # Deleted or foreign jobs mean the structure changed behind the index
+                if states.keys() != changed or not states.keys() <= self._states.keys():
+                    self._valid = False
+                else:
+                    for job_id, state in states.items():
+                        self._apply_state(job_id, state)
+            if not self._valid:
+                self._rebuild(connection)
+            return set(self._ready)
+
+    def _rebuild(self, connection: sqlite3.Connection) -> None:
+        """Load every job state and edge from one consistent read.
+
+        Args:
+            connection: Connection outside of any transaction.
+        """
+        connection.execute("BEGIN")
+        try:
+            states = {row["job_id"]: row["state"] for row in connection.execute("SELECT job_id, state FROM jobs")}
+            edges = connection.execute(
+                """
+                SELECT source_job_id AS predecessor, target_job_id AS target FROM job_connections
+                UNION
+                SELECT prerequisite_job_id, target_job_id FROM job_control_edges
+                """
+            ).fetchall()
+        finally:
+            connection.rollback()
+        successors: dict[str, list[str]] = {}
+        pending: dict[str, int] = {}
+        for edge in edges:
+            predecessor, target = edge["predecessor"], edge["target"]
+            successors.setdefault(predecessor, []).append(target)
+            if states.get(predecessor, JobState.DONE.value) != JobState.DONE.value:
+                pending[target] = pending.get(target, 0) + 1
+        self._states = states
+        self._successors = successors
+        self._pending = pending
+        self._ready = {
+            job_id for job_id, state in states.items() if state == JobState.QUEUED.value and not pending.get(job_id)
+        }
+        self._changed.clear()
+        self._valid = True
+
+    def _apply_state(self, job_id: str, state: str) -> None:
+        """Propagate one committed state change to the job and its successors.
+
+        Args:
+            job_id: Changed job identifier.
+            state: Committed persisted state.
+        """
+        done = JobState.DONE.value
+        previous = self._states[job_id]
+        self._states[job_id] = state
+        if (previous == done) != (state == done):
+            delta = -1 if state == done else 1
+            for successor in self._successors.get(job_id, ()):
+                self._pending[successor] = self._pending.get(successor, 0) + delta
+                self._update_ready(successor)
+        self._update_ready(job_id)
+
+    def _update_ready(self, job_id: str) -> None:
+        """Add or remove one job from the runnable candidates.
+
+        Args:
+            job_id: Job identifier to evaluate.
+        """
+        if self._states.get(job_id) == JobState.QUEUED.value and not self._pending.get(job_id):
+            self._ready.add(job_id)
+        else:
+            self._ready.discard(job_id)
+
+
+class JobCache:
+    """Keep the deserialized jobs of the runnable candidates, keyed by their exact persisted payload."""
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+
+    def get(self, job_data: str, job_type: type[Job]) -> Job:
+        """Return the job for one payload, deserializing it only when needed.
+
+        Args:
+            job_data: Exact persisted job payload.
+            job_type: Registered job type the payload must decode to.
+
+        Returns:
+            Deserialized job. Callers must not mutate it.
+
+        Raises:
+            TypeError: If the payload does not decode to the registered type.
+            Exception: Any error raised by a registered decoder.
+        """
+        with self._lock:
+            job = self._jobs.get(job_data)
+        # A plugin may register a new class under the same persisted name
+        if job is None or type(job) is not job_type:
+            job = deserialize(job_data)
+            if type(job) is not job_type:
+                raise TypeError("The persisted job does not match its registered type")
+            with self._lock:
+                self._jobs[job_data] = job
+        return job
+
+    def retain(self, job_datas: Iterable[str]) -> None:
+        """Drop every cached job whose payload is no longer queued.
+
+        Args:
+            job_datas: Payloads of the current runnable candidates.
+        """
+        keep = set(job_datas)
+        with self._lock:
+            self._jobs = {job_data: job for job_data, job in self._jobs.items() if job_data in keep}
+
+    def clear(self) -> None:
+        """Drop every cached job."""
+        with self._lock:
+            self._jobs.clear()
+
+
+class QueueDatabase:
+    """Process-wide connection pool and scheduling caches shared by every queue opened on one SQLite file."""
+
+    def __init__(self, db_path: str) -> None:
+        """Create the shared state of one database file.
+
+        Args:
+            db_path: Path to the SQLite queue database.
+        """
+        self.connections = ConnectionPool(db_path)
+        self.readiness = ReadinessIndex()
+        self.jobs = JobCache()
+
+    def close(self) -> None:
+        """Close the idle connections and drop the caches. They are recreated on the next use."""
+        self.connections.close()
+        self.readiness.invalidate()
+        self.jobs.clear()
+
+
+_DATABASES_LOCK = threading.Lock()
+_DATABASES: weakref.WeakValueDictionary[str, QueueDatabase] = weakref.WeakValueDictionary()
+
+
+def _database_key(db_path: str) -> str:
+    """Normalize one database path so aliases share their state.
+
+    Args:
+        db_path: Path to the SQLite queue database.
+
+    Returns:
+        Normalized absolute path.
+    """
+    return os.path.normcase(os.path.abspath(db_path))
+
+
+def get_queue_database(db_path: str) -> QueueDatabase:
+    """Return the shared state of one database file, creating it if no queue uses the file.
+
+    Args:
+        db_path: Path to the SQLite queue database.
+
+    Returns:
+        Shared state kept alive by the queues using it.
+    """
+    key = _database_key(db_path)
+    with _DATABASES_LOCK:
+        database = _DATABASES.get(key)
+        if database is None:
+            database = QueueDatabase(db_path)
+            _DATABASES[key] = database
+        return database
+
+
+def close_queue_database(db_path: str) -> None:
+    """Close the pooled connections of one database file so it can be moved or deleted.
+
+    Args:
+        db_path: Path to the SQLite queue database.
+    """
+    with _DATABASES_LOCK:
+        database = _DATABASES.get(_database_key(db_path))
+    if database is not None:
+        database.close()
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import json
 import os
 import pathlib
 import shutil
@@ -33,6 +34,7 @@ from omni.flux.utils.common import Event, EventSubscription
 
 from . import persistence
 from .constants import QUEUE_SCHEMA_VERSION
+from .database import get_queue_database
 from .enums import (
     ApplyDisposition,
     ApplyOperation,
@@ -45,6 +47,7 @@ from .models import (
     QueueDataConnectionSnapshot,
     QueueGraphSnapshot,
     QueueJob,
+    QueueJobChanges,
     QueueJobDetailsSnapshot,
     QueueJobSnapshot,
     QueueLiteralInputSnapshot,
@@ -53,6 +56,10 @@ from .serializer import deserialize, serialize
 
 __all__ = ("QueueInterface",)
 
+# Every committed job write stamps its rows with the next queue revision so readers can fetch only what changed. The
+# revision is read from a one-row counter that triggers advance in the same transaction, so deletions never move it back.
+_NEXT_REVISION = "(SELECT revision + 1 FROM queue_revision)"
+
 
 def _isolated_subscription(event: Event, callback: Callable[..., Any], channel: str) -> EventSubscription:
     """Subscribe one callback behind a failure-isolating notification boundary.
@@ -97,23 +104,25 @@ class QueueInterface:
         self._schedule_conditions_lock = threading.Lock()
         self._schedule_conditions_revision = 0
         self._accepting_submissions = True
+        self._database = get_queue_database(db_path)
         self._initialize()
 
     @contextlib.contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
-        """Open one configured SQLite connection.
+        """Borrow one configured SQLite connection from the pool shared by every queue on this database.
 
         Yields:
             Connection with dictionary rows and foreign keys enabled.
         """
-        connection = sqlite3.connect(self.db_path, timeout=30.0)
-        try:
-            connection.row_factory = sqlite3.Row
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA journal_mode = WAL")
+        with self._database.connections.connection() as connection:
             yield connection
-        finally:
-            connection.close()
+
+    def close(self) -> None:
+        """Close the pooled connections so the database file can be moved or deleted.
+
+        The queue stays usable and reopens connections on its next operation.
+        """
+        self._database.close()
 
     def _initialize(self) -> None:
         """Create the fresh queue schema, replacing an incompatible database file."""
@@ -132,6 +141,7 @@ class QueueInterface:
                 f"Queue database schema {version} is incompatible with schema {QUEUE_SCHEMA_VERSION}: {self.db_path}"
             )
         if incompatible:
+            self.close()
             database_path = pathlib.Path(self.db_path)
             for path in (database_path, pathlib.Path(f"{database_path}-wal"), pathlib.Path(f"{database_path}-shm")):
                 path.unlink(missing_ok=True)
@@ -171,6 +181,7 @@ class QueueInterface:
                     apply_error_type TEXT,
                     apply_error_message TEXT,
                     apply_error_traceback TEXT,
+                    revision INTEGER NOT NULL DEFAULT 0,
                     UNIQUE(graph_id, position),
                     FOREIGN KEY(graph_id) REFERENCES job_graphs(graph_id) ON DELETE CASCADE
                 );
@@ -198,12 +209,43 @@ class QueueInterface:
                     FOREIGN KEY(prerequisite_job_id) REFERENCES jobs(job_id)
                 );
                 CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs(state, graph_id, position);
+                CREATE INDEX IF NOT EXISTS idx_jobs_state_type ON jobs(state, job_type);
+                CREATE TABLE IF NOT EXISTS queue_revision (
+                    id INTEGER PRIMARY KEY CHECK(id = 0),
+                    revision INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO queue_revision(id, revision) VALUES (0, 0);
+                CREATE TABLE IF NOT EXISTS deleted_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    revision INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_revision ON jobs(revision);
+                CREATE INDEX IF NOT EXISTS idx_deleted_jobs_revision ON deleted_jobs(revision);
+                CREATE INDEX IF NOT EXISTS idx_job_connections_source ON job_connections(source_job_id);
+                CREATE INDEX IF NOT EXISTS idx_job_control_edges_prerequisite ON job_control_edges(prerequisite_job_id);
                 CREATE TRIGGER IF NOT EXISTS prevent_direct_job_delete
                 BEFORE DELETE ON jobs
                 WHEN EXISTS(SELECT 1 FROM job_graphs WHERE graph_id = OLD.graph_id)
                 BEGIN
                     SELECT RAISE(ABORT, 'child jobs must be deleted through their graph');
                 END;
+                CREATE TRIGGER IF NOT EXISTS advance_revision_on_job_insert
+                AFTER INSERT ON jobs
+                BEGIN
+                    UPDATE queue_revision SET revision = NEW.revision WHERE revision < NEW.revision;
+                    DELETE FROM deleted_jobs WHERE job_id = NEW.job_id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS advance_revision_on_job_update
+                AFTER UPDATE OF revision ON jobs
+                BEGIN
+                    UPDATE queue_revision SET revision = NEW.revision WHERE revision < NEW.revision;
+                END;
+                CREATE TRIGGER IF NOT EXISTS record_deleted_job
+                AFTER DELETE ON jobs
+                BEGIN
+                    UPDATE queue_revision SET revision = revision + 1;
+                    INSERT OR REPLACE INTO deleted_jobs(job_id, revision) SELECT OLD.job_id, revision FROM queue_revision;
+                END;
                 """
             )
             connection.execute(f"PRAGMA user_version = {QUEUE_SCHEMA_VERSION}")
@@ -366,12 +408,12 @@ class QueueInterface:
                 else ApplyDisposition.NOT_READY
             )
             connection.execute(
-                """
+                f"""
                 INSERT INTO jobs(
                     job_id, graph_id, name, job_type, job_data, position, state, state_reason, completed_at,
-                    apply_disposition, apply_operation, apply_handler_id
+                    apply_disposition, apply_operation, apply_handler_id, revision
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?,
-                    CASE WHEN ? = 'SKIPPED' THEN CURRENT_TIMESTAMP END, ?, ?, ?)
+                    CASE WHEN ? = 'SKIPPED' THEN CURRENT_TIMESTAMP END, ?, ?, ?, {_NEXT_REVISION})
                 """,
                 (
                     str(job.job_id),
@@ -472,7 +514,10 @@ class QueueInterface:
         payload = serialize(updated_job)
         with self.connection() as connection:
             cursor = connection.execute(
-                "UPDATE jobs SET name = ?, job_data = ? WHERE job_id = ? AND state = ? AND job_type = ?",
+                f"""
+                UPDATE jobs SET revision = {_NEXT_REVISION}, name = ?, job_data = ?
+                WHERE job_id = ? AND state = ? AND job_type = ?
+                """,
                 (updated_job.name, payload, str(updated_job.job_id), JobState.QUEUED.value, job_type),
             )
             connection.commit()
@@ -721,6 +766,59 @@ class QueueInterface:
             for row in rows
         ]
 
+    def get_revision(self) -> int:
+        """Return the revision of the latest committed job write or deletion.
+
+        Returns:
+            Revision to pass to ``get_job_changes`` after loading the full queue.
+        """
+        with self.connection() as connection:
+            return connection.execute("SELECT revision FROM queue_revision").fetchone()[0]
+
+    def get_job_changes(self, since_revision: int) -> QueueJobChanges:
+        """Return the child snapshots written and the jobs deleted after one revision.
+
+        The direct successors of changed jobs are included since their derived dependency state may have changed with
+        them. A revision ahead of the queue, from a database that was replaced, returns every job.
+
+        Args:
+            since_revision: Revision returned by ``get_revision`` or by the previous call.
+
+        Returns:
+            Current revision, the ordered snapshots of the changed jobs, and the deleted job identifiers.
+        """
+        with self.connection() as connection:
+            connection.execute("BEGIN")
+            revision = connection.execute("SELECT revision FROM queue_revision").fetchone()[0]
+            if revision < since_revision:
+                since_revision = 0
+            if revision == since_revision:
+                return QueueJobChanges(revision=revision, jobs=())
+            deleted_job_ids = tuple(
+                uuid.UUID(row[0])
+                for row in connection.execute(
+                    "SELECT job_id FROM deleted_jobs WHERE revision > ? ORDER BY revision", (since_revision,)
+                )
+            )
+            jobs = tuple(
+                self._iter_snapshots(
+                    """
+                    WHERE jobs.job_id IN (
+                        SELECT job_id FROM jobs WHERE revision > ?
+                        UNION
+                        SELECT target_job_id FROM job_connections
+                        WHERE source_job_id IN (SELECT job_id FROM jobs WHERE revision > ?)
+                        UNION
+                        SELECT target_job_id FROM job_control_edges
+                        WHERE prerequisite_job_id IN (SELECT job_id FROM jobs WHERE revision > ?)
+                    )
+                    """,
+                    (since_revision, since_revision, since_revision),
+                    connection,
+                )
+            )
+        return QueueJobChanges(revision=revision, jobs=jobs, deleted_job_ids=deleted_job_ids)
+
     def _transition_job(
         self,
         job_id: uuid.UUID,
@@ -753,7 +851,7 @@ class QueueInterface:
             cursor = connection.execute(
                 f"""
                 UPDATE jobs
-                SET state = ?, state_reason = ?
+                SET revision = {_NEXT_REVISION}, state = ?, state_reason = ?
                 WHERE job_id = ? AND state IN ({placeholders})
                 """,
                 (new_state.value, reason, str(job_id), *(state.value for state in expected)),
@@ -775,8 +873,9 @@ class QueueInterface:
         """
         with self.connection() as connection:
             cursor = connection.execute(
-                """
-                UPDATE jobs SET state = ?, state_reason = NULL, started_at = CURRENT_TIMESTAMP
+                f"""
+                UPDATE jobs
+                SET revision = {_NEXT_REVISION}, state = ?, state_reason = NULL, started_at = CURRENT_TIMESTAMP
                 WHERE job_id = ? AND state = ?
                 """,
                 (JobState.IN_PROGRESS.value, str(job_id), JobState.SCHEDULED.value),
@@ -804,8 +903,9 @@ class QueueInterface:
             raise TypeError("progress must be a JobProgress")
         with self.connection() as connection:
             cursor = connection.execute(
-                """
-                UPDATE jobs SET progress_completed = ?, progress_total = ?, progress_detail = ?
+                f"""
+                UPDATE jobs
+                SET revision = {_NEXT_REVISION}, progress_completed = ?, progress_total = ?, progress_detail = ?
                 WHERE job_id = ? AND state IN (?, ?)
                 """,
                 (
@@ -846,9 +946,9 @@ class QueueInterface:
         with self.connection() as connection:
             connection.execute("BEGIN IMMEDIATE")
             cursor = connection.execute(
-                """
+                f"""
                 UPDATE jobs
-                SET state = ?, state_reason = NULL, outputs = ?,
+                SET revision = {_NEXT_REVISION}, state = ?, state_reason = NULL, outputs = ?,
                     progress_completed = progress_total, completed_at = CURRENT_TIMESTAMP
                 WHERE job_id = ? AND state = ?
                 """,
@@ -856,7 +956,10 @@ class QueueInterface:
             )
             if cursor.rowcount:
                 connection.execute(
-                    "UPDATE jobs SET apply_disposition = ?, apply_operation = ? WHERE job_id = ?",
+                    f"""
+                    UPDATE jobs SET revision = {_NEXT_REVISION}, apply_disposition = ?, apply_operation = ?
+                    WHERE job_id = ?
+                    """,
                     (disposition.value, ApplyOperation.IDLE.value, str(job_id)),
                 )
             connection.commit()
@@ -887,8 +990,8 @@ class QueueInterface:
         with self.connection() as connection:
             connection.execute("BEGIN IMMEDIATE")
             cursor = connection.execute(
-                """
-                UPDATE jobs SET state = ?, state_reason = ?,
+                f"""
+                UPDATE jobs SET revision = {_NEXT_REVISION}, state = ?, state_reason = ?,
                     error_type = ?, error_message = ?, error_traceback = ?,
                     apply_disposition = ?, apply_operation = ?, completed_at = CURRENT_TIMESTAMP
                 WHERE job_id = ? AND state IN (?, ?)
@@ -933,8 +1036,9 @@ class QueueInterface:
         with self.connection() as connection:
             connection.execute("BEGIN IMMEDIATE")
             cursor = connection.execute(
-                """
-                UPDATE jobs SET state = ?, state_reason = ?, apply_disposition = ?, apply_operation = ?,
+                f"""
+                UPDATE jobs
+                SET revision = {_NEXT_REVISION}, state = ?, state_reason = ?, apply_disposition = ?, apply_operation = ?,
                     completed_at = CURRENT_TIMESTAMP
                 WHERE job_id = ? AND state = ?
                 """,
@@ -965,36 +1069,30 @@ class QueueInterface:
         with self._schedule_conditions_lock:
             readiness_revision = self._schedule_conditions_revision
         with self.connection() as connection:
+            # Only re-examine the queued jobs whose predecessors are all done instead of scanning every queued job.
+            # The cross join keeps the candidates as the outer loop rather than the queued-state index.
+            candidates = json.dumps(sorted(self._database.readiness.get_ready_jobs(connection)))
             rows = connection.execute(
                 """
                 SELECT jobs.job_id, jobs.job_type, jobs.job_data
-                FROM jobs JOIN job_graphs ON job_graphs.graph_id = jobs.graph_id
+                FROM json_each(?) AS candidates
+                CROSS JOIN jobs ON jobs.job_id = candidates.value
+                JOIN job_graphs ON job_graphs.graph_id = jobs.graph_id
                 WHERE jobs.state = ?
-                    AND NOT EXISTS (
-                        SELECT 1 FROM (
-                            SELECT source_job_id AS predecessor
-                            FROM job_connections WHERE target_job_id = jobs.job_id
-                            UNION
-                            SELECT prerequisite_job_id
-                            FROM job_control_edges WHERE target_job_id = jobs.job_id
-                        ) edges
-                        JOIN jobs AS predecessor_jobs ON predecessor_jobs.job_id = edges.predecessor
-                        WHERE predecessor_jobs.state != ?
-                    )
                 ORDER BY job_graphs.position, jobs.position
                 """,
-                (JobState.QUEUED.value, JobState.DONE.value),
+                (candidates, JobState.QUEUED.value),
             ).fetchall()
             source_type_rows = connection.execute(
                 """
                 SELECT DISTINCT edges.target_job_id, sources.job_type
                 FROM job_connections AS edges
                 JOIN jobs AS sources ON sources.job_id = edges.source_job_id
-                JOIN jobs AS targets ON targets.job_id = edges.target_job_id
-                WHERE targets.state = ?
+                WHERE edges.target_job_id IN (SELECT value FROM json_each(?))
                 """,
-                (JobState.QUEUED.value,),
+                (candidates,),
             ).fetchall()
+        self._database.jobs.retain(row["job_data"] for row in rows)
         source_types_by_target: dict[str, set[str]] = {}
         for source_row in source_type_rows:
             source_types_by_target.setdefault(source_row["target_job_id"], set()).add(source_row["job_type"])
@@ -1009,9 +1107,7 @@ class QueueInterface:
             ):
                 continue
             try:
-                job = deserialize(row["job_data"])
-                if type(job) is not registered_type:
-                    raise TypeError(f"Persisted job type {row['job_type']} does not match its payload")
+                job = self._database.jobs.get(row["job_data"], registered_type)
             except Exception as error:  # noqa: BLE001 - registered codecs are an extension boundary.
                 failed_job_ids.extend(
                     self._fail_queued_job(
@@ -1053,17 +1149,22 @@ class QueueInterface:
                         for row in connection.execute(
                             """
                             SELECT job_type, COUNT(*) AS count FROM jobs
-                            WHERE state IN (?, ?) GROUP BY job_type
+                            WHERE state IN (?, ?) AND job_type IN (SELECT value FROM json_each(?))
+                            GROUP BY job_type
                             """,
-                            (JobState.SCHEDULED.value, JobState.IN_PROGRESS.value),
+                            (
+                                JobState.SCHEDULED.value,
+                                JobState.IN_PROGRESS.value,
+                                json.dumps(sorted({job_type for _, job_type, _, _ in ready})),
+                            ),
                         )
                     }
                     for job_id, job_type, job_data, max_concurrency in ready:
                         if active_counts.get(job_type, 0) >= max_concurrency:
                             continue
                         cursor = connection.execute(
-                            """
-                            UPDATE jobs SET state = ?
+                            f"""
+                            UPDATE jobs SET revision = {_NEXT_REVISION}, state = ?
                             WHERE job_id = ? AND state = ? AND job_type = ? AND job_data = ?
                                 AND NOT EXISTS (
                                     SELECT 1 FROM (
@@ -1124,8 +1225,8 @@ class QueueInterface:
         with self.connection() as connection:
             connection.execute("BEGIN IMMEDIATE")
             cursor = connection.execute(
-                """
-                UPDATE jobs SET state = ?, state_reason = ?,
+                f"""
+                UPDATE jobs SET revision = {_NEXT_REVISION}, state = ?, state_reason = ?,
                     error_type = ?, error_message = ?, error_traceback = ?, completed_at = CURRENT_TIMESTAMP,
                     apply_disposition = ?, apply_operation = ?
                 WHERE job_id = ? AND state = ? AND job_data = ?
@@ -1258,11 +1359,17 @@ class QueueInterface:
                 for graph_id in selected_graph_ids:
                     child_query = "SELECT job_id FROM jobs WHERE graph_id = ?"
                     connection.execute(
-                        f"DELETE FROM job_connections WHERE source_job_id IN ({child_query}) OR target_job_id IN ({child_query})",
+                        f"""
+                        DELETE FROM job_connections
+                        WHERE source_job_id IN ({child_query}) OR target_job_id IN ({child_query})
+                        """,
                         (str(graph_id), str(graph_id)),
                     )
                     connection.execute(
-                        f"DELETE FROM job_control_edges WHERE target_job_id IN ({child_query}) OR prerequisite_job_id IN ({child_query})",
+                        f"""
+                        DELETE FROM job_control_edges
+                        WHERE target_job_id IN ({child_query}) OR prerequisite_job_id IN ({child_query})
+                        """,
                         (str(graph_id), str(graph_id)),
                     )
                     connection.execute(
@@ -1538,7 +1645,7 @@ class QueueInterface:
         with self.connection() as connection:
             cursor = connection.execute(
                 f"""
-                UPDATE jobs SET apply_operation = ?, apply_error_type = NULL,
+                UPDATE jobs SET revision = {_NEXT_REVISION}, apply_operation = ?, apply_error_type = NULL,
                     apply_error_message = NULL, apply_error_traceback = NULL, apply_reason = NULL
                 WHERE job_id = ? AND apply_disposition IN ({disposition_slots})
                     AND apply_operation IN ({operation_slots})
@@ -1604,9 +1711,9 @@ class QueueInterface:
         """
         with self.connection() as connection:
             cursor = connection.execute(
-                """
+                f"""
                 UPDATE jobs
-                SET apply_disposition = ?, apply_operation = ?,
+                SET revision = {_NEXT_REVISION}, apply_disposition = ?, apply_operation = ?,
                     apply_receipt = CASE WHEN ? THEN NULL ELSE apply_receipt END,
                     apply_reason = NULL,
                     apply_error_type = NULL,
@@ -1656,9 +1763,10 @@ class QueueInterface:
             raise ValueError("reason must be a non-empty string")
         with self.connection() as connection:
             cursor = connection.execute(
-                """
-                UPDATE jobs SET apply_disposition = ?, apply_operation = ?, apply_reason = ?, apply_error_type = ?,
-                    apply_error_message = ?, apply_error_traceback = ?
+                f"""
+                UPDATE jobs
+                SET revision = {_NEXT_REVISION}, apply_disposition = ?, apply_operation = ?, apply_reason = ?,
+                    apply_error_type = ?, apply_error_message = ?, apply_error_traceback = ?
                 WHERE job_id = ? AND apply_operation = ?
                 """,
                 (
@@ -1692,7 +1800,7 @@ class QueueInterface:
         with self.connection() as connection:
             cursor = connection.execute(
                 f"""
-                UPDATE jobs SET apply_disposition = ?, apply_operation = ?,
+                UPDATE jobs SET revision = {_NEXT_REVISION}, apply_disposition = ?, apply_operation = ?,
                     apply_reason = NULL, apply_error_type = NULL,
                     apply_error_message = NULL, apply_error_traceback = NULL
                 WHERE job_id = ? AND apply_disposition = ? AND apply_operation IN ({slots})
@@ -1717,7 +1825,7 @@ class QueueInterface:
         with self.connection() as connection:
             connection.execute("BEGIN IMMEDIATE")
             connection.execute(
-                "UPDATE jobs SET state = ? WHERE state = ?",
+                f"UPDATE jobs SET revision = {_NEXT_REVISION}, state = ? WHERE state = ?",
                 (JobState.QUEUED.value, JobState.SCHEDULED.value),
             )
             interrupted = [
@@ -1726,8 +1834,8 @@ class QueueInterface:
             ]
             for job_id in interrupted:
                 connection.execute(
-                    """
-                    UPDATE jobs SET state = ?, state_reason = ?,
+                    f"""
+                    UPDATE jobs SET revision = {_NEXT_REVISION}, state = ?, state_reason = ?,
                         error_type = ?, error_message = ?, error_traceback = ?, completed_at = CURRENT_TIMESTAMP,
                         apply_disposition = ?, apply_operation = ?, apply_reason = NULL,
                         apply_error_type = NULL, apply_error_message = NULL, apply_error_traceback = NULL
@@ -1767,8 +1875,8 @@ class QueueInterface:
             )
             for active_operation, failed_operation, failure_disposition, reason in interrupted_apply_operations:
                 connection.execute(
-                    """
-                    UPDATE jobs SET apply_disposition = COALESCE(?, apply_disposition),
+                    f"""
+                    UPDATE jobs SET revision = {_NEXT_REVISION}, apply_disposition = COALESCE(?, apply_disposition),
                         apply_operation = ?, apply_reason = ?,
                         apply_error_type = ?, apply_error_message = ?, apply_error_traceback = ?
                     WHERE apply_operation = ?
@@ -1885,17 +1993,6 @@ class QueueInterface:
             return
         rows = connection.execute(
             f"""
-                WITH dependency_states AS (
-                    SELECT edges.target_job_id,
-                        MIN(CASE WHEN predecessor.state = ? THEN 1 ELSE 0 END) AS dependencies_done
-                    FROM (
-                        SELECT target_job_id, source_job_id AS predecessor_job_id FROM job_connections
-                        UNION
-                        SELECT target_job_id, prerequisite_job_id FROM job_control_edges
-                    ) edges
-                    LEFT JOIN jobs predecessor ON predecessor.job_id = edges.predecessor_job_id
-                    GROUP BY edges.target_job_id
-                )
                 SELECT job_graphs.graph_id, job_graphs.name AS graph_name,
                     job_graphs.position AS graph_position,
                     jobs.job_id, jobs.name, jobs.job_type, jobs.position, job_graphs.submitted_at,
@@ -1905,14 +2002,24 @@ class QueueInterface:
                     jobs.apply_disposition, jobs.apply_operation, jobs.apply_handler_id,
                     jobs.apply_reason,
                     jobs.apply_error_type, jobs.apply_error_message, jobs.apply_error_traceback,
-                    COALESCE(dependency_states.dependencies_done, 1) AS dependencies_done
+                    CASE WHEN jobs.state = ? AND (
+                        EXISTS (
+                            SELECT 1 FROM job_connections
+                            LEFT JOIN jobs predecessor ON predecessor.job_id = job_connections.source_job_id
+                            WHERE job_connections.target_job_id = jobs.job_id AND predecessor.state IS NOT ?
+                        )
+                        OR EXISTS (
+                            SELECT 1 FROM job_control_edges
+                            LEFT JOIN jobs predecessor ON predecessor.job_id = job_control_edges.prerequisite_job_id
+                            WHERE job_control_edges.target_job_id = jobs.job_id AND predecessor.state IS NOT ?
+                        )
+                    ) THEN 0 ELSE 1 END AS dependencies_done
                 FROM jobs
                 JOIN job_graphs ON job_graphs.graph_id = jobs.graph_id
-                LEFT JOIN dependency_states ON dependency_states.target_job_id = jobs.job_id
                 {where}
                 ORDER BY job_graphs.position, jobs.position
                 """,
-            (JobState.DONE.value, *parameters),
+            (JobState.QUEUED.value, JobState.DONE.value, JobState.DONE.value, *parameters),
         )
         for row in rows:
             state = JobState(row["state"])
@@ -1957,7 +2064,7 @@ class QueueInterface:
             Descendant identifiers changed by this call.
         """
         rows = connection.execute(
-            """
+            f"""
             WITH RECURSIVE edges(prerequisite_job_id, target_job_id) AS (
                 SELECT source_job_id, target_job_id FROM job_connections
                 UNION
@@ -1982,7 +2089,7 @@ class QueueInterface:
             ), reasons AS (
                 SELECT job_id, MIN(skip_reason) AS skip_reason FROM descendants GROUP BY job_id
             )
-            UPDATE jobs SET state = ?,
+            UPDATE jobs SET revision = {_NEXT_REVISION}, state = ?,
                 state_reason = (SELECT skip_reason FROM reasons WHERE reasons.job_id = jobs.job_id),
                 apply_disposition = ?, apply_operation = ?, completed_at = CURRENT_TIMESTAMP
             WHERE job_id IN (SELECT job_id FROM reasons) AND state = ?
@@ -2035,11 +2142,13 @@ class QueueInterface:
         Args:
             job_id: Changed child identifier.
         """
+        self._database.readiness.mark_changed((str(job_id),))
         self._job_changed_event(job_id)
         self._publish_schedule_conditions_changed()
 
     def _notify_mutation(self) -> None:
         """Emit one committed structural queue change."""
+        self._database.readiness.invalidate()
         self._mutation_event()
         self._publish_schedule_conditions_changed()
 
@@ -37,6 +37,7 @@ __all__ = (
     "QueueDataConnectionSnapshot",
     "QueueGraphSnapshot",
     "QueueJob",
+    "QueueJobChanges",
     "QueueJobDetailsSnapshot",
     "QueueJobSnapshot",
     "QueueLiteralInputSnapshot",
@@ -79,6 +80,15 @@ class QueueGraphSnapshot:
     jobs: tuple[QueueJobSnapshot, ...]
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class QueueJobChanges:
+    """Represent the child snapshots changed and the child jobs deleted since one queue revision."""
+
+    revision: int
+    jobs: tuple[QueueJobSnapshot, ...]
+    deleted_job_ids: tuple[uuid.UUID, ...] = ()
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class QueueDataConnectionSnapshot:
     """Describe one typed graph data edge related to a selected job."""
@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from .e2e.test_claim_latency import TestClaimLatency
 from .e2e.test_typed_queue_workflow import TestTypedQueueWorkflow
 from .unit.test_apply_runtime import TestApplyRuntime
 from .unit.test_extension_runtime import TestExtensionRuntime
@@ -24,6 +25,7 @@ from .unit.test_typed_graph import TestTypedGraph
 
 __all__ = (
     "TestApplyRuntime",
+    "TestClaimLatency",
     "TestExtensionRuntime",
     "TestPersistenceRuntime",
     "TestQueuePersistence",
@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from .test_claim_latency import TestClaimLatency
 from .test_typed_queue_workflow import TestTypedQueueWorkflow
 
-__all__ = ("TestTypedQueueWorkflow",)
+__all__ = ("TestClaimLatency", "TestTypedQueueWorkflow")
@@ -0,0 +1,130 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import statistics
+import tempfile
+import time
+
+import carb
+import omni.kit.test
+import omni.flux.job_queue.core.persistence as persistence
+from omni.flux.job_queue.core.interface import QueueInterface
+from omni.flux.job_queue.core.job import Job, JobGraph, JobInputs, JobOutputs, JobProgressCallback
+from omni.flux.job_queue.core.persistence import PersistenceCodec
+
+__all__ = ("TestClaimLatency",)
+
+_WAITING_GRAPH_COUNTS = (100, 1000, 5000)
+_CLAIMED_STEPS = 20
+
+
+@dataclasses.dataclass
+class _LatencyJob(Job):
+    """Return no outputs while the benchmark drives transitions directly."""
+
+    async def execute(
+        self,
+        _job_directory: pathlib.Path,
+        _inputs: JobInputs,
+        _progress_callback: JobProgressCallback,
+    ) -> JobOutputs:
+        """Return no outputs."""
+        return JobOutputs({})
+
+
+@dataclasses.dataclass
+class _ChainJob(_LatencyJob):
+    """Represent one link of the sequential graph driven by the benchmark."""
+
+
+@dataclasses.dataclass
+class _WaitingJob(_LatencyJob):
+    """Represent unrelated work that stays claimed or waiting on its claimed predecessor."""
+
+    max_concurrency = 1_000_000
+
+
+_LATENCY_CODECS = (
+    PersistenceCodec(
+        "test.ClaimLatencyChainJob",
+        _ChainJob,
+        lambda value: (value.job_id, value.name, value.skip_reason, value.apply_binding),
+        lambda value: _ChainJob(*value),
+    ),
+    PersistenceCodec(
+        "test.ClaimLatencyWaitingJob",
+        _WaitingJob,
+        lambda value: (value.job_id, value.name, value.skip_reason, value.apply_binding),
+        lambda value: _WaitingJob(*value),
+    ),
+)
+
+
+class TestClaimLatency(omni.kit.test.AsyncTestCase):
+    """Measure scheduler claim latency while the number of waiting jobs grows."""
+
+    async def setUp(self):
+        """Register the benchmark job codecs."""
+        persistence.get_registry().register_codecs(_LATENCY_CODECS)
+
+    async def tearDown(self):
+        """Unregister the benchmark job codecs."""
+        persistence.get_registry().unregister_codecs(_LATENCY_CODECS)
+
+    async def test_claim_latency_follows_completed_work_instead_of_queue_size(self):
+        """Each claim after a completion releases exactly the next chain link regardless of the waiting jobs."""
+        latencies = {}
+        for graph_count in _WAITING_GRAPH_COUNTS:
+            with tempfile.TemporaryDirectory(prefix="omni-flux-job_queue-benchmark") as temp_dir:
+                # Arrange
+                interface = QueueInterface(str(pathlib.Path(temp_dir) / "db.sqlite"))
+                waiting_graphs = []
+                for index in range(graph_count):
+                    head = _WaitingJob(name=f"Head {index}")
+                    tail = _WaitingJob(name=f"Tail {index}")
+                    graph = JobGraph(name=f"Waiting {index}", jobs=[head, tail])
+                    graph.depends_on(tail, head)
+                    waiting_graphs.append(graph)
+                chain = [_ChainJob(name=f"Link {index}") for index in range(_CLAIMED_STEPS + 1)]
+                chain_graph = JobGraph(name="Chain", jobs=chain)
+                for previous, current in zip(chain, chain[1:]):
+                    chain_graph.depends_on(current, previous)
+                interface.submit_graphs([*waiting_graphs, chain_graph])
+                self.assertEqual(len(interface.claim_runnable_jobs()), graph_count + 1)
+
+                # Act
+                elapsed = []
+                for index in range(_CLAIMED_STEPS):
+                    self.assertTrue(interface.start_job(chain[index].job_id))
+                    self.assertTrue(interface.complete_job(chain[index].job_id, JobOutputs({})))
+                    start = time.perf_counter()
+                    claimed = interface.claim_runnable_jobs()
+                    elapsed.append(time.perf_counter() - start)
+
+                    # Assert
+                    self.assertEqual(claimed, [chain[index + 1].job_id])
+                latencies[graph_count * 2 + len(chain)] = statistics.median(elapsed)
+                interface.close()
+
+        carb.log_info(
+            "Median job queue claim latency: "
+            + ", ".join(f"{size} jobs {latency * 1000:.2f} ms" for size, latency in latencies.items())
+        )
@@ -223,6 +223,7 @@ class TestTypedQueueWorkflow(omni.kit.test.AsyncTestCase):
         if self._scheduler is not None:
             await self._scheduler.stop()
         persistence.get_registry().unregister_codecs(_PERSISTENCE_CODECS)
+        self._interface.close()
         self._temporary_directory.cleanup()
 
     @staticmethod
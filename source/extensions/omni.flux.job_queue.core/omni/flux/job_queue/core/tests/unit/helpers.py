@@ -19,6 +19,8 @@ import contextlib
 import os
 import tempfile
 
+from omni.flux.job_queue.core.database import close_queue_database
+
 
 @contextlib.asynccontextmanager
 async def temp_db_path():
@@ -29,4 +31,7 @@ async def temp_db_path():
     """
     with tempfile.TemporaryDirectory(prefix="omni-flux-job_queue") as temp_dir:
         temp_path = os.path.join(temp_dir, "db.sqlite")
-        yield temp_path
+        try:
+            yield temp_path
+        finally:
+            close_queue_database(temp_path)
@@ -27,6 +27,7 @@ from unittest import mock
 
 import omni.kit.test
 import omni.flux.job_queue.core.persistence as persistence
+import omni.flux.job_queue.core.database as queue_database
 import omni.flux.job_queue.core.interface as queue_interface
 from omni.flux.job_queue.core.constants import QUEUE_SCHEMA_VERSION
 from omni.flux.job_queue.core.enums import ApplyDisposition, ApplyOperation, JobState
@@ -330,6 +331,12 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
         if job_id not in interface.claim_runnable_jobs() or not interface.start_job(job_id):
             raise RuntimeError(f"Could not start test job {job_id}")
 
+    @staticmethod
+    def _borrow_connection(interface: QueueInterface) -> sqlite3.Connection:
+        """Borrow and return one pooled connection from the calling thread."""
+        with interface.connection() as connection:
+            return connection
+
     @staticmethod
     async def _complete_from_worker_after_subscription(
         queue_job: QueueJob,
@@ -375,11 +382,13 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
             self.assertEqual(
                 tables,
                 {
+                    "deleted_jobs",
                     "job_connections",
                     "job_control_edges",
                     "job_graphs",
                     "job_input_values",
                     "jobs",
+                    "queue_revision",
                 },
             )
             self.assertEqual(
@@ -407,6 +416,7 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
                     "progress_completed",
                     "progress_detail",
                     "progress_total",
+                    "revision",
                     "started_at",
                     "state",
                     "state_reason",
@@ -602,7 +612,7 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
 
             # Assert
             select_statements = [
-                statement for statement in interface.statements if statement.lstrip().upper().startswith("WITH")
+                statement for statement in interface.statements if statement.lstrip().upper().startswith("SELECT")
             ]
             self.assertEqual(len(select_statements), 1)
             self.assertEqual(
@@ -610,6 +620,66 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
                 [JobState.QUEUED, JobState.WAITING_FOR_DEPENDENCIES],
             )
 
+    async def test_job_changes_return_written_jobs_and_their_direct_successors(self):
+        """The change feed reports written rows and successors whose derived dependency state moved with them."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = QueueInterface(db_path)
+            source = _LaneA()
+            dependent = _LaneB()
+            graph = JobGraph(jobs=[source, dependent])
+            graph.depends_on(dependent, source)
+            unrelated = _LaneA()
+            interface.submit_graphs([graph, JobGraph(jobs=[unrelated])])
+            revision = interface.get_revision()
+            interface.claim_runnable_jobs()
+            interface.start_job(source.job_id)
+            started = interface.get_job_changes(revision)
+
+            # Act
+            interface.complete_job(source.job_id, JobOutputs({RESULT: 1}))
+            completed = interface.get_job_changes(started.revision)
+            unchanged = interface.get_job_changes(interface.get_revision())
+
+            # Assert
+            self.assertGreater(started.revision, revision)
+            self.assertEqual(
+                [(snapshot.job_id, snapshot.state) for snapshot in started.jobs],
+                [(source.job_id, JobState.IN_PROGRESS), (dependent.job_id, JobState.WAITING_FOR_DEPENDENCIES)],
+            )
+            self.assertEqual(
+                [(snapshot.job_id, snapshot.state) for snapshot in completed.jobs],
+                [(source.job_id, JobState.DONE), (dependent.job_id, JobState.QUEUED)],
+            )
+            self.assertEqual(completed.revision, interface.get_revision())
+            self.assertEqual(unchanged.jobs, ())
+
+    async def test_job_changes_report_deleted_jobs_without_moving_the_revision_back(self):
+        """Deleting the job holding the latest revision advances the revision and reports a tombstone."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = QueueInterface(db_path)
+            kept = _LaneA()
+            deleted = _LaneA()
+            interface.submit(kept)
+            interface.submit(deleted)
+            revision = interface.get_revision()
+
+            # Act
+            interface.delete_graphs([interface.get_job_snapshot(deleted.job_id).graph_id])
+            changes = interface.get_job_changes(revision)
+            deletion_revision = interface.get_revision()
+            resubmitted = interface.submit(deleted)
+            after_resubmission = interface.get_job_changes(changes.revision)
+
+            # Assert
+            self.assertGreater(changes.revision, revision)
+            self.assertEqual(changes.revision, deletion_revision)
+            self.assertEqual(changes.jobs, ())
+            self.assertEqual(changes.deleted_job_ids, (deleted.job_id,))
+            self.assertEqual([snapshot.job_id for snapshot in after_resubmission.jobs], [resubmitted[0].job_id])
+            self.assertEqual(after_resubmission.deleted_job_ids, ())
+
     async def test_job_details_returns_typed_related_topology_without_payload_values(self):
         """Targeted details expose declared ports and related edges without reading serialized job values."""
         # Arrange
@@ -1724,6 +1794,101 @@ class TestQueuePersistence(omni.kit.test.AsyncTestCase):
             with self.assertRaisesRegex(KeyError, "Unknown job"):
                 await asyncio.wait_for(waiter, 2)
 
+    async def test_connection_reuses_one_pooled_connection_per_thread(self):
+        """Sequential borrows reuse a configured connection while nested and worker borrows stay isolated."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = QueueInterface(db_path)
+
+            # Act
+            with interface.connection() as first:
+                with interface.connection() as nested:
+                    pass
+            with interface.connection() as reused:
+                journal_mode = reused.execute("PRAGMA journal_mode").fetchone()[0]
+                foreign_keys = reused.execute("PRAGMA foreign_keys").fetchone()[0]
+            worker = await asyncio.to_thread(self._borrow_connection, interface)
+
+            # Assert
+            self.assertIs(reused, first)
+            self.assertIsNot(nested, first)
+            self.assertIsNot(worker, first)
+            self.assertEqual(journal_mode, "wal")
+            self.assertEqual(foreign_keys, 1)
+
+    async def test_close_releases_pooled_connections(self):
+        """Closing the queue closes idle pooled connections and later operations reopen the database."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = QueueInterface(db_path)
+            with interface.connection() as pooled:
+                pass
+
+            # Act
+            interface.close()
+            queue_job = interface.submit(_LaneA())[0]
+
+            # Assert
+            with self.assertRaises(sqlite3.ProgrammingError):
+                pooled.execute("SELECT 1")
+            self.assertEqual(interface.claim_runnable_jobs(), [queue_job.job_id])
+
+    async def test_claim_reexamines_only_changed_jobs(self):
+        """Repeated claims reuse cached readiness and a completed predecessor releases only its dependent."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = _TracingQueueInterface(db_path)
+            first = _LaneA(value=1)
+            second = _LaneB(value=2)
+            graph = JobGraph(name="Graph", jobs=[first, second])
+            graph.depends_on(second, first)
+            interface.submit(graph)
+            self._claim_and_start(interface, first.job_id)
+
+            # Act
+            interface.statements.clear()
+            idle_claim = interface.claim_runnable_jobs()
+            idle_statements = "\n".join(interface.statements).lower()
+            interface.complete_job(first.job_id, JobOutputs({RESULT: 1}))
+            released_claim = interface.claim_runnable_jobs()
+
+            # Assert
+            self.assertEqual(idle_claim, [])
+            self.assertNotIn("job_control_edges", idle_statements)
+            self.assertEqual(released_claim, [second.job_id])
+
+    async def test_claim_sees_jobs_submitted_through_another_interface(self):
+        """Queues opened on the same database share readiness so submissions from either one are claimable."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            scheduler_interface = QueueInterface(db_path)
+            self.assertEqual(scheduler_interface.claim_runnable_jobs(), [])
+            submitting_interface = QueueInterface(db_path)
+
+            # Act
+            queue_job = submitting_interface.submit(_LaneA())[0]
+
+            # Assert
+            self.assertEqual(scheduler_interface.claim_runnable_jobs(), [queue_job.job_id])
+
+    async def test_claim_reuses_deserialized_waiting_jobs(self):
+        """Queued jobs waiting on their type concurrency are deserialized once across scheduler passes."""
+        # Arrange
+        async with temp_db_path() as db_path:
+            interface = QueueInterface(db_path)
+            interface.submit(_LaneA())
+            interface.submit(_LaneA())
+
+            # Act
+            with mock.patch.object(queue_database, "deserialize", wraps=queue_database.deserialize) as deserialize_mock:
+                interface.claim_runnable_jobs()
+                interface.notify_schedule_conditions_changed()
+                second_claim = interface.claim_runnable_jobs()
+
+            # Assert
+            self.assertEqual(second_claim, [])
+            self.assertEqual(deserialize_mock.call_count, 2)
+
 
 class TestScheduler(omni.kit.test.AsyncTestCase):
     """Validate event-driven exact concrete job-type scheduling."""
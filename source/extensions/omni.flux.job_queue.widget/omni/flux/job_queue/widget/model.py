@@ -26,6 +26,7 @@ from omni.flux.job_queue.core.apply_executor import ApplyExecutor
 from omni.flux.job_queue.core.enums import ApplyDisposition, ApplyOperation, JobState
 from omni.flux.job_queue.core.interface import QueueInterface
 from omni.flux.job_queue.core.job import Job, JobProgress
+from omni.flux.job_queue.core.models import QueueJobSnapshot
 from omni.flux.utils.common import Event, EventSubscription
 from omni.flux.utils.widget.tree_widget.model import TreeModelBase
 from omni.kit.notification_manager import NotificationStatus, post_notification
@@ -90,6 +91,7 @@ class QueueModel(TreeModelBase):
         self._progress_changed_event = Event()
         self._schedule_condition_keys: dict[uuid.UUID, tuple[object, ...]] = {}
         self._handler_availability: dict[uuid.UUID, bool] = {}
+        self._revision = 0
 
     @property
     def default_attr(self) -> dict[str, None]:
@@ -215,7 +217,10 @@ class QueueModel(TreeModelBase):
         """
         previous_selection = list(self._selected_items)
         self._handler_availability.clear()
+        # Read the revision first so writes racing the full read are delivered again by the next change sync
+        revision = self.interface.get_revision()
         snapshots = self.interface.get_graph_snapshots()
+        self._revision = revision
         remaining_graphs = dict(self._graphs_by_id)
         remaining_items = dict(self._items_by_id)
         next_graphs: list[QueueGraphItem] = []
@@ -284,6 +289,36 @@ class QueueModel(TreeModelBase):
         except SNAPSHOT_READ_ERRORS:
             self.refresh()
             return
+        self._apply_snapshot(child, snapshot, force_notify)
+
+    def update_changed_items(self) -> None:
+        """Refresh every child written since the last synchronization from one targeted queue read.
+
+        A changed job missing from the model or a deleted job still in it falls back to one full hierarchy read.
+        """
+        try:
+            changes = self.interface.get_job_changes(self._revision)
+        except SNAPSHOT_READ_ERRORS:
+            self.refresh()
+            return
+        if any(snapshot.job_id not in self._items_by_id for snapshot in changes.jobs) or any(
+            job_id in self._items_by_id for job_id in changes.deleted_job_ids
+        ):
+            self.refresh()
+            return
+        self._revision = changes.revision
+        for snapshot in changes.jobs:
+            self._apply_snapshot(self._items_by_id[snapshot.job_id], snapshot)
+
+    def _apply_snapshot(self, child: QueueItem, snapshot: QueueJobSnapshot, force_notify: bool = False) -> None:
+        """Update one child from a fresh snapshot and invalidate only the affected cells.
+
+        Args:
+            child: Existing child representing the snapshot job.
+            snapshot: Current committed job snapshot.
+            force_notify: Whether to invalidate even when snapshot values are unchanged.
+        """
+        job_id = snapshot.job_id
         self._handler_availability.pop(job_id, None)
         changed = child.row.update_from(Row.from_snapshot(snapshot, self.interface))
         parent = child.parent
@@ -497,6 +497,7 @@ class TestQueueWidget(AsyncTestCase):
         get_display_adapter_registry().unregister(_WidgetDisplayAdapter)
         destroy_all_notifications()
         persistence.get_registry().unregister_codecs(_PERSISTENCE_CODECS)
+        self._interface.close()
         self._temporary_directory.cleanup()
         await ui_test.human_delay()
 
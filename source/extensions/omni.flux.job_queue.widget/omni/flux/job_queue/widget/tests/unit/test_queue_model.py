@@ -26,7 +26,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from omni.flux.job_queue.core.enums import ApplyDisposition, ApplyOperation, JobState
 from omni.flux.job_queue.core.errors import JobError
-from omni.flux.job_queue.core.models import QueueGraphSnapshot, QueueJobSnapshot
+from omni.flux.job_queue.core.models import QueueGraphSnapshot, QueueJobChanges, QueueJobSnapshot
 from omni.flux.job_queue.core.job import Job, JobInputs, JobOutputs, JobProgress, JobProgressCallback
 from omni.flux.job_queue.widget.constants import APPLY_FILTER_OPTIONS
 from omni.flux.job_queue.widget.enums import DisplayState
@@ -170,6 +170,7 @@ def _model(
         Refreshed queue model with mocked runtime dependencies.
     """
     interface = MagicMock()
+    interface.get_revision.return_value = 0
     interface.get_graph_snapshots.return_value = graphs
     snapshots = {snapshot.job_id: snapshot for graph in graphs for snapshot in graph.jobs}
     interface.get_job_snapshot.side_effect = snapshots.get
@@ -987,6 +988,73 @@ class TestQueueModel(AsyncTestCase):
         self.assertEqual(model.get_item_children(None), [child.parent])
         self.assertEqual(item_changed.call_args_list, [call(None)])
 
+    async def test_update_changed_items_applies_one_change_read_and_advances_revision(self):
+        """One coalesced event burst reads only the rows written since the previous synchronization."""
+        # Arrange
+        graph_id = uuid.uuid4()
+        first = _snapshot(graph_id=graph_id, state=JobState.IN_PROGRESS)
+        second = _snapshot(graph_id=graph_id, state=JobState.QUEUED, position=1)
+        model = _model([_graph(first, second)])
+        root = model.get_item_children(None)[0]
+        first_child, second_child = model.get_item_children(root)
+        model.interface.get_job_changes.return_value = QueueJobChanges(
+            revision=4, jobs=(dataclasses.replace(first, state=JobState.DONE),)
+        )
+
+        # Act
+        with patch(_REGISTRY_FUNCTION) as get_registry, patch.object(model, "_item_changed") as item_changed:
+            get_registry.return_value.get_adapter.return_value = None
+            model.update_changed_items()
+            model.update_changed_items()
+
+        # Assert
+        self.assertEqual(model.interface.get_job_changes.call_args_list, [call(0), call(4)])
+        model.interface.get_job_snapshot.assert_not_called()
+        self.assertEqual(first_child.row.state, JobState.DONE)
+        self.assertEqual(second_child.row.state, JobState.QUEUED)
+        self.assertEqual(item_changed.call_args_list, [call(first_child), call(root)])
+
+    async def test_update_changed_items_refreshes_when_a_change_is_not_represented(self):
+        """A changed job unknown to the model falls back to one full hierarchy read."""
+        # Arrange
+        snapshot = _snapshot(graph_id=uuid.uuid4(), state=JobState.QUEUED)
+        model = _model([_graph(snapshot)])
+        added = _snapshot(graph_id=snapshot.graph_id, state=JobState.QUEUED, position=1)
+        model.interface.get_graph_snapshots.return_value = [_graph(snapshot, added)]
+        model.interface.get_revision.return_value = 2
+        model.interface.get_job_changes.return_value = QueueJobChanges(revision=2, jobs=(added,))
+
+        # Act
+        with patch(_REGISTRY_FUNCTION) as get_registry:
+            get_registry.return_value.get_adapter.return_value = None
+            model.update_changed_items()
+
+        # Assert
+        self.assertEqual([item.row.job_id for item in model.all_items], [snapshot.job_id, added.job_id])
+        self.assertEqual(model.interface.get_graph_snapshots.call_count, 2)
+
+    async def test_update_changed_items_refreshes_when_a_represented_job_is_deleted(self):
+        """A deleted job still shown by the model falls back to one full hierarchy read."""
+        # Arrange
+        graph_id = uuid.uuid4()
+        kept = _snapshot(graph_id=graph_id, state=JobState.QUEUED)
+        deleted = _snapshot(graph_id=uuid.uuid4(), state=JobState.QUEUED)
+        model = _model([_graph(kept), _graph(deleted)])
+        model.interface.get_graph_snapshots.return_value = [_graph(kept)]
+        model.interface.get_revision.return_value = 3
+        model.interface.get_job_changes.return_value = QueueJobChanges(
+            revision=3, jobs=(), deleted_job_ids=(deleted.job_id,)
+        )
+
+        # Act
+        with patch(_REGISTRY_FUNCTION) as get_registry:
+            get_registry.return_value.get_adapter.return_value = None
+            model.update_changed_items()
+
+        # Assert
+        self.assertEqual([item.row.job_id for item in model.all_items], [kept.job_id])
+        self.assertEqual(model.interface.get_graph_snapshots.call_count, 2)
+
     async def test_progress_only_update_notifies_existing_item_without_tree_invalidation(self):
         """Structured progress updates the retained child without rebuilding tree cells."""
         # Arrange
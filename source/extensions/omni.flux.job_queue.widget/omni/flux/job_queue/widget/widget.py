@@ -654,8 +654,8 @@ class QueueWidget:
             self.delegate.prune_status_widgets()
             self._refresh_scheduler_state()
             return
-        for job_id in job_ids:
-            self.model.update_item(job_id)
+        if job_ids:
+            self.model.update_changed_items()
         progress_updates = {job_id: progress for job_id, progress in progress_updates.items() if job_id not in job_ids}
         if progress_updates and self.model.update_progress_batch(progress_updates):
             self.model.refresh()
@@ -36,6 +36,7 @@ __all__ = [
     "USDDelegate",
     "USDFloatDragField",
     "USDIntDragField",
+    "USDListenerStatistics",
     "USDLogicalGroupOutletItem",
     "USDMetadataListItem",
     "USDModel",
@@ -69,7 +70,7 @@ from .items import (
     VirtualUSDAttributeItem,
     VirtualUSDAttrListItem,
 )
-from .listener import DisableAllListenersBlock
+from .listener import DisableAllListenersBlock, USDListenerStatistics
 from .model import USDModel
 from .property_group_expansion import PropertyGroupExpansionMixin, PropertyGroupExpansionWidget
 from .setup_ui import USDPropertyWidget
@@ -15,17 +15,78 @@
 * limitations under the License.
 """
 
+import asyncio
+import dataclasses
+import time
 import typing
 
+import omni.kit.app
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.interactive_usd_notices import ListenerSubscription as _ListenerSubscription
 from omni.flux.utils.common.interactive_usd_notices import register_objects_changed_listener as _register_listener
-from pxr import Usd
+from pxr import Sdf, Usd
+
+from .item_model.attr_value import UsdAttributeBase as _UsdAttributeBase
+from .items import USDLogicalGroupOutletItem as _USDLogicalGroupOutletItem
+from .items import _BaseUSDAttributeItem
 
 if typing.TYPE_CHECKING:
+    from omni.flux.property_widget_builder.widget import Item as _Item
+
     from .model import USDModel as _USDModel
 
 
+@dataclasses.dataclass(frozen=True)
+class USDListenerStatistics:
+    """Counters of the refreshes triggered by one USD listener, for profiling.
+
+    Attributes:
+        notices: USD notices received for at least one listening model.
+        dispatches: Coalesced batches of notices dispatched to the models.
+        model_refreshes: Whole models refreshed because a change could not be mapped to their items.
+        item_refreshes: Single items refreshed because one of their properties changed.
+        refresh_seconds: Time spent refreshing models and items.
+    """
+
+    notices: int = 0
+    dispatches: int = 0
+    model_refreshes: int = 0
+    item_refreshes: int = 0
+    refresh_seconds: float = 0.0
+
+
+class _ModelPathIndex:
+    """Items of one model indexed by the USD property paths they display."""
+
+    def __init__(self, items: tuple["_Item", ...]):
+        self.items = items
+        self.paths: dict[Sdf.Path, list[_Item]] = {}
+        for item in items:
+            for path in self._get_item_paths(item):
+                self._add(path, item)
+            if not isinstance(item, (_BaseUSDAttributeItem, _USDLogicalGroupOutletItem)):
+                continue
+            # Logical group rows summarize the state of the rows they own
+            for owned_item in item.logical_group_items:
+                if owned_item is item:
+                    continue
+                for path in self._get_item_paths(owned_item):
+                    self._add(path, item)
+
+    def _add(self, path: Sdf.Path, item: "_Item"):
+        items = self.paths.setdefault(path, [])
+        if item not in items:
+            items.append(item)
+
+    @staticmethod
+    def _get_item_paths(item: "_Item") -> list[Sdf.Path]:
+        paths = list(item.attribute_paths) if isinstance(item, _BaseUSDAttributeItem) else []
+        for value_model in item.value_models:
+            if isinstance(value_model, _UsdAttributeBase):
+                paths.extend(value_model.attribute_paths)
+        return paths
+
+
 class DisableAllListenersBlock:
     """Temporarily disables all USD listeners.
 
@@ -59,17 +120,45 @@ class DisableAllListenersBlock:
 
 
 class USDListener:
-    """Listens for USD changes and refreshes matching property models."""
+    """Listens for USD changes and refreshes the matching items of the property models.
+
+    Notices are coalesced and dispatched once per frame. Every changed property is looked up in an index of the items
+    displaying it, so only those items are refreshed. A model is only refreshed as a whole when a change on one of its
+    prims cannot be mapped to its items.
+    """
 
     def __init__(self):
         """Create an empty USD listener for the property widget."""
 
-        self._default_attr = {"_listeners": None, "_models": None, "_tmp_models": None}
+        self._default_attr = {
+            "_listeners": None,
+            "_models": None,
+            "_tmp_models": None,
+            "_path_indexes": None,
+            "_pending_changes": None,
+            "_dispatch_task": None,
+            "_statistics": None,
+        }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
         self._models: list[_USDModel] = []
         self._tmp_models: list[_USDModel] = []
         self._listeners: dict[Usd.Stage, _ListenerSubscription] = {}
+        # Keyed by model id: models are not always hashable
+        self._path_indexes: dict[int, _ModelPathIndex] = {}
+        self._pending_changes: dict[int, tuple[_USDModel, set[Sdf.Path]]] = {}
+        self._dispatch_task: asyncio.Future | None = None
+        self._statistics = USDListenerStatistics()
+
+    @property
+    def statistics(self) -> USDListenerStatistics:
+        """Counters of the refreshes triggered since the listener was created or the counters were reset."""
+        return self._statistics
+
+    def reset_statistics(self):
+        """Reset the refresh counters."""
+
+        self._statistics = USDListenerStatistics()
 
     def tmp_enable_all_listeners(self):
         """Restore listeners that were temporarily disabled."""
@@ -122,37 +211,130 @@ class USDListener:
             self._disable_listener(stage)
 
     def _on_usd_changed(self, notice, stage):
-        """Refresh matching models for a USD object-change notice.
+        """Queue the changed paths of a USD object-change notice for the matching models.
+
+        Models editing a value from their own widgets are skipped, like when the notice is received.
 
         Args:
             notice: USD notice, or aggregated notice, exposing the ObjectsChanged read API.
             stage: Stage whose properties changed.
         """
 
-        for model in self._models:
-            if model.supress_usd_events_during_widget_edit:
+        models = [
+            model for model in self._models if not model.supress_usd_events_during_widget_edit and stage == model.stage
+        ]
+        if not models:
+            return
+
+        changed_paths = [
+            path for path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()] if path.IsPropertyPath()
+        ]
+        if not changed_paths:
+            return
+
+        for model in models:
+            _, pending_paths = self._pending_changes.setdefault(id(model), (model, set()))
+            pending_paths.update(changed_paths)
+        self._statistics = dataclasses.replace(self._statistics, notices=self._statistics.notices + 1)
+        self._schedule_dispatch()
+
+    def _schedule_dispatch(self):
+        """Dispatch the queued changes on the next frame, once for all the notices received until then."""
+
+        if self._dispatch_task is not None and not self._dispatch_task.done():
+            return
+
+        async def dispatch_async():
+            try:
+                await omni.kit.app.get_app().next_update_async()
+            finally:
+                self._dispatch_task = None
+            self.dispatch_pending_changes()
+
+        self._dispatch_task = asyncio.ensure_future(dispatch_async())
+
+    def dispatch_pending_changes(self):
+        """Refresh the items affected by the queued changes now instead of waiting for the next frame."""
+
+        if not self._pending_changes:
+            return
+        pending_changes = self._pending_changes
+        self._pending_changes = {}
+
+        start = time.perf_counter()
+        model_refreshes = 0
+        item_refreshes = 0
+        for model, changed_paths in pending_changes.values():
+            # The model may have been removed since the notice was received
+            if not any(model is listened_model for listened_model in self._models):
                 continue
+            items = self._get_changed_items(model, changed_paths)
+            if items is None:
+                model.refresh()
+                model_refreshes += 1
+                continue
+            if items:
+                model.refresh_items(items)
+                item_refreshes += len(items)
+        self._statistics = dataclasses.replace(
+            self._statistics,
+            dispatches=self._statistics.dispatches + 1,
+            model_refreshes=self._statistics.model_refreshes + model_refreshes,
+            item_refreshes=self._statistics.item_refreshes + item_refreshes,
+            refresh_seconds=self._statistics.refresh_seconds + time.perf_counter() - start,
+        )
+
+    def _get_changed_items(self, model: "_USDModel", changed_paths: set[Sdf.Path]) -> list["_Item"] | None:
+        """Get the items of a model displaying the changed properties.
 
-            if stage != model.stage:
+        Args:
+            model: Model receiving the changes.
+            changed_paths: Property paths changed since the last dispatch.
+
+        Returns:
+            The items to refresh, or None if the whole model should be refreshed.
+        """
+
+        stage = model.stage
+        if not stage:
+            return []
+        prim_paths = set(model.prim_paths)
+        path_index = None
+        items = {}
+        for changed_path in changed_paths:
+            if changed_path.GetPrimPath() not in prim_paths:
                 continue
+            if not stage.GetPropertyAtPath(changed_path).IsValid():
+                continue
+            if path_index is None:
+                path_index = self._get_path_index(model)
+            changed_items = path_index.paths.get(changed_path)
+            if changed_items is None:
+                return None
+            for item in changed_items:
+                items.setdefault(id(item), item)
+        return list(items.values())
+
+    def _get_path_index(self, model: "_USDModel") -> _ModelPathIndex:
+        """Get the index of the items of a model, rebuilding it when the items changed.
 
-            should_refresh = False
-            for resynced_path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]:
-                if "." not in str(resynced_path):  # not an attribute
-                    continue
-                attr = stage.GetPropertyAtPath(resynced_path)
-                if not attr.IsValid():
-                    continue
-                prim = attr.GetPrim()
-                if not prim.IsValid():
-                    continue
-                if prim.GetPath() not in model.prim_paths:
-                    continue
-                should_refresh = True
-                break
+        Args:
+            model: Model to index.
 
-            if should_refresh:
-                model.refresh()
+        Returns:
+            The up-to-date index of the model items.
+        """
+
+        items = tuple(model.get_all_items(include_hidden=True))
+        path_index = self._path_indexes.get(id(model))
+        if (
+            path_index is None
+            or len(path_index.items) != len(items)
+            or any(item is not indexed_item for item, indexed_item in zip(items, path_index.items))
+        ):
+            path_index = _ModelPathIndex(items)
+            self._path_indexes[id(model)] = path_index
+        return path_index
 
     def refresh_all(self):
         """Refresh all registered models."""
@@ -194,6 +376,8 @@ class USDListener:
             removed_from_tmp_models = True
         if not removed_from_models and not removed_from_tmp_models:
             return
+        self._path_indexes.pop(id(model), None)
+        self._pending_changes.pop(id(model), None)
         stage = model.stage
         cancel_error = None
         if cancel_edit_interaction:
@@ -233,6 +417,8 @@ class USDListener:
 
         for listener in self._listeners.values():
             listener.Revoke()
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
 
         _reset_default_attrs(self)
         if cancel_error is not None:
@@ -37,6 +37,7 @@ from .items import USDMetadataListItem as _USDMetadataListItem
 from .items import VirtualUSDAttrListItem as _VirtualUSDAttrListItem
 
 if typing.TYPE_CHECKING:
+    from omni.flux.property_widget_builder.widget import Item as _Item
     from omni.flux.property_widget_builder.widget import ItemGroup as _ItemGroup
 
 
@@ -302,6 +303,17 @@ class USDModel(_Model):
         """
         return _EventSubscription(self.__on_attribute_created, function)
 
+    def refresh_items(self, items: list[_Item]):
+        """
+        Refresh some items only, without rebuilding the other rows
+
+        Args:
+            items: the items to refresh
+        """
+        for item in items:
+            item.refresh()
+            self._item_changed(item)
+
     def _overrides_removed(self):
         self.__on_override_removed()
 
@@ -18,11 +18,14 @@
 from types import SimpleNamespace
 from unittest.mock import Mock, call, patch
 
+import omni.kit.app
 import omni.kit.test
 import omni.usd
 from omni.flux.property_widget_builder.model.usd import grouped_keys_primvar as _grouped_keys_primvar_module
 from omni.flux.property_widget_builder.model.usd import listener as _listener_module
 from omni.flux.property_widget_builder.model.usd.grouped_keys_primvar import PropertyGroupedKeysModel
+from omni.flux.property_widget_builder.model.usd.item_model.attr_value import UsdAttributeValueModel
+from omni.flux.property_widget_builder.model.usd.items import USDAttributeItem, USDLogicalGroupOutletItem
 from omni.flux.property_widget_builder.model.usd.listener import DisableAllListenersBlock
 from omni.flux.property_widget_builder.model.usd.listener import USDListener
 from pxr import Sdf
@@ -361,6 +364,7 @@ class TestUSDListener(omni.kit.test.AsyncTestCase):
         try:
             # Act
             listener._on_usd_changed(notice, stage)
+            listener.dispatch_pending_changes()
 
             # Assert
             model.refresh.assert_not_called()
@@ -379,6 +383,7 @@ class TestUSDListener(omni.kit.test.AsyncTestCase):
             supress_usd_events_during_widget_edit=False,
             stage=stage,
             prim_paths=[Sdf.Path("/ListenerPrim")],
+            get_all_items=Mock(return_value=[]),
             refresh=Mock(),
         )
         notice = Mock()
@@ -389,8 +394,159 @@ class TestUSDListener(omni.kit.test.AsyncTestCase):
         try:
             # Act
             listener._on_usd_changed(notice, stage)
+            listener.dispatch_pending_changes()
 
             # Assert
             model.refresh.assert_called_once_with()
+            self.assertEqual(1, listener.statistics.model_refreshes)
         finally:
             await context.close_stage_async()
+
+    async def test_on_usd_changed_refreshes_only_items_displaying_changed_attribute(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+        prim = stage.DefinePrim("/ListenerPrim")
+        prim.CreateAttribute("testFloat", Sdf.ValueTypeNames.Float).Set(1.0)
+        prim.CreateAttribute("otherFloat", Sdf.ValueTypeNames.Float).Set(1.0)
+        changed_item = Mock(
+            spec=USDAttributeItem,
+            attribute_paths=[Sdf.Path("/ListenerPrim.testFloat")],
+            value_models=[],
+            logical_group_items=[],
+        )
+        other_item = Mock(
+            spec=USDAttributeItem,
+            attribute_paths=[Sdf.Path("/ListenerPrim.otherFloat")],
+            value_models=[],
+            logical_group_items=[],
+        )
+        listener = USDListener()
+        model = SimpleNamespace(
+            supress_usd_events_during_widget_edit=False,
+            stage=stage,
+            prim_paths=[Sdf.Path("/ListenerPrim")],
+            get_all_items=Mock(return_value=[changed_item, other_item]),
+            refresh=Mock(),
+            refresh_items=Mock(),
+        )
+        notice = Mock()
+        notice.GetChangedInfoOnlyPaths.return_value = [Sdf.Path("/ListenerPrim.testFloat")]
+        notice.GetResyncedPaths.return_value = []
+        listener._models = [model]
+
+        try:
+            # Act
+            listener._on_usd_changed(notice, stage)
+            listener.dispatch_pending_changes()
+
+            # Assert
+            model.refresh_items.assert_called_once_with([changed_item])
+            model.refresh.assert_not_called()
+            self.assertEqual(1, listener.statistics.item_refreshes)
+            self.assertEqual(0, listener.statistics.model_refreshes)
+        finally:
+            await context.close_stage_async()
+
+    async def test_on_usd_changed_refreshes_logical_group_rows_owning_changed_value_model(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+        prim = stage.DefinePrim("/ListenerPrim")
+        prim.CreateAttribute("testFloat", Sdf.ValueTypeNames.Float).Set(1.0)
+        value_model = Mock(spec=UsdAttributeValueModel, attribute_paths=[Sdf.Path("/ListenerPrim.testFloat")])
+        owned_item = Mock(spec=USDAttributeItem, attribute_paths=[], value_models=[value_model], logical_group_items=[])
+        outlet_item = Mock(spec=USDLogicalGroupOutletItem, value_models=[], logical_group_items=[owned_item])
+        listener = USDListener()
+        model = SimpleNamespace(
+            supress_usd_events_during_widget_edit=False,
+            stage=stage,
+            prim_paths=[Sdf.Path("/ListenerPrim")],
+            get_all_items=Mock(return_value=[outlet_item, owned_item]),
+            refresh=Mock(),
+            refresh_items=Mock(),
+        )
+        notice = Mock()
+        notice.GetChangedInfoOnlyPaths.return_value = [Sdf.Path("/ListenerPrim.testFloat")]
+        notice.GetResyncedPaths.return_value = []
+        listener._models = [model]
+
+        try:
+            # Act
+            listener._on_usd_changed(notice, stage)
+            listener.dispatch_pending_changes()
+
+            # Assert
+            model.refresh_items.assert_called_once_with([outlet_item, owned_item])
+            model.refresh.assert_not_called()
+            self.assertEqual(2, listener.statistics.item_refreshes)
+        finally:
+            await context.close_stage_async()
+
+    async def test_on_usd_changed_coalesces_notices_until_next_frame(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+        prim = stage.DefinePrim("/ListenerPrim")
+        prim.CreateAttribute("testFloat", Sdf.ValueTypeNames.Float).Set(1.0)
+        item = Mock(
+            spec=USDAttributeItem,
+            attribute_paths=[Sdf.Path("/ListenerPrim.testFloat")],
+            value_models=[],
+            logical_group_items=[],
+        )
+        listener = USDListener()
+        model = SimpleNamespace(
+            supress_usd_events_during_widget_edit=False,
+            stage=stage,
+            prim_paths=[Sdf.Path("/ListenerPrim")],
+            get_all_items=Mock(return_value=[item]),
+            refresh=Mock(),
+            refresh_items=Mock(),
+        )
+        notice = Mock()
+        notice.GetChangedInfoOnlyPaths.return_value = [Sdf.Path("/ListenerPrim.testFloat")]
+        notice.GetResyncedPaths.return_value = []
+        listener._models = [model]
+
+        try:
+            # Act
+            for _ in range(3):
+                listener._on_usd_changed(notice, stage)
+            model.refresh_items.assert_not_called()
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+
+            # Assert
+            model.refresh_items.assert_called_once_with([item])
+            self.assertEqual(3, listener.statistics.notices)
+            self.assertEqual(1, listener.statistics.dispatches)
+        finally:
+            await context.close_stage_async()
+
+    async def test_remove_model_drops_pending_changes(self):
+        # Arrange
+        listener = USDListener()
+        stage = Mock()
+        model = SimpleNamespace(
+            supress_usd_events_during_widget_edit=False,
+            stage=stage,
+            prim_paths=[Sdf.Path("/ListenerPrim")],
+            refresh=Mock(),
+            cancel_property_edit_interaction=Mock(),
+        )
+        notice = Mock()
+        notice.GetChangedInfoOnlyPaths.return_value = [Sdf.Path("/ListenerPrim.testFloat")]
+        notice.GetResyncedPaths.return_value = []
+        listener._models = [model]
+        listener._on_usd_changed(notice, stage)
+
+        # Act
+        listener.remove_model(model)
+        listener.dispatch_pending_changes()
+
+        # Assert
+        model.refresh.assert_not_called()
@@ -18,12 +18,15 @@
 import threading
 
 import omni.usd
-from omni.flux.stage_manager.factory import StageManagerItem as _StageManagerItem
 from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.utils.common.interactive_usd_notices import (
+    AggregatedObjectsChangedNotice as _AggregatedObjectsChangedNotice,
+)
 from pxr import Usd
 from pydantic import Field, PrivateAttr, field_validator
 
 from .base import StageManagerUSDContextPlugin as _StageManagerUSDContextPlugin
+from .stage_item_index import StageItemIndex as _StageItemIndex
 
 
 class CurrentStageContextPlugin(_StageManagerUSDContextPlugin):
@@ -32,6 +35,8 @@ class CurrentStageContextPlugin(_StageManagerUSDContextPlugin):
 
     _stage: Usd.Stage | None = PrivateAttr(default=None)
     _listener_event_occurred_subs: list[_EventSubscription] = PrivateAttr(default=[])
+    _item_index: _StageItemIndex = PrivateAttr(default_factory=_StageItemIndex)
+    _is_item_index_tracked: bool = PrivateAttr(default=False)
 
     @field_validator("context_name", mode="before")
     @classmethod
@@ -52,9 +57,20 @@ class CurrentStageContextPlugin(_StageManagerUSDContextPlugin):
         self._listener_event_occurred_subs.extend(
             self.subscribe_listener_event_occurred(omni.usd.StageEventType, self._on_stage_event_occurred)
         )
+        try:
+            self._listener_event_occurred_subs.extend(
+                self.subscribe_listener_event_occurred(Usd.Notice.ObjectsChanged, self._on_objects_changed)
+            )
+            self._is_item_index_tracked = True
+        except ValueError:
+            # Without a USD notice listener, the stage is traversed again on every refresh
+            self._is_item_index_tracked = False
+        self._item_index.reset()
 
     def cleanup(self):
         self._listener_event_occurred_subs.clear()
+        self._is_item_index_tracked = False
+        self._item_index.reset()
         self._stage = None
         super().cleanup()
 
@@ -68,7 +84,10 @@ class CurrentStageContextPlugin(_StageManagerUSDContextPlugin):
 
     def get_items(self, cancel_event: threading.Event | None = None):
         """
-        Fetch the list of prims other plugins should use
+        Fetch the list of prims other plugins should use.
+
+        The prim hierarchy is cached and only the subtrees resynced since the last call are traversed again. The
+        whole stage is traversed when the stage is opened or closed.
 
         Args:
             cancel_event: Signal set when the collection has been superseded.
@@ -85,26 +104,18 @@ class CurrentStageContextPlugin(_StageManagerUSDContextPlugin):
         if not stage:
             return []  # no stage is open
 
-        items = {}
-        current_layer = stage.GetPseudoRoot().GetChildren()
-
-        while current_layer:
-            if cancel_event and cancel_event.is_set():
-                return None
-            next_layer = []
-
-            for prim in current_layer:
-                if cancel_event and cancel_event.is_set():
-                    return None
-                item = _StageManagerItem(hash(prim), prim, parent=items.get(hash(prim.GetParent())))
-                items[item.identifier] = item
-
-                # Add children to the next layer
-                next_layer.extend(prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate))
+        if not self._is_item_index_tracked:
+            self._item_index.reset()
+        return self._item_index.get_items(stage, cancel_event)
 
-            current_layer = next_layer
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged | _AggregatedObjectsChangedNotice):
+        """
+        Queue the resynced paths of the notice so only the affected subtrees are traversed on the next refresh.
 
-        return list(items.values())
+        Args:
+            notice: The USD notice, or the notice aggregated during an interaction
+        """
+        self._item_index.mark_resynced(notice.GetResyncedPaths())
 
     def _on_stage_event_occurred(self, event_type: omni.usd.StageEventType):
         """
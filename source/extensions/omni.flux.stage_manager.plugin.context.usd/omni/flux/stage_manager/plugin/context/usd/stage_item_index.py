@@ -0,0 +1,230 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["StageItemIndex"]
+
+import threading
+from collections.abc import Iterable
+
+from omni.flux.stage_manager.factory import StageManagerItem as _StageManagerItem
+from pxr import Sdf, Usd
+
+
+class _IndexedPrim:
+    __slots__ = ("children", "identifier", "path", "prim")
+
+    def __init__(self, prim: Usd.Prim | None, path: Sdf.Path):
+        self.prim = prim
+        self.path = path
+        self.identifier = hash(prim)
+        self.children: list[_IndexedPrim] = []
+
+
+class StageItemIndex:
+    def __init__(self):
+        """
+        Prim hierarchy of a stage, kept up to date from the resynced paths of USD notices.
+
+        Only the subtrees of resynced prims are read from the stage again. Info-only changes never alter the
+        hierarchy, so they don't invalidate the index.
+
+        The index only caches the hierarchy: every call to `get_items` builds new item wrappers, since the filters
+        update the state of the wrappers they receive.
+        """
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
+        self._stage: Usd.Stage | None = None
+        self._root = _IndexedPrim(None, Sdf.Path.absoluteRootPath)
+        self._nodes: dict[Sdf.Path, _IndexedPrim] = {}
+
+        self._needs_rebuild = True
+        self._pending_resyncs: set[Sdf.Path] = set()
+
+    @property
+    def prim_count(self) -> int:
+        """The number of indexed prims"""
+        return len(self._nodes)
+
+    def reset(self):
+        """Rebuild the whole index on the next `get_items` call"""
+        with self._pending_lock:
+            self._needs_rebuild = True
+            self._pending_resyncs.clear()
+
+    def mark_resynced(self, paths: Iterable[Sdf.Path]):
+        """
+        Queue resynced paths. The affected subtrees are read again on the next `get_items` call.
+
+        Args:
+            paths: The resynced paths of a USD notice
+        """
+        with self._pending_lock:
+            for path in paths:
+                if path == Sdf.Path.absoluteRootPath:
+                    self._needs_rebuild = True
+                elif path.IsPrimPath():
+                    # Property resyncs don't change the prim hierarchy
+                    self._pending_resyncs.add(path)
+
+    def get_items(
+        self, stage: Usd.Stage, cancel_event: threading.Event | None = None
+    ) -> list[_StageManagerItem] | None:
+        """
+        Update the index with the queued changes and build the items of every indexed prim.
+
+        Args:
+            stage: The stage to index
+            cancel_event: Signal set when the collection has been superseded.
+
+        Returns:
+            Newly allocated items in breadth-first order, parents before children, or None when cancelled.
+        """
+        with self._lock:
+            if not self._sync(stage, cancel_event):
+                return None
+            return self._build_items(cancel_event)
+
+    def _sync(self, stage: Usd.Stage, cancel_event: threading.Event | None) -> bool:
+        with self._pending_lock:
+            needs_rebuild = self._needs_rebuild or stage is not self._stage
+            pending = self._pending_resyncs
+            self._needs_rebuild = False
+            self._pending_resyncs = set()
+
+        if needs_rebuild:
+            if not self._rebuild(stage, cancel_event):
+                self.reset()
+                return False
+            return True
+        if not pending:
+            return True
+
+        resynced_by_parent: dict[Sdf.Path, set[Sdf.Path]] = {}
+        for resynced_path in self._remove_descendant_paths(pending):
+            # Prims created under a prim the index doesn't know yet are indexed from their first known ancestor
+            path = resynced_path
+            while path.GetParentPath() != Sdf.Path.absoluteRootPath and path.GetParentPath() not in self._nodes:
+                path = path.GetParentPath()
+            resynced_by_parent.setdefault(path.GetParentPath(), set()).add(path)
+
+        remaining = list(resynced_by_parent.items())
+        while remaining:
+            if cancel_event and cancel_event.is_set():
+                # Keep the changes that were not applied for the next call
+                with self._pending_lock:
+                    for _, paths in remaining:
+                        self._pending_resyncs.update(paths)
+                return False
+            parent_path, resynced = remaining.pop()
+            if parent_path == Sdf.Path.absoluteRootPath:
+                parent = self._root
+            elif parent_path in self._nodes:
+                parent = self._nodes[parent_path]
+            else:
+                # The parent was removed with the subtree of another resynced prim
+                continue
+            if not self._reconcile_children(stage, parent_path, parent, resynced):
+                # The parent disappeared without a resync notice: the index can't be trusted anymore
+                if not self._rebuild(stage, cancel_event):
+                    self.reset()
+                    return False
+                return True
+        return True
+
+    @staticmethod
+    def _remove_descendant_paths(paths: set[Sdf.Path]) -> list[Sdf.Path]:
+        result = []
+        for path in paths:
+            ancestor = path.GetParentPath()
+            while ancestor != Sdf.Path.absoluteRootPath and ancestor not in paths:
+                ancestor = ancestor.GetParentPath()
+            if ancestor == Sdf.Path.absoluteRootPath:
+                result.append(path)
+        return result
+
+    def _rebuild(self, stage: Usd.Stage, cancel_event: threading.Event | None) -> bool:
+        self._stage = stage
+        self._root = _IndexedPrim(None, Sdf.Path.absoluteRootPath)
+        self._nodes = {}
+        return self._index_children(self._root, stage.GetPseudoRoot().GetChildren(), cancel_event)
+
+    def _index_children(
+        self, parent: _IndexedPrim, child_prims: list[Usd.Prim], cancel_event: threading.Event | None = None
+    ) -> bool:
+        to_index = [(parent, child_prims)]
+        while to_index:
+            if cancel_event and cancel_event.is_set():
+                return False
+            node, prims = to_index.pop()
+            for prim in prims:
+                child = _IndexedPrim(prim, prim.GetPath())
+                self._nodes[child.path] = child
+                node.children.append(child)
+                to_index.append((child, prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate)))
+        return True
+
+    def _reconcile_children(
+        self, stage: Usd.Stage, parent_path: Sdf.Path, parent: _IndexedPrim, resynced: set[Sdf.Path]
+    ) -> bool:
+        if parent_path == Sdf.Path.absoluteRootPath:
+            child_prims = stage.GetPseudoRoot().GetChildren()
+        else:
+            parent_prim = stage.GetPrimAtPath(parent_path)
+            if not parent_prim.IsValid():
+                return False
+            child_prims = parent_prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate)
+
+        child_paths = [prim.GetPath() for prim in child_prims]
+        kept_paths = set(child_paths) - resynced
+        for child in parent.children:
+            if child.path not in kept_paths:
+                self._remove_subtree(child)
+
+        parent.children = []
+        for prim, path in zip(child_prims, child_paths):
+            child = self._nodes.get(path)
+            if child is None:
+                child = _IndexedPrim(prim, path)
+                self._nodes[path] = child
+                self._index_children(child, prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate))
+            parent.children.append(child)
+        return True
+
+    def _remove_subtree(self, node: _IndexedPrim):
+        to_remove = [node]
+        while to_remove:
+            current = to_remove.pop()
+            self._nodes.pop(current.path, None)
+            to_remove.extend(current.children)
+
+    def _build_items(self, cancel_event: threading.Event | None) -> list[_StageManagerItem] | None:
+        items = []
+        current_layer = [(node, None) for node in self._root.children]
+        while current_layer:
+            next_layer = []
+            for node, parent in current_layer:
+                if cancel_event and cancel_event.is_set():
+                    return None
+                item = _StageManagerItem(node.identifier, node.prim, parent=parent)
+                items.append(item)
+                for child in node.children:
+                    next_layer.append((child, item))
+            current_layer = next_layer
+        return items
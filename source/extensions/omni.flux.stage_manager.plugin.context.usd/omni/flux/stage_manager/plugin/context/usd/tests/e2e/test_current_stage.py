@@ -16,13 +16,18 @@
 """
 
 import asyncio
+import time
+from unittest import mock
 
+import carb
 import omni.kit.test
 import omni.usd
 from omni.flux.stage_manager.plugin.context.usd import CurrentStageContextPlugin
+from omni.flux.stage_manager.plugin.context.usd import stage_item_index as stage_item_index_module
 from omni.flux.stage_manager.plugin.listener.usd.stage_listener import StageManagerUSDStageListenerPlugin
+from omni.flux.stage_manager.plugin.listener.usd.usd_listener import StageManagerUSDNoticeListenerPlugin
 from omni.kit import ui_test
-from pxr import Gf, UsdGeom
+from pxr import Gf, Sdf, Usd, UsdGeom
 
 __all__ = ["TestCurrentStageContextPluginE2E"]
 
@@ -93,3 +98,65 @@ class TestCurrentStageContextPluginE2E(omni.kit.test.AsyncTestCase):
             plugin.cleanup()
             if omni.usd.get_context(context_name):
                 omni.usd.destroy_context(context_name)
+
+    async def test_get_items_large_stage_incremental_refresh_only_reads_resynced_parent(self):
+        """Refresh a large stage after a single prim is authored by reading only the children of its parent."""
+        stage = self._usd_context.get_stage()
+        layer = stage.GetRootLayer()
+        with Sdf.ChangeBlock():
+            for group_index in range(100):
+                group_path = f"/World/Group_{group_index}"
+                for prim_index in range(200):
+                    Sdf.CreatePrimInLayer(layer, f"{group_path}/Mesh_{prim_index}").specifier = Sdf.SpecifierDef
+                layer.GetPrimAtPath(group_path).specifier = Sdf.SpecifierDef
+            layer.GetPrimAtPath("/World").specifier = Sdf.SpecifierDef
+
+        plugin = CurrentStageContextPlugin(
+            context_name="",
+            listeners=[StageManagerUSDStageListenerPlugin(), StageManagerUSDNoticeListenerPlugin()],
+        )
+        plugin.setup()
+        try:
+            started = time.perf_counter()
+            full_items = await asyncio.to_thread(plugin.get_items)
+            full_seconds = time.perf_counter() - started
+
+            UsdGeom.Xform.Define(stage, "/World/Group_50/Mesh_10/Added")
+            index_class = stage_item_index_module.StageItemIndex
+            with (
+                mock.patch.object(
+                    stage_item_index_module, "_IndexedPrim", side_effect=stage_item_index_module._IndexedPrim
+                ) as indexed_prim_mock,
+                mock.patch.object(
+                    index_class, "_reconcile_children", autospec=True, side_effect=index_class._reconcile_children
+                ) as reconcile_mock,
+                mock.patch.object(
+                    index_class, "_rebuild", autospec=True, side_effect=index_class._rebuild
+                ) as rebuild_mock,
+            ):
+                started = time.perf_counter()
+                incremental_items = await asyncio.to_thread(plugin.get_items)
+                incremental_seconds = time.perf_counter() - started
+
+            carb.log_info(
+                f"Stage Manager refresh of {len(incremental_items)} prims: full traversal {full_seconds * 1000:.1f}ms, "
+                f"incremental {incremental_seconds * 1000:.1f}ms"
+            )
+
+            # Only the children of the resynced prim's parent are read again, and only the new prim is indexed
+            rebuild_mock.assert_not_called()
+            self.assertEqual(
+                [Sdf.Path("/World/Group_50/Mesh_10")], [call.args[2] for call in reconcile_mock.call_args_list]
+            )
+            self.assertEqual(
+                [Sdf.Path("/World/Group_50/Mesh_10/Added")], [call.args[1] for call in indexed_prim_mock.call_args_list]
+            )
+            expected_paths = {str(prim.GetPath()) for prim in stage.Traverse(Usd.PrimAllPrimsPredicate)}
+            items_by_path = {str(item.data.GetPath()): item for item in incremental_items}
+            self.assertEqual(len(full_items) + 1, len(incremental_items))
+            self.assertEqual(expected_paths, set(items_by_path))
+            self.assertIs(
+                items_by_path["/World/Group_50/Mesh_10/Added"].parent, items_by_path["/World/Group_50/Mesh_10"]
+            )
+        finally:
+            plugin.cleanup()
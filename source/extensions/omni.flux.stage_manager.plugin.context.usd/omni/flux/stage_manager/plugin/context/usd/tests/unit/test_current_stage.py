@@ -20,17 +20,40 @@ from unittest.mock import Mock
 
 import omni.kit.test
 from omni.flux.stage_manager.plugin.context.usd.current_stage import CurrentStageContextPlugin
+from pxr import Sdf
 
 __all__ = ["TestCurrentStageContextPlugin"]
 
 
 class TestCurrentStageContextPlugin(omni.kit.test.AsyncTestCase):
-    def _make_plugin(self, stage):
+    def _make_plugin(self, stage, tracked: bool = False):
         plugin = CurrentStageContextPlugin.model_construct(context_name="")
         plugin._stage = stage
         plugin._listener_event_occurred_subs = [Mock()]
+        plugin._is_item_index_tracked = tracked
         return plugin
 
+    def _make_prim(self, path: str, children: list | None = None):
+        prim = Mock()
+        prim.GetPath.return_value = Sdf.Path(path)
+        prim.GetFilteredChildren.return_value = children or []
+        prim.IsValid.return_value = True
+        return prim
+
+    def _make_stage(self, root_prims: list, prims: list):
+        prims_by_path = {prim.GetPath(): prim for prim in prims}
+        invalid_prim = Mock()
+        invalid_prim.IsValid.return_value = False
+        stage = Mock()
+        stage.GetPseudoRoot.return_value.GetChildren.return_value = root_prims
+        stage.GetPrimAtPath.side_effect = lambda path: prims_by_path.get(path, invalid_prim)
+        return stage
+
+    def _resync(self, plugin, *paths: str):
+        notice = Mock()
+        notice.GetResyncedPaths.return_value = [Sdf.Path(path) for path in paths]
+        plugin._on_objects_changed(notice)
+
     async def test_get_items_without_stage_returns_empty_list(self):
         # Arrange
         plugin = self._make_plugin(None)
@@ -78,3 +101,96 @@ class TestCurrentStageContextPlugin(omni.kit.test.AsyncTestCase):
 
         # Assert
         self.assertIsNone(result)
+
+    async def test_get_items_resynced_prim_only_traverses_changed_subtree(self):
+        # Arrange
+        leaf = self._make_prim("/World/Mesh/Leaf")
+        mesh = self._make_prim("/World/Mesh", [leaf])
+        world = self._make_prim("/World", [mesh])
+        lights = self._make_prim("/Lights")
+        stage = self._make_stage([world, lights], [world, mesh, leaf, lights])
+        plugin = self._make_plugin(stage, tracked=True)
+        plugin.get_items()
+
+        new_light = self._make_prim("/Lights/Key")
+        lights.GetFilteredChildren.return_value = [new_light]
+
+        # Act
+        self._resync(plugin, "/Lights/Key")
+        result = plugin.get_items()
+
+        # Assert
+        self.assertEqual([world, lights, mesh, new_light, leaf], [item.data for item in result])
+        self.assertIs(result[3].parent, result[1])
+        self.assertEqual(1, world.GetFilteredChildren.call_count)
+        self.assertEqual(1, mesh.GetFilteredChildren.call_count)
+        self.assertEqual(1, new_light.GetFilteredChildren.call_count)
+
+    async def test_get_items_removed_prim_drops_subtree(self):
+        # Arrange
+        leaf = self._make_prim("/World/Mesh/Leaf")
+        mesh = self._make_prim("/World/Mesh", [leaf])
+        world = self._make_prim("/World", [mesh])
+        stage = self._make_stage([world], [world, mesh, leaf])
+        plugin = self._make_plugin(stage, tracked=True)
+        plugin.get_items()
+
+        world.GetFilteredChildren.return_value = []
+
+        # Act
+        self._resync(plugin, "/World/Mesh", "/World/Mesh/Leaf")
+        result = plugin.get_items()
+
+        # Assert
+        self.assertEqual([world], [item.data for item in result])
+        self.assertEqual(1, plugin._item_index.prim_count)
+
+    async def test_get_items_absolute_root_resynced_traverses_whole_stage(self):
+        # Arrange
+        mesh = self._make_prim("/World/Mesh")
+        world = self._make_prim("/World", [mesh])
+        stage = self._make_stage([world], [world, mesh])
+        plugin = self._make_plugin(stage, tracked=True)
+        plugin.get_items()
+
+        # Act
+        self._resync(plugin, "/")
+        plugin.get_items()
+
+        # Assert
+        self.assertEqual(2, world.GetFilteredChildren.call_count)
+        self.assertEqual(2, mesh.GetFilteredChildren.call_count)
+
+    async def test_get_items_without_notice_listener_traverses_whole_stage(self):
+        # Arrange
+        world = self._make_prim("/World")
+        stage = self._make_stage([world], [world])
+        plugin = self._make_plugin(stage, tracked=False)
+
+        # Act
+        first = plugin.get_items()
+        second = plugin.get_items()
+
+        # Assert
+        self.assertEqual(2, world.GetFilteredChildren.call_count)
+        self.assertIsNot(first[0], second[0])
+
+    async def test_get_items_cancelled_during_update_keeps_pending_changes(self):
+        # Arrange
+        world = self._make_prim("/World")
+        stage = self._make_stage([world], [world])
+        plugin = self._make_plugin(stage, tracked=True)
+        plugin.get_items()
+        mesh = self._make_prim("/World/Mesh")
+        world.GetFilteredChildren.return_value = [mesh]
+        self._resync(plugin, "/World/Mesh")
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        # Act
+        cancelled = plugin.get_items(cancel_event)
+        result = plugin.get_items()
+
+        # Assert
+        self.assertIsNone(cancelled)
+        self.assertEqual([world, mesh], [item.data for item in result])
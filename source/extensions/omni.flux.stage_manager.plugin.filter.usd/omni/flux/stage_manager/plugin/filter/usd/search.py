@@ -15,11 +15,18 @@
 * limitations under the License.
 """
 
+import dataclasses
 import re
+import threading
+import weakref
+from collections import OrderedDict
 
 from omni import ui
 from omni.flux.stage_manager.factory import StageManagerItem as _StageManagerItem
 from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.utils.common.stage_cache import StageCache as _StageCache
+from omni.flux.utils.common.stage_cache import StageCacheRegistry as _StageCacheRegistry
+from pxr import Usd
 from pydantic import Field, PrivateAttr
 
 from .base import StageManagerUSDFilterPlugin as _StageManagerUSDFilterPlugin
@@ -27,6 +34,9 @@ from .base import StageManagerUSDFilterPlugin as _StageManagerUSDFilterPlugin
 # Path-like search terms are handled literally against prim paths before regex detection. For non-path terms,
 # backslash remains a regex metacharacter so explicit regex escapes like \d work as expected.
 _REGEX_META_CHARS = frozenset(r"\.^$*+?{}[]|()")
+_NICKNAME_ATTRIBUTE = "nickname"
+# Number of literal searches per stage whose results are kept to narrow the next searches
+_CACHED_SEARCH_COUNT = 4
 
 
 def _is_path_search_term(search_term: str) -> bool:
@@ -45,6 +55,37 @@ def _get_search_state(search_term: str) -> tuple[bool, str, re.Pattern | None, b
         return path_mode, "", None, True
 
 
+@dataclasses.dataclass(slots=True)
+class _SearchEntry:
+    """The strings of a prim matched by the search."""
+
+    folded_path: str
+    names: tuple[str, ...]
+    folded_names: tuple[str, ...]
+
+
+def _create_search_entry(prim, prim_path: str) -> _SearchEntry:
+    """Read the name and nickname of a prim."""
+    names = (prim_path.rpartition("/")[2],)
+    nickname_attr = prim.GetAttribute(_NICKNAME_ATTRIBUTE)
+    if nickname_attr.IsValid() and nickname_attr.HasValue():
+        names += (str(nickname_attr.Get()),)
+    return _SearchEntry(prim_path.casefold(), names, tuple(name.casefold() for name in names))
+
+
+def _matches_search_entry(
+    entry: _SearchEntry, path_mode: bool, literal_search_term: str, compiled_pattern: re.Pattern | None
+) -> bool:
+    """Return whether the strings of a prim match immutable search state."""
+    if literal_search_term:
+        if path_mode:
+            return literal_search_term in entry.folded_path
+        return any(literal_search_term in name for name in entry.folded_names)
+    if compiled_pattern is None:
+        return False
+    return any(compiled_pattern.search(name) for name in entry.names)
+
+
 def _matches_search_item(
     item: _StageManagerItem,
     path_mode: bool,
@@ -55,21 +96,108 @@ def _matches_search_item(
     """Return whether an item matches immutable search state."""
     if invalid_regex:
         return False
+    entry = _create_search_entry(item.data, str(item.data.GetPath()))
+    return _matches_search_entry(entry, path_mode, literal_search_term, compiled_pattern)
 
-    prim_path = item.data.GetPath()
-    if path_mode:
-        strings_to_search = [str(prim_path)]
-    else:
-        strings_to_search = [prim_path.name]
-        nickname_attr = item.data.GetAttribute("nickname")
-        if nickname_attr.IsValid() and nickname_attr.HasValue():
-            strings_to_search.append(str(nickname_attr.Get()))
 
-    if literal_search_term:
-        return any(literal_search_term in value.casefold() for value in strings_to_search)
-    if compiled_pattern is None:
-        return False
-    return any(compiled_pattern.search(value) for value in strings_to_search)
+class _SearchIndex(_StageCache):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Index the search strings of the prims of one stage, shared by every search of the stage.
+
+        Holds the lower-cased path, name and nickname of every searched prim, and the per-prim results of the latest
+        literal searches. A term extending a previous term can only match the prims the previous term matched, so
+        typing a longer term only reads the prims that still match.
+
+        Args:
+            stage: The stage holding the prims
+        """
+        super().__init__(stage)
+        self._lock = threading.Lock()
+        self._entries: dict[str, _SearchEntry] = {}
+        self._results: OrderedDict[tuple[bool, str], dict[str, bool]] = OrderedDict()
+
+    def get_entry(self, prim_path: str, prim: Usd.Prim) -> _SearchEntry:
+        """
+        Get the search strings of a prim
+
+        Args:
+            prim_path: The path of the prim. Paths are indexed as strings, which hash faster than `Sdf.Path`.
+            prim: The prim to search
+
+        Returns:
+            The search strings, read once until the prim or its nickname changes
+        """
+        # Capture the index so a concurrent invalidation can't receive strings read before the change
+        entries = self._entries
+        entry = entries.get(prim_path)
+        if entry is None:
+            entry = _create_search_entry(prim, prim_path)
+            entries[prim_path] = entry
+        return entry
+
+    def get_literal_results(
+        self, path_mode: bool, literal_search_term: str
+    ) -> tuple[dict[str, bool], dict[str, bool] | None]:
+        """
+        Get the per-prim results of a literal search
+
+        Args:
+            path_mode: Whether the term is matched against prim paths
+            literal_search_term: The lower-cased search term
+
+        Returns:
+            The results of the term to read and fill, and the results of the longest previous term it extends, if any
+        """
+        key = (path_mode, literal_search_term)
+        with self._lock:
+            results = self._results.get(key)
+            if results is not None:
+                self._results.move_to_end(key)
+                return results, None
+
+            previous_term = ""
+            previous_results = None
+            for (cached_path_mode, cached_term), cached_results in self._results.items():
+                if cached_path_mode != path_mode or cached_term not in literal_search_term:
+                    continue
+                if previous_results is None or len(cached_term) > len(previous_term):
+                    previous_term, previous_results = cached_term, cached_results
+
+            results = {}
+            self._results[key] = results
+            while len(self._results) > _CACHED_SEARCH_COUNT:
+                self._results.popitem(last=False)
+            return results, previous_results
+
+    def invalidate(self):
+        """Drop the search strings and results"""
+        with self._lock:
+            self._entries = {}
+            self._results = OrderedDict()
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, _sender: Usd.Stage):
+        # Names and paths only change with a prim resync. Nicknames are attributes of the prims.
+        nickname_prim_paths = []
+        for path in notice.GetResyncedPaths():
+            if not path.IsPropertyPath():
+                self.invalidate()
+                return
+            if path.name == _NICKNAME_ATTRIBUTE:
+                nickname_prim_paths.append(str(path.GetPrimPath()))
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath() and path.name == _NICKNAME_ATTRIBUTE:
+                nickname_prim_paths.append(str(path.GetPrimPath()))
+        if not nickname_prim_paths:
+            return
+        with self._lock:
+            for prim_path in nickname_prim_paths:
+                self._entries.pop(prim_path, None)
+                for results in self._results.values():
+                    results.pop(prim_path, None)
+
+
+_SEARCH_INDEXES = _StageCacheRegistry(_SearchIndex)
 
 
 class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
@@ -86,6 +214,9 @@ class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
     search_term: str = Field(default="", exclude=False)
 
     _end_edit_sub: _EventSubscription | None = PrivateAttr(default=None)
+    _value_changed_sub: _EventSubscription | None = PrivateAttr(default=None)
+    # The search index and prim path of the items, which are reused by the refreshes of the same context items
+    _item_keys: weakref.WeakKeyDictionary = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
     _compiled_pattern: re.Pattern | None = PrivateAttr(default=None)
     _literal_search_term: str = PrivateAttr(default="")
     _invalid_regex: bool = PrivateAttr(default=False)
@@ -113,14 +244,66 @@ class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
         )
 
     def prepare_filter_predicate(self):
-        """Capture immutable search state for worker filtering."""
+        """
+        Capture immutable search state for worker filtering.
+
+        USD prims are matched through the search index of their stage, so their strings are only read once across
+        refreshes and a term extending the previous one only checks the prims the previous term matched.
+        """
         search_term = self.search_term
+        if not search_term:
+            return lambda _item: True
         search_state = _get_search_state(search_term)
-        return lambda item: not search_term or _matches_search_item(item, *search_state)
+        path_mode, literal_search_term, compiled_pattern, invalid_regex = search_state
+        if invalid_regex:
+            return lambda _item: False
+
+        item_keys = self._item_keys
+        # The predicate is owned by one refresh and called from one worker at a time
+        index_results = {}
+
+        def _predicate(item: _StageManagerItem) -> bool:
+            key = item_keys.get(item)
+            if key is None:
+                prim = item.data
+                if not isinstance(prim, Usd.Prim):
+                    return _matches_search_item(item, *search_state)
+                key = (_SEARCH_INDEXES.get(prim.GetStage()), str(prim.GetPath()))
+                item_keys[item] = key
+            index, prim_path = key
+
+            if literal_search_term:
+                lookup = index_results.get(index)
+                if lookup is None:
+                    lookup = index.get_literal_results(path_mode, literal_search_term)
+                    index_results[index] = lookup
+                results, previous_results = lookup
+            else:
+                results = previous_results = None
+
+            if results is not None:
+                matches = results.get(prim_path)
+                if matches is not None:
+                    return matches
+                if previous_results is not None and previous_results.get(prim_path) is False:
+                    results[prim_path] = False
+                    return False
+
+            entry = index.get_entry(prim_path, item.data)
+            matches = _matches_search_entry(entry, path_mode, literal_search_term, compiled_pattern)
+            if results is not None:
+                results[prim_path] = matches
+            return matches
+
+        return _predicate
 
     def _on_edit(self, model):
         """Update the search term from the text field and refresh filtering."""
-        self.search_term = model.get_value_as_string()
+        search_term = model.get_value_as_string()
+        # The field reports every keystroke and the end of the edit: only refresh when the term changed
+        if search_term == self.search_term and search_term == self._prepared_search_term:
+            return
+        self.search_term = search_term
         self._prepare_search_term(self.search_term)
         self._filter_items_changed()
 
@@ -138,4 +321,6 @@ class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
                 height=ui.Pixel(24),
                 identifier="search_field",
             )
+            # Search while typing: a new keystroke cancels the refresh of the previous term
+            self._value_changed_sub = search_field.model.subscribe_value_changed_fn(self._on_edit)
             self._end_edit_sub = search_field.model.subscribe_end_edit_fn(self._on_edit)
@@ -20,8 +20,10 @@ from unittest.mock import Mock, patch
 
 import omni.kit.test
 from omni.flux.stage_manager.factory import StageManagerItem
+from omni.flux.stage_manager.plugin.filter.usd import search as _search
 from omni.flux.stage_manager.plugin.filter.usd.base import StageManagerUSDFilterPlugin
 from omni.flux.stage_manager.plugin.filter.usd.search import SearchFilterPlugin
+from pxr import Sdf, Usd
 
 __all__ = ["TestSearchFilterPluginUnit"]
 
@@ -68,6 +70,17 @@ def _make_item(name: str, nickname: str | None = None, path: str | None = None)
     return StageManagerItem(name, data=prim)
 
 
+def _make_stage_items(stage: Usd.Stage, paths: list[str]) -> list[StageManagerItem]:
+    """Build Stage Manager items wrapping prims defined on a real stage."""
+    return [StageManagerItem(path, data=stage.DefinePrim(path)) for path in paths]
+
+
+def _filter(plugin: SearchFilterPlugin, items: list[StageManagerItem]) -> list[str]:
+    """Return the paths of the items matched by a prepared predicate."""
+    predicate = plugin.prepare_filter_predicate()
+    return [str(item.data.GetPath()) for item in items if predicate(item)]
+
+
 def _set_search_term(plugin: SearchFilterPlugin, value: str):
     """Apply a search term through the same path used by the UI."""
     plugin._on_edit(_Model(value))
@@ -255,3 +268,80 @@ class TestSearchFilterPluginUnit(omni.kit.test.AsyncTestCase):
         # Assert
         self.assertTrue(foo_matches)
         self.assertFalse(bar_matches)
+
+    async def test_prepared_filter_predicate_usd_prims_should_match_name_path_and_nickname(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        items = _make_stage_items(stage, ["/RootNode/Props/HeroMesh", "/RootNode/Props/Mesh_001", "/RootNode/Lights"])
+        items[1].data.CreateAttribute("nickname", Sdf.ValueTypeNames.String).Set("Villain")
+        plugin = SearchFilterPlugin()
+
+        # Act
+        _set_search_term(plugin, "hero")
+        name_matches = _filter(plugin, items)
+        _set_search_term(plugin, "VILL")
+        nickname_matches = _filter(plugin, items)
+        _set_search_term(plugin, "props/")
+        path_matches = _filter(plugin, items)
+        _set_search_term(plugin, r"_\d+")
+        regex_matches = _filter(plugin, items)
+
+        # Assert
+        self.assertEqual(["/RootNode/Props/HeroMesh"], name_matches)
+        self.assertEqual(["/RootNode/Props/Mesh_001"], nickname_matches)
+        self.assertEqual(["/RootNode/Props/HeroMesh", "/RootNode/Props/Mesh_001"], path_matches)
+        self.assertEqual(["/RootNode/Props/Mesh_001"], regex_matches)
+
+    async def test_prepared_filter_predicate_extended_term_should_only_check_previous_matches(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        items = _make_stage_items(stage, [f"/RootNode/Mesh_{index:03d}" for index in range(20)] + ["/RootNode/Light"])
+        plugin = SearchFilterPlugin()
+        _set_search_term(plugin, "mesh_01")
+        _filter(plugin, items)
+
+        # Act
+        _set_search_term(plugin, "mesh_015")
+        with (
+            patch.object(_search, "_matches_search_entry", wraps=_search._matches_search_entry) as match_mock,
+            patch.object(_search, "_create_search_entry", wraps=_search._create_search_entry) as read_mock,
+        ):
+            matches = _filter(plugin, items)
+
+        # Assert
+        self.assertEqual(["/RootNode/Mesh_015"], matches)
+        # Only the 10 matches of the previous term are checked, and their strings were already read
+        self.assertEqual(10, match_mock.call_count)
+        read_mock.assert_not_called()
+
+    async def test_prepared_filter_predicate_changed_nickname_should_update_the_index(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        items = _make_stage_items(stage, ["/RootNode/Mesh_001", "/RootNode/Mesh_002"])
+        plugin = SearchFilterPlugin()
+        _set_search_term(plugin, "hero")
+        before = _filter(plugin, items)
+
+        # Act
+        items[1].data.CreateAttribute("nickname", Sdf.ValueTypeNames.String).Set("HeroMesh")
+        after = _filter(plugin, items)
+        stage.DefinePrim("/RootNode/Mesh_001/HeroChild")
+        added = _filter(plugin, items + _make_stage_items(stage, ["/RootNode/Mesh_001/HeroChild"]))
+
+        # Assert
+        self.assertEqual([], before)
+        self.assertEqual(["/RootNode/Mesh_002"], after)
+        self.assertEqual(["/RootNode/Mesh_002", "/RootNode/Mesh_001/HeroChild"], added)
+
+    async def test_on_edit_unchanged_term_should_not_refresh_filtering(self):
+        # Arrange
+        plugin = SearchFilterPlugin()
+
+        with patch.object(SearchFilterPlugin, "_filter_items_changed") as changed_mock:
+            # Act
+            _set_search_term(plugin, "mesh")
+            _set_search_term(plugin, "mesh")
+            _set_search_term(plugin, "mesh_")
+
+        # Assert
+        self.assertEqual(2, changed_mock.call_count)
@@ -0,0 +1,330 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DEFAULT_HASH_ALGORITHM", "HashIndex", "compute_file_hash", "get_hash_index"]
+
+import copy
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import carb
+import carb.settings
+import carb.tokens
+
+EXTS_HASH_INDEX_ENABLED = "/exts/omni.flux.utils.common/hash_index/enabled"
+EXTS_HASH_INDEX_PATH = "/exts/omni.flux.utils.common/hash_index/path"
+EXTS_HASH_INDEX_MAX_WORKERS = "/exts/omni.flux.utils.common/hash_index/max_workers"
+
+# The digest stored in the `.meta` sidecar files. Changing it would invalidate every existing sidecar.
+DEFAULT_HASH_ALGORITHM = "md5"
+
+_BLOCK_SIZE = 1024 * 1024
+_MMAP_THRESHOLD = 64 * 1024 * 1024
+# A file modified this close to the moment it was read could be modified again without changing its size or mtime
+_RACY_WINDOW_NS = 2_000_000_000
+_SCHEMA_VERSION = 1
+
+_INSTANCE: HashIndex | None = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def compute_file_hash(file_path: str, algorithm: str = DEFAULT_HASH_ALGORITHM, block_size: int = _BLOCK_SIZE) -> str:
+    """
+    Hash the content of a file without using the index.
+
+    Large files are memory-mapped, smaller files are read in blocks of `block_size` bytes. The hash functions release
+    the GIL, so files can be hashed in parallel threads.
+
+    Args:
+        file_path: the local path of the file to hash
+        algorithm: the name of a `hashlib` algorithm
+        block_size: the size of the reads
+
+    Raises:
+        OSError: if the file can't be read
+
+    Returns:
+        The hexdigest of the file content
+    """
+    digest = hashlib.new(algorithm)
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            buffer = bytearray(block_size)
+            view = memoryview(buffer)
+            while read := file.readinto(buffer):
+                digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class HashIndex:
+    def __init__(self, database_path: str | None = None, max_workers: int = 8, block_size: int = _BLOCK_SIZE):
+        """
+        Cache of file content hashes keyed by path, size and modification time.
+
+        Unchanged files are never hashed twice: the hashes are stored in an SQLite database that is shared by every
+        process using the same database path. The index also keeps the content of the `.meta` sidecar files read by
+        the current process, keyed by the same stat information.
+
+        Args:
+            database_path: the path of the SQLite database. None keeps the index in memory.
+            max_workers: the number of threads used to hash several files
+            block_size: the size of the reads when hashing files that are not memory-mapped
+        """
+        self._max_workers = max(1, max_workers)
+        self._block_size = block_size
+
+        self.__lock = threading.Lock()
+        self.__metadata: dict[str, tuple[int, int, int, dict[str, Any]]] = {}
+        self.__connection = self.__connect(database_path)
+
+    def hash_file(self, file_path: str, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+        """
+        Get the hash of a file. The file is only hashed if it changed since it was last indexed.
+
+        Args:
+            file_path: the local path of the file to hash
+            algorithm: the name of a `hashlib` algorithm
+
+        Raises:
+            OSError: if the file can't be read
+
+        Returns:
+            The hexdigest of the file content
+        """
+        key = self.__normalize(file_path)
+        stat = os.stat(key)
+        digest = self.__lookup(key, algorithm, stat)
+        if digest is not None:
+            return digest
+        hashed_at = time.time_ns()
+        digest = compute_file_hash(key, algorithm=algorithm, block_size=self._block_size)
+        if self.__is_stable(stat, hashed_at):
+            self.__store([(key, algorithm, stat.st_size, stat.st_mtime_ns, digest)])
+        return digest
+
+    def hash_files(self, file_paths: Iterable[str], algorithm: str = DEFAULT_HASH_ALGORITHM) -> dict[str, str | None]:
+        """
+        Get the hashes of several files. The files that changed since they were last indexed are hashed in parallel.
+
+        Args:
+            file_paths: the local paths of the files to hash
+            algorithm: the name of a `hashlib` algorithm
+
+        Returns:
+            The hexdigest of every given path, or None for the files that can't be read
+        """
+        results: dict[str, str | None] = {}
+        to_hash: list[tuple[str, str, os.stat_result]] = []
+        for file_path in file_paths:
+            key = self.__normalize(file_path)
+            try:
+                stat = os.stat(key)
+            except OSError:
+                results[file_path] = None
+                continue
+            digest = self.__lookup(key, algorithm, stat)
+            if digest is None:
+                to_hash.append((file_path, key, stat))
+            results[file_path] = digest
+
+        if not to_hash:
+            return results
+
+        def _hash(item: tuple[str, str, os.stat_result]) -> tuple[str | None, int]:
+            hashed_at = time.time_ns()
+            try:
+                return compute_file_hash(item[1], algorithm=algorithm, block_size=self._block_size), hashed_at
+            except OSError:
+                return None, hashed_at
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(to_hash))) as executor:
+            hashed = list(executor.map(_hash, to_hash))
+
+        rows = []
+        for (file_path, key, stat), (digest, hashed_at) in zip(to_hash, hashed):
+            results[file_path] = digest
+            if digest is not None and self.__is_stable(stat, hashed_at):
+                rows.append((key, algorithm, stat.st_size, stat.st_mtime_ns, digest))
+        self.__store(rows)
+        return results
+
+    def get_metadata(self, meta_file_path: str) -> dict[str, Any] | None:
+        """
+        Get the content of a `.meta` sidecar file read or written by this process, if the file didn't change since.
+
+        Args:
+            meta_file_path: the path of the metadata file
+
+        Returns:
+            A copy of the metadata, or None if the file must be read again
+        """
+        key = self.__normalize(meta_file_path)
+        with self.__lock:
+            cached = self.__metadata.get(key)
+        if cached is None:
+            return None
+        size, mtime_ns, cached_at, data = cached
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self.invalidate_metadata(meta_file_path)
+            return None
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns or not self.__is_stable(stat, cached_at):
+            return None
+        return copy.deepcopy(data)
+
+    def set_metadata(self, meta_file_path: str, data: dict[str, Any]):
+        """
+        Remember the content of a `.meta` sidecar file that was just read or written.
+
+        Args:
+            meta_file_path: the path of the metadata file
+            data: the content of the metadata file
+        """
+        key = self.__normalize(meta_file_path)
+        cached_at = time.time_ns()
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self.invalidate_metadata(meta_file_path)
+            return
+        with self.__lock:
+            self.__metadata[key] = (stat.st_size, stat.st_mtime_ns, cached_at, copy.deepcopy(data))
+
+    def invalidate_metadata(self, meta_file_path: str):
+        """
+        Forget the content of a `.meta` sidecar file.
+
+        Args:
+            meta_file_path: the path of the metadata file
+        """
+        with self.__lock:
+            self.__metadata.pop(self.__normalize(meta_file_path), None)
+
+    def clear(self):
+        """Forget every indexed hash and metadata file"""
+        with self.__lock:
+            self.__metadata.clear()
+            try:
+                with self.__connection:
+                    self.__connection.execute("DELETE FROM hashes")
+            except sqlite3.Error as e:
+                carb.log_warn(f"Unable to clear the file hash index: {e}")
+
+    def close(self):
+        """Close the database of the index"""
+        with self.__lock:
+            self.__connection.close()
+
+    @staticmethod
+    def __normalize(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    @staticmethod
+    def __is_stable(stat: os.stat_result, read_at_ns: int) -> bool:
+        return stat.st_mtime_ns < read_at_ns - _RACY_WINDOW_NS
+
+    @staticmethod
+    def __connect(database_path: str | None) -> sqlite3.Connection:
+        connection = None
+        if database_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+                connection = sqlite3.connect(database_path, timeout=5, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                HashIndex.__create_schema(connection)
+            except (OSError, sqlite3.Error) as e:
+                carb.log_warn(f"Unable to open the file hash index {database_path}, hashes won't be persisted: {e}")
+                if connection is not None:
+                    connection.close()
+                connection = None
+        if connection is None:
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            HashIndex.__create_schema(connection)
+        return connection
+
+    @staticmethod
+    def __create_schema(connection: sqlite3.Connection):
+        with connection:
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS hashes")
+                connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, algorithm TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "digest TEXT NOT NULL, PRIMARY KEY (path, algorithm)) WITHOUT ROWID"
+            )
+
+    def __lookup(self, key: str, algorithm: str, stat: os.stat_result) -> str | None:
+        with self.__lock:
+            try:
+                row = self.__connection.execute(
+                    "SELECT size, mtime_ns, digest FROM hashes WHERE path = ? AND algorithm = ?", (key, algorithm)
+                ).fetchone()
+            except sqlite3.Error as e:
+                carb.log_warn(f"Unable to read the file hash index: {e}")
+                return None
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        return row[2]
+
+    def __store(self, rows: list[tuple[str, str, int, int, str]]):
+        if not rows:
+            return
+        with self.__lock:
+            try:
+                with self.__connection:
+                    self.__connection.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)", rows)
+            except sqlite3.Error as e:
+                # The index is only a cache: the hashes are still returned to the caller
+                carb.log_warn(f"Unable to write the file hash index: {e}")
+
+
+def get_hash_index() -> HashIndex | None:
+    """
+    Get the file hash index shared by the current process.
+
+    Returns:
+        The shared index, or None if the index is disabled in the settings
+    """
+    global _INSTANCE
+    settings = carb.settings.get_settings()
+    if settings.get(EXTS_HASH_INDEX_ENABLED) is False:
+        return None
+    with _INSTANCE_LOCK:
+        if _INSTANCE is None:
+            database_path = settings.get(EXTS_HASH_INDEX_PATH)
+            if database_path:
+                database_path = carb.tokens.get_tokens_interface().resolve(database_path)
+            _INSTANCE = HashIndex(
+                database_path=database_path, max_workers=settings.get(EXTS_HASH_INDEX_MAX_WORKERS) or 8
+            )
+    return _INSTANCE
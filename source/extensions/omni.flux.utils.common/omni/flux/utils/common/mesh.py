@@ -0,0 +1,154 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "FanTriangulation",
+    "gather_elements",
+    "is_triangulated",
+    "remap_subset_faces",
+    "triangulate_fan",
+]
+
+import dataclasses
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from pxr import Vt
+
+
+@dataclasses.dataclass(frozen=True)
+class FanTriangulation:
+    """
+    The topology of a mesh once every face is split in a triangle fan.
+
+    Args:
+        face_vertex_counts: the vertex count of every triangle, always 3
+        face_vertex_indices: the point indices of every triangle
+        source_faces: the index of the original face of every triangle
+    """
+
+    face_vertex_counts: Vt.IntArray
+    face_vertex_indices: Vt.IntArray
+    source_faces: np.ndarray
+
+
+def is_triangulated(face_vertex_counts: Sequence[int]) -> bool:
+    """
+    Check if every face of a mesh has exactly 3 vertices.
+
+    Args:
+        face_vertex_counts: the `faceVertexCounts` of the mesh
+
+    Returns:
+        True if every face is a triangle, including when the mesh has no face
+    """
+    return bool(np.all(np.asarray(face_vertex_counts) == 3))
+
+
+def triangulate_fan(face_vertex_counts: Sequence[int], face_vertex_indices: Sequence[int]) -> FanTriangulation:
+    """
+    Split every face of a mesh in a triangle fan around its first vertex.
+
+    Face N with K vertices becomes the K - 2 triangles (v0, v1, v2), (v0, v2, v3)... in order, so the result is only valid
+    for triangles, quads and convex polygons. Faces with less than 3 vertices are dropped.
+
+    Args:
+        face_vertex_counts: the `faceVertexCounts` of the mesh
+        face_vertex_indices: the `faceVertexIndices` of the mesh
+
+    Returns:
+        The triangulated topology and the original face of every triangle
+
+    Raises:
+        IndexError: if the face vertex counts reference more indices than the mesh has
+    """
+    counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    indices = np.asarray(face_vertex_indices, dtype=np.int32)
+    if np.sum(counts) > indices.size:
+        raise IndexError("The face vertex counts reference more face vertex indices than the mesh has")
+
+    triangle_counts = np.maximum(counts - 2, 0)
+    source_faces = np.repeat(np.arange(counts.size), triangle_counts)
+    # The position of every triangle in its fan, and the offset of the first vertex of its face
+    fan_offsets = np.arange(source_faces.size) - np.repeat(
+        np.cumsum(triangle_counts) - triangle_counts, triangle_counts
+    )
+    face_starts = (np.cumsum(counts) - counts)[source_faces]
+
+    triangles = np.empty((source_faces.size, 3), dtype=np.int32)
+    triangles[:, 0] = indices[face_starts]
+    triangles[:, 1] = indices[face_starts + fan_offsets + 1]
+    triangles[:, 2] = indices[face_starts + fan_offsets + 2]
+    return FanTriangulation(
+        face_vertex_counts=Vt.IntArray.FromNumpy(np.full(source_faces.size, 3, dtype=np.int32)),
+        face_vertex_indices=Vt.IntArray.FromNumpy(triangles.ravel()),
+        source_faces=source_faces,
+    )
+
+
+def remap_subset_faces(subset_faces: Sequence[int], source_faces: np.ndarray, face_count: int) -> Vt.IntArray:
+    """
+    Get the faces of a GeomSubset once the faces of its mesh are split.
+
+    Args:
+        subset_faces: the face indices of the subset before the split
+        source_faces: the original face of every new face, see `FanTriangulation.source_faces`
+        face_count: the number of faces before the split
+
+    Returns:
+        The sorted indices of the new faces split from a face of the subset. Indices outside of the mesh are ignored.
+    """
+    faces = np.asarray(subset_faces, dtype=np.int64)
+    faces = faces[(faces >= 0) & (faces < face_count)]
+    in_subset = np.zeros(face_count, dtype=bool)
+    in_subset[faces] = True
+    return Vt.IntArray.FromNumpy(np.flatnonzero(in_subset[source_faces]).astype(np.int32))
+
+
+def gather_elements(values: Any, indices: Sequence[int], element_size: int = 1) -> Any:
+    """
+    Gather the elements of an array, for instance to expand per-vertex data to one value per face vertex.
+
+    Element `i` of `values` is made of the `element_size` consecutive values starting at `i * element_size`, so the result
+    holds `len(indices) * element_size` values.
+
+    Args:
+        values: a `Vt` array, or a sequence of values
+        indices: the index of the element to gather at every position
+        element_size: the number of values per element
+
+    Returns:
+        The gathered values, as an array of the same `Vt` type when `values` is a `Vt` array
+
+    Raises:
+        IndexError: if an index references an element outside of `values`
+    """
+    element_indices = np.asarray(indices, dtype=np.int64)
+    if element_size != 1:
+        element_indices = (element_indices[:, None] * element_size + np.arange(element_size)).ravel()
+    if element_indices.size and (element_indices.min() < 0 or element_indices.max() >= len(values)):
+        raise IndexError("An index references an element outside of the values")
+
+    array_type = type(values)
+    if hasattr(array_type, "FromNumpy"):
+        # Numeric Vt arrays can be viewed as NumPy buffers
+        return array_type.FromNumpy(np.asarray(values)[element_indices])
+    gathered = [values[index] for index in element_indices.tolist()]
+    return gathered if isinstance(values, (list, tuple)) else array_type(gathered)
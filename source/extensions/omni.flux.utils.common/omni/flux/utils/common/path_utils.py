@@ -26,7 +26,9 @@ __all__ = [
     "get_invalid_extensions",
     "get_new_hash",
     "get_udim_sequence",
+    "hash_directory",
     "hash_file",
+    "hash_files",
     "hash_match_metadata",
     "is_absolute_path",
     "is_file_path_valid",
@@ -39,9 +41,9 @@ __all__ = [
     "write_file",
     "write_json_file",
     "write_metadata",
+    "write_metadata_values",
 ]
 
-import hashlib
 import json
 import ntpath
 import os
@@ -57,6 +59,9 @@ from enum import Enum, auto
 import carb
 import carb.tokens
 import omni.client
+from omni.flux.utils.common.hash_index import DEFAULT_HASH_ALGORITHM as _DEFAULT_HASH_ALGORITHM
+from omni.flux.utils.common.hash_index import compute_file_hash as _compute_file_hash
+from omni.flux.utils.common.hash_index import get_hash_index as _get_hash_index
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 
 if TYPE_CHECKING:
@@ -244,34 +249,119 @@ def hash_match_metadata(file_path: str, key: str = "src_hash") -> bool | None:
     return not (old_src_hash is None or src_hash != old_src_hash)
 
 
-def hash_file(file_path: str, block_size: int = 8192) -> str | None:
+def hash_file(file_path: str, block_size: int = 1024 * 1024, algorithm: str = _DEFAULT_HASH_ALGORITHM) -> str | None:
     """
     Generate a hash from the data in a file.
 
+    The hash is read from the file hash index when the file didn't change since it was last hashed.
+
     Args:
         file_path: the json file path
-        block_size: block size to read the file
+        block_size: block size to read the file when the index is disabled
+        algorithm: the name of the `hashlib` algorithm to use
 
     Returns:
-        string containing the md5 hexdigest of the passed in file's contents
+        string containing the hexdigest of the passed in file's contents
     """
     file_path = carb.tokens.get_tokens_interface().resolve(file_path)
     new_hash = None
     try:
-        m = hashlib.md5()
-        with open(file_path, "rb") as asset_file:
-            while True:
-                buf = asset_file.read(block_size)
-                if not buf:
-                    break
-                m.update(buf)
-        new_hash = m.hexdigest()
-
+        index = _get_hash_index()
+        if index is not None:
+            new_hash = index.hash_file(file_path, algorithm=algorithm)
+        else:
+            new_hash = _compute_file_hash(file_path, algorithm=algorithm, block_size=block_size)
     except OSError:
         carb.log_error(f"Error opening asset file for hashing: {file_path}.")
     return new_hash
 
 
+def hash_files(file_paths: list[str], algorithm: str = _DEFAULT_HASH_ALGORITHM) -> dict[str, str | None]:
+    """
+    Generate the hashes of several files. The files are hashed in parallel.
+
+    Args:
+        file_paths: the file paths to hash
+        algorithm: the name of the `hashlib` algorithm to use
+
+    Returns:
+        The hexdigest of every given path, or None for the files that can't be read
+    """
+    tokens = carb.tokens.get_tokens_interface()
+    resolved_paths = {file_path: tokens.resolve(file_path) for file_path in file_paths}
+    index = _get_hash_index()
+    if index is not None:
+        hashes = index.hash_files(resolved_paths.values(), algorithm=algorithm)
+    else:
+        hashes = {}
+        for resolved_path in resolved_paths.values():
+            try:
+                hashes[resolved_path] = _compute_file_hash(resolved_path, algorithm=algorithm)
+            except OSError:
+                hashes[resolved_path] = None
+    return {file_path: hashes[resolved_path] for file_path, resolved_path in resolved_paths.items()}
+
+
+def hash_directory(
+    directory: str, recursive: bool = True, algorithm: str = _DEFAULT_HASH_ALGORITHM
+) -> dict[str, str | None]:
+    """
+    Generate the hashes of every file in a directory. The files are hashed in parallel.
+
+    Metadata files are skipped.
+
+    Args:
+        directory: the directory to hash
+        recursive: whether the files of the sub-directories should be hashed
+        algorithm: the name of the `hashlib` algorithm to use
+
+    Returns:
+        The hexdigest of every file, or None for the files that can't be read
+    """
+    directory = carb.tokens.get_tokens_interface().resolve(directory)
+    file_paths = []
+    directories = [directory]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            directories.append(entry.path)
+                    elif entry.is_file() and not entry.name.endswith(".meta"):
+                        file_paths.append(entry.path)
+        except OSError:
+            carb.log_error(f"Error listing directory for hashing: {directory}.")
+    return hash_files(file_paths, algorithm=algorithm)
+
+
+def _get_meta_file_path(file_path: str) -> Path:
+    resolved_path = Path(carb.tokens.get_tokens_interface().resolve(file_path))
+    return resolved_path.with_suffix(resolved_path.suffix + ".meta")
+
+
+def _load_metadata(meta_file_path: Path) -> dict[str, Any] | None:
+    index = _get_hash_index()
+    if index is not None:
+        data = index.get_metadata(str(meta_file_path))
+        if data is not None:
+            return data
+    if not meta_file_path.exists():
+        return None
+    data = read_json_file(str(meta_file_path))
+    if index is not None:
+        index.set_metadata(str(meta_file_path), data)
+    return data
+
+
+def _save_metadata(meta_file_path: Path, data: dict[str, Any]):
+    index = _get_hash_index()
+    if index is not None:
+        index.invalidate_metadata(str(meta_file_path))
+    if write_json_file(str(meta_file_path), data) and index is not None:
+        index.set_metadata(str(meta_file_path), data)
+
+
 def delete_metadata(file_path: str, key: str):
     """
     Delete a specific metadata key from a file
@@ -283,13 +373,11 @@ def delete_metadata(file_path: str, key: str):
     Returns:
         None
     """
-    resolved_path = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    meta_file_path = resolved_path.with_suffix(resolved_path.suffix + ".meta")
-    if meta_file_path.exists():
-        data = read_json_file(str(meta_file_path))
-        if key in data:
-            del data[key]
-            write_json_file(str(meta_file_path), data)
+    meta_file_path = _get_meta_file_path(file_path)
+    data = _load_metadata(meta_file_path)
+    if data is not None and key in data:
+        del data[key]
+        _save_metadata(meta_file_path, data)
 
 
 def write_metadata(file_path: str, key: str, value: Any, append: bool = False):
@@ -305,10 +393,9 @@ def write_metadata(file_path: str, key: str, value: Any, append: bool = False):
     Returns:
         None
     """
-    resolved_path = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    meta_file_path = resolved_path.with_suffix(resolved_path.suffix + ".meta")
-    if meta_file_path.exists():
-        data = read_json_file(str(meta_file_path))
+    meta_file_path = _get_meta_file_path(file_path)
+    data = _load_metadata(meta_file_path)
+    if data is not None:
         if append:
             if key in data:
                 if isinstance(data[key], list):
@@ -319,9 +406,25 @@ def write_metadata(file_path: str, key: str, value: Any, append: bool = False):
                 data[key] = [value]
         else:
             data[key] = value
-        write_json_file(str(meta_file_path), data)
+        _save_metadata(meta_file_path, data)
     else:
-        write_json_file(str(meta_file_path), {key: [value]} if append else {key: value})
+        _save_metadata(meta_file_path, {key: [value]} if append else {key: value})
+
+
+def write_metadata_values(file_path: str, values: dict[str, Any]):
+    """
+    Write several metadata keys for a file with a single write of the metadata file
+
+    Args:
+        file_path: the file path to write the metadata for (not the metadata file)
+        values: the values to write, overwriting the existing values of the same keys
+
+    Returns:
+        None
+    """
+    meta_file_path = _get_meta_file_path(file_path)
+    data = _load_metadata(meta_file_path)
+    _save_metadata(meta_file_path, {**data, **values} if data is not None else dict(values))
 
 
 def read_metadata(file_path: str, key: str) -> Any | None:
@@ -335,12 +438,9 @@ def read_metadata(file_path: str, key: str) -> Any | None:
     Returns:
         The value of the key
     """
-    resolved_path = Path(carb.tokens.get_tokens_interface().resolve(file_path))
-    meta_file_path = resolved_path.with_suffix(resolved_path.suffix + ".meta")
-    if meta_file_path.exists():
-        data = read_json_file(str(meta_file_path))
-        if key in data:
-            return data[key]
+    data = _load_metadata(_get_meta_file_path(file_path))
+    if data is not None and key in data:
+        return data[key]
     return None
 
 
@@ -360,6 +460,9 @@ def cleanup_file(file_path: _OmniUrl | Path | str):
     # Cleanup the meta file if it exists
     if meta_file_url.exists:
         meta_file_url.delete()
+    index = _get_hash_index()
+    if index is not None:
+        index.invalidate_metadata(str(meta_file_url))
 
 
 def is_udim_texture(file_path: _OmniUrl | Path | str) -> bool:
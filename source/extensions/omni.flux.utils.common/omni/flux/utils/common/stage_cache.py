@@ -0,0 +1,97 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["StageCache", "StageCacheRegistry"]
+
+import abc
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from pxr import Tf, Usd
+
+T = TypeVar("T", bound="StageCache")
+
+
+class StageCache(abc.ABC):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Base class of the caches computed from the content of one stage.
+
+        The cache listens to the changes of the stage so it can drop what they affect. Use a `StageCacheRegistry` to
+        share one cache between every tool working on a stage.
+
+        Args:
+            stage: the stage to cache. The cache doesn't keep the stage alive.
+        """
+        self._stage = weakref.ref(stage)
+        # Bound methods are only weakly held by the listener: it is revoked when the cache is deleted
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @abc.abstractmethod
+    def invalidate(self):
+        """Drop everything cached for the stage"""
+
+    @abc.abstractmethod
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage):
+        """
+        Called when objects of the stage change.
+
+        Args:
+            notice: the changes of the stage
+            sender: the stage
+        """
+
+
+class StageCacheRegistry(Generic[T]):
+    def __init__(self, factory: Callable[[Usd.Stage], T]):
+        """
+        Hold one cache per stage, created on first use.
+
+        The registry doesn't keep the stages alive: a cache is deleted, and stops listening to changes, with its stage.
+
+        Args:
+            factory: create the cache of a stage
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._caches: weakref.WeakKeyDictionary[Usd.Stage, T] = weakref.WeakKeyDictionary()
+
+    def get(self, stage: Usd.Stage) -> T:
+        """
+        Get the cache of a stage, creating it on first use.
+
+        Args:
+            stage: the stage to get the cache of
+
+        Returns:
+            The cache shared by every caller working on the stage
+        """
+        with self._lock:
+            cache = self._caches.get(stage)
+            if cache is None:
+                cache = self._factory(stage)
+                self._caches[stage] = cache
+            return cache
+
+    def clear(self):
+        """Delete the cache of every stage"""
+        with self._lock:
+            self._caches.clear()
@@ -17,10 +17,12 @@
 
 from .unit.test_decorators import TestLimitRecursion
 from .unit.test_event import TestEvent
+from .unit.test_hash_index import TestHashIndex
 from .unit.test_icons import TestIcons
 from .unit.test_interactive_usd_notices import TestInteractiveUsdNoticeService
 from .unit.test_layer_utils import TestLayerUtils
 from .unit.test_lights import TestLights
+from .unit.test_mesh import TestMesh
 from .unit.test_mouse import TestGetMousePosition, TestIsPointInsideWidget
 from .unit.test_omni_url import TestOmniUrl
 from .unit.test_os_drop_router import TestWidgetDropRouter
@@ -28,6 +30,7 @@ from .unit.test_path_utils import TestPathUtils
 from .unit.test_prims import TestPrims
 from .unit.test_progress import TestProgressWorker
 from .unit.test_serialize import TestSerializer
+from .unit.test_stage_cache import TestStageCache
 from .unit.test_symlink import TestSymlink
 from .unit.test_task_budget import TestAdaptiveTaskBudget
 from .unit.test_version import TestVersion
@@ -36,17 +39,20 @@ __all__ = [
     "TestAdaptiveTaskBudget",
     "TestEvent",
     "TestGetMousePosition",
+    "TestHashIndex",
     "TestIcons",
     "TestInteractiveUsdNoticeService",
     "TestIsPointInsideWidget",
     "TestLayerUtils",
     "TestLights",
     "TestLimitRecursion",
+    "TestMesh",
     "TestOmniUrl",
     "TestPathUtils",
     "TestPrims",
     "TestProgressWorker",
     "TestSerializer",
+    "TestStageCache",
     "TestSymlink",
     "TestVersion",
     "TestWidgetDropRouter",
@@ -0,0 +1,164 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common import hash_index as _hash_index
+
+
+class TestHashIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, data: bytes, age_seconds: float = 60) -> str:
+        path = self.root / name
+        path.write_bytes(data)
+        # Files modified right before being hashed are not indexed, so age them
+        mtime = time.time() - age_seconds
+        os.utime(path, (mtime, mtime))
+        return str(path)
+
+    async def test_hash_file_unchanged_file_hashed_once_across_instances(self):
+        # Arrange
+        file_path = self._write("texture.png", b"123456789")
+        database_path = str(self.root / "index" / "hashes.sqlite")
+
+        # Act
+        with patch.object(_hash_index, "compute_file_hash", wraps=_hash_index.compute_file_hash) as compute_mock:
+            first_index = _hash_index.HashIndex(database_path)
+            first = first_index.hash_file(file_path)
+            second = first_index.hash_file(file_path)
+            first_index.close()
+            second_index = _hash_index.HashIndex(database_path)
+            third = second_index.hash_file(file_path)
+            second_index.close()
+
+        # Assert
+        self.assertEqual(compute_mock.call_count, 1)
+        self.assertEqual({first, second, third}, {"25f9e794323b453885f5181f1b624d0b"})
+
+    async def test_hash_file_modified_file_hashed_again(self):
+        # Arrange
+        index = _hash_index.HashIndex()
+        file_path = self._write("texture.png", b"123456789", age_seconds=120)
+        index.hash_file(file_path)
+        self._write("texture.png", b"987654321", age_seconds=60)
+
+        # Act
+        result = index.hash_file(file_path)
+
+        # Assert
+        self.assertEqual(result, hashlib.md5(b"987654321").hexdigest())
+
+    async def test_hash_file_recently_modified_file_not_indexed(self):
+        # Arrange
+        index = _hash_index.HashIndex()
+        file_path = self._write("texture.png", b"123456789", age_seconds=0)
+
+        # Act
+        with patch.object(_hash_index, "compute_file_hash", wraps=_hash_index.compute_file_hash) as compute_mock:
+            index.hash_file(file_path)
+            index.hash_file(file_path)
+
+        # Assert
+        self.assertEqual(compute_mock.call_count, 2)
+
+    async def test_hash_file_algorithm_indexed_separately(self):
+        # Arrange
+        index = _hash_index.HashIndex()
+        file_path = self._write("texture.png", b"123456789")
+        index.hash_file(file_path)
+
+        # Act
+        result = index.hash_file(file_path, algorithm="blake2b")
+
+        # Assert
+        self.assertEqual(result, hashlib.blake2b(b"123456789").hexdigest())
+
+    async def test_hash_files_hashes_changed_files_and_skips_missing_ones(self):
+        # Arrange
+        index = _hash_index.HashIndex(max_workers=4)
+        cached_path = self._write("cached.png", b"cached")
+        index.hash_file(cached_path)
+        new_paths = [self._write(f"new_{i}.png", str(i).encode()) for i in range(5)]
+        missing_path = str(self.root / "missing.png")
+
+        # Act
+        with patch.object(_hash_index, "compute_file_hash", wraps=_hash_index.compute_file_hash) as compute_mock:
+            results = index.hash_files([cached_path, *new_paths, missing_path])
+
+        # Assert
+        self.assertEqual(compute_mock.call_count, 5)
+        self.assertEqual(results[cached_path], hashlib.md5(b"cached").hexdigest())
+        for i, new_path in enumerate(new_paths):
+            self.assertEqual(results[new_path], hashlib.md5(str(i).encode()).hexdigest())
+        self.assertIsNone(results[missing_path])
+
+    async def test_compute_file_hash_memory_mapped_and_empty_files(self):
+        # Arrange
+        large_path = self._write("large.dds", os.urandom(4096))
+        empty_path = self._write("empty.dds", b"")
+
+        # Act
+        with patch.object(_hash_index, "_MMAP_THRESHOLD", 1024):
+            large = _hash_index.compute_file_hash(large_path)
+        empty = _hash_index.compute_file_hash(empty_path)
+
+        # Assert
+        self.assertEqual(large, hashlib.md5(Path(large_path).read_bytes()).hexdigest())
+        self.assertEqual(empty, hashlib.md5(b"").hexdigest())
+
+    async def test_get_metadata_returns_copy_until_file_changes(self):
+        # Arrange
+        index = _hash_index.HashIndex()
+        meta_path = self._write("texture.png.meta", b'{"src_hash": "a"}', age_seconds=120)
+        index.set_metadata(meta_path, {"src_hash": "a"})
+
+        # Act
+        cached = index.get_metadata(meta_path)
+        cached["src_hash"] = "b"
+        cached_again = index.get_metadata(meta_path)
+        self._write("texture.png.meta", b'{"src_hash": "b"}', age_seconds=60)
+        changed = index.get_metadata(meta_path)
+
+        # Assert
+        self.assertEqual(cached_again, {"src_hash": "a"})
+        self.assertIsNone(changed)
+
+    async def test_init_database_cant_be_opened_falls_back_to_memory(self):
+        # Arrange
+        file_path = self._write("texture.png", b"123456789")
+        database_path = str(self.root / "texture.png" / "hashes.sqlite")
+
+        # Act
+        with patch.object(_hash_index.carb, "log_warn") as log_warn_mock:
+            index = _hash_index.HashIndex(database_path)
+        result = index.hash_file(file_path)
+
+        # Assert
+        log_warn_mock.assert_called_once()
+        self.assertEqual(result, "25f9e794323b453885f5181f1b624d0b")
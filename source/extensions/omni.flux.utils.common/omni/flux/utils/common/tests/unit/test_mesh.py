@@ -0,0 +1,164 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import numpy as np
+import omni.kit.test
+from omni.flux.utils.common import mesh as _mesh
+from pxr import Gf, Vt
+
+_BENCHMARK_TRIANGLE_COUNT = 2_000_000
+
+
+def _reference_triangulation(face_counts, indices, subset_faces):
+    """The per-face fan triangulation the kernels replace"""
+    offset = 0
+    triangles = []
+    new_subset_faces = []
+    triangle_count = 0
+    for face_index, face_count in enumerate(face_counts):
+        for fan_index in range(face_count - 2):
+            if face_index in subset_faces:
+                new_subset_faces.append(triangle_count)
+            triangles.extend([indices[offset], indices[offset + fan_index + 1], indices[offset + fan_index + 2]])
+            triangle_count += 1
+        offset += face_count
+    return triangles, new_subset_faces
+
+
+def _random_mesh(face_count: int, seed: int = 0):
+    generator = np.random.default_rng(seed)
+    face_counts = generator.integers(3, 7, size=face_count).astype(np.int32)
+    indices = generator.integers(0, face_count, size=int(face_counts.sum())).astype(np.int32)
+    return Vt.IntArray.FromNumpy(face_counts), Vt.IntArray.FromNumpy(indices)
+
+
+class TestMesh(omni.kit.test.AsyncTestCase):
+    async def test_is_triangulated(self):
+        # Arrange
+        triangles = Vt.IntArray([3, 3, 3])
+        mixed = Vt.IntArray([3, 4, 3])
+
+        # Act
+        results = (_mesh.is_triangulated(triangles), _mesh.is_triangulated(mixed), _mesh.is_triangulated([]))
+
+        # Assert
+        self.assertEqual((True, False, True), results)
+
+    async def test_triangulate_fan_matches_per_face_triangulation(self):
+        # Arrange
+        face_counts, indices = _random_mesh(500)
+        subset_faces = [0, 3, 4, 250, 499]
+        expected_triangles, expected_subset_faces = _reference_triangulation(face_counts, indices, subset_faces)
+
+        # Act
+        triangulation = _mesh.triangulate_fan(face_counts, indices)
+        new_subset_faces = _mesh.remap_subset_faces(subset_faces, triangulation.source_faces, len(face_counts))
+
+        # Assert
+        self.assertIsInstance(triangulation.face_vertex_indices, Vt.IntArray)
+        self.assertEqual(expected_triangles, list(triangulation.face_vertex_indices))
+        self.assertEqual([3] * (len(expected_triangles) // 3), list(triangulation.face_vertex_counts))
+        self.assertEqual(expected_subset_faces, list(new_subset_faces))
+
+    async def test_triangulate_fan_drops_degenerate_faces(self):
+        # Arrange
+        face_counts = Vt.IntArray([4, 2, 3])
+        indices = Vt.IntArray([0, 1, 2, 3, 4, 5, 6, 7, 8])
+
+        # Act
+        triangulation = _mesh.triangulate_fan(face_counts, indices)
+
+        # Assert
+        self.assertEqual([0, 1, 2, 0, 2, 3, 6, 7, 8], list(triangulation.face_vertex_indices))
+        self.assertEqual([0, 0, 2], triangulation.source_faces.tolist())
+
+    async def test_triangulate_fan_missing_indices_raises(self):
+        # Act / Assert
+        with self.assertRaises(IndexError):
+            _mesh.triangulate_fan(Vt.IntArray([4]), Vt.IntArray([0, 1, 2]))
+
+    async def test_remap_subset_faces_ignores_faces_outside_of_the_mesh(self):
+        # Arrange
+        triangulation = _mesh.triangulate_fan(Vt.IntArray([4, 3]), Vt.IntArray([0, 1, 2, 3, 4, 5, 6]))
+
+        # Act
+        new_faces = _mesh.remap_subset_faces(Vt.IntArray([1, 2, -1]), triangulation.source_faces, 2)
+
+        # Assert
+        self.assertEqual([2], list(new_faces))
+
+    async def test_gather_elements_keeps_vt_array_types(self):
+        # Arrange
+        points = Vt.Vec3fArray([Gf.Vec3f(0, 0, 0), Gf.Vec3f(1, 0, 0), Gf.Vec3f(0, 1, 0)])
+        indices = Vt.IntArray([2, 0, 2])
+
+        # Act
+        gathered = _mesh.gather_elements(points, indices)
+
+        # Assert
+        self.assertIsInstance(gathered, Vt.Vec3fArray)
+        self.assertEqual([points[2], points[0], points[2]], list(gathered))
+
+    async def test_gather_elements_expands_element_sizes(self):
+        # Arrange
+        values = Vt.FloatArray([0.0, 0.5, 1.0, 1.5, 2.0, 2.5])
+
+        # Act
+        gathered = _mesh.gather_elements(values, [2, 0], element_size=2)
+
+        # Assert
+        self.assertEqual([2.0, 2.5, 0.0, 0.5], list(gathered))
+
+    async def test_gather_elements_non_numeric_arrays(self):
+        # Arrange
+        values = Vt.StringArray(["a", "b", "c"])
+
+        # Act
+        gathered = _mesh.gather_elements(values, [1, 1, 2])
+
+        # Assert
+        self.assertIsInstance(gathered, Vt.StringArray)
+        self.assertEqual(["b", "b", "c"], list(gathered))
+
+    async def test_gather_elements_out_of_range_raises(self):
+        # Act / Assert
+        with self.assertRaises(IndexError):
+            _mesh.gather_elements(Vt.FloatArray([0.0, 1.0]), [0, 2])
+
+    async def test_large_mesh_kernels_benchmark(self):
+        # Arrange
+        quad_count = _BENCHMARK_TRIANGLE_COUNT // 2
+        face_counts = Vt.IntArray.FromNumpy(np.full(quad_count, 4, dtype=np.int32))
+        indices = Vt.IntArray.FromNumpy(np.arange(quad_count * 4, dtype=np.int32))
+        subset_faces = Vt.IntArray.FromNumpy(np.arange(0, quad_count, 2, dtype=np.int32))
+        points = Vt.Vec3fArray.FromNumpy(np.random.default_rng(0).random((quad_count * 4, 3), dtype=np.float32))
+
+        # Act
+        start = time.perf_counter()
+        triangulation = _mesh.triangulate_fan(face_counts, indices)
+        new_subset_faces = _mesh.remap_subset_faces(subset_faces, triangulation.source_faces, quad_count)
+        expanded_points = _mesh.gather_elements(points, triangulation.face_vertex_indices)
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        self.assertEqual(_BENCHMARK_TRIANGLE_COUNT, len(triangulation.face_vertex_counts))
+        self.assertEqual(_BENCHMARK_TRIANGLE_COUNT // 2, len(new_subset_faces))
+        self.assertEqual(_BENCHMARK_TRIANGLE_COUNT * 3, len(expanded_points))
+        carb.log_info(f"Triangulated, remapped and expanded {_BENCHMARK_TRIANGLE_COUNT} triangles in {elapsed:.2f}s")
@@ -170,6 +170,15 @@ class TestPathUtils(omni.kit.test.AsyncTestCase):
             self.assertEqual(_path_utils.read_metadata(str(tmpfile.name), key), value)
             self.assertEqual(_path_utils.read_metadata(str(tmpfile.name), key2), value2)
 
+    async def test_write_metadata_values(self):
+        with tempfile.NamedTemporaryFile("w") as tmpfile:
+            _path_utils.write_metadata(str(tmpfile.name), "kept", "value")
+
+            _path_utils.write_metadata_values(str(tmpfile.name), {"kept": "new_value", "added": ["a", "b"]})
+
+            self.assertEqual(_path_utils.read_metadata(str(tmpfile.name), "kept"), "new_value")
+            self.assertEqual(_path_utils.read_metadata(str(tmpfile.name), "added"), ["a", "b"])
+
     async def test_hash_file_exist(self):
         with tempfile.NamedTemporaryFile("w", delete=False) as tmp_file:
             tmp_file_name = tmp_file.name
@@ -0,0 +1,97 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import gc
+import weakref
+
+import omni.kit.test
+from omni.flux.utils.common.stage_cache import StageCache, StageCacheRegistry
+from pxr import Usd
+
+
+class _PrimCountCache(StageCache):
+    def __init__(self, stage: Usd.Stage):
+        super().__init__(stage)
+        self.prim_count = None
+        self.notice_count = 0
+
+    def get_prim_count(self) -> int:
+        if self.prim_count is None:
+            self.prim_count = len(list(self._stage().TraverseAll()))
+        return self.prim_count
+
+    def invalidate(self):
+        self.prim_count = None
+
+    def _on_objects_changed(self, notice, sender):
+        self.notice_count += 1
+        self.invalidate()
+
+
+class TestStageCache(omni.kit.test.AsyncTestCase):
+    async def test_get_returns_one_cache_per_stage(self):
+        # Arrange
+        registry = StageCacheRegistry(_PrimCountCache)
+        first_stage = Usd.Stage.CreateInMemory()
+        second_stage = Usd.Stage.CreateInMemory()
+
+        # Act
+        first_cache = registry.get(first_stage)
+        second_cache = registry.get(second_stage)
+
+        # Assert
+        self.assertIs(first_cache, registry.get(first_stage))
+        self.assertIsNot(first_cache, second_cache)
+
+    async def test_cache_is_notified_of_stage_changes(self):
+        # Arrange
+        registry = StageCacheRegistry(_PrimCountCache)
+        stage = Usd.Stage.CreateInMemory()
+        cache = registry.get(stage)
+        self.assertEqual(cache.get_prim_count(), 0)
+
+        # Act
+        stage.DefinePrim("/World")
+
+        # Assert
+        self.assertEqual(cache.notice_count, 1)
+        self.assertEqual(cache.get_prim_count(), 1)
+
+    async def test_cache_is_deleted_with_its_stage(self):
+        # Arrange
+        registry = StageCacheRegistry(_PrimCountCache)
+        stage = Usd.Stage.CreateInMemory()
+        cache = weakref.ref(registry.get(stage))
+
+        # Act
+        del stage
+        gc.collect()
+
+        # Assert
+        self.assertIsNone(cache())
+
+    async def test_clear_deletes_the_caches(self):
+        # Arrange
+        registry = StageCacheRegistry(_PrimCountCache)
+        stage = Usd.Stage.CreateInMemory()
+        cache = registry.get(stage)
+
+        # Act
+        registry.clear()
+
+        # Assert
+        self.assertIsNot(cache, registry.get(stage))
@@ -16,6 +16,7 @@
 """
 
 __all__ = [
+    "MaterialConversionResult",
     "MaterialConverterCore",
     "NoneToAperturePBRConverterBuilder",
     "OmniGlassToAperturePBRConverterBuilder",
@@ -23,7 +24,7 @@ __all__ = [
     "USDPreviewSurfaceToAperturePBRConverterBuilder",
 ]
 
-from .core import MaterialConverterCore
+from .core import MaterialConversionResult, MaterialConverterCore
 from .impl.none_to_aperture_pbr import NoneToAperturePBRConverterBuilder
 from .impl.omni_glass_to_aperture_pbr import OmniGlassToAperturePBRConverterBuilder
 from .impl.omni_pbr_to_aperture_pbr import OmniPBRToAperturePBRConverterBuilder
@@ -0,0 +1,145 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["MaterialSpecReplacement", "ReplaceMaterialSpecsCommand"]
+
+import dataclasses
+import time
+from typing import Any
+
+import omni.kit.commands
+from pxr import Sdf
+
+_MDL_TERMINALS = ("surface", "displacement", "volume")
+_SHADER_OUTPUT_NAME = "outputs:out"
+
+
+@dataclasses.dataclass(frozen=True)
+class MaterialSpecReplacement:
+    """
+    The converted specs of one material, ready to be written on a layer.
+
+    Args:
+        material_path: the path of the material to replace
+        shader_name: the name of the material shader
+        is_definition: whether the material is defined with a new MDL shader or only overridden
+        mdl_subidentifier: the MDL sub-identifier of the shader of a definition
+        inputs: the name, type and value of every shader input to author
+    """
+
+    material_path: Sdf.Path
+    shader_name: str
+    is_definition: bool
+    mdl_subidentifier: str | None = None
+    inputs: tuple[tuple[str, Sdf.ValueTypeName, Any], ...] = ()
+
+
+class ReplaceMaterialSpecsCommand(omni.kit.commands.Command):
+    """Replace the specs of many materials on one layer in a single change block, as one undo entry."""
+
+    def __init__(self, layer_identifier: str, replacements: list[MaterialSpecReplacement], **_kwargs):
+        """
+        Args:
+            layer_identifier: the identifier of the layer holding the materials
+            replacements: the converted specs of every material
+        """
+        self._layer_identifier = layer_identifier
+        self._replacements = list(replacements)
+        self._backup_layer = None
+
+    def do(self) -> dict[Sdf.Path, float]:
+        """
+        Returns:
+            The time spent writing the specs of every material, in seconds
+        """
+        layer = Sdf.Layer.FindOrOpen(self._layer_identifier)
+        self._backup_layer = Sdf.Layer.CreateAnonymous()
+        durations = {}
+        with Sdf.ChangeBlock():
+            for replacement in self._replacements:
+                start = time.perf_counter()
+                self._move_spec(layer, self._backup_layer, replacement.material_path)
+                self._write_replacement(layer, replacement)
+                durations[replacement.material_path] = time.perf_counter() - start
+        return durations
+
+    def undo(self):
+        layer = Sdf.Layer.FindOrOpen(self._layer_identifier)
+        with Sdf.ChangeBlock():
+            for replacement in reversed(self._replacements):
+                self._remove_spec(layer, replacement.material_path)
+                if self._backup_layer.GetPrimAtPath(replacement.material_path):
+                    Sdf.CopySpec(self._backup_layer, replacement.material_path, layer, replacement.material_path)
+        self._backup_layer = None
+
+    @staticmethod
+    def _move_spec(layer: Sdf.Layer, backup_layer: Sdf.Layer, path: Sdf.Path):
+        if not layer.GetPrimAtPath(path):
+            return
+        Sdf.CreatePrimInLayer(backup_layer, path)
+        Sdf.CopySpec(layer, path, backup_layer, path)
+        ReplaceMaterialSpecsCommand._remove_spec(layer, path)
+
+    @staticmethod
+    def _remove_spec(layer: Sdf.Layer, path: Sdf.Path):
+        parent_spec = layer.GetPrimAtPath(path.GetParentPath())
+        if parent_spec and path.name in parent_spec.nameChildren:
+            del parent_spec.nameChildren[path.name]
+
+    @staticmethod
+    def _write_replacement(layer: Sdf.Layer, replacement: MaterialSpecReplacement):
+        parent_path = replacement.material_path.GetParentPath()
+        specifier = Sdf.SpecifierDef if replacement.is_definition else Sdf.SpecifierOver
+        material_spec = Sdf.PrimSpec(
+            layer if parent_path.IsAbsoluteRootPath() else Sdf.CreatePrimInLayer(layer, parent_path),
+            replacement.material_path.name,
+            specifier,
+            "Material",
+        )
+        shader_spec = Sdf.PrimSpec(material_spec, replacement.shader_name, specifier, "Shader")
+
+        if replacement.is_definition:
+            # The same specs as the `CreateMdlMaterialPrim` command
+            for name, value_type, value in (
+                ("info:implementationSource", Sdf.ValueTypeNames.Token, "sourceAsset"),
+                (
+                    "info:mdl:sourceAsset",
+                    Sdf.ValueTypeNames.Asset,
+                    Sdf.AssetPath(f"{replacement.mdl_subidentifier}.mdl"),
+                ),
+                ("info:mdl:sourceAsset:subIdentifier", Sdf.ValueTypeNames.Token, replacement.mdl_subidentifier),
+            ):
+                attr_spec = Sdf.AttributeSpec(shader_spec, name, value_type, Sdf.VariabilityUniform)
+                attr_spec.default = value
+            output_spec = Sdf.AttributeSpec(shader_spec, _SHADER_OUTPUT_NAME, Sdf.ValueTypeNames.Token)
+            output_spec.SetInfo("renderType", "material")
+            for terminal in _MDL_TERMINALS:
+                terminal_spec = Sdf.AttributeSpec(material_spec, f"outputs:mdl:{terminal}", Sdf.ValueTypeNames.Token)
+                terminal_spec.connectionPathList.explicitItems = [shader_spec.path.AppendProperty(_SHADER_OUTPUT_NAME)]
+
+        for name, value_type, value in replacement.inputs:
+            # When several inputs translate to the same output, the last one wins
+            attr_spec = layer.GetAttributeAtPath(shader_spec.path.AppendProperty(name))
+            if not attr_spec:
+                attr_spec = Sdf.AttributeSpec(shader_spec, name, value_type)
+            if value is not None:
+                attr_spec.default = value
+
+
+omni.kit.commands.register_all_commands_in_module(__name__)
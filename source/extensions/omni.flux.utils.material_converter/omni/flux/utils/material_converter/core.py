@@ -17,13 +17,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import dataclasses
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 import carb
 import omni.kit
 import omni.usd
 from pxr import Sdf, Usd, UsdShade
 
+from .commands import MaterialSpecReplacement as _MaterialSpecReplacement
 from .mapping import Converters as _ConvertersEnum
 
 if TYPE_CHECKING:
@@ -31,7 +35,31 @@ if TYPE_CHECKING:
     from .utils import SupportedShaderInputs as _SupportedShaderInputs
 
 
+@dataclasses.dataclass(frozen=True)
+class MaterialConversionResult:
+    """
+    The result of the conversion of one material by `MaterialConverterCore.convert_batch`.
+
+    Args:
+        material_path: the path of the converted material
+        success: whether the conversion succeeded
+        message: a message describing the result
+        skipped: whether the material didn't need to be converted
+        duration: the time spent reading, translating and writing the material, in seconds
+    """
+
+    material_path: Sdf.Path
+    success: bool
+    message: str | None
+    skipped: bool
+    duration: float = 0.0
+
+
 class MaterialConverterCore:
+    # The input attributes required by every converter, filled on the first material lookup. The attributes of a
+    # converter don't depend on the converted prim.
+    _CONVERTER_SIGNATURES: dict[_ConvertersEnum, frozenset[str]] | None = None
+
     @staticmethod
     async def convert(context_name: str, converter: ConverterBase) -> tuple[bool, str | None, bool]:
         """
@@ -157,6 +185,140 @@ class MaterialConverterCore:
             False,
         )
 
+    @staticmethod
+    async def convert_batch(context_name: str, converters: list[ConverterBase]) -> list[MaterialConversionResult]:
+        """
+        Convert many materials at once.
+
+        The materials are converted like with `convert`, but every material is read and translated first, then all the
+        output specs are written directly on the root layer in a single change block. The whole batch is recorded as
+        one undo entry.
+
+        Args:
+            context_name: the context to use
+            converters: the converter of every material to convert
+
+        Returns:
+            The result of every conversion, in the order of the converters
+        """
+        context = omni.usd.get_context(context_name)
+        stage = context.get_stage() if context else None
+        if not stage:
+            message = (
+                f"Unable to get the stage in context with name {context_name}"
+                if context
+                else f"Unable to get the context with name {context_name}"
+            )
+            return [
+                MaterialConversionResult(converter.input_material_prim.GetPath(), False, message, False)
+                for converter in converters
+            ]
+
+        root_layer = stage.GetRootLayer()
+        session_layer = stage.GetSessionLayer()
+
+        results = []
+        replacements = []
+        for converter in converters:
+            start = time.perf_counter()
+            result, replacement = MaterialConverterCore._get_material_spec_replacement(
+                root_layer, session_layer, converter
+            )
+            results.append(dataclasses.replace(result, duration=time.perf_counter() - start))
+            if replacement:
+                replacements.append(replacement)
+
+        if replacements:
+            _, write_durations = omni.kit.commands.execute(
+                "ReplaceMaterialSpecsCommand",
+                layer_identifier=root_layer.identifier,
+                replacements=replacements,
+                usd_context=context_name,
+            )
+            results = [
+                dataclasses.replace(result, duration=result.duration + write_durations.get(result.material_path, 0.0))
+                for result in results
+            ]
+
+        carb.log_info(
+            f"Converted {len(replacements)} of {len(results)} materials in {sum(r.duration for r in results):.3f}s"
+        )
+        return results
+
+    @staticmethod
+    def _get_material_spec_replacement(
+        root_layer: Sdf.Layer, session_layer: Sdf.Layer, converter: ConverterBase
+    ) -> tuple[MaterialConversionResult, _MaterialSpecReplacement | None]:
+        """
+        Read and translate one material without changing the stage.
+
+        Args:
+            root_layer: the layer to write the converted material on
+            session_layer: the session layer of the stage
+            converter: the converter to use
+
+        Returns:
+            The result of the conversion, and the specs to write if the material should be converted
+        """
+        input_material_path = converter.input_material_prim.GetPath()
+
+        # If the input prim is not defined on this layer, we don't need to convert anything
+        if not root_layer.GetPrimAtPath(input_material_path):
+            return (
+                MaterialConversionResult(
+                    input_material_path,
+                    True,
+                    f"Input material prim was not defined on layer: '{root_layer.identifier}'",
+                    True,
+                ),
+                None,
+            )
+
+        has_source_prop_spec = True
+        input_shader_prim = None
+        input_shader = omni.usd.get_shader_from_material(converter.input_material_prim, get_prim=False)
+        if input_shader:
+            has_source_prop_spec = bool(
+                root_layer.GetPropertyAtPath(input_shader.GetImplementationSourceAttr().GetPath())
+            ) or bool(root_layer.GetPropertyAtPath(input_shader.GetIdAttr().GetPath()))
+
+            input_shader_prim = input_shader.GetPrim()
+            if not input_shader_prim:
+                return (
+                    MaterialConversionResult(
+                        input_material_path, False, "Unable to fetch input material shader prim", False
+                    ),
+                    None,
+                )
+
+        inputs = []
+        if input_shader_prim:
+            for output_attr_name, output_attr_type, output_value in MaterialConverterCore._translate_attributes(
+                root_layer, session_layer, converter, input_shader_prim
+            ):
+                if output_attr_type is None:
+                    carb.log_warn(f'Could not translate "{output_attr_name}" as it doesn\'t have a type')
+                    continue
+                inputs.append((output_attr_name, output_attr_type, output_value))
+
+        replacement = _MaterialSpecReplacement(
+            material_path=input_material_path,
+            # The `CreateMdlMaterialPrim` command always names the shader of a definition "Shader"
+            shader_name="Shader" if has_source_prop_spec else input_shader_prim.GetName(),
+            is_definition=has_source_prop_spec,
+            mdl_subidentifier=converter.output_mdl_subidentifier,
+            inputs=tuple(inputs),
+        )
+        return (
+            MaterialConversionResult(
+                input_material_path,
+                True,
+                f"Completed prim '{input_material_path}' conversion on layer {root_layer.identifier}",
+                False,
+            ),
+            replacement,
+        )
+
     @staticmethod
     def _create_material_definition_prim(context_name: str, converter: ConverterBase, output_material_path: str):
         stage = omni.usd.get_context(context_name).get_stage()
@@ -275,22 +437,36 @@ class MaterialConverterCore:
         But the MDL is not supported. So to check if this is really supported, we check if the attributes are matching
         with a supported MDL
         """
-        for converter in _ConvertersEnum:
-            all_valid = []
-            if converter.value[1].value is None:
-                continue
-            converter_instance = converter.value[0]().build(input_shader_prim, converter.value[1].value)
-            for attr in converter_instance.attributes:
-                if attr.fake_attribute:
-                    continue
-                if not input_shader_prim.HasAttribute(attr.input_attr_name):
-                    all_valid.append(False)
-                    break
-                all_valid.append(True)
-            if all(all_valid):
+        for converter, required_attr_names in MaterialConverterCore._get_converter_signatures(
+            input_shader_prim
+        ).items():
+            if all(input_shader_prim.HasAttribute(attr_name) for attr_name in required_attr_names):
                 return converter.value[0], converter.value[1]
         return None, None
 
+    @staticmethod
+    def _get_converter_signatures(input_shader_prim: Usd.Prim) -> dict[_ConvertersEnum, frozenset[str]]:
+        """
+        Get the input attributes required by every converter, building every converter only once.
+
+        Args:
+            input_shader_prim: a valid shader prim used to build the converters the first time
+
+        Returns:
+            The required input attribute names of every converter, in matching order
+        """
+        if MaterialConverterCore._CONVERTER_SIGNATURES is None:
+            signatures = {}
+            for converter in _ConvertersEnum:
+                if converter.value[1].value is None:
+                    continue
+                converter_instance = converter.value[0]().build(input_shader_prim, converter.value[1].value)
+                signatures[converter] = frozenset(
+                    attr.input_attr_name for attr in converter_instance.attributes if not attr.fake_attribute
+                )
+            MaterialConverterCore._CONVERTER_SIGNATURES = signatures
+        return MaterialConverterCore._CONVERTER_SIGNATURES
+
     @staticmethod
     async def _create_material_attributes(
         context_name: str, converter: ConverterBase, input_shader_prim: Usd.Prim, output_shader_prim: Usd.Prim
@@ -299,22 +475,41 @@ class MaterialConverterCore:
         root_layer = stage.GetRootLayer()
         session_layer = stage.GetSessionLayer()
 
-        for attr in converter.attributes:
-            output_attr_path = str(output_shader_prim.GetPath().AppendProperty(attr.output_attr_name))
+        for output_attr_name, output_attr_type, output_value in MaterialConverterCore._translate_attributes(
+            root_layer, session_layer, converter, input_shader_prim
+        ):
+            omni.kit.commands.execute(
+                "ChangePropertyCommand",
+                prop_path=str(output_shader_prim.GetPath().AppendProperty(output_attr_name)),
+                value=output_value,
+                prev=None,
+                target_layer=root_layer,
+                type_to_create_if_not_exist=output_attr_type,
+                usd_context_name=context_name,
+            )
+
+    @staticmethod
+    def _translate_attributes(
+        root_layer: Sdf.Layer, session_layer: Sdf.Layer, converter: ConverterBase, input_shader_prim: Usd.Prim
+    ) -> Iterator[tuple[str, Sdf.ValueTypeName | None, Any]]:
+        """
+        Translate the attributes of an input shader to the attributes of the output shader.
+
+        Args:
+            root_layer: the layer holding the input specs
+            session_layer: the session layer, holding the attributes defined in the MDL directly
+            converter: the converter to use
+            input_shader_prim: the shader to translate
 
+        Yields:
+            The name, type and value of every output attribute to author
+        """
+        for attr in converter.attributes:
             # If the input doesn't have the value, there's nothing to translate
             if not input_shader_prim.HasAttribute(attr.input_attr_name):
                 # If a default output value was set, add it to the output shader if it doesn't exist already
                 if attr.output_default_value is not None and not input_shader_prim.HasAttribute(attr.output_attr_name):
-                    omni.kit.commands.execute(
-                        "ChangePropertyCommand",
-                        prop_path=output_attr_path,
-                        value=attr.output_default_value,
-                        prev=None,
-                        target_layer=root_layer,
-                        type_to_create_if_not_exist=attr.output_attr_type,
-                        usd_context_name=context_name,
-                    )
+                    yield attr.output_attr_name, attr.output_attr_type, attr.output_default_value
                 continue
 
             input_attr = input_shader_prim.GetAttribute(attr.input_attr_name)
@@ -334,16 +529,7 @@ class MaterialConverterCore:
                     input_attr_value = value
 
             translated_type, translated_value = attr.translate_fn(input_attr_value, input_attr)
-
-            omni.kit.commands.execute(
-                "ChangePropertyCommand",
-                prop_path=output_attr_path,
-                value=translated_value,
-                prev=None,
-                target_layer=root_layer,
-                type_to_create_if_not_exist=translated_type,
-                usd_context_name=context_name,
-            )
+            yield attr.output_attr_name, translated_type, translated_value
 
     @staticmethod
     def _get_default_value(usd_property):
@@ -87,6 +87,41 @@ class TestOmniPBRToAperturePBRConverterBuilderE2E(omni.kit.test.AsyncTestCase):
             with open(aperture_pbr_temp_path) as actual_file:
                 self.assertEqual(expected_file.read(), actual_file.read())
 
+    async def test_convert_batch_should_produce_expected_output(self):
+        # Arrange
+        base_temp_path = Path(self.temp_dir.name)
+        omni_pbr_temp_path = base_temp_path / "omni_pbr.usda"
+        aperture_pbr_temp_path = base_temp_path / "aperture_pbr.usda"
+        shutil.copy(get_test_data_path(__name__, "usd/omni_pbr.usda"), omni_pbr_temp_path)
+
+        await self.context.open_stage_async(str(omni_pbr_temp_path))
+        stage = self.context.get_stage()
+        root_layer = stage.GetRootLayer()
+        converters = [
+            OmniPBRToAperturePBRConverterBuilder().build(
+                stage.GetPrimAtPath(prim_path), SupportedShaderOutputs.APERTURE_PBR_OPACITY.value
+            )
+            for prim_path in _PRIM_PATHS
+        ]
+
+        # Act
+        results = await MaterialConverterCore.convert_batch("", converters)
+        self.context.save_as_stage(str(aperture_pbr_temp_path))
+
+        # Assert
+        self.assertEqual(_PRIM_PATHS, [str(result.material_path) for result in results])
+        for result in results:
+            self.assertTrue(result.success)
+            self.assertFalse(result.skipped)
+            self.assertEqual(
+                f"Completed prim '{result.material_path}' conversion on layer {root_layer.identifier}", result.message
+            )
+            self.assertGreater(result.duration, 0.0)
+
+        with open(get_test_data_path(__name__, "usd/aperture_pbr.usda")) as expected_file:
+            with open(aperture_pbr_temp_path) as actual_file:
+                self.assertEqual(expected_file.read(), actual_file.read())
+
     async def test_explicit_normal_encoding_should_override_legacy_flip_tangent_v(self):
         # Arrange
         omni_pbr_temp_path = Path(self.temp_dir.name) / "omni_pbr.usda"
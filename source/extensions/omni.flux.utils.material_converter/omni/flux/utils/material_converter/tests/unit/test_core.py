@@ -20,12 +20,13 @@ from unittest.mock import Mock, call, patch
 
 import omni.kit.commands
 import omni.kit.test
+import omni.kit.undo
 import omni.usd
-from omni.flux.utils.material_converter import MaterialConverterCore
+from omni.flux.utils.material_converter import MaterialConverterCore, OmniGlassToAperturePBRConverterBuilder
 from omni.flux.utils.material_converter.base.attribute_base import AttributeBase
 from omni.flux.utils.material_converter.base.converter_base import ConverterBase
 from omni.flux.utils.material_converter.base.converter_builder_base import ConverterBuilderBase
-from pxr import Sdf, Usd
+from pxr import Sdf, Usd, UsdShade
 
 
 class TestConverterBuilder(ConverterBuilderBase):
@@ -453,6 +454,88 @@ class TestCore(omni.kit.test.AsyncTestCase):
         else:
             self.assertEqual(Sdf.SpecifierOver, prim_spec_mock.specifier)
 
+    async def test_convert_batch_no_context_should_return_error_for_every_material(self):
+        # Arrange
+        context_name_mock = Mock()
+        converters = [Mock(), Mock()]
+
+        with patch.object(omni.usd, "get_context") as get_context_mock:
+            get_context_mock.return_value = None
+
+            # Act
+            results = await MaterialConverterCore.convert_batch(context_name_mock, converters)
+
+        # Assert
+        self.assertEqual(2, len(results))
+        for converter, result in zip(converters, results):
+            self.assertEqual(converter.input_material_prim.GetPath.return_value, result.material_path)
+            self.assertFalse(result.success)
+            self.assertFalse(result.skipped)
+            self.assertEqual(f"Unable to get the context with name {context_name_mock}", result.message)
+
+    async def test_convert_batch_should_replace_materials_in_one_undoable_command(self):
+        # Arrange
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+        converters = []
+        for index in range(3):
+            material = UsdShade.Material.Define(stage, f"/World/Looks/Material{index}")
+            shader = UsdShade.Shader.Define(stage, f"/World/Looks/Material{index}/InputShader")
+            shader.SetShaderId("UsdPreviewSurface")
+            shader.CreateInput("flip_tangent_v", Sdf.ValueTypeNames.Bool).Set(bool(index % 2))
+            material.CreateSurfaceOutput("mdl").ConnectToSource(shader.ConnectableAPI(), "out")
+            converter = Mock()
+            converter.input_material_prim = material.GetPrim()
+            converter.output_mdl_subidentifier = "AperturePBR_Opacity"
+            converter.attributes = TestConverterBuilder().build(material.GetPrim(), "AperturePBR_Opacity").attributes
+            converters.append(converter)
+        original_layer = stage.GetRootLayer().ExportToString()
+
+        try:
+            with patch.object(omni.kit.commands, "execute", wraps=omni.kit.commands.execute) as execute_mock:
+                # Act
+                results = await MaterialConverterCore.convert_batch("", converters)
+
+            # Assert
+            self.assertTrue(all(result.success and not result.skipped for result in results))
+            self.assertEqual(1, execute_mock.call_count)
+            self.assertEqual("ReplaceMaterialSpecsCommand", execute_mock.call_args.args[0])
+            for index in range(3):
+                shader_prim = stage.GetPrimAtPath(f"/World/Looks/Material{index}/Shader")
+                shader = UsdShade.Shader(shader_prim)
+                self.assertFalse(stage.GetPrimAtPath(f"/World/Looks/Material{index}/InputShader"))
+                self.assertEqual("AperturePBR_Opacity", shader.GetSourceAssetSubIdentifier("mdl"))
+                self.assertEqual(index % 2 * 2, shader_prim.GetAttribute("inputs:encoding").Get())
+
+            omni.kit.undo.undo()
+            self.assertEqual(
+                sorted(original_layer.splitlines()), sorted(stage.GetRootLayer().ExportToString().splitlines())
+            )
+        finally:
+            await context.close_stage_async()
+
+    async def test_find_matching_supported_material_should_build_converters_once(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        shader_prim = UsdShade.Shader.Define(stage, "/Material/Shader").GetPrim()
+        original_build = OmniGlassToAperturePBRConverterBuilder.build
+
+        with (
+            patch.object(MaterialConverterCore, "_CONVERTER_SIGNATURES", None),
+            patch.object(
+                OmniGlassToAperturePBRConverterBuilder, "build", autospec=True, side_effect=original_build
+            ) as build_mock,
+        ):
+            # Act
+            first_match = await MaterialConverterCore.find_matching_supported_material(shader_prim)
+            second_match = await MaterialConverterCore.find_matching_supported_material(shader_prim)
+
+        # Assert
+        self.assertEqual((None, None), first_match)
+        self.assertEqual(first_match, second_match)
+        self.assertEqual(1, build_mock.call_count)
+
     async def __run_convert_material_attributes(self, exists_on_input: bool):
         # Arrange
         def test_translate_fn(v, _):
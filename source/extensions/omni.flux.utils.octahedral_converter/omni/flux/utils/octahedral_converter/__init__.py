@@ -15,6 +15,6 @@
 * limitations under the License.
 """
 
-from .octahedral_converter_core import OctahedralConverter
+from .octahedral_converter_core import OctahedralConversion, OctahedralConversionResult, OctahedralConverter
 
-__all__ = ["OctahedralConverter"]
+__all__ = ["OctahedralConversion", "OctahedralConversionResult", "OctahedralConverter"]
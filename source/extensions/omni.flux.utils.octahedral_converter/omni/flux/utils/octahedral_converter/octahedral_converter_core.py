@@ -15,12 +15,85 @@
 * limitations under the License.
 """
 
+from __future__ import annotations
+
+__all__ = ["OctahedralConversion", "OctahedralConversionResult", "OctahedralConverter"]
+
+import concurrent.futures
+import ctypes
+import dataclasses
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from collections.abc import Sequence
 from pathlib import Path
 
 import carb
 import numpy as np
 from PIL import Image
 
+# Rows converted at once. The float scratch buffers of a tile are ~25MB for an 8K wide float32 image.
+DEFAULT_TILE_ROWS = 256
+
+# Memory used by a worker process on top of the images it converts (interpreter, NumPy and Pillow)
+_WORKER_OVERHEAD_BYTES = 128 * 1024 * 1024
+
+_SUPPORTED_MODES = {"RGB", "RGBA", "RGBX"}
+
+
+@dataclasses.dataclass(frozen=True)
+class OctahedralConversion:
+    """
+    A normal map to convert to octahedral encoding.
+
+    Args:
+        source_path: the tangent space normal map
+        output_path: the path of the octahedral normal map to write
+        opengl: whether the normal map is OpenGL style (green is up) instead of DirectX style (green is down)
+    """
+
+    source_path: str
+    output_path: str
+    opengl: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class OctahedralConversionResult:
+    """
+    The outcome of one conversion of a batch.
+
+    Args:
+        conversion: the conversion that was executed
+        success: whether the octahedral normal map was written
+        message: the error details on failure
+        inward_normal_count: the number of pixels with inward pointing normals that were mirrored
+        seconds: the time the conversion took
+    """
+
+    conversion: OctahedralConversion
+    success: bool
+    message: str = ""
+    inward_normal_count: int = 0
+    seconds: float = 0.0
+
+
+class _TileBuffers:
+    def __init__(self, rows: int, width: int, dtype: np.dtype):
+        """
+        Scratch buffers reused by every tile of an image, so a conversion never allocates full-size temporaries.
+
+        Args:
+            rows: the maximum number of rows of a tile
+            width: the width of the image
+            dtype: the float type of the math, float32 or float16
+        """
+        self.vectors = np.empty((rows, width, 3), dtype=dtype)
+        self.sums = np.empty((rows, width), dtype=dtype)
+        self.values = np.empty((rows, width), dtype=dtype)
+        self.pixels = np.zeros((rows, width, 3), dtype=np.uint8)
+
 
 # Converts either OpenGL or DirectX style normal maps to RTX Remix compatible Hemispherical Octahedral maps.
 #
@@ -33,112 +106,312 @@ from PIL import Image
 # To use, call this from python as
 # `OctahedralConverter.convert_dx_file_to_octahedral("input_dx_normal_map.png", "output_octahedral_map.png")`
 #
+# Images are converted a few rows at a time with preallocated scratch buffers, so the memory used by a conversion is
+#   the source and output images plus a small constant. Use `OctahedralConverter.convert_files_to_octahedral` to
+#   convert many files in parallel worker processes.
+#
 # To then load these into RTX Remix, you can convert it to a DDS file using
 #   https://developer.nvidia.com/nvidia-texture-tools-exporter
 #   Use BC5 compression, and the flag --no-mip-gamma-correct
 class OctahedralConverter:
     # Convert DirectX style normal maps (green is down)
     @staticmethod
-    def convert_dx_file_to_octahedral(dx_path: str, oth_path: str):
+    def convert_dx_file_to_octahedral(
+        dx_path: str, oth_path: str, tile_rows: int = DEFAULT_TILE_ROWS, dtype: np.dtype = np.float32
+    ):
         if not Path(dx_path).exists():
             carb.log_warn("convert_dx_to_octahedral called on non-existant path: " + dx_path)
             return
-        with Image.open(dx_path) as image_file:
-            img = np.array(image_file)
-            OctahedralConverter._check_for_spherical_normals(dx_path, img)
-            img_int = OctahedralConverter.convert_dx_to_octahedral(img)
-            Image.fromarray(img_int, "RGB").save(oth_path)
+        inward_normal_count = _convert_file(dx_path, oth_path, False, tile_rows, dtype)
+        OctahedralConverter._warn_inward_normals(dx_path, inward_normal_count)
 
     # Convert OpenGL style normal maps (green is up)
     @staticmethod
-    def convert_ogl_file_to_octahedral(ogl_path: str, oth_path: str):
+    def convert_ogl_file_to_octahedral(
+        ogl_path: str, oth_path: str, tile_rows: int = DEFAULT_TILE_ROWS, dtype: np.dtype = np.float32
+    ):
         if not Path(ogl_path).exists():
             carb.log_warn("convert_ogl_to_octahedral called on non-existant path: " + ogl_path)
             return
-        with Image.open(ogl_path) as image_file:
-            img = np.array(image_file)
-            OctahedralConverter._check_for_spherical_normals(ogl_path, img)
-            img_int = OctahedralConverter.convert_ogl_to_octahedral(img)
-            Image.fromarray(img_int, "RGB").save(oth_path)
+        inward_normal_count = _convert_file(ogl_path, oth_path, True, tile_rows, dtype)
+        OctahedralConverter._warn_inward_normals(ogl_path, inward_normal_count)
 
     @staticmethod
-    def convert_dx_to_octahedral(image: np.ndarray) -> np.ndarray:
-        normals = OctahedralConverter._pixels_to_normals(image)
-        octahedrals = OctahedralConverter._convert_to_octahedral(normals)
-        return OctahedralConverter._octahedrals_to_pixels(octahedrals)
+    def convert_dx_to_octahedral(
+        image: np.ndarray, tile_rows: int = DEFAULT_TILE_ROWS, dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """
+        Convert a DirectX style normal map. 8 bit, 16 bit and float ([0, 1]) images are supported.
+
+        Returns:
+            An 8 bit RGB image with the octahedral encoding in the red and green channels
+        """
+        return _convert_array(image, False, tile_rows, dtype)[0]
+
+    @staticmethod
+    def convert_ogl_to_octahedral(
+        image: np.ndarray, tile_rows: int = DEFAULT_TILE_ROWS, dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """
+        Convert an OpenGL style normal map. 8 bit, 16 bit and float ([0, 1]) images are supported.
+
+        Returns:
+            An 8 bit RGB image with the octahedral encoding in the red and green channels
+        """
+        return _convert_array(image, True, tile_rows, dtype)[0]
 
     @staticmethod
-    def convert_ogl_to_octahedral(image: np.ndarray) -> np.ndarray:
-        dx_image = OctahedralConverter._ogl_to_dx(image)
-        return OctahedralConverter.convert_dx_to_octahedral(dx_image)
+    def convert_files_to_octahedral(
+        conversions: Sequence[OctahedralConversion],
+        max_workers: int | None = None,
+        tile_rows: int = DEFAULT_TILE_ROWS,
+        dtype: np.dtype = np.float32,
+    ) -> list[OctahedralConversionResult]:
+        """
+        Convert normal maps in parallel worker processes.
+
+        Conversions a worker process can't run are executed in the current process instead.
+
+        Args:
+            conversions: the normal maps to convert
+            max_workers: the maximum number of worker processes. None sizes the pool with the CPU cores and the
+                         available memory, see `get_batch_worker_count`.
+            tile_rows: the number of rows converted at once
+            dtype: the float type of the math, float32 or float16
+
+        Returns:
+            The results, in the order of the conversions
+        """
+        if max_workers is None:
+            max_workers = OctahedralConverter.get_batch_worker_count(conversions, tile_rows)
+        max_workers = min(max_workers, len(conversions))
+
+        results: list[OctahedralConversionResult | None] = [None] * len(conversions)
+        executable = _get_python_executable()
+        if max_workers > 1 and executable:
+            mp_context = multiprocessing.get_context("spawn")
+            if executable != sys.executable:
+                # Embedded interpreters report the host application as their executable
+                mp_context.set_executable(executable)
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+                    futures = [
+                        pool.submit(_run_conversion, conversion, tile_rows, np.dtype(dtype))
+                        for conversion in conversions
+                    ]
+                    for index, future in enumerate(futures):
+                        try:
+                            results[index] = future.result()
+                        except Exception as e:  # noqa: BLE001
+                            carb.log_warn(f"Octahedral conversion worker failed, converting in process instead: {e}")
+            except (OSError, concurrent.futures.process.BrokenProcessPool) as e:
+                carb.log_warn(f"Unable to start the octahedral conversion workers, converting in process instead: {e}")
+
+        for index, conversion in enumerate(conversions):
+            if results[index] is None:
+                results[index] = _run_conversion(conversion, tile_rows, np.dtype(dtype))
+            OctahedralConverter._warn_inward_normals(conversion.source_path, results[index].inward_normal_count)
+        return results
 
     @staticmethod
-    def _check_for_spherical_normals(original_path: str, image: np.ndarray):
-        # Check for blue values below 128.
-        mask = image[:, :, 2] < 128
-        num_negative = image[mask].shape[0]
-        if num_negative > 0:
+    def get_batch_worker_count(conversions: Sequence[OctahedralConversion], tile_rows: int = DEFAULT_TILE_ROWS) -> int:
+        """
+        Get the number of worker processes that can convert a batch at the same time.
+
+        The count is limited by the CPU cores, and by the available memory divided by the memory needed to convert the
+        largest image of the batch.
+
+        Args:
+            conversions: the normal maps to convert
+            tile_rows: the number of rows converted at once
+
+        Returns:
+            The number of worker processes, at least 1
+        """
+        worker_count = min(os.cpu_count() or 1, len(conversions))
+        available_memory = _get_available_memory()
+        if available_memory is not None and conversions:
+            peak_memory = max(_estimate_conversion_memory(c.source_path, tile_rows) for c in conversions)
+            worker_count = min(worker_count, available_memory // peak_memory)
+        return max(1, worker_count)
+
+    @staticmethod
+    def _warn_inward_normals(original_path: str, inward_normal_count: int):
+        if inward_normal_count > 0:
             carb.log_warn(
                 original_path
                 + " contained "
-                + str(num_negative)
+                + str(inward_normal_count)
                 + " pixels with inward pointing normals (z < 0.0, or b < 128).  RTX Remix only supports hemispherical"
                 + " normals, with the normal pointing away from the surface."
             )
 
-        # Mirror the normal to point out from surface.
-        image[mask, 2] = 255 - image[mask, 2]
 
-    @staticmethod
-    def _pixels_to_normals(image: np.ndarray) -> np.ndarray:
-        image = image[:, :, 0:3].astype("float32") / 255
-        image = image * 2.0 - 1.0
-        return image / np.linalg.norm(image, axis=2)[:, :, np.newaxis]
+def _convert_file(source_path: str, output_path: str, opengl: bool, tile_rows: int, dtype: np.dtype) -> int:
+    with Image.open(source_path) as image_file:
+        image = image_file if image_file.mode in _SUPPORTED_MODES else image_file.convert("RGB")
+        width, height = image.size
+        output = Image.new("RGB", image.size)
+        buffers = _TileBuffers(min(tile_rows, height), width, dtype)
+        inward_normal_count = 0
+        for top in range(0, height, tile_rows):
+            bottom = min(top + tile_rows, height)
+            tile = np.asarray(image.crop((0, top, width, bottom)))
+            inward_normal_count += _convert_tile(tile, buffers, opengl)
+            output.paste(Image.fromarray(buffers.pixels[: bottom - top]), (0, top))
+    output.save(output_path)
+    return inward_normal_count
 
-    @staticmethod
-    def _octahedrals_to_pixels(octahedrals: np.ndarray) -> np.ndarray:
-        image = np.floor(octahedrals * 255 + 0.5).astype("uint8")
-        return np.pad(image, ((0, 0), (0, 0), (0, 1)), mode="constant")
 
-    @staticmethod
-    def _ogl_to_dx(image: np.ndarray) -> np.ndarray:
+def _convert_array(image: np.ndarray, opengl: bool, tile_rows: int, dtype: np.dtype) -> tuple[np.ndarray, int]:
+    height, width = image.shape[:2]
+    result = np.empty((height, width, 3), dtype=np.uint8)
+    buffers = _TileBuffers(max(1, min(tile_rows, height)), width, dtype)
+    inward_normal_count = 0
+    for top in range(0, height, tile_rows):
+        bottom = min(top + tile_rows, height)
+        inward_normal_count += _convert_tile(image[top:bottom], buffers, opengl)
+        result[top:bottom] = buffers.pixels[: bottom - top]
+    return result, inward_normal_count
+
+
+def _convert_tile(tile: np.ndarray, buffers: _TileBuffers, opengl: bool) -> int:
+    # vectorized implementation of hemisphereDirectionToSignedOctahedral from dxvk_rt's packing.glsli, computed in
+    # place in the tile buffers. The direction doesn't need to be normalized: p = v.xy / (|v.x| + |v.y| + |v.z|)
+    # gives the same result for any length of v.
+    rows = tile.shape[0]
+    vectors = buffers.vectors[:rows]
+    sums = buffers.sums[:rows]
+    values = buffers.values[:rows]
+    pixels = buffers.pixels[:rows]
+
+    max_value = np.iinfo(tile.dtype).max if np.issubdtype(tile.dtype, np.integer) else 1.0
+    # Integer values can be larger than the float16 range: scale them in float32
+    np.multiply(tile[:, :, 0:3], 2.0 / max_value, out=vectors, dtype=np.float32, casting="unsafe")
+    vectors -= 1.0
+    if opengl:
         # flip the g channel to convert to DX style
-        image[:, :, (1)] = 255 - image[:, :, (1)]
-        return image
+        np.negative(vectors[:, :, 1], out=vectors[:, :, 1])
 
-    @staticmethod
-    def _convert_to_octahedral(image: np.ndarray) -> np.ndarray:
-        # convert from 3 channel to 2 channel normal map
-        # vectorized implementation of hemisphereDirectionToSignedOctahedral from dxvk_rt's packing.glsli
-
-        # p = v.xy / (abs(v.x) + abs(v.y) + abs(v.z));
-        abs_values = np.absolute(image)
-        snorm_octahedrals = image[:, :, 0:2] / np.expand_dims(abs_values.sum(2), axis=2)
-        # Hemisphere normal handling:
-        result = snorm_octahedrals.copy()
-        result[:, :, 0] = snorm_octahedrals[:, :, 0] + snorm_octahedrals[:, :, 1]
-        result[:, :, 1] = snorm_octahedrals[:, :, 0] - snorm_octahedrals[:, :, 1]
-        return result * 0.5 + 0.5
-
-        # # Spherical normal handling.  Leaving this in for reference, since it does work.
-        # TODO [REMIX-1018] this code will be needed to support Tangent maps
-        # snorm_octahedrals = result
-
-        # # snormOctahedral = (v.z >= 0.0) ? p : octWrap(p);
-        # needs_wrap_mask = image[:, :, 2] < 0.0
-        # # vec2 wrapped = 1.0f - abs(v.yx);
-        # snorm_octahedrals[needs_wrap_mask] = -abs_values[needs_wrap_mask, 1::-1] + 1
-
-        # # wrapped.x *= signNotZero(v.x);
-        # #   create mask of normals with x < 0 and z < 0
-        # needs_xflip_mask = (needs_wrap_mask) & (image[:, :, 0] < 0.0)
-        # #   use those masks to flip the x components of snorm_octahedrals
-        # snorm_octahedrals[needs_xflip_mask, 0] = -1.0 * snorm_octahedrals[needs_xflip_mask, 0]
-
-        # # wrapped.y *= signNotZero(v.y);
-        # #   create mask of normals with y < 0 and z < 0
-        # needs_yflip_mask = (needs_wrap_mask) & (image[:, :, 1] < 0.0)
-        # #   use those masks to flip the y components of snorm_octahedrals
-        # snorm_octahedrals[needs_yflip_mask, 1] = -1.0 * snorm_octahedrals[needs_yflip_mask, 1]
-
-        # return snorm_octahedrals * 0.5 + 0.5
+    # Inward pointing normals are mirrored to point out of the surface: only |v.z| is used below
+    inward_normal_count = int(np.count_nonzero(vectors[:, :, 2] < 0.0))
+
+    np.absolute(vectors[:, :, 0], out=sums)
+    np.absolute(vectors[:, :, 1], out=values)
+    sums += values
+    np.absolute(vectors[:, :, 2], out=values)
+    sums += values
+    np.maximum(sums, np.finfo(sums.dtype).tiny, out=sums)
+    snorm_x = vectors[:, :, 0]
+    snorm_y = vectors[:, :, 1]
+    snorm_x /= sums
+    snorm_y /= sums
+
+    # Hemisphere normal handling: (x + y, x - y) * 0.5 + 0.5, quantized to 8 bit
+    np.subtract(snorm_x, snorm_y, out=values)
+    snorm_x += snorm_y
+    for channel, octahedral in enumerate((snorm_x, values)):
+        np.multiply(octahedral, 127.5, out=octahedral)
+        np.add(octahedral, 128.0, out=octahedral)
+        np.floor(octahedral, out=octahedral)
+        np.clip(octahedral, 0.0, 255.0, out=octahedral)
+        pixels[:, :, channel] = octahedral
+    return inward_normal_count
+
+    # # Spherical normal handling.  Leaving this in for reference, since it does work.
+    # TODO [REMIX-1018] this code will be needed to support Tangent maps
+    # snorm_octahedrals = result
+
+    # # snormOctahedral = (v.z >= 0.0) ? p : octWrap(p);
+    # needs_wrap_mask = image[:, :, 2] < 0.0
+    # # vec2 wrapped = 1.0f - abs(v.yx);
+    # snorm_octahedrals[needs_wrap_mask] = -abs_values[needs_wrap_mask, 1::-1] + 1
+
+    # # wrapped.x *= signNotZero(v.x);
+    # #   create mask of normals with x < 0 and z < 0
+    # needs_xflip_mask = (needs_wrap_mask) & (image[:, :, 0] < 0.0)
+    # #   use those masks to flip the x components of snorm_octahedrals
+    # snorm_octahedrals[needs_xflip_mask, 0] = -1.0 * snorm_octahedrals[needs_xflip_mask, 0]
+
+    # # wrapped.y *= signNotZero(v.y);
+    # #   create mask of normals with y < 0 and z < 0
+    # needs_yflip_mask = (needs_wrap_mask) & (image[:, :, 1] < 0.0)
+    # #   use those masks to flip the y components of snorm_octahedrals
+    # snorm_octahedrals[needs_yflip_mask, 1] = -1.0 * snorm_octahedrals[needs_yflip_mask, 1]
+
+    # return snorm_octahedrals * 0.5 + 0.5
+
+
+def _run_conversion(conversion: OctahedralConversion, tile_rows: int, dtype: np.dtype) -> OctahedralConversionResult:
+    """Convert one file of a batch. This runs in the worker processes, so errors are returned instead of logged."""
+    start = time.perf_counter()
+    if not Path(conversion.source_path).exists():
+        return OctahedralConversionResult(
+            conversion=conversion, success=False, message=f"{conversion.source_path} doesn't exist"
+        )
+    try:
+        inward_normal_count = _convert_file(
+            conversion.source_path, conversion.output_path, conversion.opengl, tile_rows, dtype
+        )
+    except Exception:  # noqa: BLE001
+        return OctahedralConversionResult(
+            conversion=conversion,
+            success=False,
+            message=traceback.format_exc(),
+            seconds=time.perf_counter() - start,
+        )
+    return OctahedralConversionResult(
+        conversion=conversion,
+        success=True,
+        inward_normal_count=inward_normal_count,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _estimate_conversion_memory(source_path: str, tile_rows: int) -> int:
+    """The peak memory of one conversion: the decoded source, the output image and the tile buffers"""
+    try:
+        with Image.open(source_path) as image:
+            width, height = image.size
+    except OSError:
+        return _WORKER_OVERHEAD_BYTES
+    # Pillow stores 3 and 4 channel images with 4 bytes per pixel. The tile buffers hold 5 float32 values per pixel.
+    return _WORKER_OVERHEAD_BYTES + width * height * 8 + min(tile_rows, height) * width * (5 * 4 + 3)
+
+
+def _get_available_memory() -> int | None:
+    """The physical memory available to new processes, or None if it can't be queried"""
+    if sys.platform == "win32":
+
+        class _MemoryStatus(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = _MemoryStatus()
+        status.dwLength = ctypes.sizeof(_MemoryStatus)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return None
+        return status.ullAvailPhys
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _get_python_executable() -> str | None:
+    """The Python interpreter the worker processes run with, or None if there is none"""
+    if Path(sys.executable).stem.lower().startswith("python"):
+        return sys.executable
+    for candidate in (Path(sys.prefix) / "python.exe", Path(sys.prefix) / "bin" / "python3"):
+        if candidate.is_file():
+            return str(candidate)
+    return None
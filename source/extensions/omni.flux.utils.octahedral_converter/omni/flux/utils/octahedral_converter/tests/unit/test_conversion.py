@@ -16,14 +16,43 @@
 """
 
 import pathlib
+import tempfile
+import time
+import tracemalloc
 
+import carb
 import numpy as np
 import omni.kit.test
 import omni.usd
-from omni.flux.utils.octahedral_converter import OctahedralConverter
+from omni.flux.utils.octahedral_converter import OctahedralConversion, OctahedralConverter
 from omni.kit.test_suite.helpers import get_test_data_path
 from PIL import Image
 
+_BENCHMARK_SIZE = 2048
+
+
+def _reference_dx_to_octahedral(image: np.ndarray) -> np.ndarray:
+    """The full-image conversion the tiled conversion replaces"""
+    normals = image[:, :, 0:3].astype("float32") / 255
+    normals = normals * 2.0 - 1.0
+    normals = normals / np.linalg.norm(normals, axis=2)[:, :, np.newaxis]
+    abs_values = np.absolute(normals)
+    snorm_octahedrals = normals[:, :, 0:2] / np.expand_dims(abs_values.sum(2), axis=2)
+    result = snorm_octahedrals.copy()
+    result[:, :, 0] = snorm_octahedrals[:, :, 0] + snorm_octahedrals[:, :, 1]
+    result[:, :, 1] = snorm_octahedrals[:, :, 0] - snorm_octahedrals[:, :, 1]
+    octahedrals = result * 0.5 + 0.5
+    pixels = np.floor(octahedrals * 255 + 0.5).astype("uint8")
+    return np.pad(pixels, ((0, 0), (0, 0), (0, 1)), mode="constant")
+
+
+def _random_normal_map(height: int, width: int, seed: int = 0) -> np.ndarray:
+    generator = np.random.default_rng(seed)
+    image = generator.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    # Keep most normals pointing out of the surface
+    image[:, :, 2] = generator.integers(128, 256, size=(height, width), dtype=np.uint8)
+    return image
+
 
 class TestOctahedralConverter(omni.kit.test.AsyncTestCaseFailOnLogError):
     async def setUp(self):
@@ -66,3 +95,103 @@ class TestOctahedralConverter(omni.kit.test.AsyncTestCaseFailOnLogError):
         diff = oth_img[:, :, 0:3].astype("int32") - converted_img[:, :, 0:3].astype("int32")
         self.assertTrue((diff <= 2).all())
         self.assertTrue((diff >= -2).all())
+
+    async def test_convert_dx_file_across_tiles(self):
+        """Test converting a DirectX Normal Map file a few rows at a time"""
+        texture_folder_path = pathlib.Path(get_test_data_path(__name__, "textures"))
+        oth_path = texture_folder_path.joinpath("Normal_Map_Test_DX_Octahedral.png").absolute()
+        dx_path = texture_folder_path.joinpath("Normal_Map_Test_DirectX.png").absolute()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = pathlib.Path(temp_dir) / "converted.png"
+            OctahedralConverter.convert_dx_file_to_octahedral(str(dx_path), str(out_path), tile_rows=7)
+
+            with Image.open(oth_path) as image_file:
+                oth_img = np.array(image_file)[:, :, 0:3]
+            with Image.open(out_path) as image_file:
+                converted_img = np.array(image_file)
+
+        diff = oth_img.astype("int32") - converted_img.astype("int32")
+        self.assertTrue((diff <= 2).all())
+        self.assertTrue((diff >= -2).all())
+        self.assertTrue((converted_img[:, :, 2] == 0).all())
+
+    async def test_convert_matches_full_image_conversion(self):
+        """Test the tiled conversion against the full-image conversion, with 16 bit inputs and float16 math"""
+        image = _random_normal_map(61, 47)
+        expected = _reference_dx_to_octahedral(image.copy()).astype("int32")
+
+        results = {
+            "uint8": OctahedralConverter.convert_dx_to_octahedral(image, tile_rows=8),
+            "uint16": OctahedralConverter.convert_dx_to_octahedral(image.astype(np.uint16) * 257, tile_rows=8),
+            "float16": OctahedralConverter.convert_dx_to_octahedral(image, tile_rows=8, dtype=np.float16),
+        }
+
+        for name, converted_img in results.items():
+            with self.subTest(name):
+                diff = expected - converted_img.astype("int32")
+                self.assertTrue((diff <= 2).all())
+                self.assertTrue((diff >= -2).all())
+        # The input image is not modified
+        self.assertTrue((image == _random_normal_map(61, 47)).all())
+
+    async def test_convert_files_in_batch(self):
+        """Test converting DirectX and OpenGL Normal Maps in worker processes"""
+        texture_folder_path = pathlib.Path(get_test_data_path(__name__, "textures"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            conversions = [
+                OctahedralConversion(
+                    source_path=str(texture_folder_path.joinpath("Normal_Map_Test_DirectX.png")),
+                    output_path=str(pathlib.Path(temp_dir) / "dx.png"),
+                ),
+                OctahedralConversion(
+                    source_path=str(texture_folder_path.joinpath("Normal_Map_Test_OpenGL.png")),
+                    output_path=str(pathlib.Path(temp_dir) / "ogl.png"),
+                    opengl=True,
+                ),
+                OctahedralConversion(
+                    source_path=str(pathlib.Path(temp_dir) / "missing.png"),
+                    output_path=str(pathlib.Path(temp_dir) / "missing_oth.png"),
+                ),
+            ]
+            results = OctahedralConverter.convert_files_to_octahedral(conversions, max_workers=2)
+
+            self.assertEqual(conversions, [result.conversion for result in results])
+            self.assertEqual([True, True, False], [result.success for result in results])
+            for result, expected_name in zip(
+                results[:2], ["Normal_Map_Test_DX_Octahedral.png", "Normal_Map_Test_OGL_Octahedral.png"], strict=True
+            ):
+                with Image.open(texture_folder_path.joinpath(expected_name)) as image_file:
+                    oth_img = np.array(image_file)[:, :, 0:3]
+                with Image.open(result.conversion.output_path) as image_file:
+                    converted_img = np.array(image_file)
+                diff = oth_img.astype("int32") - converted_img.astype("int32")
+                self.assertTrue((abs(diff) <= 2).all())
+        self.assertGreaterEqual(OctahedralConverter.get_batch_worker_count(conversions), 1)
+
+    async def test_tiled_conversion_benchmark(self):
+        """Compare the throughput and the peak NumPy memory of the tiled and full-image conversions"""
+        image = _random_normal_map(_BENCHMARK_SIZE, _BENCHMARK_SIZE)
+        megapixels = _BENCHMARK_SIZE * _BENCHMARK_SIZE / 1_000_000
+
+        measures = {}
+        for name, convert in (
+            ("full image", lambda: _reference_dx_to_octahedral(image.copy())),
+            ("tiled float32", lambda: OctahedralConverter.convert_dx_to_octahedral(image)),
+            ("tiled float16", lambda: OctahedralConverter.convert_dx_to_octahedral(image, dtype=np.float16)),
+        ):
+            tracemalloc.start()
+            start = time.perf_counter()
+            convert()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            measures[name] = peak
+            carb.log_info(
+                f"Octahedral conversion ({name}): {megapixels / elapsed:.1f} MP/s, peak {peak / 1024 / 1024:.0f} MB"
+            )
+
+        # The tiled conversions only hold the output image and the buffers of one tile
+        self.assertLess(measures["tiled float32"], measures["full image"] / 4)
+        self.assertLess(measures["tiled float16"], measures["full image"] / 4)
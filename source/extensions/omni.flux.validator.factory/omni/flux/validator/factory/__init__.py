@@ -32,6 +32,7 @@ __all__ = [
     "FluxValidatorFactoryExtension",
     "IBase",
     "IBaseSchema",
+    "InOutData",
     "InOutDataFlow",
     "ResultorBase",
     "ResultorSchema",
@@ -45,7 +46,7 @@ __all__ = [
 from .constant import BASE_HASH_KEY, CONTEXT_FIXES_APPLIED, FIXES_APPLIED, VALIDATION_EXTENSIONS, VALIDATION_PASSED
 from .data_flow import utils
 from .data_flow.base_data_flow import DataFlow
-from .data_flow.in_out_data import InOutDataFlow
+from .data_flow.in_out_data import InOutData, InOutDataFlow
 from .extension import FluxValidatorFactoryExtension, get_instance
 from .plugins.check_base import CheckBase
 from .plugins.check_base import Schema as CheckSchema
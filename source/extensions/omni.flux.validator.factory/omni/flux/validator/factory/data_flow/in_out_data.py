@@ -15,12 +15,159 @@
 * limitations under the License.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, SupportsIndex
+
+from pydantic_core import core_schema
+
 from .base_data_flow import DataFlow as _DataFlow
 
 
+class InOutData(list):
+    """
+    An insertion-ordered list of unique paths.
+
+    Membership tests and pushes are O(1), so pushing thousands of paths one by one doesn't scan the whole list each
+    time. It is still a list for the readers: it can be indexed, iterated, compared to a list and serialized as one.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        super().__init__()
+        self._index: set[str] = set()
+        self.update(paths)
+
+    def add(self, path: str) -> bool:
+        """
+        Append a path if it is not already in the list
+
+        Args:
+            path: the path to append
+
+        Returns:
+            True if the path was appended, False if it was already in the list
+        """
+        if path in self._index:
+            return False
+        self._index.add(path)
+        super().append(path)
+        return True
+
+    def update(self, paths: Iterable[str]) -> int:
+        """
+        Append the paths that are not already in the list, in order
+
+        Args:
+            paths: the paths to append
+
+        Returns:
+            The number of appended paths
+        """
+        new_paths = []
+        for path in paths:
+            if path in self._index:
+                continue
+            self._index.add(path)
+            new_paths.append(path)
+        super().extend(new_paths)
+        return len(new_paths)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._index
+
+    def append(self, path: str):
+        self.add(path)
+
+    def extend(self, paths: Iterable[str]):
+        self.update(paths)
+
+    def __iadd__(self, paths: Iterable[str]) -> InOutData:
+        self.update(paths)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._index.clear()
+
+    def copy(self) -> InOutData:
+        return InOutData(self)
+
+    def insert(self, index: SupportsIndex, path: str):
+        if path in self._index:
+            return
+        super().insert(index, path)
+        self._index.add(path)
+
+    def remove(self, path: str):
+        super().remove(path)
+        self._index.discard(path)
+
+    def pop(self, index: SupportsIndex = -1) -> str:
+        path = super().pop(index)
+        self._index.discard(path)
+        return path
+
+    # Item assignments and deletions are rare: they rebuild the index and drop the duplicates they introduced
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def __imul__(self, value: SupportsIndex) -> InOutData:
+        # Repeating unique paths only keeps them once
+        if value.__index__() <= 0:
+            self.clear()
+        return self
+
+    def _reindex(self):
+        """
+        Rebuild the index from the list after an item assignment or deletion, keeping the first of duplicated paths
+        """
+        paths = list(self)
+        self.clear()
+        self.update(paths)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: Callable[[Any], core_schema.CoreSchema]
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate_in_out_data_for_pydantic,
+            serialization=core_schema.plain_serializer_function_ser_schema(list),
+        )
+
+    @classmethod
+    def _validate_in_out_data_for_pydantic(cls, v: Any) -> InOutData:
+        """
+        Validate a value assigned to an InOutData field of a pydantic model
+
+        Args:
+            v: the value to validate
+
+        Returns:
+            The value itself if it is already an InOutData, or a new InOutData built from the list of paths
+
+        Raises:
+            TypeError: if the value is not a list or tuple of str
+        """
+        if isinstance(v, InOutData):
+            return v
+        if isinstance(v, (list, tuple)) and all(isinstance(path, str) for path in v):
+            return cls(v)
+        raise TypeError(f"Invalid type for InOutData. Expected a list of str, got {type(v).__name__}")
+
+
 class InOutDataFlow(_DataFlow):
     name: str = "InOutData"
-    input_data: list[str] | None = None
+    input_data: InOutData | None = None
     push_input_data: bool = False
-    output_data: list[str] | None = None
+    output_data: InOutData | None = None
     push_output_data: bool = False
@@ -15,42 +15,73 @@
 * limitations under the License.
 """
 
+from collections.abc import Iterable
+
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 
+from .in_out_data import InOutData as _InOutData
+from .in_out_data import InOutDataFlow as _InOutDataFlow
+
 
-def push_input_data(schema_data, file_paths: list[str]):
+def push_input_data(schema_data, file_paths: Iterable[str]):
     """
-    Push a list of files into the data flow input
+    Push a list of files into the data flow input. Files already in the input are skipped.
 
     Args:
         schema_data: the schema to use
         file_paths: the list of files to push
     """
-    for data_flow in schema_data.data_flows or []:
-        if data_flow.name == "InOutData" and data_flow.push_input_data:
-            if data_flow.input_data is None:
-                data_flow.input_data = []
-            for file_path in file_paths:
-                url_in_path_str = _OmniUrl(file_path)
-                if str(url_in_path_str) in data_flow.input_data:
-                    continue
-                data_flow.input_data.append(str(url_in_path_str))
+    data_flows = [data_flow for data_flow in _get_in_out_data_flows(schema_data) if data_flow.push_input_data]
+    if not data_flows:
+        return
+    urls = _normalize_paths(file_paths)
+    for data_flow in data_flows:
+        # The data flows are not validated on assignment, so plain lists may have been set
+        if not isinstance(data_flow.input_data, _InOutData):
+            data_flow.input_data = _InOutData(data_flow.input_data or ())
+        data_flow.input_data.update(urls)
 
 
-def push_output_data(schema_data, file_paths: list[str]):
+def push_output_data(schema_data, file_paths: Iterable[str]):
     """
-    Push a list of files into the data flow output
+    Push a list of files into the data flow output. Files already in the output are skipped.
 
     Args:
         schema_data: the schema to use
         file_paths: the list of files to push
     """
-    for data_flow in schema_data.data_flows or []:
-        if data_flow.name == "InOutData" and data_flow.push_output_data:
-            if data_flow.output_data is None:
-                data_flow.output_data = []
-            for file_path in file_paths:
-                url_texture_path = _OmniUrl(file_path)
-                if str(url_texture_path) in data_flow.output_data:
-                    continue
-                data_flow.output_data.append(str(url_texture_path))
+    data_flows = [data_flow for data_flow in _get_in_out_data_flows(schema_data) if data_flow.push_output_data]
+    if not data_flows:
+        return
+    urls = _normalize_paths(file_paths)
+    for data_flow in data_flows:
+        # The data flows are not validated on assignment, so plain lists may have been set
+        if not isinstance(data_flow.output_data, _InOutData):
+            data_flow.output_data = _InOutData(data_flow.output_data or ())
+        data_flow.output_data.update(urls)
+
+
+def _get_in_out_data_flows(schema_data) -> list[_InOutDataFlow]:
+    """
+    Get the InOutData data flows of a schema
+
+    Args:
+        schema_data: the schema to inspect
+
+    Returns:
+        The InOutData data flows, in the schema order
+    """
+    return [data_flow for data_flow in schema_data.data_flows or [] if data_flow.name == "InOutData"]
+
+
+def _normalize_paths(file_paths: Iterable[str]) -> list[str]:
+    """
+    Normalize the paths once for all the data flows they are pushed to
+
+    Args:
+        file_paths: the paths to normalize
+
+    Returns:
+        The normalized paths, in order
+    """
+    return [str(_OmniUrl(file_path)) for file_path in file_paths]
@@ -16,5 +16,6 @@
 """
 
 from .unit.test_factory import TestValidatorFactory
+from .unit.test_in_out_data import TestInOutData
 
-__all__ = ["TestValidatorFactory"]
+__all__ = ["TestInOutData", "TestValidatorFactory"]
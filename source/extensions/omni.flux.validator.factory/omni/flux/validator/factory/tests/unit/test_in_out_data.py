@@ -0,0 +1,104 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+from omni.flux.validator.factory import InOutData, InOutDataFlow, utils
+from omni.kit.test import AsyncTestCase
+
+
+class TestInOutData(AsyncTestCase):
+    async def test_push_data_should_keep_unique_paths_in_order(self):
+        # Arrange
+        data_flow = InOutDataFlow(push_input_data=True, push_output_data=True, output_data=["c:/out/a.dds"])
+        schema_data = SimpleNamespace(data_flows=[data_flow, InOutDataFlow()])
+
+        # Act
+        utils.push_input_data(schema_data, ["c:\\in\\b.png", "c:/in/a.png", "c:/in/b.png"])
+        utils.push_input_data(schema_data, ["c:/in/a.png", "c:/in/c.png"])
+        utils.push_output_data(schema_data, ["c:/out/a.dds", "c:/out/b.dds"])
+
+        # Assert
+        self.assertIsInstance(data_flow.input_data, InOutData)
+        self.assertEqual(["c:/in/b.png", "c:/in/a.png", "c:/in/c.png"], data_flow.input_data)
+        self.assertEqual(["c:/out/a.dds", "c:/out/b.dds"], data_flow.output_data)
+        self.assertIsNone(schema_data.data_flows[1].input_data)
+
+    async def test_push_data_assigned_list_should_be_converted(self):
+        # Arrange
+        data_flow = InOutDataFlow(push_output_data=True)
+        data_flow.output_data = ["c:/out/a.dds"]
+
+        # Act
+        utils.push_output_data(SimpleNamespace(data_flows=[data_flow]), ["c:/out/a.dds", "c:/out/b.dds"])
+
+        # Assert
+        self.assertIsInstance(data_flow.output_data, InOutData)
+        self.assertEqual(["c:/out/a.dds", "c:/out/b.dds"], data_flow.output_data)
+
+    async def test_in_out_data_list_mutations_should_keep_the_index(self):
+        # Arrange
+        data = InOutData(["a", "b", "c"])
+
+        # Act
+        data.remove("b")
+        data.insert(0, "c")
+        data.append("b")
+        data[0] = "c"
+        popped = data.pop()
+
+        # Assert
+        self.assertEqual("b", popped)
+        self.assertEqual(["c"], data)
+        self.assertNotIn("a", data)
+        self.assertNotIn("b", data)
+        self.assertIn("c", data)
+
+    async def test_serialization_should_round_trip(self):
+        # Arrange
+        data_flow = InOutDataFlow(input_data=["a", "b"], output_data=None, push_input_data=True)
+
+        # Act
+        dumped = json.loads(data_flow.model_dump_json())
+        loaded = InOutDataFlow.model_validate_json(data_flow.model_dump_json())
+
+        # Assert
+        self.assertEqual(["a", "b"], dumped["input_data"])
+        self.assertIsNone(dumped["output_data"])
+        self.assertEqual(["a", "b"], data_flow.model_dump()["input_data"])
+        self.assertIsInstance(loaded.input_data, InOutData)
+        self.assertEqual(data_flow, loaded)
+
+    async def test_push_data_benchmark_should_scale_linearly(self):
+        # Arrange
+        paths = [f"c:/textures/texture_{index}.png" for index in range(20000)]
+        data_flow = InOutDataFlow(push_input_data=True)
+        schema_data = SimpleNamespace(data_flows=[data_flow])
+
+        # Act
+        start = time.perf_counter()
+        for path in paths:
+            utils.push_input_data(schema_data, [path])
+        utils.push_input_data(schema_data, paths)
+        seconds = time.perf_counter() - start
+
+        # Assert
+        self.assertEqual(paths, data_flow.input_data)
+        # Scanning the list for every push grew quadratically with the number of paths and took several seconds
+        self.assertLess(seconds, 2)
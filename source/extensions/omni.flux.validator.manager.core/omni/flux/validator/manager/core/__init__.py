@@ -20,7 +20,11 @@ __all__ = [
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST",
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT",
     "ManagerCore",
+    "ProgressChannel",
+    "ValidationProgressDelta",
     "ValidationSchema",
+    "get_progress_channel",
+    "iter_schema_plugins",
     "validation_schema_json_encoder",
 ]
 
@@ -29,6 +33,9 @@ from .manager import (
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST,
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT,
     ManagerCore,
+    ValidationProgressDelta,
     ValidationSchema,
+    iter_schema_plugins,
     validation_schema_json_encoder,
 )
+from .progress_channel import ProgressChannel, get_progress_channel
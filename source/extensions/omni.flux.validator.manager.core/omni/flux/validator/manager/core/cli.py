@@ -23,6 +23,7 @@ import omni.kit.app
 import omni.usd
 from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.manager.core import get_progress_channel as _get_progress_channel
 
 
 def main():
@@ -58,6 +59,8 @@ async def run(json_path: str, print_result: bool, queue_id: str | None):
         await core.deferred_run(print_result=print_result, queue_id=queue_id)
         exit_code = 0
     finally:
+        # The service must receive the final schema before the process quits
+        await asyncio.to_thread(_get_progress_channel().flush)
         omni.kit.app.get_app().post_quit(exit_code)
 
 
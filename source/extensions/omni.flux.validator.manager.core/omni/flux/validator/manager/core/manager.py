@@ -34,7 +34,6 @@ import carb
 import carb.settings
 import omni.kit.app
 import omni.usd
-import requests
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
@@ -50,10 +49,21 @@ from omni.flux.validator.factory import get_instance as _get_factory_instance
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+from .progress_channel import get_progress_channel as _get_progress_channel
+
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST = "/exts/omni.services.transport.server.http/host"
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT = "/exts/omni.services.transport.server.http/port"
 EXTS_MASS_VALIDATOR_SERVICE_PREFIX = "/exts/omni.flux.validator.mass.service/service/prefix"
 
+# Plugin data fields sent with the progress deltas. Fields that a plugin doesn't declare are skipped.
+_PLUGIN_PROGRESS_FIELDS = {
+    "progress",
+    "last_check_result",
+    "last_check_message",
+    "last_fix_result",
+    "last_fix_message",
+}
+
 
 @contextmanager
 def disable_exception_traceback():
@@ -178,6 +188,47 @@ class ValidationSchema(BaseModel):
         return self
 
 
+class ValidationProgressDelta(BaseModel):
+    """Fields of a validation schema that changed since the last progress update."""
+
+    uuid: str
+    progress: float | None = Field(default=None)
+    validation_passed: bool | None = Field(default=None)
+    finished: tuple[bool, str] | None = Field(default=None)
+    plugins: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Changed plugin data fields, keyed by the plugin path in the schema (ex: 'check_plugins/0')",
+    )
+
+
+def iter_schema_plugins(model: BaseModel, path: str = "") -> Iterable[tuple[str, _BaseSchema]]:
+    """
+    Iterate over the plugins of a schema, depth first, with their path in the schema.
+
+    The path only depends on the schema layout, so two processes that load the same schema get the same paths.
+
+    Args:
+        model: the validation schema or a plugin schema
+        path: the path of the given model
+
+    Yields:
+        The path of the plugin (ex: 'check_plugins/0/selector_plugins/1') and the plugin schema
+    """
+    for attr in type(model).model_fields:
+        value = getattr(model, attr)
+        if isinstance(value, _BaseSchema):
+            plugins = [(f"{path}{attr}", value)]
+        elif isinstance(value, list):
+            plugins = [
+                (f"{path}{attr}/{i}", plugin) for i, plugin in enumerate(value) if isinstance(plugin, _BaseSchema)
+            ]
+        else:
+            continue
+        for plugin_path, plugin in plugins:
+            yield plugin_path, plugin
+            yield from iter_schema_plugins(plugin, path=f"{plugin_path}/")
+
+
 def validation_schema_json_encoder(obj):
     if isinstance(obj, (_OmniUrl, pathlib.PurePath)):
         return str(obj)
@@ -234,6 +285,7 @@ class ManagerCore:
         self.__pause_validation = False
         self.__stop_validation = False
         self.__progress = 0.0
+        self.__sent_progress_state: dict[str, Any] = {}
 
         self.__model = ValidationSchema(**self._recursive_model_dump(schema))
         self.__model.on_progress_callback = self._on_run_progress
@@ -380,26 +432,91 @@ class ManagerCore:
             self.__model.progress = progress
 
         if not force_not_send_request and self.__model.send_request:
-            self._send_update_request()
+            self._send_progress_delta()
 
-    def _send_update_request(self):
-        """This method handles the POST request to update a schema. It sends an HTTP post request with JSON data of
-        current model instance, and expects status code 200 if everything is okay."""
+    def _get_service_url(self, endpoint: str) -> str:
+        """
+        Get the URL of a mass validator service endpoint for the current queue.
+
+        Args:
+            endpoint: the endpoint path, relative to the mass validator service
+
+        Returns:
+            The full URL
+        """
         host = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
         port = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
         prefix = self.__settings.get(EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
 
-        url = f"http://{host}:{port}{prefix}/mass-validator/schema"  # use IP. localhost is very slow
+        url = f"http://{host}:{port}{prefix}/mass-validator/{endpoint}"  # use IP. localhost is very slow
         if self.__current_queue_id:
             url += f"?queue_id={self.__current_queue_id}"  # Set the query param if we have a queue ID
+        return url
+
+    def _build_progress_delta(self) -> ValidationProgressDelta | None:
+        """
+        Collect the progress fields that changed since the last sent update.
+
+        Returns:
+            The changed fields, or None if nothing changed
+        """
+        state = {
+            "progress": self.__model.progress,
+            "validation_passed": self.__model.validation_passed,
+            "finished": self.__model.finished,
+        }
+        changed = {key: value for key, value in state.items() if self.__sent_progress_state.get(key) != value}
+        plugins = {}
+        for path, plugin in iter_schema_plugins(self.__model):
+            fields = plugin.data.model_dump(include=_PLUGIN_PROGRESS_FIELDS)
+            sent_fields = self.__sent_progress_state.get(path, {})
+            changed_fields = {key: value for key, value in fields.items() if sent_fields.get(key) != value}
+            if changed_fields:
+                plugins[path] = changed_fields
+                state[path] = fields
+        if not changed and not plugins:
+            return None
+        self.__sent_progress_state.update(state)
+        return ValidationProgressDelta(uuid=self.__model.uuid or "", plugins=plugins, **changed)
+
+    def _send_progress_delta(self):
+        """Queue the changed progress fields for the mass validator service. The request is sent off the event loop."""
+        delta = self._build_progress_delta()
+        if delta is None:
+            return
+        _get_progress_channel().post_delta(
+            self._get_service_url("schema/progress"), delta.model_dump(exclude_none=True, exclude_unset=True)
+        )
+
+    def _send_update_request(self):
+        """Queue the full schema for the mass validator service. The request is sent off the event loop, after the
+        pending progress deltas."""
+        _get_progress_channel().post_schema(
+            self._get_service_url("schema"),
+            self.__model.uuid or "",
+            self.model.model_dump_json(serialize_as_any=True),
+            progress_url=self._get_service_url("schema/progress"),
+        )
 
-        r = None
-        try:
-            # Sending a schema update request should be quick. Set a short timeout.
-            r = requests.put(url, data=self.model.model_dump_json(serialize_as_any=True), timeout=5)
-            r.raise_for_status()
-        except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
-            raise ValueError(r.text) from e
+    def apply_progress_delta(self, delta: ValidationProgressDelta):
+        """
+        Apply the progress fields sent by the process that runs this validation.
+
+        Args:
+            delta: the changed fields
+        """
+        if delta.plugins:
+            for path, plugin in iter_schema_plugins(self.__model):
+                for field_name, value in delta.plugins.get(path, {}).items():
+                    if field_name in _PLUGIN_PROGRESS_FIELDS and getattr(plugin.data, field_name) != value:
+                        setattr(plugin.data, field_name, value)
+        # Progress and finished fire the run callbacks, so the result must be set before
+        if delta.validation_passed is not None:
+            self.__model.validation_passed = delta.validation_passed
+        if delta.progress is not None and delta.progress != self.__model.progress:
+            self.__model.progress = delta.progress
+        if delta.finished is not None and delta.finished != self.__model.finished:
+            self.__model.finished = delta.finished
 
     def get_progress(self):
         return self.__progress
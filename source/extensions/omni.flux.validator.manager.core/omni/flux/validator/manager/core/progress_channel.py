@@ -0,0 +1,198 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ProgressChannel", "get_progress_channel", "merge_progress_deltas"]
+
+import json
+import threading
+from typing import Any
+
+import carb
+import carb.settings
+import requests
+
+EXTS_PROGRESS_CHANNEL_WINDOW = "/exts/omni.flux.validator.manager.core/progress_channel/window"
+EXTS_PROGRESS_CHANNEL_TIMEOUT = "/exts/omni.flux.validator.manager.core/progress_channel/timeout"
+
+_INSTANCE: ProgressChannel | None = None
+
+
+def merge_progress_deltas(previous: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge a progress delta into a previous delta of the same schema. Newer values win.
+
+    Args:
+        previous: the pending delta
+        new: the delta to merge into the pending one
+
+    Returns:
+        The merged delta
+    """
+    merged = {**previous, **{key: value for key, value in new.items() if key != "plugins"}}
+    if "plugins" not in previous and "plugins" not in new:
+        return merged
+    plugins = {path: dict(fields) for path, fields in previous.get("plugins", {}).items()}
+    for path, fields in new.get("plugins", {}).items():
+        plugins.setdefault(path, {}).update(fields)
+    merged["plugins"] = plugins
+    return merged
+
+
+class ProgressChannel:
+    def __init__(self, window: float = 0.25, timeout: float = 5):
+        """
+        Send validation progress to the mass validator service from a background thread.
+
+        Progress deltas of the same schema are coalesced over a time window and sent in one batched request per
+        endpoint. All requests reuse the connections of one HTTP session. A full schema replaces the pending deltas
+        of that schema.
+
+        Args:
+            window: the time in seconds during which progress deltas are coalesced before being sent
+            timeout: the timeout of each request in seconds
+        """
+        self._window = window
+        self._timeout = timeout
+
+        self.__session = requests.Session()
+        self.__condition = threading.Condition()
+        self.__pending_deltas: dict[tuple[str, str], dict[str, Any]] = {}
+        self.__pending_schemas: dict[tuple[str, str], str] = {}
+        self.__sending = False
+        self.__flush_requests = 0
+        self.__closed = False
+        self.__thread: threading.Thread | None = None
+
+    def post_delta(self, url: str, delta: dict[str, Any]):
+        """
+        Queue a progress delta. It is merged with the pending delta of the same schema.
+
+        Args:
+            url: the progress endpoint of the service
+            delta: the changed fields of a schema. Must hold the `uuid` of the schema.
+        """
+        key = (url, delta["uuid"])
+        with self.__condition:
+            pending = self.__pending_deltas.get(key)
+            self.__pending_deltas[key] = merge_progress_deltas(pending, delta) if pending else delta
+            self.__ensure_thread()
+
+    def post_schema(self, url: str, uuid: str, schema_json: str, progress_url: str | None = None):
+        """
+        Queue the full schema of a finished validation. It is sent without waiting for the coalescing window.
+
+        Args:
+            url: the schema endpoint of the service
+            uuid: the UUID of the schema
+            schema_json: the serialized schema
+            progress_url: the progress endpoint whose pending deltas of this schema become obsolete
+        """
+        with self.__condition:
+            if progress_url is not None:
+                self.__pending_deltas.pop((progress_url, uuid), None)
+            self.__pending_schemas[(url, uuid)] = schema_json
+            self.__ensure_thread()
+            self.__condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued update was sent.
+
+        Args:
+            timeout: the maximum time to wait in seconds. None waits forever.
+
+        Returns:
+            True if everything was sent, False if the timeout expired
+        """
+        with self.__condition:
+            self.__flush_requests += 1
+            self.__condition.notify_all()
+            try:
+                return self.__condition.wait_for(
+                    lambda: not self.__pending_deltas and not self.__pending_schemas and not self.__sending, timeout
+                )
+            finally:
+                self.__flush_requests -= 1
+
+    def close(self):
+        """Send the queued updates, stop the background thread and close the HTTP session."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        self.__session.close()
+
+    def __ensure_thread(self):
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                # Wait for the first update, then leave the window open to coalesce the next ones. A full schema or a
+                # flush cuts the window short.
+                self.__condition.wait_for(lambda: self.__pending_deltas or self.__pending_schemas or self.__closed)
+                self.__condition.wait_for(
+                    lambda: self.__pending_schemas or self.__flush_requests or self.__closed, self._window
+                )
+                deltas, self.__pending_deltas = self.__pending_deltas, {}
+                schemas, self.__pending_schemas = self.__pending_schemas, {}
+                if not deltas and not schemas and self.__closed:
+                    return
+                self.__sending = True
+            try:
+                self.__send(deltas, schemas)
+            finally:
+                with self.__condition:
+                    self.__sending = False
+                    self.__condition.notify_all()
+
+    def __send(self, deltas: dict[tuple[str, str], dict[str, Any]], schemas: dict[tuple[str, str], str]):
+        batches: dict[str, list[dict[str, Any]]] = {}
+        for (url, _uuid), delta in deltas.items():
+            batches.setdefault(url, []).append(delta)
+        # Deltas go first: the full schema of a finished validation must be the last update the service receives
+        requests_to_send = [(url, json.dumps(batch)) for url, batch in batches.items()]
+        requests_to_send.extend((url, schema_json) for (url, _uuid), schema_json in schemas.items())
+        for url, data in requests_to_send:
+            try:
+                response = self.__session.put(url, data=data, timeout=self._timeout)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                carb.log_error(f"Unable to send the validation progress to {url}: {e}")
+
+
+def get_progress_channel() -> ProgressChannel:
+    """
+    Get the progress channel of the current process.
+
+    Returns:
+        The progress channel shared by every validation of the process
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        settings = carb.settings.get_settings()
+        _INSTANCE = ProgressChannel(
+            window=settings.get(EXTS_PROGRESS_CHANNEL_WINDOW) or 0.25,
+            timeout=settings.get(EXTS_PROGRESS_CHANNEL_TIMEOUT) or 5,
+        )
+    return _INSTANCE
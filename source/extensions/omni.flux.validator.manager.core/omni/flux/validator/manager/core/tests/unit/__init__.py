@@ -16,4 +16,5 @@
 """
 
 from .test_core import *
+from .test_progress_channel import *
 from .test_schema import *
@@ -24,7 +24,7 @@ import sys
 import unittest
 from pathlib import Path
 from typing import Any
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
 import carb.tokens
 import omni.kit.app
@@ -32,6 +32,7 @@ from omni.flux.validator.factory import BaseValidatorRunMode as _BaseValidatorRu
 from omni.flux.validator.factory import ResultorBase as _ResultorBase
 from omni.flux.validator.factory import get_instance as _get_factory_instance
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.manager.core import ValidationProgressDelta as _ValidationProgressDelta
 from omni.flux.validator.plugin.check.usd.example.print_prims import PrintPrims as _PrintPrims
 from omni.flux.validator.plugin.context.usd_stage.current_stage import CurrentStage as _CurrentStage
 from omni.flux.validator.plugin.selector.usd.all_prims import AllPrims as _AllPrims
@@ -377,18 +378,74 @@ class TestCore(AsyncTestCase):
         """Test if _send_service_request is not called when model data does not require it."""
         core = _create_good_schema()
 
-        with patch.object(_ManagerCore, "_send_update_request") as m_mocked:
+        with (
+            patch.object(_ManagerCore, "_send_update_request") as m_mocked,
+            patch.object(_ManagerCore, "_send_progress_delta") as m_delta_mocked,
+        ):
             await core.deferred_run()
             self.assertFalse(m_mocked.called)
+            self.assertFalse(m_delta_mocked.called)
 
     async def test_send_service_request_called_true(self):
         """Test if _send_service_request is called when model data requires it."""
         core = _create_good_schema()
         core.model.send_request = True
 
-        with patch.object(_ManagerCore, "_send_update_request") as m_mocked:
+        with (
+            patch.object(_ManagerCore, "_send_update_request") as m_mocked,
+            patch.object(_ManagerCore, "_send_progress_delta") as m_delta_mocked,
+        ):
+            await core.deferred_run()
+            self.assertEqual(1, m_mocked.call_count)
+            self.assertTrue(m_delta_mocked.called)
+
+    async def test_send_service_request_sends_only_changed_fields(self):
+        core = _create_good_schema()
+        core.model.send_request = True
+        channel_mock = Mock()
+
+        with patch("omni.flux.validator.manager.core.manager._get_progress_channel", return_value=channel_mock):
             await core.deferred_run()
-            self.assertTrue(m_mocked.called)
+
+        deltas = [c.args[1] for c in channel_mock.post_delta.call_args_list]
+        self.assertTrue(deltas)
+        self.assertTrue(
+            all(c.args[0].endswith("/mass-validator/schema/progress") for c in channel_mock.post_delta.call_args_list)
+        )
+        # the progress changes every time, but the plugin results are only sent when they change
+        sent_check_results = [
+            d["plugins"]["check_plugins/1"]["last_check_result"]
+            for d in deltas
+            if "last_check_result" in d.get("plugins", {}).get("check_plugins/1", {})
+        ]
+        self.assertEqual([True], sent_check_results)
+        # the full schema is sent once, at the end
+        self.assertEqual(1, channel_mock.post_schema.call_count)
+        self.assertTrue(channel_mock.post_schema.call_args.args[0].endswith("/mass-validator/schema"))
+
+    async def test_apply_progress_delta_mirrors_remote_run(self):
+        core = _create_good_schema()
+        core.model.send_request = True
+        mirror = _ManagerCore(core.model.model_dump(serialize_as_any=True))
+        channel_mock = Mock()
+        mirror_progress = []
+        _sub = mirror.subscribe_run_progress(mirror_progress.append)
+
+        with patch("omni.flux.validator.manager.core.manager._get_progress_channel", return_value=channel_mock):
+            await core.deferred_run()
+        for c in channel_mock.post_delta.call_args_list:
+            mirror.apply_progress_delta(_ValidationProgressDelta(**c.args[1]))
+
+        self.assertEqual(100, mirror.model.progress)
+        self.assertEqual(100, mirror_progress[-1])
+        self.assertEqual(core.model.validation_passed, mirror.model.validation_passed)
+        self.assertEqual(
+            core.model.check_plugins[1].data.last_check_message, mirror.model.check_plugins[1].data.last_check_message
+        )
+        self.assertEqual(
+            core.model.check_plugins[1].selector_plugins[0].data.progress,
+            mirror.model.check_plugins[1].selector_plugins[0].data.progress,
+        )
 
     async def test_run_stopped(self):
         def sub_stopped_count_fn():
@@ -0,0 +1,108 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+from unittest.mock import DEFAULT, patch
+
+import requests
+from omni.flux.validator.manager.core import ProgressChannel
+from omni.flux.validator.manager.core.progress_channel import merge_progress_deltas
+from omni.kit.test import AsyncTestCase
+
+
+class TestProgressChannel(AsyncTestCase):
+    async def setUp(self):
+        self.session_patcher = patch("omni.flux.validator.manager.core.progress_channel.requests.Session")
+        self.session_mock = self.session_patcher.start().return_value
+
+    async def tearDown(self):
+        self.session_patcher.stop()
+
+    def _sent_requests(self) -> list[tuple[str, str]]:
+        return [(c.args[0], c.kwargs["data"]) for c in self.session_mock.put.call_args_list]
+
+    async def test_merge_progress_deltas_newer_values_win(self):
+        # Arrange
+        previous = {"uuid": "a", "progress": 10, "plugins": {"check_plugins/0": {"progress": [0.5, "", True]}}}
+        new = {"uuid": "a", "progress": 20, "plugins": {"check_plugins/0": {"last_check_result": True}}}
+
+        # Act
+        merged = merge_progress_deltas(previous, new)
+
+        # Assert
+        self.assertEqual(
+            merged,
+            {
+                "uuid": "a",
+                "progress": 20,
+                "plugins": {"check_plugins/0": {"progress": [0.5, "", True], "last_check_result": True}},
+            },
+        )
+        self.assertNotIn("last_check_result", previous["plugins"]["check_plugins/0"])
+
+    async def test_post_delta_many_deltas_coalesced_in_one_request(self):
+        # Arrange
+        channel = ProgressChannel(window=10)
+
+        # Act
+        for progress in range(50):
+            channel.post_delta("http://progress", {"uuid": "a", "progress": progress})
+        channel.post_delta("http://progress", {"uuid": "b", "progress": 1})
+        flushed = channel.flush(timeout=10)
+        channel.close()
+
+        # Assert
+        self.assertTrue(flushed)
+        sent = self._sent_requests()
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0][0], "http://progress")
+        self.assertEqual(json.loads(sent[0][1]), [{"uuid": "a", "progress": 49}, {"uuid": "b", "progress": 1}])
+
+    async def test_post_schema_drops_pending_deltas_of_same_schema(self):
+        # Arrange
+        channel = ProgressChannel(window=10)
+
+        # Act
+        channel.post_delta("http://progress", {"uuid": "a", "progress": 50})
+        channel.post_delta("http://progress", {"uuid": "b", "progress": 50})
+        channel.post_schema("http://schema", "a", '{"uuid": "a"}', progress_url="http://progress")
+        channel.flush(timeout=10)
+        channel.close()
+
+        # Assert
+        self.assertEqual(
+            self._sent_requests(),
+            [("http://progress", json.dumps([{"uuid": "b", "progress": 50}])), ("http://schema", '{"uuid": "a"}')],
+        )
+
+    async def test_flush_request_fails_logs_error_and_keeps_sending(self):
+        # Arrange
+        channel = ProgressChannel(window=10)
+        self.session_mock.put.side_effect = [requests.exceptions.ConnectionError("refused"), DEFAULT]
+
+        # Act
+        with patch("omni.flux.validator.manager.core.progress_channel.carb.log_error") as log_error_mock:
+            channel.post_delta("http://progress", {"uuid": "a", "progress": 50})
+            channel.post_schema("http://schema", "b", '{"uuid": "b"}')
+            flushed = channel.flush(timeout=10)
+            channel.close()
+
+        # Assert
+        self.assertTrue(flushed)
+        self.assertEqual(self.session_mock.put.call_count, 2)
+        log_error_mock.assert_called_once()
+        self.session_mock.close.assert_called_once()
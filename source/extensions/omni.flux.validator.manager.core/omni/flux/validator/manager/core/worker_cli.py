@@ -0,0 +1,171 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import traceback
+
+import carb
+import omni.kit.app
+import omni.usd
+from omni.flux.utils.common import path_utils as _path_utils
+from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.manager.core import get_progress_channel as _get_progress_channel
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+else:
+    import resource
+
+
+def main():
+    example = """
+    Example:
+
+        kit.exe omni.flux.app.validator.mass_cli.kit --exec "worker_cli.py --host 127.0.0.1 --port 50000 -w 0"
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Run a long-lived validation worker that takes schemas from a mass validation worker pool.",
+        epilog=example,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("--host", type=str, help="Host of the worker pool to connect to", required=True)
+    parser.add_argument("--port", type=int, help="Port of the worker pool to connect to", required=True)
+    parser.add_argument("-w", "--worker-id", type=int, help="ID given to this worker by the pool", required=True)
+    args = parser.parse_args()
+
+    asyncio.ensure_future(serve(args.host, args.port, args.worker_id))
+
+
+def get_peak_memory_mb() -> float:
+    """
+    Get the peak resident memory of the current process.
+
+    Returns:
+        The peak resident memory in megabytes
+    """
+    if sys.platform == "win32":
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return 0.0
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _send(writer: asyncio.StreamWriter, message: dict):
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def run_job(message: dict) -> dict:
+    """
+    Run one schema sent by the worker pool and build the reply.
+
+    Args:
+        message: the job message with the keys `job_id`, `schema`, `print_result` and `queue_id`
+
+    Returns:
+        The reply message with the result, the error message, the job duration and the worker memory
+    """
+    start = time.perf_counter()
+    try:
+        data = _path_utils.read_json_file(message["schema"])
+        core = _ManagerCore(data)
+        await core.deferred_run(print_result=message.get("print_result", False), queue_id=message.get("queue_id"))
+        # The service must receive the final schema before the pool sees the job as done
+        await asyncio.to_thread(_get_progress_channel().flush)
+        result = True
+        result_message = "Ok"
+    except Exception:  # noqa: BLE001
+        # The worker must survive a failing schema: the error goes back to the pool as the job result
+        result = False
+        result_message = traceback.format_exc()
+        carb.log_error(result_message)
+    return {
+        "type": "result",
+        "job_id": message["job_id"],
+        "result": result,
+        "message": result_message,
+        "duration": time.perf_counter() - start,
+        "memory_mb": get_peak_memory_mb(),
+    }
+
+
+@omni.usd.handle_exception
+async def serve(host: str, port: int, worker_id: int):
+    """
+    Connect to the worker pool and execute the received jobs until the pool asks to shut down.
+
+    Args:
+        host: the host of the worker pool
+        port: the port of the worker pool
+        worker_id: the ID given to this worker by the pool
+    """
+    exit_code = 1
+    writer = None
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        await _send(writer, {"type": "hello", "worker_id": worker_id, "pid": os.getpid()})
+        while True:
+            line = await reader.readline()
+            if not line:
+                # The pool closed the connection: nothing left to do
+                exit_code = 0
+                break
+            message = json.loads(line)
+            if message["type"] == "ping":
+                await _send(writer, {"type": "pong", "memory_mb": get_peak_memory_mb()})
+            elif message["type"] == "job":
+                await _send(writer, await run_job(message))
+            elif message["type"] == "shutdown":
+                exit_code = 0
+                break
+            else:
+                carb.log_error(f"Unknown worker pool message type: {message['type']}")
+    finally:
+        if writer is not None:
+            writer.close()
+        omni.kit.app.get_app().post_quit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import carb
+import carb.settings
+import omni.kit.app
+from omni.flux.validator.mass.core import Executors as _Executors
+from omni.flux.validator.mass.core import ManagerMassCore as _ManagerMassCore
+from omni.flux.validator.mass.core.executors import ExternalProcessExecutor as _ExternalProcessExecutor
+from omni.flux.validator.mass.core.executors.external_process_executor import (
+    WORKER_POOL_ENABLED as _WORKER_POOL_ENABLED,
+)
+
+
+def main():
+    example = """
+    Example:
+
+        kit.exe omni.flux.app.validator.mass_cli.kit --no-window --exec "benchmark_cli.py -s my_schema.json -r 20 -w 4"
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Compare the throughput of the cold-start process executor with the worker pool.",
+        epilog=example,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("-s", "--schema", type=str, help="Your schema file (.json)", required=True, action="append")
+    parser.add_argument("-r", "--repeat", type=int, help="Number of times each cooked schema runs", default=10)
+    parser.add_argument("-w", "--workers", type=int, help="Number of processes for both modes", default=1)
+    parser.add_argument("-t", "--timeout", type=int, help="Timeout for each job in seconds", required=False)
+    args = parser.parse_args()
+
+    asyncio.ensure_future(run(args.schema, args.repeat, args.workers, args.timeout))
+
+
+async def _run_mode(
+    core: _ManagerMassCore, schemas: list[dict[Any, Any]], workers: int, pooled: bool, timeout: int | None
+) -> tuple[float, int]:
+    """
+    Run every schema with a new process executor and measure the wall-clock time.
+
+    Args:
+        core: the mass core that creates the tasks
+        schemas: the cooked schemas to run
+        workers: the number of processes
+        pooled: use the worker pool or start one process per schema
+        timeout: timeout for each job
+
+    Returns:
+        The wall-clock time in seconds and the number of failed jobs
+    """
+    carb.settings.get_settings().set(_WORKER_POOL_ENABLED, pooled)
+    executor = _ExternalProcessExecutor(processor_count=workers)
+    try:
+        start = time.perf_counter()
+        tasks = await core.create_tasks(
+            _Executors.EXTERNAL_PROCESS_EXECUTOR,
+            schemas,
+            custom_executors=(None, executor),
+            silent=True,
+            timeout=timeout,
+            standalone=True,
+        )
+        results = await asyncio.gather(*[asyncio.wrap_future(task) for _core, task in tasks])
+        elapsed = time.perf_counter() - start
+    finally:
+        executor.destroy()
+    return elapsed, sum(1 for result, _message in results if not result)
+
+
+async def run(json_paths: list[str], repeat: int, workers: int, timeout: int | None = None):
+    exit_code = 1
+    settings = carb.settings.get_settings()
+    previous_pool_setting = settings.get(_WORKER_POOL_ENABLED)
+    core = _ManagerMassCore(schema_paths=json_paths)
+    try:
+        schemas = []
+        for item in core.schema_model.get_item_children(None):
+            schemas.extend(await item.cook_template_no_exception())
+        schemas *= repeat
+
+        cold_time, cold_failed = await _run_mode(core, schemas, workers, False, timeout)
+        pool_time, pool_failed = await _run_mode(core, schemas, workers, True, timeout)
+
+        print(f"Jobs: {len(schemas)}, processes: {workers}")
+        print(f"Cold start: {cold_time:.2f}sc, {len(schemas) / cold_time:.2f} job(s)/sc, {cold_failed} failed")
+        print(f"Worker pool: {pool_time:.2f}sc, {len(schemas) / pool_time:.2f} job(s)/sc, {pool_failed} failed")
+        print(f"Speedup: x{cold_time / pool_time:.2f}")
+        exit_code = 0 if not cold_failed and not pool_failed else 1
+    finally:
+        settings.set(_WORKER_POOL_ENABLED, bool(previous_pool_setting))
+        core.destroy()
+        omni.kit.app.get_app().post_quit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
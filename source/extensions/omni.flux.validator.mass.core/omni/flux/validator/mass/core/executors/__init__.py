@@ -17,5 +17,6 @@
 
 from .current_process_executor import CurrentProcessExecutor
 from .external_process_executor import ExternalProcessExecutor
+from .worker_pool import JobReport, WorkerPool, WorkerPoolError
 
-__all__ = ["CurrentProcessExecutor", "ExternalProcessExecutor"]
+__all__ = ["CurrentProcessExecutor", "ExternalProcessExecutor", "JobReport", "WorkerPool", "WorkerPoolError"]
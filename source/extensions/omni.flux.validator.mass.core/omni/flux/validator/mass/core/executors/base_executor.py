@@ -56,3 +56,6 @@ class BaseExecutor:
             The future of the job (that will hold the result)
         """
         pass
+
+    def destroy(self):
+        """Release the executor resources."""
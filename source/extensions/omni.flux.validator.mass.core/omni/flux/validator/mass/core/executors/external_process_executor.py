@@ -20,6 +20,7 @@ from __future__ import annotations
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
 from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path
@@ -41,6 +42,7 @@ from omni.flux.validator.manager.core import (
 )
 
 from .base_executor import BaseExecutor as _BaseExecutor
+from .worker_pool import WorkerPool as _WorkerPool
 
 if TYPE_CHECKING:
     from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
@@ -49,20 +51,32 @@ if TYPE_CHECKING:
 OVERRIDE_EXPERIENCE = (
     "/exts/omni.flux.validator.mass.core/override_process_experience"  # list of paths of schema separated by a coma
 )
+WORKER_POOL_ENABLED = "/exts/omni.flux.validator.mass.core/worker_pool/enabled"
+WORKER_POOL_MAX_JOBS_PER_WORKER = "/exts/omni.flux.validator.mass.core/worker_pool/max_jobs_per_worker"
+WORKER_POOL_MAX_MEMORY_MB = "/exts/omni.flux.validator.mass.core/worker_pool/max_memory_mb"
+WORKER_POOL_STARTUP_TIMEOUT = "/exts/omni.flux.validator.mass.core/worker_pool/startup_timeout"
+WORKER_POOL_HEALTH_CHECK_INTERVAL = "/exts/omni.flux.validator.mass.core/worker_pool/health_check_interval"
 
 
 class ExternalProcessExecutor(_BaseExecutor):
     _EXECUTOR = None
 
-    def __init__(self):
+    def __init__(self, processor_count: int = 1):
         """
         Executor that will run job(s) in ThreadPoolExecutor. Multiple processes can be set from the UI.
+
+        By default, each job starts its own Kit process. When the worker pool setting is enabled, jobs are sent to
+        long-lived Kit processes instead, one per processor.
+
+        Args:
+            processor_count: number of job(s) we would want to run concurrently
         """
         super().__init__()
         self.__settings = carb.settings.get_settings()
+        self.__worker_pool: _WorkerPool | None = None
+        self.__worker_pool_lock = threading.Lock()
 
-        # Default to one processor
-        self._enabled_processor_count = 1
+        self._enabled_processor_count = processor_count
         if self._EXECUTOR is None:
             self._EXECUTOR = _ThreadPoolExecutor(max_workers=self._enabled_processor_count)
 
@@ -85,16 +99,47 @@ class ExternalProcessExecutor(_BaseExecutor):
     def _update_processor_count(self, processor_count: int):
         self._enabled_processor_count = processor_count
         self._EXECUTOR = _ThreadPoolExecutor(max_workers=self._enabled_processor_count)
+        # The pool is started again with the new size on the next pooled job
+        self.shutdown_worker_pool()
 
-    def _worker(
-        self,
-        core: _ManagerCore,
-        print_result: bool = False,
-        silent: bool = False,
-        timeout: int | None = None,
-        standalone: bool | None = False,
-        queue_id: str | None = None,
-    ):
+    def _get_worker_pool(self) -> _WorkerPool:
+        """
+        Get the worker pool, starting it on the first call.
+
+        Returns:
+            The running worker pool
+        """
+        with self.__worker_pool_lock:
+            if self.__worker_pool is None:
+                self.__worker_pool = _WorkerPool(
+                    self._build_worker_command,
+                    self._enabled_processor_count,
+                    max_jobs_per_worker=self.__settings.get(WORKER_POOL_MAX_JOBS_PER_WORKER) or 0,
+                    max_memory_mb=self.__settings.get(WORKER_POOL_MAX_MEMORY_MB) or 0,
+                    startup_timeout=self.__settings.get(WORKER_POOL_STARTUP_TIMEOUT) or 300,
+                    health_check_interval=self.__settings.get(WORKER_POOL_HEALTH_CHECK_INTERVAL) or 0,
+                )
+            if not self.__worker_pool.is_running:
+                self.__worker_pool.start()
+            return self.__worker_pool
+
+    def shutdown_worker_pool(self):
+        """Stop the long-lived worker processes, if any."""
+        with self.__worker_pool_lock:
+            if self.__worker_pool is not None:
+                self.__worker_pool.shutdown()
+                self.__worker_pool = None
+
+    def _build_kit_command(self, sub_cmd: list[str]) -> str:
+        """
+        Build the shell command that starts the validator Kit experience and executes a script in it.
+
+        Args:
+            sub_cmd: the escaped script path followed by its escaped arguments
+
+        Returns:
+            The shell command to run
+        """
         exe_ext = carb.tokens.get_tokens_interface().resolve("${exe_ext}")
         kit_folder = carb.tokens.get_tokens_interface().resolve("${kit}")
         kit_path = Path(kit_folder) / f"kit{exe_ext}"
@@ -108,34 +153,156 @@ class ExternalProcessExecutor(_BaseExecutor):
             app = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.mass.core}")
             experience_path = Path(app) / "apps" / "omni.flux.app.validator.mass_cli.kit"
 
+        cmd = [f'"{str(kit_path)}"', f'"{str(experience_path)}"', "--no-window"]
+        extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
+        ignore_arg = False
+        for extra_arg in extra_args:
+            # if this is the standalone, we delete args between --start-future-args-remove and
+            # --end-future-args-remove
+            if app_filename == "omni.flux.app.validator.mass_cli":
+                if extra_arg == "--start-future-args-remove":
+                    ignore_arg = True
+                if extra_arg == "--end-future-args-remove":
+                    ignore_arg = False
+                    continue
+                if ignore_arg:
+                    continue
+            cmd.append(f'"{extra_arg}"')
+
+        sub_cmd_str = " ".join(sub_cmd)
+
+        # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
+        # deallocation, the process may crash
+        cmd.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
+
+        host = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
+        port = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
+
+        cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
+        cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
+
+        prefix = self.__settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
+
+        if prefix:
+            cmd.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
+
+        cmd.extend(["--exec", f'"{sub_cmd_str}"'])
+        return " ".join(cmd)
+
+    @staticmethod
+    def _get_validator_script(name: str) -> str:
+        """
+        Get the path of a script shipped with the validator manager core.
+
+        Args:
+            name: the file name of the script
+
+        Returns:
+            The path of the script
+        """
         validator_cli_root_ext = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.manager.core}")
-        exec_cmd = f"{Path(validator_cli_root_ext).joinpath('omni', 'flux', 'validator', 'manager', 'core', 'cli.py')}"
+        return f"{Path(validator_cli_root_ext).joinpath('omni', 'flux', 'validator', 'manager', 'core', name)}"
+
+    def _build_worker_command(self, host: str, port: int, worker_id: int) -> str:
+        """
+        Build the shell command of a long-lived worker of the pool.
+
+        Args:
+            host: the host the worker connects to
+            port: the port the worker connects to
+            worker_id: the ID of the worker in the pool
+
+        Returns:
+            The shell command to run
+        """
+        exec_cmd = self._get_validator_script("worker_cli.py")
+        return self._build_kit_command(
+            [f'\\"{exec_cmd}\\"', "--host", host, "--port", str(port), "--worker-id", str(worker_id)]
+        )
+
+    def _write_schema_file(self, core: _ManagerCore, standalone: bool | None) -> str:
+        """
+        Write the schema of a job into a temporary file that the Kit process can read.
+
+        Args:
+            core: the manager core that holds the data
+            standalone: does the process run in a standalone mode or not (like a CLI)
 
+        Returns:
+            The path of the temporary schema file
+        """
         with tempfile.NamedTemporaryFile("w", delete=False, suffix=".json") as tmp_file:
             jsonfile = tmp_file.name
+        # for standalone, we don't need to send a request to a micro service
+        core.model.send_request = not standalone
+        _path_utils.write_file(
+            jsonfile,
+            core.model.model_dump_json(serialize_as_any=True, indent=4).encode("utf-8"),
+            raise_if_error=True,
+        )
+        return jsonfile
+
+    def _pooled_worker(
+        self,
+        core: _ManagerCore,
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: int | None = None,
+        standalone: bool | None = False,
+        queue_id: str | None = None,
+    ):
+        """
+        Run a job on a long-lived worker of the pool.
+
+        Args:
+            core: the manager core that holds the data
+            print_result: print the resulting schema or not
+            silent: print the timing of the job or not
+            timeout: timeout for the job
+            standalone: does the process run in a standalone mode or not (like a CLI)
+            queue_id: the queue ID to use. Needed if you have multiple widgets that shows different queues
+
+        Returns:
+            The result of the job and its message
+        """
+        jsonfile = None
         try:
-            # for standalone, we don't need to send a request to a micro service
-            core.model.send_request = not standalone
-            _path_utils.write_file(
-                jsonfile,
-                core.model.model_dump_json(serialize_as_any=True, indent=4).encode("utf-8"),
-                raise_if_error=True,
+            jsonfile = self._write_schema_file(core, standalone)
+            report = self._get_worker_pool().run_job(
+                str(Path(jsonfile).resolve()), print_result=print_result, queue_id=queue_id, timeout=timeout
             )
-            cmd = [f'"{str(kit_path)}"', f'"{str(experience_path)}"', "--no-window"]
-            extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
-            ignore_arg = False
-            for extra_arg in extra_args:
-                # if this is the standalone, we delete args between --start-future-args-remove and
-                # --end-future-args-remove
-                if app_filename == "omni.flux.app.validator.mass_cli":
-                    if extra_arg == "--start-future-args-remove":
-                        ignore_arg = True
-                    if extra_arg == "--end-future-args-remove":
-                        ignore_arg = False
-                        continue
-                    if ignore_arg:
-                        continue
-                cmd.append(f'"{extra_arg}"')
+            result, message = report.result, report.message
+            if not silent:
+                print(
+                    f"Job {report.job_id} on worker {report.worker_id}: waited {report.queue_seconds:.2f}sc, "
+                    f"ran {report.run_seconds:.2f}sc, peak memory {report.memory_mb:.0f} MB"
+                )
+            if not result:
+                carb.log_error(message)
+        except Exception:  # noqa: BLE001
+            result = False
+            message = str(traceback.format_exc())
+            carb.log_error(message)
+        finally:
+            if jsonfile is not None:
+                omni.client.delete(jsonfile)
+
+        return result, message
+
+    def _worker(
+        self,
+        core: _ManagerCore,
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: int | None = None,
+        standalone: bool | None = False,
+        queue_id: str | None = None,
+    ):
+        exec_cmd = self._get_validator_script("cli.py")
+
+        jsonfile = None
+        try:
+            jsonfile = self._write_schema_file(core, standalone)
             sub_cmd = [f'\\"{exec_cmd}\\"']
             sub_cmd.extend(["-s", rf"\"{Path(jsonfile).resolve()}\""])
             if print_result:
@@ -143,31 +310,14 @@ class ExternalProcessExecutor(_BaseExecutor):
             if queue_id:
                 sub_cmd.extend(["-q", queue_id])
 
-            sub_cmd_str = " ".join(sub_cmd)
-
-            # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
-            # deallocation, the process may crash
-            cmd.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
-
-            host = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
-            port = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
+            cmd = self._build_kit_command(sub_cmd)
 
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
-
-            prefix = self.__settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
-
-            if prefix:
-                cmd.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
-
-            cmd.extend(["--exec", f'"{sub_cmd_str}"'])
-
-            print(f"Run {' '.join(cmd)}")
+            print(f"Run {cmd}")
 
             try:
                 prev_stdout = None
                 p = subprocess.run(  # noqa: PLW1510
-                    " ".join(cmd),
+                    cmd,
                     shell=True,
                     capture_output=True,
                     text=True,
@@ -202,7 +352,8 @@ class ExternalProcessExecutor(_BaseExecutor):
             message = str(traceback.format_exc())
             carb.log_error(message)
         finally:
-            omni.client.delete(jsonfile)
+            if jsonfile is not None:
+                omni.client.delete(jsonfile)
 
         return result, message
 
@@ -215,8 +366,9 @@ class ExternalProcessExecutor(_BaseExecutor):
         standalone: bool | None = False,
         queue_id: str | None = None,
     ):
+        worker = self._pooled_worker if self.__settings.get(WORKER_POOL_ENABLED) else self._worker
         return self._EXECUTOR.submit(
-            self._worker,
+            worker,
             core,
             print_result=print_result,
             silent=silent,
@@ -224,3 +376,6 @@ class ExternalProcessExecutor(_BaseExecutor):
             standalone=standalone,
             queue_id=queue_id,
         )
+
+    def destroy(self):
+        self.shutdown_worker_pool()
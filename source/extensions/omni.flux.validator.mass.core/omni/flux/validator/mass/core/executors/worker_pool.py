@@ -0,0 +1,449 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["JobReport", "WorkerPool", "WorkerPoolError"]
+
+import contextlib
+import dataclasses
+import itertools
+import json
+import os
+import queue
+import signal
+import socket
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+
+import carb
+
+_LOCALHOST = "127.0.0.1"
+_SHUTDOWN_GRACE_SECONDS = 10
+
+
+class WorkerPoolError(Exception):
+    """Raised when the worker pool can't start or reach its workers."""
+
+
+@dataclasses.dataclass
+class JobReport:
+    """Result and timing of one job executed by a pooled worker."""
+
+    job_id: int
+    worker_id: int
+    result: bool
+    message: str
+    queue_seconds: float
+    run_seconds: float
+    memory_mb: float
+
+
+class _PooledWorker:
+    def __init__(self, worker_id: int, process: subprocess.Popen):
+        """
+        One long-lived validator Kit process connected to the pool.
+
+        Args:
+            worker_id: the ID of the worker in the pool
+            process: the process that runs the worker
+        """
+        self.worker_id = worker_id
+        self.process = process
+        self.pid: int | None = None
+        self.connection: socket.socket | None = None
+        self.reader = None
+        self.jobs_done = 0
+        self.memory_mb = 0.0
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process runs and is connected to the pool"""
+        return self.connection is not None and self.process.poll() is None
+
+    def attach(self, connection: socket.socket, reader, pid: int):
+        """
+        Attach the connection the worker opened to the pool.
+
+        Args:
+            connection: the socket connected to the worker
+            reader: the binary file reader of the socket
+            pid: the process ID of the Kit process that runs the worker
+        """
+        self.connection = connection
+        self.reader = reader
+        self.pid = pid
+
+    def send(self, message: dict):
+        """
+        Send a message to the worker.
+
+        Args:
+            message: the message to serialize
+        """
+        self.connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+    def receive(self, timeout: float | None) -> dict:
+        """
+        Wait for the next message of the worker.
+
+        Args:
+            timeout: the maximum time to wait in seconds. None waits forever.
+
+        Raises:
+            ConnectionError: if the worker closed the connection
+            TimeoutError: if the worker didn't answer in time
+
+        Returns:
+            The deserialized message
+        """
+        self.connection.settimeout(timeout)
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError(f"Worker {self.worker_id} closed the connection")
+        return json.loads(line)
+
+    def close(self, graceful: bool = True):
+        """
+        Stop the worker process.
+
+        Args:
+            graceful: ask the worker to quit before killing it
+        """
+        if graceful and self.is_alive:
+            try:
+                self.send({"type": "shutdown"})
+                self.process.wait(timeout=_SHUTDOWN_GRACE_SECONDS)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        if self.connection is not None:
+            self.reader.close()
+            self.connection.close()
+            self.connection = None
+        # The process is the shell that started Kit: the Kit process itself is reached with the reported PID
+        if self.pid is not None and self.process.poll() is None:
+            with contextlib.suppress(OSError):
+                os.kill(self.pid, signal.SIGTERM)
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        command_factory: Callable[[str, int, int], str],
+        size: int,
+        max_jobs_per_worker: int = 0,
+        max_memory_mb: int = 0,
+        startup_timeout: float = 300,
+        health_check_interval: float = 30,
+    ):
+        """
+        Pool of pre-started validator Kit processes that execute schemas sent over a local socket.
+
+        Workers keep their loaded extensions between jobs, so only the first job of a worker pays the Kit startup.
+
+        Args:
+            command_factory: build the shell command of a worker from the pool host, the pool port and the worker ID
+            size: the number of workers
+            max_jobs_per_worker: recycle a worker after this number of jobs. 0 never recycles.
+            max_memory_mb: recycle a worker when its peak memory is above this value. 0 never recycles.
+            startup_timeout: the maximum time for a worker to connect to the pool, in seconds
+            health_check_interval: the time between two health checks of the idle workers, in seconds. 0 disables it.
+        """
+        self._command_factory = command_factory
+        self._size = size
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._max_memory_mb = max_memory_mb
+        self._startup_timeout = startup_timeout
+        self._health_check_interval = health_check_interval
+
+        self.__listener: socket.socket | None = None
+        self.__accept_lock = threading.Lock()
+        self.__pending_connections: dict[int, tuple[socket.socket, object, int]] = {}
+        self.__workers: dict[int, _PooledWorker] = {}
+        self.__idle_workers: queue.Queue[_PooledWorker] = queue.Queue()
+        self.__job_ids = itertools.count()
+        self.__stop_event = threading.Event()
+        self.__health_thread: threading.Thread | None = None
+
+    @property
+    def size(self) -> int:
+        """The number of workers of the pool"""
+        return self._size
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the pool was started and not shut down"""
+        return self.__listener is not None
+
+    def start(self):
+        """
+        Start the workers and wait until they are all connected.
+
+        Raises:
+            WorkerPoolError: if a worker didn't connect in time
+        """
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__listener.bind((_LOCALHOST, 0))
+        self.__listener.listen(self._size)
+
+        workers = [self._launch(worker_id) for worker_id in range(self._size)]
+        try:
+            self._connect(workers)
+        except WorkerPoolError:
+            for worker in workers:
+                worker.close(graceful=False)
+            self.shutdown()
+            raise
+        for worker in workers:
+            self.__workers[worker.worker_id] = worker
+            self.__idle_workers.put(worker)
+
+        if self._health_check_interval > 0:
+            self.__health_thread = threading.Thread(target=self.__health_check_loop, daemon=True)
+            self.__health_thread.start()
+
+    def run_job(
+        self, schema_path: str, print_result: bool = False, queue_id: str | None = None, timeout: float | None = None
+    ) -> JobReport:
+        """
+        Execute a schema on the next idle worker. Blocks until the job is done.
+
+        A worker that crashes or times out is restarted, and the job is reported as failed.
+
+        Args:
+            schema_path: the path of the schema file to execute
+            print_result: print the resulting schema or not
+            queue_id: the queue ID to use. Needed if you have multiple widgets that shows different queues
+            timeout: the maximum time of the job in seconds
+
+        Returns:
+            The result and the timing of the job
+        """
+        job_id = next(self.__job_ids)
+        queued = time.perf_counter()
+        worker = self.__idle_workers.get()
+        started = time.perf_counter()
+        try:
+            if not worker.is_alive:
+                worker = self._restart(worker)
+            worker.send(
+                {
+                    "type": "job",
+                    "job_id": job_id,
+                    "schema": schema_path,
+                    "print_result": print_result,
+                    "queue_id": queue_id,
+                }
+            )
+            reply = worker.receive(timeout)
+            worker.jobs_done += 1
+            worker.memory_mb = reply["memory_mb"]
+            report = JobReport(
+                job_id=job_id,
+                worker_id=worker.worker_id,
+                result=reply["result"],
+                message=reply["message"],
+                queue_seconds=started - queued,
+                run_seconds=reply["duration"],
+                memory_mb=reply["memory_mb"],
+            )
+            if self._should_recycle(worker):
+                carb.log_info(
+                    f"Recycle validation worker {worker.worker_id} after {worker.jobs_done} job(s) "
+                    f"({worker.memory_mb:.0f} MB)"
+                )
+                worker = self._restart(worker)
+        except TimeoutError:
+            message = f"Time out expired ({timeout}sc)"
+            carb.log_error(message)
+            report = self.__failed_report(job_id, worker, message, queued, started)
+            worker = self._restart(worker, graceful=False)
+        except (OSError, ValueError) as e:
+            message = f"Validation worker {worker.worker_id} crashed: {e}"
+            carb.log_error(message)
+            report = self.__failed_report(job_id, worker, message, queued, started)
+            worker = self._restart(worker, graceful=False)
+        finally:
+            self.__idle_workers.put(worker)
+        return report
+
+    def check_health(self) -> list[int]:
+        """
+        Ping the idle workers and restart the ones that don't answer.
+
+        Returns:
+            The IDs of the restarted workers
+        """
+        restarted = []
+        idle_workers = []
+        while True:
+            try:
+                idle_workers.append(self.__idle_workers.get_nowait())
+            except queue.Empty:
+                break
+        for idle_worker in idle_workers:
+            worker = idle_worker
+            try:
+                if not worker.is_alive:
+                    raise ConnectionError(f"Worker {worker.worker_id} is not running")
+                worker.send({"type": "ping"})
+                worker.memory_mb = worker.receive(self._startup_timeout)["memory_mb"]
+                if self._should_recycle(worker):
+                    worker = self._restart(worker)
+                    restarted.append(worker.worker_id)
+            except (OSError, ValueError, TimeoutError) as e:
+                carb.log_warn(f"Validation worker {worker.worker_id} failed its health check: {e}")
+                try:
+                    worker = self._restart(worker, graceful=False)
+                    restarted.append(worker.worker_id)
+                except WorkerPoolError as restart_error:
+                    # The dead worker goes back to the queue: the next job restarts it again
+                    carb.log_error(str(restart_error))
+            finally:
+                self.__idle_workers.put(worker)
+        return restarted
+
+    def shutdown(self):
+        """Stop the workers and close the pool socket."""
+        self.__stop_event.set()
+        if self.__health_thread is not None:
+            self.__health_thread.join()
+            self.__health_thread = None
+        for worker in self.__workers.values():
+            worker.close()
+        self.__workers.clear()
+        self.__idle_workers = queue.Queue()
+        for connection, reader, _pid in self.__pending_connections.values():
+            reader.close()
+            connection.close()
+        self.__pending_connections.clear()
+        if self.__listener is not None:
+            self.__listener.close()
+            self.__listener = None
+
+    def _launch(self, worker_id: int) -> _PooledWorker:
+        """
+        Start the process of a worker. The worker connects back to the pool by itself.
+
+        Args:
+            worker_id: the ID of the worker
+
+        Returns:
+            The worker waiting for its connection
+        """
+        host, port = self.__listener.getsockname()
+        cmd = self._command_factory(host, port, worker_id)
+        print(f"Run {cmd}")
+        process = subprocess.Popen(cmd, shell=True, stdin=subprocess.DEVNULL)
+        return _PooledWorker(worker_id, process)
+
+    def _connect(self, workers: list[_PooledWorker]):
+        """
+        Accept the connections of the given workers.
+
+        Connections of other workers that arrive in the meantime are kept until their own worker asks for them.
+
+        Args:
+            workers: the launched workers to connect
+
+        Raises:
+            WorkerPoolError: if a worker didn't connect before the startup timeout
+        """
+        waiting = {worker.worker_id: worker for worker in workers}
+        deadline = time.monotonic() + self._startup_timeout
+        with self.__accept_lock:
+            while waiting:
+                for worker_id in list(waiting):
+                    if worker_id in self.__pending_connections:
+                        waiting.pop(worker_id).attach(*self.__pending_connections.pop(worker_id))
+                if not waiting:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or any(worker.process.poll() is not None for worker in waiting.values()):
+                    raise WorkerPoolError(f"Validation worker(s) {sorted(waiting)} failed to start")
+                self.__listener.settimeout(min(remaining, 1.0))
+                try:
+                    connection, _address = self.__listener.accept()
+                except TimeoutError:
+                    continue
+                connection.settimeout(remaining)
+                reader = connection.makefile("rb")
+                try:
+                    hello = json.loads(reader.readline())
+                except (OSError, ValueError):
+                    reader.close()
+                    connection.close()
+                    continue
+                self.__pending_connections[hello["worker_id"]] = (connection, reader, hello["pid"])
+
+    def _restart(self, worker: _PooledWorker, graceful: bool = True) -> _PooledWorker:
+        """
+        Replace a worker with a new process that has the same ID.
+
+        Args:
+            worker: the worker to replace
+            graceful: ask the old worker to quit before killing it
+
+        Raises:
+            WorkerPoolError: if the new worker didn't connect in time
+
+        Returns:
+            The new worker
+        """
+        worker.close(graceful=graceful)
+        new_worker = self._launch(worker.worker_id)
+        self._connect([new_worker])
+        self.__workers[new_worker.worker_id] = new_worker
+        return new_worker
+
+    def _should_recycle(self, worker: _PooledWorker) -> bool:
+        """
+        Check the recycling thresholds of a worker.
+
+        Args:
+            worker: the worker to check
+
+        Returns:
+            True if the worker reached its maximum number of jobs or its maximum memory
+        """
+        if self._max_jobs_per_worker and worker.jobs_done >= self._max_jobs_per_worker:
+            return True
+        return bool(self._max_memory_mb and worker.memory_mb >= self._max_memory_mb)
+
+    @staticmethod
+    def __failed_report(job_id: int, worker: _PooledWorker, message: str, queued: float, started: float) -> JobReport:
+        return JobReport(
+            job_id=job_id,
+            worker_id=worker.worker_id,
+            result=False,
+            message=message,
+            queue_seconds=started - queued,
+            run_seconds=time.perf_counter() - started,
+            memory_mb=worker.memory_mb,
+        )
+
+    def __health_check_loop(self):
+        while not self.__stop_event.wait(self._health_check_interval):
+            self.check_health()
@@ -181,3 +181,5 @@ class ManagerMassCore:
 
     def destroy(self):
         self.__schema_model.destroy()
+        for executor in self.__executors:
+            executor.destroy()
@@ -17,3 +17,4 @@
 
 from .test_core import *
 from .test_executors import *
+from .test_worker_pool import *
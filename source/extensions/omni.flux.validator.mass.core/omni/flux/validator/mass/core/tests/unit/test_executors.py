@@ -17,8 +17,13 @@
 
 from unittest.mock import patch
 
+import carb.settings
 import omni.kit.app
 from omni.flux.validator.mass.core import ManagerMassCore as _ManagerMassCore
+from omni.flux.validator.mass.core.executors import JobReport as _JobReport
+from omni.flux.validator.mass.core.executors.external_process_executor import (
+    WORKER_POOL_ENABLED as _WORKER_POOL_ENABLED,
+)
 from omni.kit.test import AsyncTestCase
 from omni.kit.test_suite.helpers import get_test_data_path
 
@@ -111,3 +116,32 @@ class TestExecutors(AsyncTestCase):
                 self.assertEqual(run_mock.call_count, 4)
                 self.assertEqual(core_added_mock.call_count, 4)
                 self.assertIsNotNone(result)
+
+    async def test_create_tasks_external_process_executor_worker_pool_enabled_runs_jobs_on_pool(self):
+        # Arrange
+        settings = carb.settings.get_settings()
+        settings.set(_WORKER_POOL_ENABLED, True)
+        with (
+            patch("omni.flux.validator.mass.core.executors.external_process_executor._WorkerPool") as pool_mock,
+            patch("subprocess.run") as run_mock,
+        ):
+            pool_mock.return_value.run_job.return_value = _JobReport(
+                job_id=0, worker_id=0, result=True, message="Ok", queue_seconds=0.0, run_seconds=1.0, memory_mb=1.0
+            )
+            core = _ManagerMassCore(schema_paths=self.SCHEMAS)
+            items = core.schema_model.get_item_children(None)
+
+            # Act
+            with patch.object(core, "_on_core_added"):
+                result = await core.create_tasks(1, [item._data for item in items])
+                for _ in range(len(items) * 2):
+                    await omni.kit.app.get_app().next_update_async()
+
+            # Assert
+            settings.set(_WORKER_POOL_ENABLED, False)
+            core.destroy()
+            run_mock.assert_not_called()
+            pool_mock.assert_called_once()
+            self.assertEqual(pool_mock.return_value.run_job.call_count, 2)
+            self.assertTrue(all(task.result() == (True, "Ok") for _core, task in result))
+            pool_mock.return_value.shutdown.assert_called_once()
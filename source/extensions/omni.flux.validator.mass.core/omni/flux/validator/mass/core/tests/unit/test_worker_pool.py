@@ -0,0 +1,224 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from unittest.mock import Mock, patch
+
+from omni.flux.validator.mass.core.executors import WorkerPool, WorkerPoolError
+from omni.kit.test import AsyncTestCase
+
+
+class _FakeWorker(threading.Thread):
+    def __init__(
+        self, host: str, port: int, worker_id: int, crash_on_job: bool = False, exit_after_jobs: int | None = None
+    ):
+        """Thread that speaks the worker protocol in place of a Kit process."""
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.worker_id = worker_id
+        self.crash_on_job = crash_on_job
+        self.exit_after_jobs = exit_after_jobs
+        self.jobs: list[dict] = []
+
+    def run(self):
+        with socket.create_connection((self.host, self.port)) as connection, connection.makefile("rb") as reader:
+            self.__send(connection, {"type": "hello", "worker_id": self.worker_id, "pid": 0})
+            for line in reader:
+                message = json.loads(line)
+                if message["type"] == "shutdown":
+                    return
+                if message["type"] == "ping":
+                    self.__send(connection, {"type": "pong", "memory_mb": 10.0})
+                    continue
+                if self.crash_on_job:
+                    return
+                self.jobs.append(message)
+                self.__send(
+                    connection,
+                    {
+                        "type": "result",
+                        "job_id": message["job_id"],
+                        "result": True,
+                        "message": "Ok",
+                        "duration": 0.5,
+                        "memory_mb": 100.0 * len(self.jobs),
+                    },
+                )
+                if self.exit_after_jobs is not None and len(self.jobs) >= self.exit_after_jobs:
+                    return
+
+    @staticmethod
+    def __send(connection: socket.socket, message: dict):
+        connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+class TestWorkerPool(AsyncTestCase):
+    async def setUp(self):
+        self.fake_workers: list[_FakeWorker] = []
+        self.crash_on_job = False
+        self.exit_after_jobs = None
+        self.kill_patcher = patch("omni.flux.validator.mass.core.executors.worker_pool.os.kill")
+        self.popen_patcher = patch(
+            "omni.flux.validator.mass.core.executors.worker_pool.subprocess.Popen", side_effect=self._popen
+        )
+        self.kill_patcher.start()
+        self.popen_patcher.start()
+
+    async def tearDown(self):
+        self.popen_patcher.stop()
+        self.kill_patcher.stop()
+
+    def _command_factory(self, host: str, port: int, worker_id: int) -> str:
+        self.fake_workers.append(
+            _FakeWorker(host, port, worker_id, crash_on_job=self.crash_on_job, exit_after_jobs=self.exit_after_jobs)
+        )
+        return f"fake_worker {worker_id}"
+
+    def _popen(self, *_args, **_kwargs):
+        fake_worker = self.fake_workers[-1]
+        fake_worker.start()
+        process = Mock()
+        process.poll.side_effect = lambda: None if fake_worker.is_alive() else 0
+        process.wait.side_effect = lambda timeout=None: fake_worker.join(timeout)
+        return process
+
+    async def test_run_job_idle_worker_returns_worker_report(self):
+        # Arrange
+        pool = WorkerPool(self._command_factory, 1, health_check_interval=0)
+        pool.start()
+
+        # Act
+        report = pool.run_job("schema.json", print_result=True, queue_id="queue", timeout=10)
+
+        # Assert
+        pool.shutdown()
+        self.assertTrue(report.result)
+        self.assertEqual(report.worker_id, 0)
+        self.assertEqual(report.run_seconds, 0.5)
+        self.assertEqual(report.memory_mb, 100.0)
+        self.assertEqual(self.fake_workers[0].jobs[0]["schema"], "schema.json")
+        self.assertEqual(self.fake_workers[0].jobs[0]["queue_id"], "queue")
+
+    async def test_run_job_consecutive_jobs_reuse_same_worker_process(self):
+        # Arrange
+        pool = WorkerPool(self._command_factory, 1, health_check_interval=0)
+        pool.start()
+
+        # Act
+        reports = [pool.run_job(f"schema_{index}.json", timeout=10) for index in range(3)]
+
+        # Assert
+        pool.shutdown()
+        self.assertTrue(all(report.result for report in reports))
+        self.assertEqual(len(self.fake_workers), 1)
+        self.assertEqual(len(self.fake_workers[0].jobs), 3)
+
+    async def test_run_job_max_jobs_reached_recycles_worker(self):
+        # Arrange
+        pool = WorkerPool(self._command_factory, 1, max_jobs_per_worker=2, health_check_interval=0)
+        pool.start()
+
+        # Act
+        for index in range(3):
+            pool.run_job(f"schema_{index}.json", timeout=10)
+
+        # Assert
+        pool.shutdown()
+        self.assertEqual(len(self.fake_workers), 2)
+        self.assertEqual(len(self.fake_workers[0].jobs), 2)
+        self.assertEqual(len(self.fake_workers[1].jobs), 1)
+
+    async def test_run_job_max_memory_reached_recycles_worker(self):
+        # Arrange
+        pool = WorkerPool(self._command_factory, 1, max_memory_mb=150, health_check_interval=0)
+        pool.start()
+
+        # Act
+        for index in range(2):
+            pool.run_job(f"schema_{index}.json", timeout=10)
+
+        # Assert
+        pool.shutdown()
+        self.assertEqual(len(self.fake_workers), 2)
+        self.assertEqual(len(self.fake_workers[0].jobs), 2)
+
+    async def test_run_job_worker_crashes_fails_job_and_restarts_worker(self):
+        # Arrange
+        self.crash_on_job = True
+        pool = WorkerPool(self._command_factory, 1, health_check_interval=0)
+        pool.start()
+        self.crash_on_job = False
+
+        # Act
+        report = pool.run_job("schema.json", timeout=10)
+
+        # Assert
+        pool.shutdown()
+        self.assertFalse(report.result)
+        self.assertIn("crashed", report.message)
+        self.assertEqual(len(self.fake_workers), 2)
+        self.assertFalse(self.fake_workers[1].crash_on_job)
+
+    async def test_check_health_exited_idle_worker_restarts_worker(self):
+        # Arrange
+        self.exit_after_jobs = 1
+        pool = WorkerPool(self._command_factory, 1, health_check_interval=0)
+        pool.start()
+        self.exit_after_jobs = None
+        pool.run_job("schema.json", timeout=10)
+        self.fake_workers[0].join(10)
+
+        # Act
+        restarted = pool.check_health()
+
+        # Assert
+        pool.shutdown()
+        self.assertEqual(restarted, [0])
+        self.assertEqual(len(self.fake_workers), 2)
+
+    async def test_check_health_running_workers_restarts_nothing(self):
+        # Arrange
+        pool = WorkerPool(self._command_factory, 2, health_check_interval=0)
+        pool.start()
+
+        # Act
+        restarted = pool.check_health()
+
+        # Assert
+        pool.shutdown()
+        self.assertEqual(restarted, [])
+        self.assertEqual(len(self.fake_workers), 2)
+
+    async def test_start_worker_never_connects_raises_worker_pool_error(self):
+        # Arrange
+        pool = WorkerPool(lambda host, port, worker_id: "fake_worker", 1, startup_timeout=0.1, health_check_interval=0)
+        process = Mock()
+        process.poll.return_value = None
+
+        # Act
+        with patch("omni.flux.validator.mass.core.executors.worker_pool.subprocess.Popen", return_value=process):
+            with self.assertRaises(WorkerPoolError):
+                pool.start()
+
+        # Assert
+        self.assertFalse(pool.is_running)
+        process.kill.assert_called_once()
@@ -19,13 +19,16 @@ from collections.abc import Callable
 
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.validator.manager.core import ValidationProgressDelta as _ValidationProgressDelta
 from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema  # FastAPI needs the full import
+from omni.flux.validator.mass.queue.core.data_models import UpdateProgressRequestModel as _UpdateProgressRequestModel
 from omni.flux.validator.mass.queue.core.data_models import UpdateSchemaRequestModel as _UpdateSchemaRequestModel
 
 
 class ValidatorMassQueueCore:
     def __init__(self):
         self.__on_update_item = _Event()
+        self.__on_update_progress = _Event()
 
     def subscribe_on_update_item(self, function: Callable[[_ValidationSchema, str | None], None]):
         """
@@ -41,3 +44,18 @@ class ValidatorMassQueueCore:
 
     def update_schema(self, data: _UpdateSchemaRequestModel):
         self.__on_update_item(data.validation_schema, queue_id=data.queue_id)
+
+    def subscribe_on_update_progress(self, function: Callable[[list[_ValidationProgressDelta], str | None], None]):
+        """
+        Subscribe to the *on_update_progress* event.
+
+        Args:
+            function: the callback to execute when the event is triggered
+
+        Returns:
+            An object that will automatically unsubscribe when destroyed.
+        """
+        return _EventSubscription(self.__on_update_progress, function)
+
+    def update_progress(self, data: _UpdateProgressRequestModel):
+        self.__on_update_progress(data.deltas, queue_id=data.queue_id)
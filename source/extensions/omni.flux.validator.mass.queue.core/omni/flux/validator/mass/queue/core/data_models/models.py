@@ -16,7 +16,7 @@
 """
 
 from omni.flux.service.shared import BaseServiceModel
-from omni.flux.validator.manager.core import ValidationSchema
+from omni.flux.validator.manager.core import ValidationProgressDelta, ValidationSchema
 
 # REQUEST MODELS
 
@@ -24,3 +24,8 @@ from omni.flux.validator.manager.core import ValidationSchema
 class UpdateSchemaRequestModel(BaseServiceModel):
     validation_schema: ValidationSchema
     queue_id: str | None = None
+
+
+class UpdateProgressRequestModel(BaseServiceModel):
+    deltas: list[ValidationProgressDelta]
+    queue_id: str | None = None
@@ -32,6 +32,7 @@ from .tree.model import Model as _Model
 
 if TYPE_CHECKING:
     from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+    from omni.flux.validator.manager.core import ValidationProgressDelta as _ValidationProgressDelta
     from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema
 
 
@@ -62,6 +63,7 @@ class MassQueueTreeWidget:
             "_progress_bar_widget": None,
             "_mass_queue_core": None,
             "_sub_update_item": None,
+            "_sub_update_progress": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
@@ -75,6 +77,7 @@ class MassQueueTreeWidget:
         self.__create_ui()
         self._mass_queue_core = _get_mass_ingestion_queue_instance()
         self._sub_update_item = self._mass_queue_core.subscribe_on_update_item(self._update_items)
+        self._sub_update_progress = self._mass_queue_core.subscribe_on_update_progress(self._update_items_progress)
 
         self._sub_progress = self._tree_model.subscribe_progress(self._on_progress)
 
@@ -89,6 +92,11 @@ class MassQueueTreeWidget:
         # we add the schema into a queue
         self._tree_model.add_schema_in_update_item_queue(schema)
 
+    def _update_items_progress(self, deltas: list[_ValidationProgressDelta], queue_id: str | None = None):
+        if queue_id is not None and queue_id != self.__queue_id:
+            return
+        self._tree_model.add_progress_deltas_in_update_item_queue(deltas)
+
     def show(self, value: bool):
         """
         This function tell us if the widget is shown or not. When not, we pause any update of the items in the tree.
@@ -29,6 +29,7 @@ import omni.usd
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import deferred_destroy_tasks as _deferred_destroy_tasks
+from omni.flux.validator.manager.core import ValidationProgressDelta as _ValidationProgressDelta
 from omni.flux.validator.manager.widget import ValidatorManagerWidget as _ValidatorManagerWidget
 from omni.ui import color as cl
 
@@ -102,6 +103,9 @@ class Item(ui.AbstractItem):
     def update_schema(self, schema: _ValidationSchema):
         self._data.update_model(schema)
 
+    def apply_progress_delta(self, delta: _ValidationProgressDelta):
+        self._data.apply_progress_delta(delta)
+
     def subscribe_mass_queue_action_pressed(self, callback: Callable[[Item, str, Any | None], Any]):
         """
         Return the object that will automatically unsubscribe when destroyed.
@@ -256,6 +260,16 @@ class Model(ui.AbstractItemModel):
             self.__queue_schema_update_item[schema.uuid] = [schema]
         self.__queue_update_item.put_nowait(schema)
 
+    def add_progress_deltas_in_update_item_queue(self, deltas: list[_ValidationProgressDelta]):
+        """
+        Add progress deltas into the queue. They go through the same queue as the schemas to keep the updates ordered.
+
+        Args:
+            deltas: the changed fields of the schemas
+        """
+        for delta in deltas:
+            self.__queue_update_item.put_nowait(delta)
+
     def update_item(self):
         """
         Update an item from a given schema that has the same UUID.
@@ -293,8 +307,14 @@ class Model(ui.AbstractItemModel):
                 return
             # get an item in the queue
             schema = await self.__queue_update_item.get()
+            if isinstance(schema, _ValidationProgressDelta):
+                # deltas are small and only hold the changed fields: apply them all, in order
+                for item in self.__items:
+                    if item.schema_uuid == schema.uuid:
+                        item.apply_progress_delta(schema)
+                        break
             # throw away schema update we don't need to consume. Consume only the last update schema
-            if (
+            elif (
                 schema.uuid in self.__queue_schema_update_item
                 and self.__queue_schema_update_item[schema.uuid][-1] == schema
             ):
@@ -24,11 +24,11 @@ import carb
 import omni.kit.app
 from omni.flux.service.factory import ServiceBase
 from omni.flux.utils.common import path_utils
-from omni.flux.validator.manager.core import ValidationSchema, validation_schema_json_encoder
+from omni.flux.validator.manager.core import ValidationProgressDelta, ValidationSchema, validation_schema_json_encoder
 from omni.flux.validator.mass.core import ManagerMassCore
 from omni.flux.validator.mass.core.data_models import Executors, MassValidationResponseModel
 from omni.flux.validator.mass.queue.core import get_mass_validation_queue_instance
-from omni.flux.validator.mass.queue.core.data_models import UpdateSchemaRequestModel
+from omni.flux.validator.mass.queue.core.data_models import UpdateProgressRequestModel, UpdateSchemaRequestModel
 from pydantic import ValidationError, create_model
 
 
@@ -80,6 +80,27 @@ class MassValidatorService(ServiceBase):
                 or "OK"
             )
 
+        @self.router.put(
+            path="/schema/progress",
+            operation_id="update_ingestion_schema_progress",
+            description=(
+                "Update the progress of one or more mass validation schemas with the fields that changed. "
+                "Used by external processes to send batched progress updates."
+            ),
+        )
+        async def update_schema_progress(
+            body: list[dict],
+            queue_id: str = ServiceBase.describe_query_param(None, "ID to describe which queue should be updated"),
+        ) -> str:
+            return (
+                self._mass_queue_core.update_progress(
+                    UpdateProgressRequestModel(
+                        deltas=[ValidationProgressDelta(**delta) for delta in body], queue_id=queue_id
+                    )
+                )
+                or "OK"
+            )
+
         def build_queue_endpoint(_schema_model):
             """
             Dynamically build endpoints for the various schemas provided in the init
@@ -17,8 +17,10 @@
 
 from typing import Any
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
+from omni.flux.utils.common import mesh as _mesh
 from pxr import Sdf, Usd, UsdGeom
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD
@@ -85,15 +87,13 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
 
                     subset = UsdGeom.Subset(child_prim)
                     face_indices = subset.GetIndicesAttr().Get()
-                    vert_indices = vert_indices_attr.Get()
-                    for i, face_index in enumerate(face_indices):
-                        if (
-                            vert_indices[i * 3 + 0] != face_vertex_indices[face_index * 3 + 0]
-                            or vert_indices[i * 3 + 1] != face_vertex_indices[face_index * 3 + 1]
-                            or vert_indices[i * 3 + 2] != face_vertex_indices[face_index * 3 + 2]
-                        ):
-                            prim_passed = False
-                            break
+                    vert_indices = np.asarray(vert_indices_attr.Get() or [])
+                    expected_indices = np.asarray(_mesh.gather_elements(face_vertex_indices, face_indices, 3))
+                    # Extra trailing indices are tolerated, only the triangles of the subset are compared
+                    if vert_indices.size < expected_indices.size or not np.array_equal(
+                        vert_indices[: expected_indices.size], expected_indices
+                    ):
+                        prim_passed = False
                 if not prim_passed:
                     break
 
@@ -143,11 +143,7 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
                     if child_prim.IsA(UsdGeom.Subset):
                         subset = UsdGeom.Subset(child_prim)
                         face_indices = subset.GetIndicesAttr().Get()
-                        vert_indices = []
-                        for face_index in face_indices:
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 0])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 1])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 2])
+                        vert_indices = _mesh.gather_elements(face_vertex_indices, face_indices, 3)
                         child_prim.CreateAttribute(self._attr_name, Sdf.ValueTypeNames.IntArray).Set(vert_indices)
 
                 message += f"- PASS: {str(prim.GetPath())}\n"
@@ -155,7 +151,7 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
         return all_pass, message, None
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        return len(faces) > 0 and _mesh.is_triangulated(faces)
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
@@ -17,9 +17,11 @@
 
 from typing import Any
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from omni.flux.utils.common import mesh as _mesh
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD
 
@@ -145,23 +147,20 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
             if primvar.GetInterpolation() in geom_tokens
         ]
 
-        fixed_indices = range(0, len(face_vertex_indices))
-        fixed_points = [points[face_vertex_indices[i]] for i in fixed_indices]
+        fixed_indices = Vt.IntArray.FromNumpy(np.arange(len(face_vertex_indices), dtype=np.int32))
+        fixed_points = _mesh.gather_elements(points, face_vertex_indices)
 
         for primvar in primvars:
             if primvar["interpolation"] == UsdGeom.Tokens.vertex:
-                element_size = primvar["element_size"]
-                primvar["fixed_values"] = [
-                    primvar["values"][face_vertex_indices[i] * element_size + j]
-                    for i in fixed_indices
-                    for j in range(element_size)
-                ]
+                primvar["fixed_values"] = _mesh.gather_elements(
+                    primvar["values"], face_vertex_indices, primvar["element_size"]
+                )
 
         normals_interp = mesh.GetNormalsInterpolation()
         normals = mesh.GetNormalsAttr().Get()
         if normals_interp == UsdGeom.Tokens.vertex and normals:
             # Normals are currently in the (old) vertex order.  need to expand them to be 1 normal per vertex per face
-            fixed_normals = [normals[face_vertex_indices[i]] for i in fixed_indices]
+            fixed_normals = _mesh.gather_elements(normals, face_vertex_indices)
             mesh.GetNormalsAttr().Set(fixed_normals)
         else:
             # Normals are already in 1 normal per vertex per face, need to set it to vertex so that triangulation
@@ -19,6 +19,7 @@ from typing import Any
 
 import omni.ui as ui
 import omni.usd
+from omni.flux.utils.common import mesh as _mesh
 from pxr import Sdf, Usd, UsdGeom
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD
@@ -102,7 +103,7 @@ class Triangulate(_CheckBaseUSD):
         ui.Label("None")
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        return len(faces) > 0 and _mesh.is_triangulated(faces)
 
     def _triangulate_mesh(self, prim: Usd.Prim):
         # indices and faces converted to triangles
@@ -119,10 +120,7 @@ class Triangulate(_CheckBaseUSD):
         if not indices or not faces:
             return True
 
-        indices_offset = 0
-        new_face_counts = []
-        triangles = []
-        subsets = []
+        triangulation = _mesh.triangulate_fan(faces, indices)
 
         # need to update geom subset face lists
         display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
@@ -130,31 +128,9 @@ class Triangulate(_CheckBaseUSD):
         for child_prim in children_iterator:
             if child_prim.IsA(UsdGeom.Subset):
                 subset = UsdGeom.Subset.Get(prim.GetStage(), child_prim.GetPath())
-                subsets.append(
-                    {
-                        "subset": subset,
-                        "old_faces": set(subset.GetIndicesAttr().Get()),  # set of old face indices in this subset
-                        "new_faces": [],  # the new face index list
-                    }
-                )
-
-        for old_face_index, face_count in enumerate(faces):
-            start_index = indices[indices_offset]
-            for face_index in range(face_count - 2):
-                for subset in subsets:
-                    if old_face_index in subset["old_faces"]:
-                        subset["new_faces"].append(len(new_face_counts))
-                new_face_counts.append(3)
-                index1 = indices_offset + face_index + 1
-                index2 = indices_offset + face_index + 2
-                triangles.append(start_index)
-                triangles.append(indices[index1])
-                triangles.append(indices[index2])
-            indices_offset += face_count
-
-        for subset in subsets:
-            subset["subset"].GetIndicesAttr().Set(subset["new_faces"])
-
-        mesh.GetFaceVertexIndicesAttr().Set(triangles)
-        mesh.GetFaceVertexCountsAttr().Set(new_face_counts)
+                old_faces = subset.GetIndicesAttr().Get() or []
+                subset.GetIndicesAttr().Set(_mesh.remap_subset_faces(old_faces, triangulation.source_faces, len(faces)))
+
+        mesh.GetFaceVertexIndicesAttr().Set(triangulation.face_vertex_indices)
+        mesh.GetFaceVertexCountsAttr().Set(triangulation.face_vertex_counts)
         return True
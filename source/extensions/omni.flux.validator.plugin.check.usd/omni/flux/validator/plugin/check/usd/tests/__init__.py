@@ -30,6 +30,7 @@ from .unit.meta.test_wrap_root_prims import *
 from .unit.paths.test_relative_asset_paths import *
 from .unit.paths.test_relative_references import *
 from .unit.test_print_prims import *
+from .unit.texture.test_conversion_engine import *
 from .unit.texture.test_convert_to_dds import *
 from .unit.texture.test_convert_to_octahedral import *
 from .unit.xform.test_apply_unit_scale import *
@@ -0,0 +1,182 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+from omni.flux.validator.plugin.check.usd.texture.conversion_engine import ConversionJob, TextureConversionEngine
+from omni.kit.test import AsyncTestCase
+
+_CREATE_SUBPROCESS_EXEC = (
+    "omni.flux.validator.plugin.check.usd.texture.conversion_engine.asyncio.create_subprocess_exec"
+)
+
+
+class _FakeProcess:
+    def __init__(self, returncode: int = 0, stdout: bytes = b"", stderr: bytes = b"", block: bool = False):
+        """Stand-in for an asyncio subprocess"""
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+        self.kill = Mock(side_effect=self.release.set)
+
+    async def communicate(self):
+        await self.release.wait()
+        return self.stdout, self.stderr
+
+    async def wait(self):
+        await self.release.wait()
+        return self.returncode
+
+
+class TestTextureConversionEngine(AsyncTestCase):
+    async def _wait_for(self, predicate, timeout: float = 5):
+        async with asyncio.timeout(timeout):
+            while not predicate():
+                await asyncio.sleep(0.01)
+
+    async def test_stream_functions_yields_every_result_in_completion_order(self):
+        # Arrange
+        engine = TextureConversionEngine(max_concurrency=2)
+        slow_release = threading.Event()
+        jobs = [
+            ConversionJob(out_path="slow.dds", function=lambda: slow_release.wait(5) and "slow"),
+            ConversionJob(out_path="fast.dds", function=lambda: "fast"),
+        ]
+
+        # Act
+        results = []
+        async for result in engine.stream(jobs):
+            results.append(result)
+            slow_release.set()
+
+        # Assert
+        self.assertEqual([r.job.out_path for r in results], ["fast.dds", "slow.dds"])
+        self.assertEqual([r.message for r in results], ["fast", "slow"])
+        self.assertTrue(all(r.success for r in results))
+
+    async def test_stream_max_concurrency_queues_extra_jobs(self):
+        # Arrange
+        engine = TextureConversionEngine(max_concurrency=4)
+        release = threading.Event()
+        jobs = [ConversionJob(out_path=f"{index}.dds", function=lambda: release.wait(5)) for index in range(3)]
+
+        # Act
+        results = engine.stream(jobs, max_concurrency=1)
+        first_result = asyncio.ensure_future(anext(results))
+        await self._wait_for(lambda: engine.running_count == 1)
+        queue_depth = engine.queue_depth
+        release.set()
+        await first_result
+        remaining = [result async for result in results]
+
+        # Assert
+        self.assertEqual(queue_depth, 2)
+        self.assertEqual(len(remaining), 2)
+        self.assertEqual(engine.queue_depth, 0)
+        self.assertEqual(engine.running_count, 0)
+
+    async def test_convert_same_output_in_flight_runs_once(self):
+        # Arrange
+        engine = TextureConversionEngine()
+        release = threading.Event()
+        function = Mock(side_effect=lambda: release.wait(5))
+
+        # Act
+        first = asyncio.ensure_future(engine.convert(ConversionJob(out_path="a.dds", function=function)))
+        second = asyncio.ensure_future(engine.convert(ConversionJob(out_path="a.dds", function=function)))
+        await self._wait_for(lambda: engine.running_count == 1)
+        release.set()
+        first_result, second_result = await asyncio.gather(first, second)
+
+        # Assert
+        function.assert_called_once()
+        self.assertFalse(first_result.deduplicated)
+        self.assertTrue(second_result.deduplicated)
+        self.assertTrue(second_result.success)
+
+    async def test_convert_command_passes_environment_and_returns_output(self):
+        # Arrange
+        engine = TextureConversionEngine()
+        job = ConversionJob(out_path="a.dds", command=["nvtt_export", "a.png"], env={"CUDA_VISIBLE_DEVICES": "0"})
+
+        # Act
+        with patch(_CREATE_SUBPROCESS_EXEC, return_value=_FakeProcess(stdout=b"done")) as exec_mock:
+            result = await engine.convert(job)
+
+        # Assert
+        self.assertTrue(result.success)
+        self.assertEqual(result.message, "done")
+        self.assertEqual(exec_mock.call_args.args, ("nvtt_export", "a.png"))
+        self.assertEqual(exec_mock.call_args.kwargs["env"], {"CUDA_VISIBLE_DEVICES": "0"})
+
+    async def test_convert_command_fails_returns_failed_result(self):
+        # Arrange
+        engine = TextureConversionEngine()
+        job = ConversionJob(out_path="a.dds", command=["nvtt_export", "a.png"])
+        finished = []
+        _sub = engine.subscribe_conversion_finished(finished.append)
+
+        # Act
+        with patch(_CREATE_SUBPROCESS_EXEC, return_value=_FakeProcess(returncode=3, stderr=b"bad input")):
+            result = await engine.convert(job)
+
+        # Assert
+        self.assertFalse(result.success)
+        self.assertIn("return code: 3", result.message)
+        self.assertIn("bad input", result.message)
+        self.assertEqual(finished, [result])
+
+    async def test_convert_caller_cancelled_kills_process(self):
+        # Arrange
+        engine = TextureConversionEngine()
+        process = _FakeProcess(block=True)
+
+        # Act
+        with patch(_CREATE_SUBPROCESS_EXEC, return_value=process):
+            task = asyncio.ensure_future(engine.convert(ConversionJob(out_path="a.dds", command=["nvtt_export"])))
+            await self._wait_for(lambda: engine.running_count == 1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await self._wait_for(lambda: engine.running_count == 0)
+
+        # Assert
+        process.kill.assert_called_once()
+
+    async def test_cancel_all_returns_cancelled_results(self):
+        # Arrange
+        engine = TextureConversionEngine()
+        process = _FakeProcess(block=True)
+
+        # Act
+        with patch(_CREATE_SUBPROCESS_EXEC, return_value=process):
+            task = asyncio.ensure_future(engine.convert(ConversionJob(out_path="a.dds", command=["nvtt_export"])))
+            await self._wait_for(lambda: engine.running_count == 1)
+            engine.cancel_all()
+            result = await task
+
+        # Assert
+        self.assertFalse(result.success)
+        self.assertIn("cancelled", result.message)
+        process.kill.assert_called_once()
@@ -17,9 +17,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
-import subprocess
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
@@ -87,23 +87,19 @@ class TestConvertToDDS(AsyncTestCase):
         self.assertEqual(2, check_plugin.data.max_workers)
         model.set_value.assert_called_once_with(2)
 
-    async def test_fix_when_data_flow_raises_releases_executor(self):
+    async def test_fix_when_data_flow_raises_starts_no_conversion(self):
         # Arrange
         shutil.copytree(get_test_data_path(__name__, "usd/pillow_cube"), self.temp_path / Path("pillow_cube"))
         await open_stage(str(self.temp_path / Path("pillow_cube/pillow_cube.usda")))
         check_plugin = self._make_core().model.check_plugins[0]
         check_plugin.data.max_workers = 1
         shader = omni.usd.get_context().get_stage().GetPrimAtPath("/World/Looks/M_Prop_CompanionCube_Pillow_A/Shader")
-        executor_context = MagicMock()
-        executor_context.__enter__.return_value = MagicMock()
-        executor_context.__exit__.return_value = False
 
         # Act
         with (
             patch(
-                "omni.flux.validator.plugin.check.usd.texture.convert_to_dds.ThreadPoolExecutor",
-                return_value=executor_context,
-            ) as thread_pool_executor,
+                "omni.flux.validator.plugin.check.usd.texture.convert_to_dds._get_texture_conversion_engine"
+            ) as get_engine_mock,
             patch(
                 "omni.flux.validator.plugin.check.usd.texture.convert_to_dds._validator_factory_utils.push_input_data",
                 side_effect=RuntimeError("Data flow failed"),
@@ -113,8 +109,7 @@ class TestConvertToDDS(AsyncTestCase):
             await check_plugin.instance._fix.__wrapped__(check_plugin.instance, check_plugin.data, "", [shader])
 
         # Assert
-        thread_pool_executor.assert_called_once_with(max_workers=1)
-        executor_context.__exit__.assert_called_once()
+        get_engine_mock.return_value.stream.assert_not_called()
 
     async def test_run_nothing_to_fix(self):
         # Arrange
@@ -166,16 +161,17 @@ class TestConvertToDDS(AsyncTestCase):
         with (
             patch.dict(os.environ, {"CUDA_VISIBLE_DEVICES": "1,0"}),
             patch(
-                "omni.flux.validator.plugin.check.usd.texture.convert_to_dds.subprocess.run", wraps=subprocess.run
-            ) as subprocess_run_mock,
+                "omni.flux.validator.plugin.check.usd.texture.conversion_engine.asyncio.create_subprocess_exec",
+                wraps=asyncio.create_subprocess_exec,
+            ) as subprocess_exec_mock,
         ):
             await core.deferred_run()
             parent_visible_devices = os.environ["CUDA_VISIBLE_DEVICES"]
 
         # Assert
         self.assertEqual("1,0", parent_visible_devices)
-        self.assertGreater(len(subprocess_run_mock.call_args_list), 0)
-        for subprocess_call in subprocess_run_mock.call_args_list:
+        self.assertGreater(len(subprocess_exec_mock.call_args_list), 0)
+        for subprocess_call in subprocess_exec_mock.call_args_list:
             self.assertEqual("0", subprocess_call.kwargs["env"]["CUDA_VISIBLE_DEVICES"])
 
         prim = stage.GetPrimAtPath("/World/Looks/M_Prop_CompanionCube_Pillow_A/Shader")
@@ -86,23 +86,19 @@ class TestConvertToOctahedral(AsyncTestCase):
         self.assertEqual(2, check_plugin.data.max_workers)
         model.set_value.assert_called_once_with(2)
 
-    async def test_fix_when_data_flow_raises_releases_executor(self):
+    async def test_fix_when_data_flow_raises_starts_no_conversion(self):
         # Arrange
         shutil.copytree(get_test_data_path(__name__, "usd/pillow_cube"), self.temp_path / Path("pillow_cube"))
         await open_stage(str(self.temp_path / Path("pillow_cube/pillow_cube.usda")))
         check_plugin = self._make_core().model.check_plugins[0]
         check_plugin.data.max_workers = 1
         shader = omni.usd.get_context().get_stage().GetPrimAtPath("/World/Looks/M_Prop_CompanionCube_Pillow_A/Shader")
-        executor_context = MagicMock()
-        executor_context.__enter__.return_value = MagicMock()
-        executor_context.__exit__.return_value = False
 
         # Act
         with (
             patch(
-                "omni.flux.validator.plugin.check.usd.texture.convert_to_octahedral.ThreadPoolExecutor",
-                return_value=executor_context,
-            ) as thread_pool_executor,
+                "omni.flux.validator.plugin.check.usd.texture.convert_to_octahedral._get_texture_conversion_engine"
+            ) as get_engine_mock,
             patch(
                 "omni.flux.validator.plugin.check.usd.texture.convert_to_octahedral._validator_factory_utils.push_input_data",
                 side_effect=RuntimeError("Data flow failed"),
@@ -112,8 +108,7 @@ class TestConvertToOctahedral(AsyncTestCase):
             await check_plugin.instance._fix.__wrapped__(check_plugin.instance, check_plugin.data, "", [shader])
 
         # Assert
-        thread_pool_executor.assert_called_once_with(max_workers=1)
-        executor_context.__exit__.assert_called_once()
+        get_engine_mock.return_value.stream.assert_not_called()
 
     async def test_run_nothing_to_fix(self):
         # Arrange
@@ -0,0 +1,312 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ConversionJob", "ConversionResult", "TextureConversionEngine", "get_texture_conversion_engine"]
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import os
+import subprocess
+import time
+import traceback
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import carb
+import carb.settings
+from omni.flux.utils.common import Event as _Event
+from omni.flux.utils.common import EventSubscription as _EventSubscription
+
+EXTS_TEXTURE_CONVERSION_MAX_CONCURRENCY = (
+    "/exts/omni.flux.validator.plugin.check.usd/texture_conversion/max_concurrency"
+)
+
+_INSTANCE: TextureConversionEngine | None = None
+
+
+@dataclasses.dataclass
+class ConversionJob:
+    """
+    A texture to convert. Set either `command` to run an executable, or `function` to run Python code in a thread.
+
+    Args:
+        out_path: the path of the converted texture. Jobs with the same output path are only run once at a time.
+        command: the command line to execute
+        env: the environment of the command. None inherits the current environment.
+        function: the callable to execute in a thread
+        context: any data the caller needs back with the result
+    """
+
+    out_path: str
+    command: list[str] | None = None
+    env: dict[str, str] | None = None
+    function: Callable[[], Any] | None = None
+    context: Any = None
+
+
+@dataclasses.dataclass
+class ConversionResult:
+    """
+    The outcome of a conversion job.
+
+    Args:
+        job: the job that was executed
+        success: whether the conversion succeeded
+        message: the output of the conversion, or the error details on failure
+        queue_seconds: the time the job waited for a free conversion slot
+        run_seconds: the time the conversion took
+        deduplicated: whether the job reused a conversion of the same output started by another caller
+    """
+
+    job: ConversionJob
+    success: bool
+    message: str
+    queue_seconds: float = 0.0
+    run_seconds: float = 0.0
+    deduplicated: bool = False
+
+
+class TextureConversionEngine:
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Run texture conversions on the event loop without blocking it.
+
+        Every caller shares the same conversion slots, so concurrent validations can't start more conversions than
+        `max_concurrency` in total. Conversions of the same output path are only run once: later callers wait for the
+        conversion in flight and get its result.
+
+        Args:
+            max_concurrency: the maximum number of conversions running at the same time across all callers
+        """
+        self._max_concurrency = max(1, max_concurrency)
+
+        self.__semaphore: asyncio.Semaphore | None = None
+        self.__in_flight: dict[str, asyncio.Task] = {}
+        self.__waiters: dict[str, int] = {}
+        self.__queued = 0
+        self.__running = 0
+        self.__on_conversion_finished = _Event()
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of conversions running at the same time across all callers"""
+        return self._max_concurrency
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of conversions waiting for a free slot"""
+        return self.__queued
+
+    @property
+    def running_count(self) -> int:
+        """The number of conversions running"""
+        return self.__running
+
+    def subscribe_conversion_finished(self, callback: Callable[[ConversionResult], Any]):
+        """
+        Subscribe to the *on_conversion_finished* event. Useful to profile the conversions.
+
+        Args:
+            callback: the callback to execute with the result of every conversion that ran
+
+        Returns:
+            An object that will automatically unsubscribe when destroyed.
+        """
+        return _EventSubscription(self.__on_conversion_finished, callback)
+
+    async def convert(self, job: ConversionJob, limiter: asyncio.Semaphore | None = None) -> ConversionResult:
+        """
+        Run a conversion job, or wait for the conversion of the same output that is already in flight.
+
+        Cancelling the caller stops the conversion unless other callers still wait for it.
+
+        Args:
+            job: the job to run
+            limiter: an extra semaphore to limit the number of conversions of one caller
+
+        Returns:
+            The result of the conversion
+        """
+        key = os.path.normcase(os.path.abspath(job.out_path))
+        task = self.__in_flight.get(key)
+        deduplicated = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self.__run(job, limiter))
+            self.__in_flight[key] = task
+            task.add_done_callback(functools.partial(self.__forget, key))
+
+        self.__waiters[key] = self.__waiters.get(key, 0) + 1
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # The caller was cancelled: stop the conversion if nobody else waits for it
+                if self.__waiters[key] == 1 and not task.done():
+                    task.cancel()
+                raise
+            # The conversion was cancelled through the engine
+            result = ConversionResult(job=job, success=False, message=f"The conversion of {job.out_path} was cancelled")
+        finally:
+            self.__waiters[key] -= 1
+            if not self.__waiters[key]:
+                del self.__waiters[key]
+
+        if deduplicated:
+            return dataclasses.replace(result, job=job, deduplicated=True)
+        return result
+
+    async def stream(
+        self, jobs: list[ConversionJob], max_concurrency: int | None = None
+    ) -> AsyncIterator[ConversionResult]:
+        """
+        Run conversion jobs and yield the results as soon as each conversion finishes.
+
+        Closing the iterator early cancels the conversions that didn't finish.
+
+        Args:
+            jobs: the jobs to run
+            max_concurrency: the maximum number of these jobs running at the same time, on top of the engine limit
+
+        Yields:
+            The results, in completion order
+        """
+        limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        tasks = [asyncio.ensure_future(self.convert(job, limiter)) for job in jobs]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def cancel_all(self):
+        """Cancel every conversion in flight"""
+        for task in list(self.__in_flight.values()):
+            task.cancel()
+
+    def __forget(self, key: str, _task: asyncio.Task):
+        self.__in_flight.pop(key, None)
+
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self.__semaphore
+
+    async def __run(self, job: ConversionJob, limiter: asyncio.Semaphore | None) -> ConversionResult:
+        queued_at = time.perf_counter()
+        self.__queued += 1
+        is_queued = True
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if limiter is not None:
+                    await stack.enter_async_context(limiter)
+                await stack.enter_async_context(self.__get_semaphore())
+                self.__queued -= 1
+                is_queued = False
+
+                self.__running += 1
+                started_at = time.perf_counter()
+                try:
+                    message = await self.__execute(job)
+                    success = True
+                except subprocess.CalledProcessError as e:
+                    message = f"cmd: {e.cmd}\nreturn code: {e.returncode}\nstdout: {e.stdout}\nstderr: {e.stderr}"
+                    success = False
+                except Exception:  # noqa: BLE001
+                    # A failing conversion must not stop the other conversions: the error goes back with the result
+                    message = traceback.format_exc()
+                    success = False
+                finally:
+                    self.__running -= 1
+        finally:
+            if is_queued:
+                self.__queued -= 1
+
+        result = ConversionResult(
+            job=job,
+            success=success,
+            message=message,
+            queue_seconds=started_at - queued_at,
+            run_seconds=time.perf_counter() - started_at,
+        )
+        carb.log_info(
+            f"Texture conversion of {job.out_path} {'done' if success else 'failed'} in {result.run_seconds:.2f}s "
+            f"(queued {result.queue_seconds:.2f}s, {self.__queued} waiting)"
+        )
+        self.__on_conversion_finished(result)
+        return result
+
+    async def __execute(self, job: ConversionJob) -> str:
+        if job.command is None:
+            if job.function is None:
+                raise ValueError(f"The conversion job of {job.out_path} has no command and no function")
+            return str(await asyncio.to_thread(job.function))
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *job.command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=job.env,
+            )
+        except NotImplementedError:
+            # The event loop doesn't support subprocesses: wait for a blocking process in a thread instead
+            completed = await asyncio.to_thread(
+                subprocess.run,
+                job.command,
+                check=True,
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                env=job.env,
+            )
+            return completed.stdout
+
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+            raise
+
+        stdout = stdout.decode(errors="replace")
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode, job.command, output=stdout, stderr=stderr.decode(errors="replace")
+            )
+        return stdout
+
+
+def get_texture_conversion_engine() -> TextureConversionEngine:
+    """
+    Get the texture conversion engine shared by every validation of the process.
+
+    Returns:
+        The shared engine
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        max_concurrency = carb.settings.get_settings().get(EXTS_TEXTURE_CONVERSION_MAX_CONCURRENCY)
+        _INSTANCE = TextureConversionEngine(max_concurrency=max_concurrency or 4)
+    return _INSTANCE
@@ -16,8 +16,6 @@
 """
 
 import os
-import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 from pathlib import Path
 from typing import Any
@@ -41,10 +39,12 @@ from omni.flux.utils.common.path_utils import texture_to_udim as _texture_to_udi
 from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
 from omni.flux.validator.factory import InOutDataFlow as _InOutDataFlow
 from omni.flux.validator.factory import utils as _validator_factory_utils
-from pxr import Sdf
+from pxr import Sdf, Usd
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD
+from .conversion_engine import ConversionJob as _ConversionJob
+from .conversion_engine import get_texture_conversion_engine as _get_texture_conversion_engine
 
 
 def _generate_out_path(in_path_str: str, suffix: str):
@@ -246,87 +246,55 @@ class ConvertToDDS(_CheckBaseUSD):
                             files_needed[out_path] = (texture_path, is_udim, settings, [attr])
 
         # generate all the files
-        processed_files = []
-        futures = []
-        with ThreadPoolExecutor(max_workers=schema_data.max_workers) as executor:
-            nvtt_path = carb.tokens.get_tokens_interface().resolve(
-                "${omni.flux.resources}/deps/tools/nvtt/nvtt_export.exe"
-            )
-            nvtt_env = os.environ.copy()
-            # NVTTE 2023.4.0 can switch from NVTT's selected GPU to GPU 0, so expose only GPU 0.
-            nvtt_env["CUDA_VISIBLE_DEVICES"] = "0"
-            for out_path_str, (in_path_str, is_udim, settings, attrs) in files_needed.items():
-                out_path = Path(out_path_str)
-                src_hash = _get_new_hash(in_path_str, out_path_str)
-
-                _validator_factory_utils.push_input_data(schema_data, [in_path_str])
-
-                if not out_path.exists() or src_hash is not None:
-                    cmd = [nvtt_path, in_path_str, "--output", out_path_str] + settings.args
-                    carb.log_info("Queuing DDS conversion: " + str(cmd))
-                    future = executor.submit(
-                        subprocess.run,
-                        cmd,
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                        stdin=subprocess.DEVNULL,
-                        env=nvtt_env,
-                    )
-                    future.original_command = cmd
-                    future.attrs = attrs
-                    future.out_path = out_path
-                    future.is_udim = is_udim
-                    future.src_hash = src_hash
-                    futures.append(future)
-                    processed_files.append(in_path_str)
-                else:
-                    # compressed texture exists and doesn't need to be updated
-                    with Sdf.ChangeBlock():
-                        for attr in attrs:
-                            value = out_path_str
-                            if is_udim:
-                                if schema_data.replace_udim_textures_by_empty:
-                                    value = ""
-                                else:
-                                    value = _texture_to_udim(out_path_str)
-                            attr.Set(value)
-                    message += f"- PASS: reused existing compressed texture: {out_path_str}\n"
-
-            # Update all the attributes as the files are generated.
-            if futures:
-                progress = 0
-                self.on_progress(progress, "Start", True)
-                to_add = 1 / len(futures)
-                for future in as_completed(futures):
-                    progress += to_add
-                    try:
-                        result = future.result()
-                        carb.log_info("DDS command result: " + str(result))
-                        out_path_str = str(future.out_path)
-                        _write_metadata(out_path_str, "src_hash", future.src_hash)
-                        with Sdf.ChangeBlock():
-                            for attr in future.attrs:
-                                value = out_path_str
-                                if future.is_udim:
-                                    if schema_data.replace_udim_textures_by_empty:
-                                        value = ""
-                                    else:
-                                        value = _texture_to_udim(out_path_str)
-                                attr.Set(value)
-
-                        _validator_factory_utils.push_output_data(schema_data, [out_path_str])
-
-                        message += f"- PASS: created compressed texture {future.out_path}\n"
-                        self.on_progress(progress, f"Compressed to {future.out_path}", True)
-                    except subprocess.CalledProcessError as e:
-                        carb.log_error(
-                            "Exception when converting texture to dds.\n"
-                            f"cmd: {e.cmd}\noutput: {e.output}\nstdout: {e.stdout}\nstderr: {e.stderr}"
-                        )
-                        message += f"- FAIL: failure in dds compression command: {future.original_command}.\n"
-                        self.on_progress(progress, f"Error from {future.out_path}", True)
-                        all_pass = False
+        nvtt_path = carb.tokens.get_tokens_interface().resolve("${omni.flux.resources}/deps/tools/nvtt/nvtt_export.exe")
+        nvtt_env = os.environ.copy()
+        # NVTTE 2023.4.0 can switch from NVTT's selected GPU to GPU 0, so expose only GPU 0.
+        nvtt_env["CUDA_VISIBLE_DEVICES"] = "0"
+        _validator_factory_utils.push_input_data(
+            schema_data, [in_path_str for in_path_str, *_ in files_needed.values()]
+        )
+        jobs = []
+        for out_path_str, (in_path_str, is_udim, settings, attrs) in files_needed.items():
+            out_path = Path(out_path_str)
+            src_hash = _get_new_hash(in_path_str, out_path_str)
+
+            if not out_path.exists() or src_hash is not None:
+                cmd = [nvtt_path, in_path_str, "--output", out_path_str] + settings.args
+                carb.log_info("Queuing DDS conversion: " + str(cmd))
+                jobs.append(
+                    _ConversionJob(out_path=out_path_str, command=cmd, env=nvtt_env, context=(attrs, is_udim, src_hash))
+                )
+            else:
+                # compressed texture exists and doesn't need to be updated
+                self.__set_texture_attributes(schema_data, attrs, out_path_str, is_udim)
+                message += f"- PASS: reused existing compressed texture: {out_path_str}\n"
+
+        # Update the attributes as each file is generated. The conversions run in separate processes, so the event
+        # loop keeps running while they progress.
+        if jobs:
+            progress = 0
+            self.on_progress(progress, "Start", True)
+            to_add = 1 / len(jobs)
+            engine = _get_texture_conversion_engine()
+            async for result in engine.stream(jobs, max_concurrency=schema_data.max_workers):
+                progress += to_add
+                out_path_str = result.job.out_path
+                if not result.success:
+                    carb.log_error(f"Exception when converting texture to dds.\n{result.message}")
+                    message += f"- FAIL: failure in dds compression command: {result.job.command}.\n"
+                    self.on_progress(progress, f"Error from {out_path_str}", True)
+                    all_pass = False
+                    continue
+
+                carb.log_info("DDS command result: " + result.message)
+                attrs, is_udim, src_hash = result.job.context
+                _write_metadata(out_path_str, "src_hash", src_hash)
+                self.__set_texture_attributes(schema_data, attrs, out_path_str, is_udim)
+
+                _validator_factory_utils.push_output_data(schema_data, [out_path_str])
+
+                message += f"- PASS: created compressed texture {out_path_str}\n"
+                self.on_progress(progress, f"Compressed to {out_path_str}", True)
 
         await omni.kit.app.get_app().next_update_async()
 
@@ -368,6 +336,14 @@ class ConvertToDDS(_CheckBaseUSD):
         self._max_workers_field_validate_sub = None
         super().destroy()
 
+    def __set_texture_attributes(self, schema_data: Data, attrs: list[Usd.Attribute], out_path_str: str, is_udim: bool):
+        value = out_path_str
+        if is_udim:
+            value = "" if schema_data.replace_udim_textures_by_empty else _texture_to_udim(out_path_str)
+        with Sdf.ChangeBlock():
+            for attr in attrs:
+                attr.Set(value)
+
     def __get_texture_type_suffix(self, attr_name: str) -> str:
         """
         Get the expected suffix based on the texture type. Get the texture type from the attribute name.
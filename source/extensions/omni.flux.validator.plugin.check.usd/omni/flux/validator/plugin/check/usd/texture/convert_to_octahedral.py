@@ -16,8 +16,6 @@
 """
 
 import functools
-import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum
 from functools import partial
 from pathlib import Path
@@ -38,10 +36,12 @@ from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
 from omni.flux.utils.octahedral_converter import OctahedralConverter
 from omni.flux.validator.factory import InOutDataFlow as _InOutDataFlow
 from omni.flux.validator.factory import utils as _validator_factory_utils
-from pxr import Sdf
+from pxr import Sdf, Usd
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD
+from .conversion_engine import ConversionJob as _ConversionJob
+from .conversion_engine import get_texture_conversion_engine as _get_texture_conversion_engine
 
 
 # This should match the `normalmap_encoding` in AperturePBR_normal.mdl
@@ -252,84 +252,59 @@ class ConvertToOctahedral(_CheckBaseUSD):
                                 files_needed[out_path] = (texture_path, is_udim, encoding, [(attr, encoding_attr)])
 
         # generate all the files
-        processed_files = []
-        futures = []
-        with ThreadPoolExecutor(max_workers=schema_data.max_workers) as executor:
-            for out_path_str, (in_path_str, is_udim, encoding, attrs) in files_needed.items():
-                out_path = Path(out_path_str)
-                src_hash = _get_new_hash(in_path_str, out_path_str)
-
-                _validator_factory_utils.push_input_data(schema_data, [in_path_str])
-
-                if not out_path.exists() or src_hash is not None:
-                    future = None
-                    if encoding == NormalMapEncodings.TANGENT_SPACE_DX.value:
-                        future = executor.submit(
-                            functools.partial(
-                                OctahedralConverter.convert_dx_file_to_octahedral, in_path_str, out_path_str
-                            )
-                        )
-                    elif encoding == NormalMapEncodings.TANGENT_SPACE_OGL.value:
-                        future = executor.submit(
-                            functools.partial(
-                                OctahedralConverter.convert_ogl_file_to_octahedral, in_path_str, out_path_str
-                            )
-                        )
-                    if future:
-                        future.attrs = attrs
-                        future.is_udim = is_udim
-                        future.out_path = out_path
-                        future.src_hash = src_hash
-                        futures.append(future)
-                        processed_files.append(in_path_str)
-                else:
-                    # octahedral texture exists and doesn't need to be updated
-                    with Sdf.ChangeBlock():
-                        for attr, encoding_attr in attrs:
-                            value = out_path_str
-                            if is_udim:
-                                if schema_data.replace_udim_textures_by_empty:
-                                    value = ""
-                                else:
-                                    value = _texture_to_udim(out_path_str)
-                            attr.Set(value)
-                            encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
-                    message += f"- PASS: reused existing octahedral map: {out_path}\n"
-
-            if futures:
-                # Update all the attributes as the files are generated.
-                progress = 0
-                self.on_progress(progress, "Start", True)
-                to_add = 1 / len(futures)
-                for future in as_completed(futures):
-                    progress += to_add
-                    try:
-                        result = future.result()
-                        carb.log_info("Octahedral command result: " + str(result))
-                        out_path_str = str(future.out_path)
-                        _write_metadata(out_path_str, "src_hash", future.src_hash)
-                        with Sdf.ChangeBlock():
-                            for attr, encoding_attr in future.attrs:
-                                value = out_path_str
-                                if future.is_udim:
-                                    if schema_data.replace_udim_textures_by_empty:
-                                        value = ""
-                                    else:
-                                        value = _texture_to_udim(out_path_str)
-                                attr.Set(value)
-                                encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
-
-                        _validator_factory_utils.push_output_data(schema_data, [out_path_str])
-
-                        message += f"- PASS: created octahedral map {future.out_path}\n"
-                        self.on_progress(progress, f"Compressed to {future.out_path}", True)
-                    except Exception:  # noqa: BLE001
-                        carb.log_error(
-                            f"Exception when creating octahedral map at {future.out_path}.\n" + traceback.format_exc()
-                        )
-                        message += f"- FAIL: exception during octahedral conversion: {future.out_path}.\n"
-                        self.on_progress(progress, f"Error from {future.out_path}", True)
-                        all_pass = False
+        _validator_factory_utils.push_input_data(
+            schema_data, [in_path_str for in_path_str, *_ in files_needed.values()]
+        )
+        jobs = []
+        for out_path_str, (in_path_str, is_udim, encoding, attrs) in files_needed.items():
+            out_path = Path(out_path_str)
+            src_hash = _get_new_hash(in_path_str, out_path_str)
+
+            if not out_path.exists() or src_hash is not None:
+                function = None
+                if encoding == NormalMapEncodings.TANGENT_SPACE_DX.value:
+                    function = functools.partial(
+                        OctahedralConverter.convert_dx_file_to_octahedral, in_path_str, out_path_str
+                    )
+                elif encoding == NormalMapEncodings.TANGENT_SPACE_OGL.value:
+                    function = functools.partial(
+                        OctahedralConverter.convert_ogl_file_to_octahedral, in_path_str, out_path_str
+                    )
+                if function:
+                    jobs.append(
+                        _ConversionJob(out_path=out_path_str, function=function, context=(attrs, is_udim, src_hash))
+                    )
+            else:
+                # octahedral texture exists and doesn't need to be updated
+                self.__set_texture_attributes(schema_data, attrs, out_path_str, is_udim)
+                message += f"- PASS: reused existing octahedral map: {out_path}\n"
+
+        # Update the attributes as each file is generated. The conversions run in worker threads, so the event loop
+        # keeps running while they progress.
+        if jobs:
+            progress = 0
+            self.on_progress(progress, "Start", True)
+            to_add = 1 / len(jobs)
+            engine = _get_texture_conversion_engine()
+            async for result in engine.stream(jobs, max_concurrency=schema_data.max_workers):
+                progress += to_add
+                out_path_str = result.job.out_path
+                if not result.success:
+                    carb.log_error(f"Exception when creating octahedral map at {out_path_str}.\n{result.message}")
+                    message += f"- FAIL: exception during octahedral conversion: {out_path_str}.\n"
+                    self.on_progress(progress, f"Error from {out_path_str}", True)
+                    all_pass = False
+                    continue
+
+                carb.log_info("Octahedral command result: " + result.message)
+                attrs, is_udim, src_hash = result.job.context
+                _write_metadata(out_path_str, "src_hash", src_hash)
+                self.__set_texture_attributes(schema_data, attrs, out_path_str, is_udim)
+
+                _validator_factory_utils.push_output_data(schema_data, [out_path_str])
+
+                message += f"- PASS: created octahedral map {out_path_str}\n"
+                self.on_progress(progress, f"Compressed to {out_path_str}", True)
 
         await omni.kit.app.get_app().next_update_async()
 
@@ -370,3 +345,14 @@ class ConvertToOctahedral(_CheckBaseUSD):
     def destroy(self):
         self._max_workers_field_validate_sub = None
         super().destroy()
+
+    def __set_texture_attributes(
+        self, schema_data: Data, attrs: list[tuple[Usd.Attribute, Usd.Attribute]], out_path_str: str, is_udim: bool
+    ):
+        value = out_path_str
+        if is_udim:
+            value = "" if schema_data.replace_udim_textures_by_empty else _texture_to_udim(out_path_str)
+        with Sdf.ChangeBlock():
+            for attr, encoding_attr in attrs:
+                attr.Set(value)
+                encoding_attr.Set(NormalMapEncodings.OCTAHEDRAL.value)
@@ -64,11 +64,14 @@ class AllLights(_SelectorUSDBase):
             else None
         )
 
+        # Make sure the prims are lights
+        if hasattr(UsdLux, "LightAPI"):
+            prims = self._get_prims(schema_data, context_plugin_data, api_schemas=(UsdLux.LightAPI,))
+        else:
+            prims = self._get_prims(schema_data, context_plugin_data, schema_types=(UsdLux.Light,))
+
         all_lights = []
-        for prim in self._get_prims(schema_data, context_plugin_data):
-            # Make sure the prim is a light
-            if not (prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light)):
-                continue
+        for prim in prims:
             # Only attempt filtering if we set the light_types in the schema data
             if light_types:
                 valid_light_type = False
@@ -47,11 +47,7 @@ class AllMaterials(_SelectorUSDBase):
         Returns: True if ok + message + the selected data
         """
 
-        all_shaders = [
-            prim_ref
-            for prim_ref in self._get_prims(schema_data, context_plugin_data)
-            if prim_ref.IsA(UsdShade.Material)
-        ]
+        all_shaders = self._get_prims(schema_data, context_plugin_data, schema_types=(UsdShade.Material,))
         return True, "Ok", all_shaders
 
     @omni.usd.handle_exception
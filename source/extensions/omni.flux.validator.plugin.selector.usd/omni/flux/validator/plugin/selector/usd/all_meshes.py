@@ -47,11 +47,8 @@ class AllMeshes(_SelectorUSDBase):
         Returns: True if ok + message + the selected data
         """
 
-        prims = self._get_prims(schema_data, context_plugin_data)
-        if schema_data.include_geom_subset:
-            all_geos = [prim_ref for prim_ref in prims if prim_ref.IsA(UsdGeom.Mesh) or prim_ref.IsA(UsdGeom.Subset)]
-        else:
-            all_geos = [prim_ref for prim_ref in prims if prim_ref.IsA(UsdGeom.Mesh)]
+        schema_types = (UsdGeom.Mesh, UsdGeom.Subset) if schema_data.include_geom_subset else (UsdGeom.Mesh,)
+        all_geos = self._get_prims(schema_data, context_plugin_data, schema_types=schema_types)
         return True, "Ok", all_geos
 
     @omni.usd.handle_exception
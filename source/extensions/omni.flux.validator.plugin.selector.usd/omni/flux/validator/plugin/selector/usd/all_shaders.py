@@ -47,9 +47,7 @@ class AllShaders(_SelectorUSDBase):
         Returns: True if ok + message + the selected data
         """
 
-        all_shaders = [
-            prim_ref for prim_ref in self._get_prims(schema_data, context_plugin_data) if prim_ref.IsA(UsdShade.Shader)
-        ]
+        all_shaders = self._get_prims(schema_data, context_plugin_data, schema_types=(UsdShade.Shader,))
         return True, "Ok", all_shaders
 
     @omni.usd.handle_exception
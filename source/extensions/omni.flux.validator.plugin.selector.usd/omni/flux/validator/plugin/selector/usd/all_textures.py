@@ -19,11 +19,9 @@ from typing import Any
 
 import omni.ui as ui
 import omni.usd
-from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS
-from omni.flux.utils.common.path_utils import get_invalid_extensions as _get_invalid_extensions
-from pxr import Sdf, UsdShade
 
 from .base.base_selector import SelectorUSDBase as _SelectorUSDBase
+from .base.stage_index import get_stage_index as _get_stage_index
 
 
 class AllTextures(_SelectorUSDBase):
@@ -48,33 +46,16 @@ class AllTextures(_SelectorUSDBase):
 
         Returns: True if ok + message + the selected data
         """
-        all_shaders = [
-            prim_ref for prim_ref in self._get_prims(schema_data, context_plugin_data) if prim_ref.IsA(UsdShade.Shader)
-        ]
+        stage_index = _get_stage_index(omni.usd.get_context(context_plugin_data).get_stage())
         all_textures = []
-
-        for shader_prim in all_shaders:
-            shader = UsdShade.Shader(shader_prim)
-            for shader_input in shader.GetInputs():
-                # Make sure the input matches the filter if set
-                if (
-                    schema_data.filtered_input_names
-                    and shader_input.GetBaseName() not in schema_data.filtered_input_names
-                ):
-                    continue
-                # Make sure the input expects an asset
-                if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
-                    continue
-                # Make sure the asset is a supported texture
-                texture_asset_path = shader_input.Get().resolvedPath
-                if _get_invalid_extensions(
-                    file_paths=[texture_asset_path], valid_extensions=SUPPORTED_TEXTURE_EXTENSIONS
-                ):
-                    continue
-                # Build the full property path
-                texture_input_path = shader_prim.GetPath().AppendProperty(shader_input.GetFullName())
-                # Store the texture property and the asset path
-                all_textures.append((str(texture_input_path), str(texture_asset_path)))
+        for texture_input in stage_index.get_texture_inputs(root_layer_only=schema_data.select_from_root_layer_only):
+            # Make sure the input matches the filter if set
+            if schema_data.filtered_input_names and texture_input.base_name not in schema_data.filtered_input_names:
+                continue
+            # Build the full property path
+            texture_input_path = texture_input.shader.GetPath().AppendProperty(texture_input.full_name)
+            # Store the texture property and the asset path
+            all_textures.append((str(texture_input_path), str(texture_input.resolved_path)))
 
         return True, "Ok", all_textures
 
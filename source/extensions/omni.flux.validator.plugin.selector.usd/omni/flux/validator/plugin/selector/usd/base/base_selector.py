@@ -18,11 +18,12 @@
 from typing import Any
 
 import omni.usd
-from omni.flux.utils.common.prims import get_omni_prims as _get_omni_prims
 from omni.flux.validator.factory import SelectorBase as _SelectorBase
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
 from pxr import Sdf, Usd
 
+from .stage_index import get_stage_index as _get_stage_index
+
 
 class SelectorUSDBase(_SelectorBase):
     class Data(_SelectorBase.Data):
@@ -44,31 +45,35 @@ class SelectorUSDBase(_SelectorBase):
             Sdf._TestTakeOwnership(root_layer)  # noqa: SLF001
             await context.close_stage_async()
 
-    def _get_prims(self, schema_data: Any, context_plugin_data: _SetupDataTypeVar) -> list["Usd.Prim"]:
+    def _get_prims(
+        self,
+        schema_data: Any,
+        context_plugin_data: _SetupDataTypeVar,
+        *,
+        schema_types: tuple[type, ...] = (),
+        api_schemas: tuple[type, ...] = (),
+    ) -> list["Usd.Prim"]:
         """
         Retrieve prims based on the given schema data and context plugin data.
 
         If `select_from_root_layer_only` is True in the schema data, the function retrieves the prims present on the
         root layer of the USD stage. Otherwise, it retrieves all prims from the entire stage.
 
+        The stage is only traversed once and the result is shared with every selector working on the same stage until
+        the stage changes.
+
         Args:
             schema_data: The data of the plugin from the schema.
             context_plugin_data: The context plugin data.
+            schema_types: Only retrieve the prims of one of these schema types.
+            api_schemas: Only retrieve the prims with one of these API schemas applied.
 
         Returns:
             A list of prims.
         """
         stage = omni.usd.get_context(context_plugin_data).get_stage()
-
-        def traverse_instanced_children(prim, layer):
-            for child in prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate):
-                # Discard omniverse prims
-                if child.GetPath() in _get_omni_prims():
-                    continue
-                # If filtering for root layer prims, make sure the prim spec exists on the root layer
-                if schema_data.select_from_root_layer_only and not layer.GetPrimAtPath(child.GetPath()):
-                    continue
-                yield child
-                yield from traverse_instanced_children(child, layer)
-
-        return list(traverse_instanced_children(stage.GetPseudoRoot(), stage.GetRootLayer()))
+        return _get_stage_index(stage).get_prims(
+            root_layer_only=schema_data.select_from_root_layer_only,
+            schema_types=schema_types,
+            api_schemas=api_schemas,
+        )
@@ -0,0 +1,208 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ShaderAssetInput", "StageIndex", "get_stage_index"]
+
+import dataclasses
+import threading
+
+from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS
+from omni.flux.utils.common.path_utils import get_invalid_extensions as _get_invalid_extensions
+from omni.flux.utils.common.prims import get_omni_prims as _get_omni_prims
+from omni.flux.utils.common.stage_cache import StageCache as _StageCache
+from omni.flux.utils.common.stage_cache import StageCacheRegistry as _StageCacheRegistry
+from pxr import Sdf, Usd, UsdShade
+
+# (root layer only, schema types, API schemas)
+_BucketKey = tuple[bool, tuple[type, ...], tuple[type, ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class ShaderAssetInput:
+    """
+    A shader input holding a path to a supported texture.
+
+    Args:
+        shader: the shader prim
+        base_name: the name of the input without its namespace
+        full_name: the name of the input with its namespace
+        resolved_path: the resolved path of the texture
+    """
+
+    shader: Usd.Prim
+    base_name: str
+    full_name: str
+    resolved_path: str
+
+
+class StageIndex(_StageCache):
+    def __init__(self, stage: Usd.Stage):
+        """
+        Index the prims of a stage once so every selector of a validation run can reuse the same traversal.
+
+        The prims are walked once, with the same rules as `SelectorUSDBase._get_prims`, and grouped in buckets by
+        schema type on demand. The index listens to the stage changes so fixes applied between selectors are
+        reflected: prim changes rebuild the whole index while property changes only drop the texture inputs.
+
+        Args:
+            stage: the stage to index. The index doesn't keep the stage alive.
+        """
+        super().__init__(stage)
+        self._lock = threading.Lock()
+
+        self._prims: dict[bool, list[Usd.Prim]] | None = None
+        self._buckets: dict[_BucketKey, list[Usd.Prim]] = {}
+        self._texture_inputs: dict[bool, list[ShaderAssetInput]] = {}
+
+    def get_prims(
+        self,
+        root_layer_only: bool = False,
+        schema_types: tuple[type, ...] = (),
+        api_schemas: tuple[type, ...] = (),
+    ) -> list[Usd.Prim]:
+        """
+        Get the indexed prims in traversal order.
+
+        Args:
+            root_layer_only: only get the prims with a spec on the root layer, along with all their ancestors
+            schema_types: only get the prims of one of these types. Ignored if no types or API schemas are given.
+            api_schemas: only get the prims with one of these API schemas applied
+
+        Returns:
+            A new list of prims
+        """
+        key = (root_layer_only, tuple(schema_types), tuple(api_schemas))
+        with self._lock:
+            prims = self._get_all_prims(root_layer_only)
+            if not schema_types and not api_schemas:
+                return list(prims)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [
+                    prim
+                    for prim in prims
+                    if any(prim.IsA(schema_type) for schema_type in schema_types)
+                    or any(prim.HasAPI(api_schema) for api_schema in api_schemas)
+                ]
+                self._buckets[key] = bucket
+            return list(bucket)
+
+    def get_texture_inputs(self, root_layer_only: bool = False) -> list[ShaderAssetInput]:
+        """
+        Get the shader inputs holding a path to a supported texture, in traversal order.
+
+        Args:
+            root_layer_only: only look at the shaders with a spec on the root layer
+
+        Returns:
+            A new list of shader inputs
+        """
+        with self._lock:
+            texture_inputs = self._texture_inputs.get(root_layer_only)
+            if texture_inputs is None:
+                texture_inputs = []
+                for shader_prim in self._get_all_prims(root_layer_only):
+                    if not shader_prim.IsA(UsdShade.Shader):
+                        continue
+                    for shader_input in UsdShade.Shader(shader_prim).GetInputs():
+                        if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                            continue
+                        asset_path = shader_input.Get()
+                        if asset_path is None:
+                            continue
+                        if _get_invalid_extensions(
+                            file_paths=[asset_path.resolvedPath], valid_extensions=SUPPORTED_TEXTURE_EXTENSIONS
+                        ):
+                            continue
+                        texture_inputs.append(
+                            ShaderAssetInput(
+                                shader=shader_prim,
+                                base_name=shader_input.GetBaseName(),
+                                full_name=shader_input.GetFullName(),
+                                resolved_path=asset_path.resolvedPath,
+                            )
+                        )
+                self._texture_inputs[root_layer_only] = texture_inputs
+            return list(texture_inputs)
+
+    def invalidate(self):
+        """Rebuild the index on its next use"""
+        with self._lock:
+            self._prims = None
+            self._buckets.clear()
+            self._texture_inputs.clear()
+
+    def _get_all_prims(self, root_layer_only: bool) -> list[Usd.Prim]:
+        if self._prims is None:
+            self._prims = self._traverse()
+        return self._prims[root_layer_only]
+
+    def _traverse(self) -> dict[bool, list[Usd.Prim]]:
+        stage = self._stage()
+        if stage is None:
+            return {False: [], True: []}
+
+        omni_prims = _get_omni_prims()
+        root_layer = stage.GetRootLayer()
+        all_prims = []
+        root_layer_prims = []
+
+        # Walk the stage once, depth-first, and fill both lists: a prim is on the root layer list if its spec and the
+        # specs of all its ancestors exist on the root layer
+        to_visit = [(stage.GetPseudoRoot(), True)]
+        while to_visit:
+            prim, on_root_layer = to_visit.pop()
+            if not prim.IsPseudoRoot():
+                all_prims.append(prim)
+                if on_root_layer:
+                    root_layer_prims.append(prim)
+            children = []
+            for child in prim.GetFilteredChildren(Usd.PrimAllPrimsPredicate):
+                # Discard omniverse prims
+                if child.GetPath() in omni_prims:
+                    continue
+                children.append((child, on_root_layer and bool(root_layer.GetPrimAtPath(child.GetPath()))))
+            to_visit.extend(reversed(children))
+        return {False: all_prims, True: root_layer_prims}
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, _sender: Usd.Stage):
+        changed_paths = [*notice.GetResyncedPaths(), *notice.GetChangedInfoOnlyPaths()]
+        if any(path.IsAbsoluteRootOrPrimPath() for path in changed_paths):
+            self.invalidate()
+        elif changed_paths:
+            with self._lock:
+                self._texture_inputs.clear()
+
+
+_STAGE_INDEXES = _StageCacheRegistry(StageIndex)
+
+
+def get_stage_index(stage: Usd.Stage) -> StageIndex:
+    """
+    Get the index shared by every selector working on a stage, creating it on first use.
+
+    The index lives as long as the stage is held, so it is shared for the whole run of a context plugin.
+
+    Args:
+        stage: the stage to index
+
+    Returns:
+        The index of the stage
+    """
+    return _STAGE_INDEXES.get(stage)
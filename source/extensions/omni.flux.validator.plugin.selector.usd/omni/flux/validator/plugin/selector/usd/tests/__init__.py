@@ -20,3 +20,4 @@ from .unit.test_all_meshes import *
 from .unit.test_all_prims import *
 from .unit.test_all_shaders import *
 from .unit.test_root_prims import *
+from .unit.test_stage_index import *
@@ -0,0 +1,141 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+from omni.flux.validator.plugin.selector.usd.base.stage_index import get_stage_index
+from pxr import Sdf, Usd, UsdGeom, UsdLux, UsdShade
+
+
+class TestStageIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for file_name in ("diffuse.png", "normal.dds", "notes.txt"):
+            (Path(self.temp_dir.name) / file_name).touch()
+
+        self.sublayer = Sdf.Layer.CreateAnonymous()
+        self.sublayer.ImportFromString(
+            """#usda 1.0
+def Xform "World"
+{
+    def Mesh "SublayerMesh"
+    {
+    }
+}
+
+def Xform "Render"
+{
+    def Mesh "OmniMesh"
+    {
+    }
+}
+"""
+        )
+        self.stage = Usd.Stage.CreateNew(str(Path(self.temp_dir.name) / "stage.usda"))
+        self.stage.GetRootLayer().subLayerPaths.append(self.sublayer.identifier)
+        UsdGeom.Mesh.Define(self.stage, "/World/RootMesh")
+        UsdLux.SphereLight.Define(self.stage, "/World/Light")
+        UsdShade.Material.Define(self.stage, "/World/Material")
+        self.shader = UsdShade.Shader.Define(self.stage, "/World/Material/Shader")
+        self.shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set("./diffuse.png")
+        self.shader.CreateInput("notes", Sdf.ValueTypeNames.Asset).Set("./notes.txt")
+
+    # After running each test
+    async def tearDown(self):
+        self.stage = None
+        self.shader = None
+        self.sublayer = None
+        self.temp_dir.cleanup()
+
+    def _get_paths(self, prims) -> list[str]:
+        return [str(prim.GetPath()) for prim in prims]
+
+    async def test_get_prims_matches_traversal_order(self):
+        # Act
+        index = get_stage_index(self.stage)
+
+        # Assert
+        self.assertIs(index, get_stage_index(self.stage))
+        self.assertListEqual(
+            [
+                "/World",
+                "/World/SublayerMesh",
+                "/World/RootMesh",
+                "/World/Light",
+                "/World/Material",
+                "/World/Material/Shader",
+            ],
+            self._get_paths(index.get_prims()),
+        )
+        self.assertListEqual(
+            ["/World", "/World/RootMesh", "/World/Light", "/World/Material", "/World/Material/Shader"],
+            self._get_paths(index.get_prims(root_layer_only=True)),
+        )
+
+    async def test_get_prims_filters_schemas(self):
+        # Arrange
+        index = get_stage_index(self.stage)
+
+        # Act
+        meshes = index.get_prims(schema_types=(UsdGeom.Mesh,))
+        root_layer_meshes = index.get_prims(root_layer_only=True, schema_types=(UsdGeom.Mesh,))
+        lights = index.get_prims(api_schemas=(UsdLux.LightAPI,))
+
+        # Assert
+        self.assertListEqual(["/World/SublayerMesh", "/World/RootMesh"], self._get_paths(meshes))
+        self.assertListEqual(["/World/RootMesh"], self._get_paths(root_layer_meshes))
+        self.assertListEqual(["/World/Light"], self._get_paths(lights))
+
+    async def test_get_texture_inputs_only_returns_supported_textures(self):
+        # Act
+        texture_inputs = get_stage_index(self.stage).get_texture_inputs()
+
+        # Assert
+        self.assertListEqual(
+            [("/World/Material/Shader", "diffuse_texture", "inputs:diffuse_texture")],
+            [(str(texture.shader.GetPath()), texture.base_name, texture.full_name) for texture in texture_inputs],
+        )
+        self.assertEqual(
+            Path(self.temp_dir.name, "diffuse.png").as_posix(), Path(texture_inputs[0].resolved_path).as_posix()
+        )
+
+    async def test_stage_changes_update_the_index(self):
+        # Arrange
+        index = get_stage_index(self.stage)
+        index.get_prims(root_layer_only=True, schema_types=(UsdGeom.Mesh,))
+        index.get_texture_inputs()
+
+        # Act
+        UsdGeom.Mesh.Define(self.stage, "/World/NewMesh")
+        Sdf.CreatePrimInLayer(self.stage.GetRootLayer(), "/World/SublayerMesh")
+        self.shader.CreateInput("normal_texture", Sdf.ValueTypeNames.Asset).Set("./normal.dds")
+        self.stage.RemovePrim("/World/Light")
+
+        # Assert
+        self.assertListEqual(
+            ["/World/SublayerMesh", "/World/RootMesh", "/World/NewMesh"],
+            self._get_paths(index.get_prims(root_layer_only=True, schema_types=(UsdGeom.Mesh,))),
+        )
+        self.assertListEqual([], index.get_prims(api_schemas=(UsdLux.LightAPI,)))
+        self.assertListEqual(
+            ["inputs:diffuse_texture", "inputs:normal_texture"],
+            [texture.full_name for texture in index.get_texture_inputs()],
+        )